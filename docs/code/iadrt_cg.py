@@ -4,9 +4,10 @@ import adrt
 
 
 class ADRTNormalOperator(LinearOperator):
-    def __init__(self, img_size, dtype=None):
+    def __init__(self, img_size, dtype=None, ridge_param=0.0):
         super().__init__(dtype=dtype, shape=(img_size**2, img_size**2))
         self._img_size = img_size
+        self._ridge_param = ridge_param
 
     def _matmat(self, x):
         # Use batch dimensions to handle columns of matrix x
@@ -14,7 +15,8 @@ class ADRTNormalOperator(LinearOperator):
         batch_img = np.moveaxis(x, -1, 0).reshape(
             (n_batch, self._img_size, self._img_size)
         )
-        ret = adrt.utils.truncate(adrt.bdrt(adrt.adrt(batch_img))).mean(axis=1)
+        # Applies A^T A x + ridge_param * x in one call
+        ret = adrt.core.adrt_normal(batch_img, ridge=self._ridge_param)
         return np.moveaxis(ret, 0, -1).reshape((self._img_size**2, n_batch))
 
     def _adjoint(self):
@@ -26,7 +28,7 @@ def iadrt_cg(b, /, *, op_cls=ADRTNormalOperator, **kwargs):
         raise ValueError("batch dimension not supported for iadrt_cg")
     img_size = b.shape[-1]
     linop = op_cls(img_size=img_size, dtype=b.dtype)
-    tb = adrt.utils.truncate(adrt.bdrt(b)).mean(axis=0).ravel()
+    tb = adrt.core.adrt_adjoint(b).ravel()
     x, info = cg(linop, tb, **kwargs)
     if info != 0:
         raise ValueError(f"convergence failed (cg status {info})")
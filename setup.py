@@ -34,8 +34,11 @@
 
 from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError
 import numpy
 import glob
+import os
+import platform
 
 
 COMPILER_EXTRA_ARGS = {
@@ -43,14 +46,69 @@ COMPILER_EXTRA_ARGS = {
     "msvc": ["/std:c++17"],
 }
 
+# Kernels compiled again for each instruction set, selected at import time.
+# Everything else (including adrt_cdefs_common.cpp, which runs before the
+# CPU features are checked) is only compiled for the baseline.
+ISA_VARIANT_SOURCES = [
+    "src/adrt/adrt_cdefs_kernels.cpp",
+]
+
+ISA_VARIANT_EXTRA_ARGS = {
+    "unix": {
+        "avx2": ["-mavx2", "-mfma", "-ffp-contract=off"],
+        "avx512": [
+            "-mavx2",
+            "-mfma",
+            "-mavx512f",
+            "-mavx512cd",
+            "-mavx512vl",
+            "-mavx512bw",
+            "-mavx512dq",
+            "-ffp-contract=off",
+        ],
+    },
+    "msvc": {
+        "avx2": ["/arch:AVX2", "/fp:precise"],
+        "avx512": ["/arch:AVX512", "/fp:precise"],
+    },
+}
+
 
 class CPPVersionBuildExt(build_ext):
     def build_extension(self, ext, *args, **kwargs):
         if ext.language == "c++":
             extra_args = COMPILER_EXTRA_ARGS.get(self.compiler.compiler_type, [])
             ext.extra_compile_args = extra_args + ext.extra_compile_args
+            if ext.name == "adrt._adrt_cdefs":
+                self.build_isa_variants(ext)
         return super().build_extension(ext, *args, **kwargs)
 
+    def build_isa_variants(self, ext):
+        if platform.machine().lower() not in {"x86_64", "amd64"}:
+            return
+        variants = ISA_VARIANT_EXTRA_ARGS.get(self.compiler.compiler_type, {})
+        # Each variant is built from the extension's own macros only
+        base_macros = list(ext.define_macros)
+        dispatch_macros = []
+        for name, isa_args in variants.items():
+            try:
+                objects = self.compiler.compile(
+                    ISA_VARIANT_SOURCES,
+                    output_dir=os.path.join(self.build_temp, f"isa_{name}"),
+                    macros=[*base_macros, ("ADRT_ISA_NAMESPACE", f"isa_{name}")],
+                    include_dirs=ext.include_dirs,
+                    debug=self.debug,
+                    extra_postargs=ext.extra_compile_args + isa_args,
+                    depends=ext.depends,
+                )
+            except CompileError:
+                self.warn(f"skipping {name} kernels, compiler does not support them")
+                continue
+            # Variant objects are linked after the baseline objects
+            ext.extra_objects.extend(objects)
+            dispatch_macros.append((f"ADRT_DISPATCH_{name.upper()}", None))
+        ext.define_macros.extend(dispatch_macros)
+
 
 adrt_c_ext = Extension(
     "adrt._adrt_cdefs",
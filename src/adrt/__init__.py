@@ -46,6 +46,8 @@ utility routines can be found in :mod:`adrt.utils`.
 
 
 import typing
+import time
+import operator
 import itertools
 import numpy as np
 import numpy.typing as npt
@@ -58,6 +60,8 @@ __all__: typing.Final[typing.Sequence[str]] = [
     "iadrt",
     "bdrt",
     "iadrt_fmg",
+    "iadrt_cg",
+    "InverseInfo",
     "utils",
     "core",
 ]
@@ -67,23 +71,90 @@ __version__: typing.Final[str] = "1.0.2.dev"
 _F = typing.TypeVar("_F", np.float32, np.float64)
 
 
+class InverseInfo(typing.NamedTuple):
+    r"""Convergence information from an iterative inverse.
+
+    Returned by :func:`iadrt_fmg` and :func:`iadrt_cg` when called with
+    :pycode:`return_info=True`.
+
+    Attributes
+    ----------
+    iterations : numpy.ndarray of numpy.intp
+        For each image in the batch, the number of iterations which
+        produced the returned estimate.
+    residuals : numpy.ndarray of numpy.float64
+        For each image, the norm of the residual error of the returned
+        estimate.
+    converged : numpy.ndarray of numpy.bool\_
+        For each image, whether the returned estimate is within the
+        requested tolerance.
+    history : numpy.ndarray of numpy.float64
+        The residual norm of every iteration along a leading axis, with
+        the batch shape following. Entries after an image stopped are
+        NaN.
+    """
+
+    iterations: npt.NDArray[np.intp]
+    residuals: npt.NDArray[np.float64]
+    converged: npt.NDArray[np.bool_]
+    history: npt.NDArray[np.float64]
+
+
+@typing.overload
 def iadrt_fmg(
-    a: npt.NDArray[_F], /, *, max_iters: typing.Optional[int] = None
+    a: npt.NDArray[_F],
+    /,
+    *,
+    max_iters: typing.Optional[int] = None,
+    rtol: float = 0.0,
+    atol: float = 0.0,
+    time_limit: typing.Optional[float] = None,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    return_info: typing.Literal[False] = ...,
 ) -> npt.NDArray[_F]:
+    ...
+
+
+@typing.overload
+def iadrt_fmg(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    max_iters: typing.Optional[int] = None,
+    rtol: float = 0.0,
+    atol: float = 0.0,
+    time_limit: typing.Optional[float] = None,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    return_info: typing.Literal[True],
+) -> tuple[npt.NDArray[_F], InverseInfo]:
+    ...
+
+
+def iadrt_fmg(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    max_iters: typing.Optional[int] = None,
+    rtol: float = 0.0,
+    atol: float = 0.0,
+    time_limit: typing.Optional[float] = None,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    return_info: bool = False,
+) -> typing.Union[npt.NDArray[_F], tuple[npt.NDArray[_F], InverseInfo]]:
     r"""Approximate inverse to the ADRT by the full multigrid method.
 
     Estimated inverses are computed and iteratively refined until the
     norm of the residual error fails to decrease from one iteration to
-    the next. This iteration can also be terminated early if
-    `max_iters` is specified.
+    the next, or falls within the requested tolerance. This iteration
+    can also be terminated early if `max_iters` or `time_limit` is
+    specified.
 
     Particularly with a limited iteration count this inverse can be
     relatively quick to compute, but may not achieve the best possible
     precision. If your output array `a` is *exact* and floating-point
     precision is sufficient you may consider :func:`iadrt` for an
     exact inverse. Otherwise, for an inverse that may perform more
-    reliably for certain inputs, consider the ``iadrt_cg`` recipe
-    proposed in the :doc:`examples.cginverse` example.
+    reliably for certain inputs, consider :func:`iadrt_cg`.
 
     See :func:`adrt.core.iadrt_fmg_iter` and
     :func:`adrt.core.iadrt_fmg_step` for more information on the
@@ -94,8 +165,8 @@ def iadrt_fmg(
     ----------
     a : numpy.ndarray of float
         The array for which the inverse is to be computed. This array
-        must have the shape of an ADRT output. This array *must not*
-        have a batch dimension.
+        must have the shape of an ADRT output, and may include any
+        number of leading batch dimensions.
     max_iters : int, optional
         If :pycode:`None` (default), the number of internal iterations
         is unbounded. The computation will terminate only when the
@@ -103,6 +174,27 @@ def iadrt_fmg(
         must be an integer argument at least :pycode:`1`, and provides
         an upper bound on the number of iterations performed
         internally.
+    rtol : float, optional
+        Relative tolerance. An image stops being refined once the norm
+        of its residual error is at most
+        :pycode:`max(rtol * norm(a), atol)`. Defaults to :pycode:`0.0`.
+    atol : float, optional
+        Absolute tolerance, see `rtol`. Defaults to :pycode:`0.0`.
+    time_limit : float, optional
+        If provided, no further iterations are started once this many
+        seconds have elapsed. At least one iteration is always
+        performed, unless every image of `x0` is already within the
+        tolerance.
+    x0 : numpy.ndarray of float, optional
+        Starting estimate, for example the inverse of a similar input.
+        It must have the shape of the output. Iteration begins by
+        refining this estimate, rather than starting from zero. Its
+        residual error is computed first, and an image whose refined
+        estimates never improve on it is returned as `x0` with zero
+        iterations.
+    return_info : bool, optional
+        If :pycode:`True`, also return convergence information for
+        each image. Defaults to :pycode:`False`.
 
     Returns
     -------
@@ -111,6 +203,15 @@ def iadrt_fmg(
         the lowest residual error observed so long as the decrease was
         monotonic, or the last computation output if iteration was
         terminated by `max_iters`.
+    InverseInfo
+        Returned only if `return_info` is :pycode:`True`. A named tuple
+        whose attributes ``iterations``, ``residuals``, and
+        ``converged`` are arrays with the batch shape of `a` giving,
+        for each image, the number of iterations which produced the
+        returned estimate, the norm of its residual error, and whether
+        it is within the tolerance. The attribute ``history`` has an
+        additional leading axis and holds the residual norm of every
+        iteration, or NaN after an image stopped.
 
     Notes
     -----
@@ -118,35 +219,308 @@ def iadrt_fmg(
     square---the same size as the original input to :func:`adrt` would
     have been.
 
-    This function *does not* support batch dimensions.
+    For a batch of inputs the stopping conditions are applied to each
+    image separately, and each keeps the last estimate for which its
+    own residual decreased. Images are refined together, and once at
+    least half of those remaining have stopped the others continue on
+    their own.
     """
-    if a.ndim > 3:
-        raise ValueError(
-            f"batch dimension not supported for iadrt_fmg, got {a.ndim} dimensions"
-        )
+    if a.ndim < 3:
+        raise ValueError(f"array must have at least 3 dimensions, got {a.ndim}")
     if max_iters is not None and max_iters < 1:
         raise ValueError(
             f"must allow at least one iteration, but specified {max_iters}"
         )
-    # Following recipe for itertools.pairwise from Python 3.10
-    i1, i2 = itertools.tee(
-        itertools.chain(
-            (
-                # Pair each estimated inverse x with its residual error
-                (x, float(np.linalg.norm(adrt(x) - a)))
-                # Use itertools.islice to limit iterations if requested
-                for x in itertools.islice(core.iadrt_fmg_iter(a, copy=False), max_iters)
-            ),
-            # Chain i2 with one extra value so we don't exhaust early
-            # Use np.inf so the residual will rise and we won't continue iterating
-            [(a, np.inf)],
-        ),
-        2,
+    if rtol < 0 or atol < 0:
+        raise ValueError(f"tolerances must be non-negative, got {rtol} and {atol}")
+    start = time.perf_counter()
+    n = a.shape[-1]
+    batch_shape: tuple[int, ...] = a.shape[:-3]
+    if x0 is not None and x0.shape != (*batch_shape, n, n):
+        raise ValueError(
+            f"x0 must have shape {(*batch_shape, n, n)} to match output, "
+            f"got {x0.shape}"
+        )
+    # Work on a flat batch so images can be dropped once they stop
+    flat = np.reshape(a, (-1, *a.shape[-3:]))
+    num_images = flat.shape[0]
+    tol = np.maximum(
+        rtol * np.linalg.norm(flat.reshape((num_images, -1)), axis=-1), atol
     )
-    next(i2, None)
-    for (_inv1, res1), (_, res2) in zip(i1, i2):
-        if not res2 < res1:
-            # Residual failed to decrease, stop early
+    best_res = np.full(num_images, np.inf)
+    iterations = np.zeros(num_images, dtype=np.intp)
+    converged = np.zeros(num_images, dtype=bool)
+    history = []
+    # Images refined by the current iterator, and which of those are still active
+    idx = np.arange(num_images)
+    live = np.ones(num_images, dtype=bool)
+    inv = np.empty((num_images, n, n), dtype=flat.dtype)
+    flat_x0 = None
+    if x0 is not None:
+        # The starting estimate is kept unless an iterate improves on it
+        flat_x0 = np.reshape(x0, (-1, n, n))
+        np.copyto(inv, flat_x0, casting="same_kind")
+        res0 = flat - adrt(flat_x0)
+        best_res = np.linalg.norm(res0.reshape((num_images, -1)), axis=-1)
+        converged = best_res <= tol
+        live = ~converged
+    estimates = core.iadrt_fmg_iter(flat, x0=flat_x0, copy=False, residuals=True)
+    # Use itertools.islice to limit iterations if requested, and skip
+    # them entirely if every starting estimate is within tolerance
+    limit = max_iters if np.any(live) else 0
+    for k in itertools.islice(itertools.count(), limit):
+        x, res = next(estimates)
+        # Residuals come from the iteration itself, so no extra transforms are needed
+        res_norm = np.linalg.norm(res.reshape((idx.size, -1)), axis=-1)
+        row = np.full(num_images, np.nan)
+        row[idx[live]] = res_norm[live]
+        history.append(row)
+        # Without x0 the first estimate is always accepted, later ones
+        # (and any compared to x0) only if the residual fell
+        accept = live if k == 0 and x0 is None else live & (res_norm < best_res[idx])
+        inv[idx[accept]] = x[accept]
+        best_res[idx[accept]] = res_norm[accept]
+        iterations[idx[accept]] = k + 1
+        within_tol = accept & (res_norm <= tol[idx])
+        converged[idx[within_tol]] = True
+        live = accept & ~within_tol
+        if not np.any(live):
             break
-    # Create a copy so returned array is writable (we have views from iadrt_fmg_iter)
-    return _inv1.copy()
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        if 2 * np.count_nonzero(live) <= idx.size:
+            # Restart from the current estimates so stopped images cost nothing
+            idx = idx[live]
+            live = np.ones(idx.size, dtype=bool)
+            estimates = core.iadrt_fmg_iter(
+                flat[idx], x0=inv[idx], copy=False, residuals=True
+            )
+    inv = inv.reshape((*batch_shape, n, n))
+    if not return_info:
+        return inv
+    return inv, InverseInfo(
+        iterations=iterations.reshape(batch_shape),
+        residuals=best_res.reshape(batch_shape),
+        converged=converged.reshape(batch_shape),
+        history=np.array(history).reshape((len(history), *batch_shape)),
+    )
+
+
+def _batch_dot(a: npt.NDArray[_F], b: npt.NDArray[_F], /) -> npt.NDArray[np.float64]:
+    # Per-image inner products over the two trailing (image) axes
+    return np.asarray(np.einsum("...ij,...ij->...", a, b, dtype=np.float64))
+
+
+@typing.overload
+def iadrt_cg(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    rtol: float = 1e-5,
+    atol: float = 0.0,
+    maxiter: typing.Optional[int] = None,
+    ridge: float = 0.0,
+    precondition: bool = False,
+    return_info: typing.Literal[False] = ...,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[_F]:
+    ...
+
+
+@typing.overload
+def iadrt_cg(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    rtol: float = 1e-5,
+    atol: float = 0.0,
+    maxiter: typing.Optional[int] = None,
+    ridge: float = 0.0,
+    precondition: bool = False,
+    return_info: typing.Literal[True],
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> tuple[npt.NDArray[_F], InverseInfo]:
+    ...
+
+
+def iadrt_cg(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    rtol: float = 1e-5,
+    atol: float = 0.0,
+    maxiter: typing.Optional[int] = None,
+    ridge: float = 0.0,
+    precondition: bool = False,
+    return_info: bool = False,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> typing.Union[npt.NDArray[_F], tuple[npt.NDArray[_F], InverseInfo]]:
+    r"""Approximate inverse to the ADRT by the conjugate gradient method.
+
+    Applies the conjugate gradient (CG) method to the normal equations
+    :math:`(A^{T}A + \lambda I)x = A^{T}b` where :math:`A` is the
+    matrix of the linear operator applied by :func:`adrt`, :math:`b`
+    is the input `a`, and :math:`\lambda` is the `ridge` parameter.
+    Compared to :func:`iadrt` this inverse is much less sensitive to
+    noise in its input (see :ref:`inverse page`).
+
+    The input may include any number of leading batch dimensions. An
+    independent CG recurrence is run for each image, all advancing
+    together so that each iteration applies the normal operator to the
+    whole batch in one call to :func:`adrt.core.adrt_normal`. Images
+    stop updating once they individually reach the requested
+    tolerance.
+
+    With `precondition` set, the preconditioned conjugate gradient
+    method is used instead, with the multilevel preconditioner
+    :func:`adrt.core.fmg_precondition` derived from the full multigrid
+    inverse. It approximately inverts :math:`A^{T}A`, so the number of
+    iterations grows only slowly with the image size. Each iteration
+    costs one more filter pass, which is small next to the transforms.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        The array for which the inverse is to be computed. This array
+        must have the shape of an ADRT output.
+    x0 : numpy.ndarray of float, optional
+        Starting estimate for the inverse, used to warm-start the
+        iteration. It must have the shape of the output. If
+        :pycode:`None` (default), the iteration starts from zero.
+    rtol : float, optional
+        Relative tolerance. An image has converged when the norm of its
+        normal equation residual is at most
+        :pycode:`max(rtol * norm(A.T @ b), atol)`.
+    atol : float, optional
+        Absolute tolerance, see `rtol`.
+    maxiter : int, optional
+        Upper bound on the number of iterations. If :pycode:`None`
+        (default), at most :pycode:`10 * n**2` iterations are run for
+        images of size :math:`n`.
+    ridge : float, optional
+        Non-negative Tikhonov regularization parameter
+        :math:`\lambda`. Defaults to :pycode:`0.0`.
+    precondition : bool, optional
+        If :pycode:`True`, precondition the iteration with
+        :func:`adrt.core.fmg_precondition`. This usually reaches the
+        tolerance in far fewer iterations, particularly for large
+        images. Defaults to :pycode:`False`.
+    return_info : bool, optional
+        If :pycode:`True`, also return convergence information for
+        each image. Defaults to
+        :pycode:`False`.
+    threads : int, optional
+        Number of threads used by each application of the normal
+        operator and the preconditioner, as in
+        :func:`adrt.core.adrt_normal`.
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The square inverses, with any batch dimensions of `a`
+        preserved.
+    InverseInfo
+        Returned only if `return_info` is :pycode:`True`. A named tuple
+        whose attributes ``iterations``, ``residuals``, and
+        ``converged`` are arrays with the batch shape of `a` giving, for each image,
+        the number of iterations performed, the norm of the final
+        normal equation residual, and whether the tolerance was met.
+        The attribute ``history`` has an additional leading axis and
+        holds the residual norm after every iteration, or NaN after an
+        image stopped.
+
+    Notes
+    -----
+    Unlike :func:`iadrt` the output of this routine will be
+    square---the same size as the original input to :func:`adrt` would
+    have been.
+
+    All iteration vectors are held in buffers allocated once before the
+    iteration begins, and the transforms share a single preallocated
+    workspace.
+    """
+    if a.ndim < 3:
+        raise ValueError(f"array must have at least 3 dimensions, got {a.ndim}")
+    if rtol < 0 or atol < 0:
+        raise ValueError(f"tolerances must be non-negative, got {rtol} and {atol}")
+    if maxiter is not None and operator.index(maxiter) < 0:
+        raise ValueError(f"maxiter must be non-negative, got {maxiter}")
+    if not ridge >= 0:
+        raise ValueError(f"ridge must be non-negative, got {ridge}")
+    # Right-hand side of the normal equations (also validates the shape)
+    rhs = core.adrt_adjoint(a, threads=threads)
+    n = rhs.shape[-1]
+    batch_shape: tuple[int, ...] = rhs.shape[:-2]
+    # Iterate over a flat batch (a view since rhs is freshly allocated)
+    r = rhs.reshape((-1, n, n))
+    maxiter = 10 * n * n if maxiter is None else operator.index(maxiter)
+    tol = np.maximum(rtol * np.sqrt(_batch_dot(r, r)), atol)
+    # Preallocate the iteration vectors and the operator workspace
+    x = np.zeros_like(r)
+    p = np.empty_like(r)
+    ap = np.empty_like(r)
+    tmp = np.empty_like(r)
+    workspace = np.empty(core.workspace_size("adrt_normal", r.shape), dtype=r.dtype)
+    # Per-image step sizes, with trailing axes to broadcast over images
+    step = np.empty((r.shape[0], 1, 1), dtype=r.dtype)
+    # Preconditioned residuals share storage with r when not preconditioning
+    z = np.empty_like(r) if precondition else r
+    precond_workspace = (
+        np.empty(core.workspace_size("fmg_precondition", r.shape), dtype=r.dtype)
+        if precondition
+        else None
+    )
+    if x0 is not None:
+        if x0.shape != rhs.shape:
+            raise ValueError(
+                f"x0 must have shape {rhs.shape} to match output, got {x0.shape}"
+            )
+        np.copyto(x, x0.reshape(x.shape), casting="same_kind")
+        core.adrt_normal(x, ridge=ridge, out=ap, workspace=workspace, threads=threads)
+        r -= ap
+    if precondition:
+        core.fmg_precondition(r, out=z, workspace=precond_workspace, threads=threads)
+    np.copyto(p, z)
+    rr = _batch_dot(r, r)
+    rz = _batch_dot(r, z) if precondition else rr.copy()
+    iterations = np.zeros(r.shape[0], dtype=np.intp)
+    history = []
+    active = np.sqrt(rr) > tol
+    for _ in range(maxiter):
+        if not np.any(active):
+            break
+        core.adrt_normal(p, ridge=ridge, out=ap, workspace=workspace, threads=threads)
+        pap = _batch_dot(p, ap)
+        # Converged images take zero-length steps so their state is frozen
+        alpha = np.divide(rz, pap, out=np.zeros_like(rz), where=active & (pap > 0))
+        np.copyto(step[..., 0, 0], alpha, casting="same_kind")
+        x += np.multiply(step, p, out=tmp)
+        r -= np.multiply(step, ap, out=tmp)
+        if precondition:
+            core.fmg_precondition(
+                r, out=z, workspace=precond_workspace, threads=threads
+            )
+        rz_next = _batch_dot(r, z)
+        rr_next = _batch_dot(r, r) if precondition else rz_next
+        beta = np.divide(rz_next, rz, out=np.zeros_like(rz), where=active & (rz > 0))
+        np.copyto(step[..., 0, 0], beta, casting="same_kind")
+        p *= step
+        p += z
+        iterations += active
+        np.copyto(rz, rz_next, where=active)
+        np.copyto(rr, rr_next, where=active)
+        history.append(np.where(active, np.sqrt(rr), np.nan))
+        active &= np.sqrt(rr) > tol
+    x = x.reshape(rhs.shape)
+    if not return_info:
+        return x
+    residuals = np.sqrt(rr)
+    return x, InverseInfo(
+        iterations=iterations.reshape(batch_shape),
+        residuals=residuals.reshape(batch_shape),
+        converged=(residuals <= tol).reshape(batch_shape),
+        history=np.array(history).reshape((len(history), *batch_shape)),
+    )
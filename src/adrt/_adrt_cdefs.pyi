@@ -38,14 +38,143 @@ import numpy.typing as npt
 F = typing.TypeVar("F", np.float32, np.float64)
 
 OPENMP_ENABLED: typing.Final[bool]
+KERNEL_VARIANT: typing.Final[str]
 
-def adrt(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def adrt_step(a: npt.NDArray[F], step: int, /) -> npt.NDArray[F]: ...
-def iadrt(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def bdrt(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def bdrt_step(a: npt.NDArray[F], step: int, /) -> npt.NDArray[F]: ...
+def adrt(
+    a: npt.NDArray[F],
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[np.floating[typing.Any]] | None = ...,
+    threads: int | None = ...,
+    wide: bool = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def adrt_step(
+    a: npt.NDArray[F], step: int, threads: int | None = ..., /
+) -> npt.NDArray[F]: ...
+def iadrt(
+    a: npt.NDArray[F],
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[F] | None = ...,
+    threads: int | None = ...,
+    wide: bool = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def bdrt(
+    a: npt.NDArray[F],
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[np.floating[typing.Any]] | None = ...,
+    threads: int | None = ...,
+    wide: bool = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def adrt_adjoint(
+    a: npt.NDArray[F],
+    per_quadrant: bool,
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[F] | None = ...,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def adrt_normal(
+    a: npt.NDArray[F],
+    ridge: float,
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[F] | None = ...,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def iadrt_fmg_step(
+    a: npt.NDArray[F],
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[F] | None = ...,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def fmg_precondition(
+    a: npt.NDArray[F],
+    out: npt.NDArray[F] | None = ...,
+    workspace: npt.NDArray[F] | None = ...,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def bdrt_step(
+    a: npt.NDArray[F], step: int, threads: int | None = ..., /
+) -> npt.NDArray[F]: ...
 def num_iters(a: int, /) -> int: ...
-def interp_to_cart(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def press_fmg_restriction(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def press_fmg_prolongation(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
-def press_fmg_highpass(a: npt.NDArray[F], /) -> npt.NDArray[F]: ...
+def set_radix(radix: int, /) -> None: ...
+def get_radix() -> int: ...
+def set_num_threads(threads: int | None, /) -> None: ...
+def get_num_threads() -> int: ...
+def workspace_size(op: str, shape: tuple[int, ...], /) -> int: ...
+def interp_to_cart(
+    a: npt.NDArray[F],
+    threads: int | None = ...,
+    heights: npt.NDArray[np.int16] | None = ...,
+    quadrants: npt.NDArray[np.int32] | None = ...,
+    slopes: npt.NDArray[np.int32] | None = ...,
+    factors: npt.NDArray[np.floating[typing.Any]] | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def interp_to_cart_coords(
+    a: npt.NDArray[F],
+    theta: npt.NDArray[np.float64],
+    t: npt.NDArray[np.float64],
+    order: int,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def interp_to_cart_adjoint(
+    a: npt.NDArray[F],
+    heights: npt.NDArray[np.int16],
+    quadrants: npt.NDArray[np.int32],
+    slopes: npt.NDArray[np.int32],
+    factors: npt.NDArray[np.floating[typing.Any]],
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def interp_to_cart_coords_adjoint(
+    a: npt.NDArray[F],
+    n: int,
+    theta: npt.NDArray[np.float64],
+    t: npt.NDArray[np.float64],
+    order: int,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def interp_to_cart_plan(
+    n: int,
+    heights: npt.NDArray[np.int16],
+    quadrants: npt.NDArray[np.int32],
+    slopes: npt.NDArray[np.int32],
+    factors32: npt.NDArray[np.float32],
+    factors64: npt.NDArray[np.float64],
+    /,
+) -> None: ...
+def sample_adrt(
+    a: npt.NDArray[F],
+    theta: npt.NDArray[np.float64],
+    t: npt.NDArray[np.float64],
+    order: int,
+    threads: int | None = ...,
+    /,
+) -> npt.NDArray[F]: ...
+def coord_cart_to_adrt(
+    theta: npt.NDArray[np.float64],
+    t: npt.NDArray[np.float64],
+    n: int,
+    quadrant: npt.NDArray[np.uint8],
+    height: npt.NDArray[np.int64],
+    slope: npt.NDArray[np.uint64],
+    factor: npt.NDArray[np.float64],
+    threads: int | None = ...,
+    /,
+) -> None: ...
+def press_fmg_restriction(
+    a: npt.NDArray[F], threads: int | None = ..., /
+) -> npt.NDArray[F]: ...
+def press_fmg_prolongation(
+    a: npt.NDArray[F], threads: int | None = ..., /
+) -> npt.NDArray[F]: ...
+def press_fmg_highpass(
+    a: npt.NDArray[F], threads: int | None = ..., /
+) -> npt.NDArray[F]: ...
@@ -48,7 +48,11 @@ Python documentation.
 """
 
 
+import contextlib
+import contextvars
+import functools
 import operator
+import threading
 import typing
 import numpy as np
 import numpy.typing as npt
@@ -94,34 +98,127 @@ def _format_object_type(obj: object, /) -> str:
     return f"{t.__module__}.{t.__qualname__}"
 
 
-def _normalize_array(a: npt.NDArray[A], /) -> npt.NDArray[A]:
+# Number of arrays copied by _normalize_array, see layout_copy_count
+_layout_copies: int = 0
+_layout_copies_lock: typing.Final[threading.Lock] = threading.Lock()
+
+
+def _has_supported_strides(a: npt.NDArray[typing.Any], /) -> bool:
+    r"""Check whether the strides of `a` can be used directly.
+
+    This is an internal function. Users should not call it. Strides
+    must be non-negative multiples of the item size, except along
+    dimensions of length one where they are never used.
+    """
+    return all(
+        n == 1 or (s >= 0 and s % a.itemsize == 0) for n, s in zip(a.shape, a.strides)
+    )
+
+
+def _normalize_array(a: npt.NDArray[A], /, *, strided: bool = False) -> npt.NDArray[A]:
     r"""Ensure provided arrays are in a suitable layout.
 
     This is an internal function. Users should not call it. Make sure
     that arrays being passed to the extension module have the expected
-    memory layout.
+    memory layout. If `strided` is true, the routine receiving the
+    array accepts any non-negative strides and only arrays that are
+    byteswapped, unaligned, or have negative strides are copied.
+    Otherwise arrays are copied unless they are C-contiguous.
     """
+    global _layout_copies
     if not isinstance(a, np.ndarray):
         # Explicitly fail if not ndarray (or subclass).
         # Users otherwise may get a confusing error related to the dtype attribute.
         raise TypeError(
             f"array must be numpy.ndarray, but got {_format_object_type(a)}"
         )
-    a = np.asarray(a, a.dtype.newbyteorder("="), "C")
-    if not a.flags.aligned:
-        return a.copy("C")
-    return a
+    if (
+        a.dtype.isnative
+        and a.flags.aligned
+        and (a.flags.c_contiguous or (strided and _has_supported_strides(a)))
+    ):
+        return np.asarray(a)
+    with _layout_copies_lock:
+        _layout_copies += 1
+    return np.array(a, dtype=a.dtype.newbyteorder("="), order="C")
+
+
+_num_threads_override: typing.Final[
+    contextvars.ContextVar[typing.Optional[int]]
+] = contextvars.ContextVar("adrt_num_threads", default=None)
+
+
+def _resolve_threads(
+    threads: typing.Optional[typing.SupportsIndex], /
+) -> typing.Optional[int]:
+    r"""Determine the thread count to pass to the native routines.
+
+    This is an internal function. Users should not call it. An explicit
+    `threads` takes priority, followed by the innermost active
+    :func:`num_threads` context. A result of :pycode:`None` defers to
+    the process-wide setting from :func:`set_num_threads`.
+    """
+    if threads is None:
+        return _num_threads_override.get()
+    return operator.index(threads)
+
+
+def _resolve_accumulate(a: npt.NDArray[F], accumulate: npt.DTypeLike, /) -> bool:
+    r"""Determine whether a transform should accumulate in float64.
+
+    This is an internal function. Users should not call it. Validates
+    the `accumulate` argument of a transform applied to `a` and
+    returns :pycode:`True` only if it widens a float32 input to
+    float64.
+    """
+    if accumulate is None:
+        return False
+    acc_dtype = np.dtype(accumulate)
+    if acc_dtype not in (np.float32, np.float64):
+        raise TypeError(f"unsupported accumulation dtype {acc_dtype}")
+    if acc_dtype.itemsize < a.dtype.itemsize:
+        raise ValueError(
+            f"accumulation dtype {acc_dtype} is narrower than array dtype {a.dtype}"
+        )
+    return bool(a.dtype == np.float32 and acc_dtype == np.float64)
+
+
+def _check_no_overlap(
+    a: npt.NDArray[A], /, **buffers: typing.Optional[npt.NDArray[A]]
+) -> None:
+    r"""Ensure that caller-provided buffers do not overlap.
+
+    This is an internal function. Users should not call it. Check that
+    the output and workspace buffers in `buffers` do not share memory
+    with the input `a` or with each other. Entries which are
+    :pycode:`None` are skipped.
+    """
+    checked = [("input", a)]
+    for name, buf in buffers.items():
+        if buf is None:
+            continue
+        for other_name, other in checked:
+            if np.may_share_memory(buf, other):
+                raise ValueError(f"{name} must not overlap with {other_name}")
+        checked.append((name, buf))
 
 
 @_set_module("adrt")
-def adrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
+def adrt(
+    a: npt.NDArray[F],
+    /,
+    *,
+    accumulate: npt.DTypeLike = None,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[np.floating[typing.Any]]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
     r"""The Approximate Discrete Radon Transform (ADRT).
 
     This is the fundamental routine of this package, computing the
     ADRT of the provided array. The array `a` must store square input
-    images with sizes a power of two. The input may optionally include
-    an additional leading batch dimension, so an array of either two
-    or three dimensions.
+    images with sizes a power of two. The input may include any number
+    of leading batch dimensions, which are preserved in the output.
 
     If padding is needed for the input array, consider
     :func:`numpy.pad`.
@@ -139,14 +236,47 @@ def adrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     ----------
     a : numpy.ndarray of float
         Array for which the ADRT should be computed. This should be a
-        square image with side length a power of two, and optionally a
-        leading batch dimension.
+        square image with side length a power of two, optionally with
+        leading batch dimensions.
+    accumulate : numpy.dtype, optional
+        Floating point type of the intermediate sums. Must be float32
+        or float64 and at least as wide as the dtype of `a`. If
+        omitted, the dtype of `a` is used. Passing float64 for a
+        float32 input reads the input and writes the result in
+        float32, but keeps the partial sums of every level in float64
+        so each output is rounded to float32 only once. This is not
+        faster than a float64 transform for large images (at
+        :math:`N = 2048` it runs at about the same speed), since the
+        float64 level buffers dominate the memory traffic.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of the result. If omitted, a new array is
+        allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("adrt", a.shape)` elements (see
+        :func:`adrt.core.workspace_size`). If omitted, temporary space
+        is allocated internally.
+        When `accumulate` widens a float32 input, it must instead be
+        float64 with at least
+        :pycode:`workspace_size("adrt", a.shape, accumulate=np.float64)`
+        elements.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
 
     Returns
     -------
     numpy.ndarray of float
         The ADRT of the provided data. For input images of size ``N``,
-        each member of the batch will have shape ``(4, 2*N-1, N)``.
+        each member of the batch will have shape ``(4, 2*N-1, N)``. If
+        `out` was provided, it is returned.
 
     Notes
     -----
@@ -157,7 +287,15 @@ def adrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     :ref:`adrt-description` and refer to the source papers [#brady98]_
     [#press06]_.
     """
-    return _adrt_cdefs.adrt(_normalize_array(a))
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    wide = _resolve_accumulate(a, accumulate)
+    if wide and isinstance(workspace, np.ndarray) and workspace.dtype != np.float64:
+        raise TypeError(
+            f"workspace must have dtype float64 to accumulate in float64, but got "
+            f"{workspace.dtype}"
+        )
+    return _adrt_cdefs.adrt(a, out, workspace, _resolve_threads(threads), wide)
 
 
 @_set_module("adrt.core")
@@ -200,16 +338,26 @@ def adrt_step(a: npt.NDArray[F], /, step: typing.SupportsIndex) -> npt.NDArray[F
     are not interested in the intermediate steps, use the more
     efficient :func:`adrt.adrt`.
     """
-    return _adrt_cdefs.adrt_step(_normalize_array(a), operator.index(step))
+    return _adrt_cdefs.adrt_step(
+        _normalize_array(a), operator.index(step), _resolve_threads(None)
+    )
 
 
 @_set_module("adrt")
-def iadrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
+def iadrt(
+    a: npt.NDArray[F],
+    /,
+    *,
+    accumulate: npt.DTypeLike = None,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[F]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
     r"""An exact inverse to the ADRT.
 
     Computes an exact inverse to the ADRT, but only works for exact
-    ADRT outputs. The array `a` may have an optional batch dimension
-    with the shape of an ADRT output.
+    ADRT outputs. The array `a` must have the shape of an ADRT output,
+    optionally with leading batch dimensions.
 
     The returned array has the same shape as `a`, but each quadrant
     should have only zeros below the square at the top of the array.
@@ -223,11 +371,37 @@ def iadrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     ----------
     a : numpy.ndarray of float
         An ADRT output for which to compute the inverse.
+    accumulate : numpy.dtype, optional
+        Floating point type in which to form the differences and
+        running sums of each level. Must be float32 or float64 and
+        at least as wide as the dtype of `a`. If omitted, the dtype of
+        `a` is used. Passing float64 for a float32 input keeps float32
+        storage for the result and workspace, but rounds each
+        intermediate only once per level.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of the result. If omitted, a new array is
+        allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("iadrt", a.shape)` elements (see
+        :func:`adrt.core.workspace_size`). If omitted, temporary space
+        is allocated internally.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
 
     Returns
     -------
     numpy.ndarray of float
-        The computed inverse with the same shape as `a`.
+        The computed inverse with the same shape as `a`. If `out` was
+        provided, it is returned.
 
     Warning
     -------
@@ -236,6 +410,11 @@ def iadrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     provides sufficient precision. In other cases this inverse is not
     appropriate.
 
+    Setting `accumulate` to float64 for a float32 input brings the
+    result much closer to the inverse computed entirely in float64,
+    but it cannot repair the conditioning: if `a` is not an exact
+    ADRT output, even the float64 inverse is inaccurate.
+
     For an alternative, see the :doc:`examples.cginverse` example.
 
     Notes
@@ -243,11 +422,22 @@ def iadrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     For details of the algorithm see :ref:`iadrt-description` or the
     source paper [#rim20]_.
     """
-    return _adrt_cdefs.iadrt(_normalize_array(a))
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    wide = _resolve_accumulate(a, accumulate)
+    return _adrt_cdefs.iadrt(a, out, workspace, _resolve_threads(threads), wide)
 
 
 @_set_module("adrt")
-def bdrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
+def bdrt(
+    a: npt.NDArray[F],
+    /,
+    *,
+    accumulate: npt.DTypeLike = None,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[np.floating[typing.Any]]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
     r"""Backprojection operator for the ADRT.
 
     The transform implemented in :func:`adrt` is a linear operation.
@@ -259,17 +449,52 @@ def bdrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     this function. The truncation operation will remove the extended
     entries and rotate each quadrant into the same orientation as the
     original, square shape ADRT input. The quadrants can then be
-    combined, if desired, potentially by :func:`numpy.mean`.
+    combined, if desired, potentially by :func:`numpy.mean`. The
+    routine :func:`adrt.core.adrt_adjoint` computes the same result
+    without the intermediate arrays.
 
     Parameters
     ----------
     a : numpy.ndarray of float
         An ADRT output array to backproject.
+    accumulate : numpy.dtype, optional
+        Floating point type of the intermediate sums. Must be float32
+        or float64 and at least as wide as the dtype of `a`. If
+        omitted, the dtype of `a` is used. Passing float64 for a
+        float32 input reads the input and writes the result in
+        float32, but keeps the partial sums of every level in float64
+        so each output is rounded to float32 only once. This is not
+        faster than a float64 transform for large images (at
+        :math:`N = 2048` it runs at about the same speed), since the
+        float64 level buffers dominate the memory traffic.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of the result. If omitted, a new array is
+        allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("bdrt", a.shape)` elements (see
+        :func:`adrt.core.workspace_size`). If omitted, temporary space
+        is allocated internally.
+        When `accumulate` widens a float32 input, it must instead be
+        float64 with at least
+        :pycode:`workspace_size("bdrt", a.shape, accumulate=np.float64)`
+        elements.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
 
     Returns
     -------
     numpy.ndarray of float
-        Backprojection of `a` with the same shape.
+        Backprojection of `a` with the same shape. If `out` was
+        provided, it is returned.
 
     Notes
     -----
@@ -282,9 +507,347 @@ def bdrt(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     transpose of the operator applied by :func:`adrt` as follows::
 
       def adrt_tranpose(a):
-          return adrt.utils.truncate(adrt.bdrt(a)).mean(axis=-3)
+          return adrt.utils.truncate(adrt.bdrt(a)).sum(axis=-3)
+
+    This is equivalent to :pycode:`adrt.core.adrt_adjoint(a)`.
+    """
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    wide = _resolve_accumulate(a, accumulate)
+    if wide and isinstance(workspace, np.ndarray) and workspace.dtype != np.float64:
+        raise TypeError(
+            f"workspace must have dtype float64 to accumulate in float64, but got "
+            f"{workspace.dtype}"
+        )
+    return _adrt_cdefs.bdrt(a, out, workspace, _resolve_threads(threads), wide)
+
+
+@_set_module("adrt.core")
+def adrt_adjoint(
+    a: npt.NDArray[F],
+    /,
+    *,
+    per_quadrant: bool = False,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[F]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
+    r"""Transpose of the ADRT.
+
+    This computes the exact transpose (adjoint) of the linear operator
+    applied by :func:`adrt.adrt`, mapping an ADRT output back to square
+    images. The result is the same as
+    :pycode:`adrt.utils.truncate(adrt.bdrt(a)).sum(axis=-3)`, but it is
+    computed directly. The lower half of each quadrant produced by
+    :func:`adrt.bdrt` is never copied out and the quadrants are
+    rotated and combined in a single pass, so no intermediate arrays
+    are allocated.
+
+    The input may include any number of leading batch dimensions,
+    which are preserved in the output.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        An ADRT output array to transform.
+    per_quadrant : bool, optional
+        If true, keep the contribution of each quadrant separate
+        rather than summing them. The result then matches
+        :pycode:`adrt.utils.truncate(adrt.bdrt(a))`.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of the result. If omitted, a new array is
+        allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("adrt_adjoint", a.shape)` elements (see
+        :func:`adrt.core.workspace_size`). If omitted, temporary space
+        is allocated internally.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The transpose of the ADRT applied to `a`. For an input of shape
+        :pycode:`(..., 4, 2*N-1, N)` the result has shape
+        :pycode:`(..., N, N)`, or :pycode:`(..., 4, N, N)` if
+        `per_quadrant` is set. If `out` was provided, it is returned.
+
+    Examples
+    --------
+    The result satisfies the defining property of the transpose:
+
+    >>> rng = np.random.default_rng(seed=0)
+    >>> x = rng.normal(size=(16, 16))
+    >>> y = rng.normal(size=(4, 31, 16))
+    >>> lhs = np.vdot(adrt.adrt(x), y)
+    >>> rhs = np.vdot(x, adrt.core.adrt_adjoint(y))
+    >>> bool(np.isclose(lhs, rhs))
+    True
+    """
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    return _adrt_cdefs.adrt_adjoint(
+        a, bool(per_quadrant), out, workspace, _resolve_threads(threads)
+    )
+
+
+@_set_module("adrt.core")
+def adrt_normal(
+    a: npt.NDArray[F],
+    /,
+    *,
+    ridge: float = 0.0,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[F]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
+    r"""Normal operator of the ADRT.
+
+    For the matrix :math:`A` of the linear operator applied by
+    :func:`adrt.adrt` this computes :math:`(A^{T}A + \lambda I)x` for
+    square input images :math:`x`, where :math:`\lambda` is the `ridge`
+    parameter. This is the operator applied by iterative solvers for
+    the normal equations, such as the conjugate gradient method (see
+    :ref:`inverse page`).
+
+    The result is the same as
+    :pycode:`adrt.core.adrt_adjoint(adrt.adrt(a)) + ridge * a`, but
+    both transforms run in a single call which shares one workspace
+    and allocates no intermediate arrays.
+
+    The input may include any number of leading batch dimensions,
+    which are preserved in the output.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        The square images to transform. Their sides must be a power of
+        two.
+    ridge : float, optional
+        The coefficient :math:`\lambda` of the identity term. If zero,
+        the default, only :math:`A^{T}A` is applied.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of `a`. If omitted, a new array is allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("adrt_normal", a.shape)` elements (see
+        :func:`adrt.core.workspace_size`). If omitted, temporary space
+        is allocated internally.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The normal operator applied to `a`, with the same shape. If
+        `out` was provided, it is returned.
+
+    Examples
+    --------
+    In an iterative solver, preallocate the output and workspace once
+    and reuse them on each iteration::
+
+      out = np.empty_like(x)
+      ws = np.empty(adrt.core.workspace_size("adrt_normal", x.shape), dtype=x.dtype)
+      for _ in range(num_steps):
+          ax = adrt.core.adrt_normal(x, ridge=lam, out=out, workspace=ws)
+          ...
+    """
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    return _adrt_cdefs.adrt_normal(
+        a, float(ridge), out, workspace, _resolve_threads(threads)
+    )
+
+
+@_set_module("adrt.core")
+def iadrt_fmg_step(
+    a: npt.NDArray[F],
+    /,
+    *,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[F]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
+    r"""Compute an estimated inverse by the full multigrid method.
+
+    This is an implementation of the "FMG" inverse described by Press
+    [1]_. A call to this function on an output of the :func:`ADRT
+    <adrt.adrt>` produces an estimated inverse which can be
+    iteratively refined by adding corrections for remaining errors.
+
+    For easy access to iteratively-improved inverses produced by this
+    method, consider :func:`iadrt_fmg_iter` which internally
+    performs the required recurrence.
+
+    For another inverse which may perform more reliably for certain
+    inputs consider :func:`adrt.iadrt_cg`.
+
+    The whole hierarchy of restrictions and corrections is computed
+    natively in a single call. All intermediate levels are stored in
+    one workspace so no arrays are allocated per level. The input may
+    include any number of leading batch dimensions, which are
+    preserved in the output.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        The array for which an estimated inverse is computed. This
+        array must have the shape of an ADRT output.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of the result. If omitted, a new array is
+        allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("iadrt_fmg_step", a.shape)` elements
+        (see :func:`adrt.core.workspace_size`). If omitted, temporary
+        space is allocated internally.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
+
+    Returns
+    -------
+    numpy.ndarray of float
+        An estimated inverse computed by the full multigrid method for
+        the input `a`. For an input of shape :pycode:`(..., 4, 2*N-1, N)`
+        the result has shape :pycode:`(..., N, N)`. If `out` was
+        provided, it is returned.
+
+    References
+    ----------
+    .. [1] W. Press, "Discrete Radon transform has an exact, fast
+      inverse and generalizes to operations other than sums along
+      lines," Proceedings of the National Academy of Sciences, 2006.
+      `doi:10.1073/pnas.0609228103
+      <https://doi.org/10.1073/pnas.0609228103>`_
+
+    Examples
+    --------
+    For an input array ``after_adrt``
+
+    >>> rng = np.random.default_rng(seed=0)
+    >>> orig = rng.normal(size=(16, 16))
+    >>> after_adrt = adrt.adrt(orig)
+
+    we can compute an estimated inverse
+
+    >>> est_inv = adrt.core.iadrt_fmg_step(after_adrt)
+
+    and iteratively refine it by repeating the below
+
+    >>> err = after_adrt - adrt.adrt(est_inv)
+    >>> est_inv += adrt.core.iadrt_fmg_step(err)
+    """
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    return _adrt_cdefs.iadrt_fmg_step(a, out, workspace, _resolve_threads(threads))
+
+
+@_set_module("adrt.core")
+def fmg_precondition(
+    a: npt.NDArray[F],
+    /,
+    *,
+    out: typing.Optional[npt.NDArray[F]] = None,
+    workspace: typing.Optional[npt.NDArray[F]] = None,
+    threads: typing.Optional[typing.SupportsIndex] = None,
+) -> npt.NDArray[F]:
+    r"""Multilevel preconditioner for the ADRT normal equations.
+
+    This applies a symmetric positive definite approximation to the
+    inverse of the normal operator :math:`A^{T}A` applied by
+    :func:`adrt.core.adrt_normal`. It is built from the smoothing
+    kernel underlying the high-pass filter of the full multigrid
+    inverse (see :func:`adrt.core.iadrt_fmg_step`), applied at every
+    scale of the image in the same way as the multigrid levels. Use it
+    with :func:`adrt.iadrt_cg` through that function's `precondition`
+    argument.
+
+    For an image :math:`x` of size :math:`N` the result is
+
+    .. math::
+      x - \sum_{k=1}^{\log_2 N} 2^{-k} G_k x
+
+    where :math:`G_k` repeatedly applies the separable kernel
+    :math:`[1/4, 1/2, 1/4]` with its taps spaced
+    :math:`1, 2, \ldots, 2^{k-1}` pixels apart, reflecting the image
+    at its edges. Each term :math:`G_k` smooths at twice the scale of
+    the one before, so the sum weights each frequency band in
+    approximate proportion to its frequency, like the ramp filter of
+    filtered backprojection.
+
+    The input may include any number of leading batch dimensions,
+    which are preserved in the output.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        The square images to filter. Their sides must be a power of
+        two.
+    out : numpy.ndarray of float, optional
+        Array in which to store the result. It must be C-contiguous,
+        aligned, writeable, must not overlap `a`, and must have the
+        dtype and shape of `a`. If omitted, a new array is allocated.
+    workspace : numpy.ndarray of float, optional
+        Scratch space for intermediate values. It must be C-contiguous,
+        aligned, writeable, must not overlap `a` or `out`, must have
+        the same dtype as `a`, and must have at least
+        :pycode:`workspace_size("fmg_precondition", a.shape)` elements
+        (see :func:`adrt.core.workspace_size`). If omitted, temporary
+        space is allocated internally.
+    threads : int, optional
+        Maximum number of threads to use for this call. If omitted,
+        the limit from :func:`adrt.core.num_threads` or
+        :func:`adrt.core.set_num_threads` applies. This has no
+        effect if the package was built without multithreading
+        support (see :func:`adrt.core.threading_enabled`).
+
+    Returns
+    -------
+    numpy.ndarray of float
+        The preconditioner applied to `a`, with the same shape. If
+        `out` was provided, it is returned.
+
+    Examples
+    --------
+    The preconditioner is symmetric:
+
+    >>> rng = np.random.default_rng(seed=0)
+    >>> x = rng.normal(size=(16, 16))
+    >>> y = rng.normal(size=(16, 16))
+    >>> lhs = np.vdot(adrt.core.fmg_precondition(x), y)
+    >>> rhs = np.vdot(x, adrt.core.fmg_precondition(y))
+    >>> bool(np.isclose(lhs, rhs))
+    True
     """
-    return _adrt_cdefs.bdrt(_normalize_array(a))
+    a = _normalize_array(a, strided=True)
+    _check_no_overlap(a, out=out, workspace=workspace)
+    return _adrt_cdefs.fmg_precondition(a, out, workspace, _resolve_threads(threads))
 
 
 @_set_module("adrt.core")
@@ -323,11 +886,74 @@ def bdrt_step(a: npt.NDArray[F], /, step: typing.SupportsIndex) -> npt.NDArray[F
     interested in the intermediate steps, use the more efficient
     :func:`adrt.bdrt`.
     """
-    return _adrt_cdefs.bdrt_step(_normalize_array(a), operator.index(step))
+    return _adrt_cdefs.bdrt_step(
+        _normalize_array(a), operator.index(step), _resolve_threads(None)
+    )
+
+
+class _InterpToCartPlan(typing.NamedTuple):
+    heights: npt.NDArray[np.int16]
+    quadrants: npt.NDArray[np.int32]
+    slopes: npt.NDArray[np.int32]
+    factors32: npt.NDArray[np.float32]
+    factors64: npt.NDArray[np.float64]
+
+
+@functools.lru_cache(maxsize=4)
+def _interp_to_cart_plan(n: int, /) -> _InterpToCartPlan:
+    plan = _InterpToCartPlan(
+        heights=np.empty((n, 4 * n), dtype=np.int16),
+        quadrants=np.empty(4 * n, dtype=np.int32),
+        slopes=np.empty(4 * n, dtype=np.int32),
+        factors32=np.empty(4 * n, dtype=np.float32),
+        factors64=np.empty(4 * n, dtype=np.float64),
+    )
+    _adrt_cdefs.interp_to_cart_plan(n, *plan)
+    for table in plan:
+        # Tables are shared between calls, protect them from modification
+        table.flags.writeable = False
+    return plan
+
+
+def _cart_grid(
+    coords: typing.Union[typing.SupportsIndex, npt.ArrayLike, None],
+    default: int,
+    start: float,
+    stop: float,
+    name: str,
+    /,
+) -> npt.NDArray[np.float64]:
+    if coords is None:
+        coords = default
+    if np.ndim(typing.cast(npt.ArrayLike, coords)) == 0:
+        # A count of evenly-spaced cell centers from start to stop
+        try:
+            num = operator.index(typing.cast(typing.SupportsIndex, coords))
+        except TypeError:
+            raise TypeError(
+                f"{name} must be an integer count or an array of coordinates"
+            ) from None
+        if num < 1:
+            raise ValueError(f"{name} count must be positive, but was {num}")
+        grid, step = np.linspace(
+            start, stop, num=num, endpoint=False, retstep=True, dtype=np.float64
+        )
+        return grid + step / 2
+    grid = np.ascontiguousarray(coords, dtype=np.float64)
+    if grid.ndim != 1 or grid.size == 0:
+        raise ValueError(f"{name} must be a non-empty one dimensional array")
+    return grid
 
 
 @_set_module("adrt.utils")
-def interp_to_cart(a: npt.NDArray[F], /) -> npt.NDArray[F]:
+def interp_to_cart(
+    a: npt.NDArray[F],
+    /,
+    *,
+    theta: typing.Union[typing.SupportsIndex, npt.ArrayLike, None] = None,
+    t: typing.Union[typing.SupportsIndex, npt.ArrayLike, None] = None,
+    order: typing.SupportsIndex = 0,
+) -> npt.NDArray[F]:
     r"""Interpolate an ADRT output into a regular Cartesian grid.
 
     The angles and offsets used in an ADRT output are irregularly-spaced to
@@ -340,12 +966,32 @@ def interp_to_cart(a: npt.NDArray[F], /) -> npt.NDArray[F]:
     coordinate transformation, a nearest neighbor interpolation is performed.
 
     For an ADRT output of size ``N``, the interpolated array has shape
-    ``(N, 4*N)`` with an optional batch dimension preserved.
+    ``(N, 4*N)`` with any leading batch dimensions preserved.
+
+    The output grid can be chosen with `theta` and `t`. Each is either a
+    count of evenly spaced cell centers spanning the default range
+    (:math:`-\pi/2` through :math:`\pi/2` for `theta`, and
+    :math:`1/\sqrt{2}` down to :math:`-1/\sqrt{2}` for `t`), or an array
+    of explicit coordinates in the convention of
+    :func:`coord_cart_to_adrt`. The result then has shape
+    ``(len(t), len(theta))``, again with batch dimensions preserved.
 
     Parameters
     ----------
     a : numpy.ndarray of float
         ADRT output array to interpolate.
+    theta : int or numpy.ndarray of float, optional
+        Number of angles in the output grid, or the angles themselves
+        in radians. Defaults to ``4*N``.
+    t : int or numpy.ndarray of float, optional
+        Number of offsets in the output grid, or the offsets
+        themselves. Defaults to ``N``.
+    order : int, optional
+        Interpolation order. With ``0`` (default) each output is the
+        nearest ADRT entry as found by :func:`coord_cart_to_adrt`. With
+        ``1`` each output is interpolated linearly between the two
+        nearest ADRT slopes, and for each of these, linearly between the
+        two nearest heights.
 
     Returns
     -------
@@ -357,8 +1003,244 @@ def interp_to_cart(a: npt.NDArray[F], /) -> npt.NDArray[F]:
 
     See the :doc:`coordinate transform section <examples.coordinate>` for more
     details on the coordinate transform.
+
+    With the default grid and ``order=0``, the source location of each
+    output entry depends only on the size ``N``. These locations are
+    computed once and cached for the most recently used sizes so that
+    repeated calls, for example on each iterate of a solver, perform only
+    a gather and a multiplication. The cached tables take two bytes per
+    output entry and are only used for ``N`` up to 16384. The cache is
+    keyed on ``N`` alone: calls passing `theta`, `t`, or ``order=1``
+    are not cached and compute their coordinates directly on each call,
+    in parallel.
+    """
+    order = operator.index(order)
+    if order not in {0, 1}:
+        raise ValueError(f"interpolation order must be 0 or 1, but was {order}")
+    a = _normalize_array(a)
+    if theta is not None or t is not None or order != 0:
+        n = a.shape[-1] if a.ndim > 0 else 1
+        return _adrt_cdefs.interp_to_cart_coords(
+            a,
+            _cart_grid(theta, 4 * n, -np.pi / 2, np.pi / 2, "theta"),
+            _cart_grid(t, n, np.sqrt(2) / 2, -np.sqrt(2) / 2, "t"),
+            order,
+            _resolve_threads(None),
+        )
+    if a.ndim < 3 or a.shape[-1] < 2 or a.shape[-1] & (a.shape[-1] - 1):
+        # Let the native routine report invalid shapes
+        return _adrt_cdefs.interp_to_cart(a, _resolve_threads(None))
+    if 2 * a.shape[-1] - 1 > np.iinfo(np.int16).max:
+        # Source rows do not fit in the plan tables
+        return _adrt_cdefs.interp_to_cart(a, _resolve_threads(None))
+    plan = _interp_to_cart_plan(a.shape[-1])
+    factors = plan.factors64 if a.dtype == np.float64 else plan.factors32
+    return _adrt_cdefs.interp_to_cart(
+        a,
+        _resolve_threads(None),
+        plan.heights,
+        plan.quadrants,
+        plan.slopes,
+        factors,
+    )
+
+
+@_set_module("adrt.utils")
+def interp_to_cart_adjoint(
+    a: npt.NDArray[F],
+    /,
+    *,
+    n: typing.Optional[typing.SupportsIndex] = None,
+    theta: typing.Union[typing.SupportsIndex, npt.ArrayLike, None] = None,
+    t: typing.Union[typing.SupportsIndex, npt.ArrayLike, None] = None,
+    order: typing.SupportsIndex = 0,
+) -> npt.NDArray[F]:
+    r"""Transpose of :func:`interp_to_cart`.
+
+    Each value of a Cartesian sinogram is scattered back to the ADRT
+    entries it would be read from by :func:`interp_to_cart`, with the
+    same scaling factors and interpolation weights. Together the two
+    routines allow solvers working with uniformly sampled sinograms to
+    run entirely in native code.
+
+    The arguments `theta`, `t`, and `order` describe the Cartesian grid
+    and have the same meaning as for :func:`interp_to_cart`. The result
+    has shape ``(4, 2*n-1, n)`` with any leading batch dimensions of `a`
+    preserved.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        Cartesian grid data of shape ``(len(t), len(theta))``.
+    n : int, optional
+        Size of the ADRT domain. Inferred from the shape of `a` unless
+        both `theta` and `t` are given explicitly.
+    theta : int or numpy.ndarray of float, optional
+        Number of angles in the grid, or the angles themselves in
+        radians. Defaults to ``4*n``.
+    t : int or numpy.ndarray of float, optional
+        Number of offsets in the grid, or the offsets themselves.
+        Defaults to ``n``.
+    order : int, optional
+        Interpolation order, either ``0`` (default) or ``1``.
+
+    Returns
+    -------
+    numpy.ndarray of float
+        Data scattered into the ADRT domain.
+
+    Notes
+    -----
+    Entries of the ADRT are accumulated without atomic operations: the
+    angles of the grid are binned by the ADRT column they read from, and
+    each column is processed by a single thread.
+    """
+    order = operator.index(order)
+    if order not in {0, 1}:
+        raise ValueError(f"interpolation order must be 0 or 1, but was {order}")
+    a = _normalize_array(a)
+    if n is not None:
+        n = operator.index(n)
+    elif t is None and a.ndim >= 2:
+        n = a.shape[-2]
+    elif theta is None and a.ndim >= 2:
+        n = a.shape[-1] // 4
+    else:
+        raise ValueError("n must be given when both theta and t are explicit")
+    if theta is not None or t is not None or order != 0:
+        return _adrt_cdefs.interp_to_cart_coords_adjoint(
+            a,
+            n,
+            _cart_grid(theta, 4 * n, -np.pi / 2, np.pi / 2, "theta"),
+            _cart_grid(t, n, np.sqrt(2) / 2, -np.sqrt(2) / 2, "t"),
+            order,
+            _resolve_threads(None),
+        )
+    if a.ndim < 2 or n != a.shape[-2]:
+        raise ValueError(
+            f"array of shape {a.shape} does not match the default grid for size {n}"
+        )
+    if n < 2 or n & (n - 1):
+        raise ValueError(f"invalid Radon domain size {n}, must be a power of two")
+    if 2 * n - 1 > np.iinfo(np.int16).max:
+        # Source rows do not fit in the plan tables, use the coordinate path
+        return _adrt_cdefs.interp_to_cart_coords_adjoint(
+            a,
+            n,
+            _cart_grid(None, 4 * n, -np.pi / 2, np.pi / 2, "theta"),
+            _cart_grid(None, n, np.sqrt(2) / 2, -np.sqrt(2) / 2, "t"),
+            0,
+            _resolve_threads(None),
+        )
+    plan = _interp_to_cart_plan(n)
+    return _adrt_cdefs.interp_to_cart_adjoint(
+        a,
+        plan.heights,
+        plan.quadrants,
+        plan.slopes,
+        plan.factors64 if a.dtype == np.float64 else plan.factors32,
+        _resolve_threads(None),
+    )
+
+
+def _coord_cart_to_adrt(
+    theta: npt.NDArray[np.floating[typing.Any]],
+    t: npt.NDArray[np.floating[typing.Any]],
+    n: int,
+    /,
+) -> tuple[
+    npt.NDArray[np.uint8],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.uint64],
+    npt.NDArray[np.float64],
+]:
+    # Callers check n and the shapes, here only flatten for the native routine
+    quadrant = np.empty(theta.shape, dtype=np.uint8)
+    height = np.empty(theta.shape, dtype=np.int64)
+    slope = np.empty(theta.shape, dtype=np.uint64)
+    factor = np.empty(theta.shape, dtype=np.float64)
+    if theta.size > 0:
+        _adrt_cdefs.coord_cart_to_adrt(
+            np.asarray(theta, dtype=np.float64, order="C").reshape(-1),
+            np.asarray(t, dtype=np.float64, order="C").reshape(-1),
+            n,
+            quadrant.reshape(-1),
+            height.reshape(-1),
+            slope.reshape(-1),
+            factor.reshape(-1),
+            _resolve_threads(None),
+        )
+    return quadrant, height, slope, factor
+
+
+@_set_module("adrt.utils")
+def sample_adrt(
+    a: npt.NDArray[F],
+    theta: npt.ArrayLike,
+    t: npt.ArrayLike,
+    /,
+    *,
+    order: typing.SupportsIndex = 0,
+) -> npt.NDArray[F]:
+    r"""Sample an ADRT output at continuous Radon coordinates.
+
+    For each point :math:`(\theta, t)` the closest ADRT entry is found
+    as in :func:`coord_cart_to_adrt`, and its value is read and scaled by
+    the corresponding factor. This is the same as indexing `a` with the
+    output of :func:`coord_cart_to_adrt`, but runs in a single native
+    pass without building the intermediate index arrays.
+
+    With ``order=1`` the two ADRT entries with heights bracketing the
+    continuous offset are combined with linear weights, matching the
+    bilinear mode of :func:`interp_to_cart`.
+
+    Parameters
+    ----------
+    a : numpy.ndarray of float
+        An array of shape ``(4, 2*n-1, n)``, the output of :func:`adrt.adrt`,
+        with optional leading batch dimensions.
+    theta : array_like of float
+        Angle :math:`\theta` coordinates in radians.
+    t : array_like of float
+        Offset :math:`t` coordinates, normalized as in
+        :func:`coord_cart_to_adrt`. Broadcast together with `theta`.
+    order : int, optional
+        Interpolation order along the offset, either ``0`` (default) for
+        the closest entry or ``1`` for linear interpolation.
+
+    Returns
+    -------
+    numpy.ndarray of float
+        Sampled values. The shape is the batch dimensions of `a` followed
+        by the broadcast shape of `theta` and `t`.
+
+    Notes
+    -----
+    Coordinates must be finite. Points whose closest height lies outside
+    the ADRT output produce zero.
     """
-    return _adrt_cdefs.interp_to_cart(_normalize_array(a))
+    order = operator.index(order)
+    if order not in {0, 1}:
+        raise ValueError(f"interpolation order must be 0 or 1, but was {order}")
+    a = _normalize_array(a)
+    theta_arr, t_arr = np.broadcast_arrays(
+        np.asarray(theta, dtype=np.float64), np.asarray(t, dtype=np.float64)
+    )
+    point_shape: tuple[int, ...] = theta_arr.shape
+    if theta_arr.size == 0:
+        # Validate the array with a single point, then drop it
+        theta_arr = t_arr = np.zeros(1, dtype=np.float64)
+    values = _adrt_cdefs.sample_adrt(
+        a,
+        np.ascontiguousarray(theta_arr).reshape(-1),
+        np.ascontiguousarray(t_arr).reshape(-1),
+        order,
+        _resolve_threads(None),
+    )
+    batch_shape: tuple[int, ...] = values.shape[:-1]
+    if 0 in point_shape:
+        values = values[..., :0]
+    return values.reshape((*batch_shape, *point_shape))
 
 
 @_set_module("adrt.core")
@@ -386,6 +1268,324 @@ def num_iters(n: typing.SupportsIndex, /) -> int:
     return _adrt_cdefs.num_iters(operator.index(n))
 
 
+@_set_module("adrt.core")
+def set_radix(radix: typing.SupportsIndex, /) -> None:
+    r"""Select how many levels the iterative transforms merge per pass.
+
+    The transforms :func:`adrt.adrt` and :func:`adrt.bdrt` proceed
+    through :func:`num_iters` levels, each of which reads and writes
+    an entire working buffer. With radix 4 (the default), two levels
+    are merged into each pass over the buffer, halving the memory
+    traffic for large inputs. Radix 2 computes one level per pass.
+    Both produce identical results.
+
+    This setting is global and affects all subsequent calls.
+
+    Parameters
+    ----------
+    radix : int
+        Either ``2`` or ``4``.
+    """
+    _adrt_cdefs.set_radix(operator.index(radix))
+
+
+@_set_module("adrt.core")
+def get_radix() -> int:
+    r"""Report the radix currently used by the iterative transforms.
+
+    Returns
+    -------
+    int
+        The value last passed to :func:`set_radix`, ``4`` by default.
+    """
+    return _adrt_cdefs.get_radix()
+
+
+@_set_module("adrt.core")
+def workspace_size(
+    op: str,
+    shape: typing.Sequence[typing.SupportsIndex],
+    *,
+    accumulate: npt.DTypeLike = None,
+) -> int:
+    r"""Number of elements needed for a transform's workspace buffer.
+
+    The routines :func:`adrt.adrt`, :func:`adrt.bdrt`,
+    :func:`adrt.iadrt`, :func:`adrt.core.adrt_adjoint`,
+    :func:`adrt.core.adrt_normal`, :func:`adrt.core.iadrt_fmg_step`,
+    and :func:`adrt.core.fmg_precondition` use temporary space for
+    their intermediate values. By default this is allocated on each
+    call, but a buffer can be provided through their ``workspace``
+    arguments. This function computes the
+    minimum number of elements such a buffer must have.
+
+    Parameters
+    ----------
+    op : str
+        The name of the transform: one of ``"adrt"``, ``"bdrt"``,
+        ``"iadrt"``, ``"adrt_adjoint"``, ``"adrt_normal"``,
+        ``"iadrt_fmg_step"``, or ``"fmg_precondition"``.
+    shape : tuple of int
+        The shape of the input array which will be passed to the
+        transform.
+    accumulate : numpy.dtype, optional
+        The ``accumulate`` argument which will be passed to the
+        transform. Only ``"adrt"``, ``"bdrt"``, and ``"iadrt"`` accept
+        it. With float64, the result is the size of the float64
+        workspace used when a float32 input is widened, which is also
+        sufficient for a float64 input.
+
+    Returns
+    -------
+    int
+        The number of elements required in the workspace buffer.
+
+    Examples
+    --------
+    To run repeated transforms without allocating, preallocate both
+    the output and the workspace::
+
+      out = np.empty((4, 2 * n - 1, n), dtype=np.float32)
+      ws = np.empty(adrt.core.workspace_size("adrt", (n, n)), dtype=np.float32)
+      for img in images:
+          adrt.adrt(img, out=out, workspace=ws)
+    """
+    if not isinstance(op, str):
+        raise TypeError(f"op must be a str, but got {_format_object_type(op)}")
+    size = _adrt_cdefs.workspace_size(op, tuple(operator.index(s) for s in shape))
+    if accumulate is None:
+        return size
+    if op not in {"adrt", "bdrt", "iadrt"}:
+        raise ValueError(f"operation {op} does not take an accumulate argument")
+    acc_dtype = np.dtype(accumulate)
+    if acc_dtype not in (np.float32, np.float64):
+        raise TypeError(f"unsupported accumulation dtype {acc_dtype}")
+    # The wide forward transforms keep their float64 levels in twice the space
+    if acc_dtype == np.float64 and op != "iadrt":
+        return 2 * size
+    return size
+
+
+@_set_module("adrt.core")
+class TransformPlan:
+    r"""A transform specialized to a fixed input shape and dtype.
+
+    A plan validates its shape and dtype once and owns a persistent
+    workspace buffer, so repeated calls on inputs of the same shape
+    avoid most per-call overhead. This is useful when computing many
+    small transforms, where this overhead can exceed the cost of the
+    transform itself.
+
+    Plans are usually created with :func:`plan_adrt`,
+    :func:`plan_bdrt`, or :func:`plan_iadrt`. They can be pickled;
+    unpickling a plan allocates a new workspace.
+
+    Parameters
+    ----------
+    op : str
+        The name of the transform: one of ``"adrt"``, ``"bdrt"``, or
+        ``"iadrt"``.
+    shape : tuple of int
+        The shape of the inputs to the transform, including any batch
+        dimensions.
+    dtype : numpy.dtype
+        The data type of the inputs, either :obj:`float32
+        <numpy.float32>` or :obj:`float64 <numpy.float64>`.
+
+    Warning
+    -------
+    Calls to a plan share its workspace. A single plan must not be
+    called concurrently from multiple threads. Create a separate plan
+    for each thread instead.
+    """
+
+    __slots__ = ("_dtype", "_func", "_op", "_out_shape", "_shape", "_workspace")
+
+    def __init__(
+        self,
+        op: str,
+        shape: typing.Sequence[typing.SupportsIndex],
+        dtype: npt.DTypeLike,
+    ) -> None:
+        funcs = {
+            "adrt": _adrt_cdefs.adrt,
+            "bdrt": _adrt_cdefs.bdrt,
+            "iadrt": _adrt_cdefs.iadrt,
+        }
+        if not isinstance(op, str):
+            raise TypeError(f"op must be a str, but got {_format_object_type(op)}")
+        if op not in funcs:
+            raise ValueError(
+                f"unknown operation {op!r}, must be one of 'adrt', 'bdrt', or 'iadrt'"
+            )
+        in_shape = tuple(operator.index(s) for s in shape)
+        in_dtype = np.dtype(dtype).newbyteorder("=")
+        if in_dtype not in (np.float32, np.float64):
+            raise TypeError(f"unsupported array dtype {in_dtype}")
+        # Validates the shape
+        ws_size = workspace_size(op, in_shape)
+        if op == "adrt":
+            n = in_shape[-1]
+            out_shape = (*in_shape[:-2], 4, 2 * n - 1, n)
+        else:
+            out_shape = in_shape
+        self._op = op
+        self._func = funcs[op]
+        self._shape = in_shape
+        self._dtype = in_dtype
+        self._out_shape = out_shape
+        self._workspace = np.empty(ws_size, dtype=in_dtype)
+
+    @property
+    def op(self) -> str:
+        r"""The name of the transform computed by this plan."""
+        return self._op
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        r"""The input shape accepted by this plan."""
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype[typing.Any]:
+        r"""The input data type accepted by this plan."""
+        return self._dtype
+
+    @property
+    def out_shape(self) -> tuple[int, ...]:
+        r"""The shape of arrays produced by this plan."""
+        return self._out_shape
+
+    def __call__(
+        self,
+        a: npt.NDArray[F],
+        /,
+        *,
+        out: typing.Optional[npt.NDArray[F]] = None,
+        threads: typing.Optional[typing.SupportsIndex] = None,
+    ) -> npt.NDArray[F]:
+        r"""Apply the planned transform to `a`.
+
+        Parameters
+        ----------
+        a : numpy.ndarray of float
+            The input array. It must have the shape and dtype of this
+            plan.
+        out : numpy.ndarray of float, optional
+            Array in which to store the result, subject to the same
+            requirements as the ``out`` argument of the planned
+            transform.
+        threads : int, optional
+            Maximum number of threads to use for this call, as for the
+            ``threads`` argument of the planned transform.
+
+        Returns
+        -------
+        numpy.ndarray of float
+            The transform of `a`. If `out` was provided, it is
+            returned.
+        """
+        if not (
+            type(a) is np.ndarray
+            and a.shape == self._shape
+            and a.dtype == self._dtype
+            and a.flags.c_contiguous
+            and a.flags.aligned
+        ):
+            # Slow path: normalize the layout and check for a match
+            a = _normalize_array(a, strided=True)
+            if a.dtype != self._dtype:
+                raise TypeError(
+                    f"array must have dtype {self._dtype}, but had {a.dtype}"
+                )
+            if a.shape != self._shape:
+                raise ValueError(
+                    f"array must have shape {self._shape}, but had {a.shape}"
+                )
+        if out is not None:
+            _check_no_overlap(a, out=out)
+        return self._func(a, out, self._workspace, _resolve_threads(threads))
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # Rebuild from the arguments; the workspace is not preserved
+        return (type(self), (self._op, self._shape, self._dtype))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._op!r}, {self._shape}, {self._dtype})"
+
+
+@_set_module("adrt.core")
+def plan_adrt(
+    shape: typing.Sequence[typing.SupportsIndex], dtype: npt.DTypeLike
+) -> TransformPlan:
+    r"""Create a reusable plan for :func:`adrt.adrt`.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the input images, optionally with leading batch
+        dimensions. These must be square with sides a power of two.
+    dtype : numpy.dtype
+        The data type of the input, :obj:`float32 <numpy.float32>` or
+        :obj:`float64 <numpy.float64>`.
+
+    Returns
+    -------
+    TransformPlan
+        A callable plan computing the ADRT of arrays with the given
+        shape and dtype.
+    """
+    return TransformPlan("adrt", shape, dtype)
+
+
+@_set_module("adrt.core")
+def plan_bdrt(
+    shape: typing.Sequence[typing.SupportsIndex], dtype: npt.DTypeLike
+) -> TransformPlan:
+    r"""Create a reusable plan for :func:`adrt.bdrt`.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the ADRT output arrays to backproject, optionally
+        with leading batch dimensions.
+    dtype : numpy.dtype
+        The data type of the input, :obj:`float32 <numpy.float32>` or
+        :obj:`float64 <numpy.float64>`.
+
+    Returns
+    -------
+    TransformPlan
+        A callable plan computing the bdrt of arrays with the given
+        shape and dtype.
+    """
+    return TransformPlan("bdrt", shape, dtype)
+
+
+@_set_module("adrt.core")
+def plan_iadrt(
+    shape: typing.Sequence[typing.SupportsIndex], dtype: npt.DTypeLike
+) -> TransformPlan:
+    r"""Create a reusable plan for :func:`adrt.iadrt`.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the ADRT output arrays to invert, optionally with
+        leading batch dimensions.
+    dtype : numpy.dtype
+        The data type of the input, :obj:`float32 <numpy.float32>` or
+        :obj:`float64 <numpy.float64>`.
+
+    Returns
+    -------
+    TransformPlan
+        A callable plan computing the inverse ADRT of arrays with the
+        given shape and dtype.
+    """
+    return TransformPlan("iadrt", shape, dtype)
+
+
 @_set_module("adrt.core")
 def threading_enabled() -> bool:
     r"""Indicate whether core routines provide multithreading.
@@ -404,13 +1604,153 @@ def threading_enabled() -> bool:
     return _adrt_cdefs.OPENMP_ENABLED
 
 
+@_set_module("adrt.core")
+def set_num_threads(n: typing.Optional[typing.SupportsIndex], /) -> None:
+    r"""Set the number of threads used by the core routines.
+
+    This limit applies to all subsequent calls in the process, except
+    where overridden by :func:`num_threads` or by the ``threads``
+    argument of an individual routine. Each call only limits the
+    threads it starts itself, so calls made concurrently from several
+    Python threads may together use more threads than this limit.
+
+    Parameters
+    ----------
+    n : int or None
+        The maximum number of threads, at least ``1``. Passing
+        :pycode:`None` restores the default, which is determined by
+        OpenMP (for example from the ``OMP_NUM_THREADS`` environment
+        variable).
+
+    Notes
+    -----
+    If the package was built without multithreading support (see
+    :func:`threading_enabled`) the setting is recorded but has no
+    effect.
+    """
+    _adrt_cdefs.set_num_threads(None if n is None else operator.index(n))
+
+
+@_set_module("adrt.core")
+def get_num_threads() -> int:
+    r"""Report the number of threads the core routines will use.
+
+    Returns
+    -------
+    int
+        The thread limit from the innermost active :func:`num_threads`
+        context, if any, otherwise the value from
+        :func:`set_num_threads` or the OpenMP default. If the package
+        was built without multithreading support this is always ``1``.
+    """
+    override = _num_threads_override.get()
+    if override is not None and _adrt_cdefs.OPENMP_ENABLED:
+        return override
+    return _adrt_cdefs.get_num_threads()
+
+
+@_set_module("adrt.core")
+@contextlib.contextmanager
+def num_threads(n: typing.SupportsIndex, /) -> typing.Iterator[None]:
+    r"""Temporarily limit the number of threads used by the core routines.
+
+    Within the ``with`` block, routines called from the current thread
+    (or :mod:`asyncio` task) use at most `n` threads, unless they are
+    given an explicit ``threads`` argument. Other threads are not
+    affected, so each worker of a thread pool can limit its own calls.
+    Contexts may be nested; the innermost one applies.
+
+    Parameters
+    ----------
+    n : int
+        The maximum number of threads, at least ``1``.
+
+    Examples
+    --------
+    Run single-threaded transforms from each worker of a thread pool,
+    so that the workers do not each start a full set of threads::
+
+      def worker(img):
+          with adrt.core.num_threads(1):
+              return adrt.adrt(img)
+
+      with concurrent.futures.ThreadPoolExecutor() as pool:
+          results = list(pool.map(worker, images))
+    """
+    n = operator.index(n)
+    if n < 1:
+        raise ValueError(f"threads must be at least 1, but got {n}")
+    token = _num_threads_override.set(n)
+    try:
+        yield
+    finally:
+        _num_threads_override.reset(token)
+
+
+@_set_module("adrt.core")
+def kernel_variant() -> str:
+    r"""Report which instruction set variant of the core routines is active.
+
+    On x86-64 the most expensive native routines (including
+    :func:`adrt.adrt`, :func:`adrt.bdrt`, :func:`adrt.iadrt`, and
+    :func:`adrt.utils.interp_to_cart`) are compiled several times for
+    different instruction sets. The widest variant supported by the
+    running processor is selected once, when the package is imported.
+    All variants produce identical results.
+
+    Returns
+    -------
+    str
+        One of ``"avx512"``, ``"avx2"``, or ``"baseline"``. The
+        baseline variant is used on other architectures and when the
+        package was built without the additional variants.
+    """
+    return _adrt_cdefs.KERNEL_VARIANT
+
+
+@_set_module("adrt.core")
+def layout_copy_count() -> int:
+    r"""Count input arrays copied to a supported memory layout.
+
+    :func:`adrt.adrt`, :func:`adrt.bdrt`, and :func:`adrt.iadrt` read
+    their input directly using its strides, so sliced, transposed,
+    or Fortran-ordered arrays are not copied. Arrays which are
+    byteswapped, unaligned, or have negative strides are first copied
+    into a new C-contiguous array. Other routines copy any input which
+    is not C-contiguous. This function reports how many such copies
+    have been made, and can be used to check that inputs avoid them.
+
+    Returns
+    -------
+    int
+        The number of input arrays copied since the package was
+        imported, counting copies made from every thread.
+
+    Examples
+    --------
+    Compare the count before and after a call to check whether its
+    input was copied.
+
+    >>> img = np.ones((16, 32))[:, ::2]
+    >>> before = adrt.core.layout_copy_count()
+    >>> out = adrt.adrt(img)
+    >>> adrt.core.layout_copy_count() - before
+    0
+    """
+    return _layout_copies
+
+
 def _press_fmg_restriction(a: npt.NDArray[F], /) -> npt.NDArray[F]:
-    return _adrt_cdefs.press_fmg_restriction(_normalize_array(a))
+    return _adrt_cdefs.press_fmg_restriction(
+        _normalize_array(a), _resolve_threads(None)
+    )
 
 
 def _press_fmg_prolongation(a: npt.NDArray[F], /) -> npt.NDArray[F]:
-    return _adrt_cdefs.press_fmg_prolongation(_normalize_array(a))
+    return _adrt_cdefs.press_fmg_prolongation(
+        _normalize_array(a), _resolve_threads(None)
+    )
 
 
 def _press_fmg_highpass(a: npt.NDArray[F], /) -> npt.NDArray[F]:
-    return _adrt_cdefs.press_fmg_highpass(_normalize_array(a))
+    return _adrt_cdefs.press_fmg_highpass(_normalize_array(a), _resolve_threads(None))
@@ -35,6 +35,7 @@
 
 #include <array>
 #include <utility>
+#include <type_traits>
 #include <algorithm>
 #include <cassert>
 #include "adrt_cdefs_common.hpp"
@@ -49,18 +50,85 @@ namespace adrt {
     std::array<size_t, 4> adrt_result_shape(const std::array<size_t, 3> &shape);
     std::array<size_t, 4> adrt_step_result_shape(const std::array<size_t, 4> &shape);
 
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
     namespace _impl {
 
+    inline std::array<size_t, 5> adrt_core_shape(const std::array<size_t, 5> &in_shape) {
+        return {
+            std::get<0>(in_shape), // Keep batch dimension
+            4, // Always 4 quadrants
+            adrt::_common::floor_div2(std::get<2>(in_shape)), // We halve the number of rows
+            std::get<3>(in_shape) * 2_uz, // The number of angles doubles
+            std::get<4>(in_shape), // Keep the same number of columns
+        };
+    }
+
+    template <typename adrt_scalar>
+    void adrt_core_angle_cols(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out, const std::array<size_t, 5> &curr_shape, size_t batch, size_t quadrant, size_t row, size_t angle, size_t col_begin, size_t col_end) {
+        // Computes columns [col_begin, col_end) of one output angle. Each column reads only itself
+        // and the column ceil(angle/2) to its left.
+        // Pair of loops below split at ceil(angle/2) to avoid extra bounds check in loop body
+        const size_t ceil_div2_angle = adrt::_common::ceil_div2(angle);
+        const size_t col_split = std::clamp(ceil_div2_angle, col_begin, col_end);
+        ADRT_OPENMP("omp simd")
+        for(size_t col = col_begin; col < col_split; ++col) {
+            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * row, adrt::_common::floor_div2(angle), col);
+            adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = aval;
+        }
+        // This second loop requires col >= ceil(angle/2) to avoid bounds check
+        ADRT_OPENMP("omp simd")
+        for(size_t col = col_split; col < col_end; ++col) {
+            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * row, adrt::_common::floor_div2(angle), col);
+            const size_t b_col_idx = col - ceil_div2_angle;
+            const adrt_scalar bval = adrt::_common::array_access(data, in_shape, batch, quadrant, (2_uz * row) + 1_uz, adrt::_common::floor_div2(angle), b_col_idx);
+            adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = aval + bval;
+        }
+    }
+
+    template <typename adrt_scalar>
+    void adrt_core_angle(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out, const std::array<size_t, 5> &curr_shape, size_t batch, size_t quadrant, size_t row, size_t angle) {
+        adrt::_impl::adrt_core_angle_cols(data, in_shape, out, curr_shape, batch, quadrant, row, angle, 0_uz, std::get<4>(curr_shape));
+    }
+
     template <typename adrt_scalar>
     std::array<size_t, 5> adrt_core(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out) {
         assert(data);
         assert(out);
 
+        const std::array<size_t, 5> curr_shape = adrt::_impl::adrt_core_shape(in_shape);
+
+        assert(adrt::_assert::same_total_size(in_shape, curr_shape));
+
+        ADRT_OPENMP("omp for collapse(4)")
+        for(size_t batch = 0; batch < std::get<0>(curr_shape); ++batch) {
+            for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                for(size_t row = 0; row < std::get<2>(curr_shape); ++row) {
+                    for(size_t angle = 0; angle < std::get<3>(curr_shape); ++angle) {
+                        adrt::_impl::adrt_core_angle(data, in_shape, out, curr_shape, batch, quadrant, row, angle);
+                    }
+                }
+            }
+        }
+
+        return curr_shape;
+    }
+
+    template <typename adrt_scalar>
+    std::array<size_t, 5> adrt_core_radix4(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out) {
+        // Computes two levels of adrt_core in a single pass over the buffers.
+        // Sums are grouped as in two separate passes so results are identical.
+        assert(data);
+        assert(out);
+        assert(std::get<2>(in_shape) % 4_uz == 0u);
+
         const std::array<size_t, 5> curr_shape = {
             std::get<0>(in_shape), // Keep batch dimension
             4, // Always 4 quadrants
-            adrt::_common::floor_div2(std::get<2>(in_shape)), // We halve the number of rows
-            std::get<3>(in_shape) * 2_uz, // The number of angles doubles
+            adrt::_common::floor_div(std::get<2>(in_shape), 4_uz), // Rows shrink by a factor of four
+            std::get<3>(in_shape) * 4_uz, // The number of angles quadruples
             std::get<4>(in_shape), // Keep the same number of columns
         };
 
@@ -71,21 +139,41 @@ namespace adrt {
             for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
                 for(size_t row = 0; row < std::get<2>(curr_shape); ++row) {
                     for(size_t angle = 0; angle < std::get<3>(curr_shape); ++angle) {
-                        // Pair of loops below split at ceil(angle/2) to avoid extra bounds check in loop body
-                        const size_t ceil_div2_angle = adrt::_common::ceil_div2(angle);
+                        // Rows 4*row + {0, 1, 2, 3} are shifted by {0, s1, s2, s1 + s2} columns
+                        const size_t in_angle = adrt::_common::floor_div(angle, 4_uz);
+                        const size_t s1 = adrt::_common::ceil_div2(adrt::_common::floor_div2(angle));
+                        const size_t s2 = adrt::_common::ceil_div2(angle);
+                        const size_t split_b = std::min(s1, std::get<4>(curr_shape));
+                        const size_t split_c = std::min(s2, std::get<4>(curr_shape));
+                        const size_t split_d = std::min(s1 + s2, std::get<4>(curr_shape));
+                        const size_t in_row = 4_uz * row;
+                        // Loops below are split at each shift to avoid bounds checks in the loop bodies
                         ADRT_OPENMP("omp simd")
-                        for(size_t col = 0; col < ceil_div2_angle; ++col) {
-                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * row, adrt::_common::floor_div2(angle), col);
+                        for(size_t col = 0; col < split_b; ++col) {
+                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row, in_angle, col);
                             adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = aval;
                         }
-                        // This second loop requires col >= ceil(angle/2) to avoid bounds check
                         ADRT_OPENMP("omp simd")
-                        for(size_t col = ceil_div2_angle; col < std::get<4>(curr_shape); ++col) {
-                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * row, adrt::_common::floor_div2(angle), col);
-                            const size_t b_col_idx = col - ceil_div2_angle;
-                            const adrt_scalar bval = adrt::_common::array_access(data, in_shape, batch, quadrant, (2_uz * row) + 1_uz, adrt::_common::floor_div2(angle), b_col_idx);
+                        for(size_t col = split_b; col < split_c; ++col) {
+                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row, in_angle, col);
+                            const adrt_scalar bval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 1_uz, in_angle, col - s1);
                             adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = aval + bval;
                         }
+                        ADRT_OPENMP("omp simd")
+                        for(size_t col = split_c; col < split_d; ++col) {
+                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row, in_angle, col);
+                            const adrt_scalar bval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 1_uz, in_angle, col - s1);
+                            const adrt_scalar cval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 2_uz, in_angle, col - s2);
+                            adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = (aval + bval) + cval;
+                        }
+                        ADRT_OPENMP("omp simd")
+                        for(size_t col = split_d; col < std::get<4>(curr_shape); ++col) {
+                            const adrt_scalar aval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row, in_angle, col);
+                            const adrt_scalar bval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 1_uz, in_angle, col - s1);
+                            const adrt_scalar cval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 2_uz, in_angle, col - s2);
+                            const adrt_scalar dval = adrt::_common::array_access(data, in_shape, batch, quadrant, in_row + 3_uz, in_angle, col - s2 - s1);
+                            adrt::_common::array_access(out, curr_shape, batch, quadrant, row, angle, col) = (aval + bval) + (cval + dval);
+                        }
                     }
                 }
             }
@@ -94,102 +182,262 @@ namespace adrt {
         return curr_shape;
     }
 
-    } // end namespace: adrt::_impl
+    template <size_t quadrant, typename adrt_scalar>
+    adrt_scalar adrt_init_read(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, size_t batch, size_t row, size_t col) {
+        // Read entry (row, col) of the given quadrant of the initialized buffer. Requires col < n.
+        static_assert(quadrant < 4u, "Invalid quadrant");
+        const size_t n = std::get<2>(shape);
+        assert(batch < std::get<0>(shape));
+        assert(row < n);
+        assert(col < n);
+        if constexpr(quadrant == 0u) {
+            // Flip along x
+            return adrt::_common::array_stride_access(data, data_strides, batch, row, n - col - 1_uz);
+        }
+        else if constexpr(quadrant == 1u) {
+            // Transpose and flip
+            return adrt::_common::array_stride_access(data, data_strides, batch, n - col - 1_uz, row);
+        }
+        else if constexpr(quadrant == 2u) {
+            // Transpose
+            return adrt::_common::array_stride_access(data, data_strides, batch, col, row);
+        }
+        else {
+            // Flip along both axes
+            return adrt::_common::array_stride_access(data, data_strides, batch, n - row - 1_uz, n - col - 1_uz);
+        }
+    }
 
-    // DOC ANCHOR: adrt.adrt +2
-    template <typename adrt_scalar>
-    void adrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+    template <size_t quadrant, typename adrt_scalar, typename accum_scalar>
+    void adrt_core_init(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, accum_scalar *const ADRT_RESTRICT out, const std::array<size_t, 5> &curr_shape, size_t batch, size_t row_begin, size_t row_end, size_t col_begin, size_t col_end) {
+        // Computes rows [row_begin, row_end) and columns [col_begin, col_end) of the first ADRT
+        // level directly from the input image, fusing the quadrant initialization (flips and
+        // transposes) and the zero padding.
+        // Produces results identical to initializing a buffer and applying adrt_core.
+        // Input values are widened to accum_scalar before they are summed.
+        static_assert(quadrant < 4u, "Invalid quadrant");
+        assert(data);
+        assert(out);
+        assert(std::get<2>(shape) >= 2u);
+        assert(curr_shape == adrt::_impl::adrt_core_shape(adrt::adrt_buffer_shape(shape)));
+        assert(col_begin <= col_end && col_end <= std::get<4>(curr_shape));
+
+        const size_t n = std::get<2>(shape);
+        // Blocks cover 16 rows and columns of the input to keep transposed reads local
+        const size_t block_stride = 16;
+        const size_t row_block_stride = adrt::_common::floor_div2(block_stride);
+        const size_t in_col_end = std::min(col_end, n);
+        const size_t pad_col_begin = std::max(col_begin, n);
+
+        for(size_t row_start = row_begin; row_start < row_end; row_start += row_block_stride) {
+            const size_t row_stop = std::min(row_start + row_block_stride, row_end);
+            for(size_t col_start = col_begin; col_start < in_col_end; col_start += block_stride) {
+                const size_t col_stop = std::min(col_start + block_stride, in_col_end);
+                for(size_t row = row_start; row < row_stop; ++row) {
+                    // Angle 0: sum the pair of rows
+                    for(size_t col = col_start; col < col_stop; ++col) {
+                        const accum_scalar aval = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, 2_uz * row, col));
+                        const accum_scalar bval = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, (2_uz * row) + 1_uz, col));
+                        adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 0_uz, col) = aval + bval;
+                    }
+                    // Angle 1: second row is shifted by one column
+                    if(col_start == 0u) {
+                        adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 1_uz, 0_uz) = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, 2_uz * row, 0_uz));
+                    }
+                    for(size_t col = std::max(col_start, 1_uz); col < col_stop; ++col) {
+                        const accum_scalar aval = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, 2_uz * row, col));
+                        const accum_scalar bval = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, (2_uz * row) + 1_uz, col - 1_uz));
+                        adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 1_uz, col) = aval + bval;
+                    }
+                }
+            }
+            // Columns past the input are zero padding, only the shifted entry is nonzero
+            for(size_t row = row_start; row < row_stop; ++row) {
+                for(size_t col = pad_col_begin; col < col_end; ++col) {
+                    adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 0_uz, col) = 0;
+                }
+                if(pad_col_begin == n && n < col_end) {
+                    const accum_scalar bval = static_cast<accum_scalar>(adrt::_impl::adrt_init_read<quadrant>(data, shape, data_strides, batch, (2_uz * row) + 1_uz, n - 1_uz));
+                    adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 1_uz, n) = static_cast<accum_scalar>(0) + bval;
+                }
+                for(size_t col = std::max(pad_col_begin, n + 1_uz); col < col_end; ++col) {
+                    adrt::_common::array_access(out, curr_shape, batch, quadrant, row, 1_uz, col) = 0;
+                }
+            }
+        }
+    }
+
+    inline std::array<size_t, 2> adrt_tile_shape(const std::array<size_t, 3> &shape, size_t elem_size, size_t num_threads, size_t cache_size) {
+        // Input rows and buffer columns of the tiles processed depth-first through the first levels.
+        // A tile of 2^k input rows runs k levels (see adrt_tile). Its column blocks must be at least
+        // as wide as the largest shift of those levels, 2^(k-1), and about k + 2 blocks of each of
+        // the two buffers are live at once. Tiles are sized so this fits in half of cache_size
+        // while leaving at least one tile for each thread.
+        assert(elem_size > 0u);
+        assert(num_threads > 0u);
+        const size_t n = std::get<2>(shape);
+        if(n < 2u) {
+            return {n, 1};
+        }
+        const size_t num_cols = 2_uz * n - 1_uz;
+        // Narrower blocks split each row into segments too short to stream well from memory
+        const size_t min_tile_cols = 256;
+        const auto tile_cols = [num_cols, min_tile_cols](size_t rows) {
+            return std::min(std::max(adrt::_common::floor_div2(rows), min_tile_cols), num_cols);
+        };
+        const auto working_set = [elem_size, &tile_cols](size_t rows) {
+            const size_t live_blocks = static_cast<size_t>(adrt::num_iters(rows)) + 2_uz;
+            return 2_uz * live_blocks * rows * tile_cols(rows) * elem_size;
+        };
+        const size_t budget = adrt::_common::floor_div2(cache_size);
+        const size_t quadrant_planes = 4_uz * std::get<0>(shape);
+        size_t tile_rows = 2;
+        while(tile_rows < n && working_set(2_uz * tile_rows) <= budget && quadrant_planes * (n / (2_uz * tile_rows)) >= num_threads) {
+            tile_rows *= 2_uz;
+        }
+        return {tile_rows, tile_cols(tile_rows)};
+    }
+
+    template <typename adrt_scalar, typename accum_scalar>
+    void adrt_tile(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, accum_scalar *const ADRT_RESTRICT buf_a, accum_scalar *const ADRT_RESTRICT buf_b, size_t batch, size_t quadrant, size_t tile_start, size_t tile_rows, int tile_levels, size_t tile_cols) {
+        // Computes the first tile_levels levels for input rows [tile_start, tile_start + tile_rows)
+        // of one quadrant. These rows occupy the same memory range at each level, and within it
+        // each column keeps the same addresses. Each level reads only its own column and columns
+        // at most tile_cols to the left, so the levels advance together along a diagonal of column
+        // blocks: at each step, level l handles block (step - l) in increasing order of l. Level l
+        // then reads each block of level l - 1 before level l + 1 overwrites it in the shared buffer,
+        // and only a few blocks are live at a time. The first level is stored to buf_b, and levels
+        // then alternate buffers.
+        assert(tile_levels >= 1);
+        assert(tile_rows % (1_uz << tile_levels) == 0u);
+        assert(tile_start % tile_rows == 0u);
+        assert(tile_cols >= (1_uz << (tile_levels - 1)));
+        const std::array<size_t, 5> init_shape = adrt::_impl::adrt_core_shape(adrt::adrt_buffer_shape(shape));
+        const size_t num_cols = std::get<4>(init_shape);
+        const size_t num_col_blocks = adrt::_common::ceil_div(num_cols, tile_cols);
+        const size_t num_steps = num_col_blocks + static_cast<size_t>(tile_levels - 1);
+        for(size_t step = 0; step < num_steps; ++step) {
+            std::array<size_t, 5> level_shape = init_shape;
+            for(int level = 0; level < tile_levels && static_cast<size_t>(level) <= step; ++level) {
+                const size_t block = step - static_cast<size_t>(level);
+                const size_t col_begin = block * tile_cols;
+                const size_t col_end = std::min(col_begin + tile_cols, num_cols);
+                if(level == 0) {
+                    if(block < num_col_blocks) {
+                        const size_t init_begin = adrt::_common::floor_div2(tile_start);
+                        const size_t init_end = adrt::_common::floor_div2(tile_start + tile_rows);
+                        switch(quadrant) {
+                        case 0:
+                            adrt::_impl::adrt_core_init<0>(data, shape, data_strides, buf_b, init_shape, batch, init_begin, init_end, col_begin, col_end);
+                            break;
+                        case 1:
+                            adrt::_impl::adrt_core_init<1>(data, shape, data_strides, buf_b, init_shape, batch, init_begin, init_end, col_begin, col_end);
+                            break;
+                        case 2:
+                            adrt::_impl::adrt_core_init<2>(data, shape, data_strides, buf_b, init_shape, batch, init_begin, init_end, col_begin, col_end);
+                            break;
+                        default:
+                            assert(quadrant == 3u);
+                            adrt::_impl::adrt_core_init<3>(data, shape, data_strides, buf_b, init_shape, batch, init_begin, init_end, col_begin, col_end);
+                            break;
+                        }
+                    }
+                    continue;
+                }
+                const std::array<size_t, 5> curr_shape = adrt::_impl::adrt_core_shape(level_shape);
+                if(block < num_col_blocks) {
+                    const accum_scalar *const src = (level % 2 != 0) ? buf_b : buf_a;
+                    accum_scalar *const dst = (level % 2 != 0) ? buf_a : buf_b;
+                    const size_t row_begin = tile_start >> (level + 1);
+                    const size_t row_end = (tile_start + tile_rows) >> (level + 1);
+                    for(size_t row = row_begin; row < row_end; ++row) {
+                        for(size_t angle = 0; angle < std::get<3>(curr_shape); ++angle) {
+                            adrt::_impl::adrt_core_angle_cols(src, level_shape, dst, curr_shape, batch, quadrant, row, angle, col_begin, col_end);
+                        }
+                    }
+                }
+                level_shape = curr_shape;
+            }
+        }
+    }
+
+    template <typename adrt_scalar, typename accum_scalar>
+    void adrt_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, accum_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix, bool cooperative) {
+        // With cooperative == false the calling thread runs every level alone
+        // If accum_scalar is wider than adrt_scalar, tmp holds both level buffers and out is only written at the end
         assert(data);
         assert(tmp);
         assert(out);
         assert(adrt::adrt_is_valid_shape(shape));
         assert(adrt::_assert::same_total_size(adrt::adrt_result_shape(shape), adrt::adrt_buffer_shape(shape)));
+        assert(adrt::is_valid_radix(radix));
 
         const int num_iters = adrt::num_iters(std::get<2>(shape));
         const std::array<size_t, 4> output_shape = adrt::adrt_result_shape(shape);
+        // The first levels are computed in cache-sized tiles, starting with the fused initialization
+        const std::array<size_t, 2> tile_shape = adrt::_impl::adrt_tile_shape(shape, sizeof(accum_scalar), cooperative ? adrt::_common::max_threads() : 1_uz, adrt::_common::cache_size_l2());
+        const size_t tile_rows = std::get<0>(tile_shape);
+        const size_t tile_cols = std::get<1>(tile_shape);
+        const int tile_levels = adrt::num_iters(tile_rows);
+        const size_t num_tiles = (num_iters > 0) ? std::get<2>(shape) / tile_rows : 0_uz;
+        // Remaining levels are split into radix-2 and radix-4 passes
+        const int num_radix4 = (radix == 4) ? (num_iters - tile_levels) / 2 : 0;
+        const int num_radix2 = (num_iters - tile_levels) - 2 * num_radix4;
+        const int num_passes = tile_levels + num_radix2 + num_radix4;
 
-        ADRT_OPENMP("omp parallel default(none) shared(data, shape, tmp, out, num_iters, output_shape)")
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, tmp, out, num_iters, output_shape, tile_rows, tile_cols, tile_levels, num_tiles, num_radix4, num_radix2, num_passes)")
         {
             // Choose the ordering of the two buffers so that we always end with result in tmp (ready to copy out)
-            adrt_scalar *buf_a = tmp;
-            adrt_scalar *buf_b = out;
-            if(num_iters % 2 != 0) {
+            std::array<size_t, 5> buf_shape = adrt::adrt_buffer_shape(shape);
+            accum_scalar *buf_a = tmp;
+            accum_scalar *buf_b = nullptr;
+            if constexpr(std::is_same_v<adrt_scalar, accum_scalar>) {
+                buf_b = out;
+            }
+            else {
+                buf_b = tmp + adrt::_common::shape_product(buf_shape).value_or(0_uz);
+            }
+            if(num_passes % 2 != 0) {
                 std::swap(buf_a, buf_b);
             }
-            std::array<size_t, 5> buf_shape = adrt::adrt_buffer_shape(shape);
             const size_t block_stride = 16;
 
-            // Copy data to tmp buffer (always load into buf_a)
-            // QUADRANT 0 (Direct copy row by row)
-            ADRT_OPENMP("omp for collapse(3) nowait")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                for(size_t row = 0; row < std::get<1>(shape); ++row) {
-                    for(size_t col = 0; col < std::get<2>(shape); ++col) {
-                        adrt::_common::array_access(buf_a, buf_shape, batch, 0_uz, row, 0_uz, std::get<2>(shape) - col - 1_uz) =
-                            adrt::_common::array_access(data, shape, batch, row, col);
+            if(num_iters == 0) {
+                // Single pixel images (n == 1): each quadrant is a copy of the input
+                ADRT_OPENMP("omp for collapse(2)")
+                for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                    for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                        adrt::_common::array_access(buf_a, buf_shape, batch, quadrant, 0_uz, 0_uz, 0_uz) =
+                            static_cast<accum_scalar>(adrt::_common::array_stride_access(data, data_strides, batch, 0_uz, 0_uz));
                     }
                 }
             }
-            // QUADRANT 1 (Transpose the squares)
-            ADRT_OPENMP("omp for collapse(3) nowait")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                // Note: no overflow here (or in other blocked loops) because very large shapes (> size_t_max - 16) are impossible
-                // The input array must be square and with that dimension, the input would be too large to exist
-                for(size_t row_start = 0; row_start < std::get<1>(shape); row_start += block_stride) {
-                    for(size_t col_start = 0; col_start < std::get<2>(shape); col_start += block_stride) {
-                        // Transpose inside each block
-                        for(size_t row = row_start; row < std::min(row_start + block_stride, std::get<1>(shape)); ++row) {
-                            for(size_t col = col_start; col < std::min(col_start + block_stride, std::get<2>(shape)); ++col) {
-                                adrt::_common::array_access(buf_a, buf_shape, batch, 1_uz, std::get<1>(shape) - row - 1_uz, 0_uz, std::get<2>(shape) - col - 1_uz) =
-                                    adrt::_common::array_access(data, shape, batch, col, std::get<1>(shape) - row - 1_uz);
-                            }
+            else {
+                // Compute the first levels directly from data, tile by tile (first level stored into buf_b)
+                ADRT_OPENMP("omp for collapse(3)")
+                for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                    for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                        for(size_t tile = 0; tile < num_tiles; ++tile) {
+                            adrt::_impl::adrt_tile(data, shape, data_strides, buf_a, buf_b, batch, quadrant, tile * tile_rows, tile_rows, tile_levels, tile_cols);
                         }
                     }
                 }
-            }
-            // QUADRANT 2 (Transpose the squares and flip along x)
-            ADRT_OPENMP("omp for collapse(3) nowait")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                for(size_t row_start = 0; row_start < std::get<1>(shape); row_start += block_stride) {
-                    for(size_t col_start = 0; col_start < std::get<2>(shape); col_start += block_stride) {
-                        // Transpose inside each block
-                        for(size_t row = row_start; row < std::min(row_start + block_stride, std::get<1>(shape)); ++row) {
-                            for(size_t col = col_start; col < std::min(col_start + block_stride, std::get<2>(shape)); ++col) {
-                                adrt::_common::array_access(buf_a, buf_shape, batch, 2_uz, std::get<1>(shape) - row - 1_uz, 0_uz, std::get<2>(shape) - col - 1_uz) =
-                                    adrt::_common::array_access(data, shape, batch, std::get<2>(shape) - col - 1_uz, std::get<1>(shape) - row - 1_uz);
-                            }
-                        }
-                    }
+                for(int i = 0; i < tile_levels; ++i) {
+                    buf_shape = adrt::_impl::adrt_core_shape(buf_shape);
+                    std::swap(buf_a, buf_b);
                 }
-            }
-            // QUADRANT 3 (Flip along y)
-            ADRT_OPENMP("omp for collapse(3) nowait")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                for(size_t row = 0; row < std::get<1>(shape); ++row) {
-                    for(size_t col = 0; col < std::get<2>(shape); ++col) {
-                        adrt::_common::array_access(buf_a, buf_shape, batch, 3_uz, row, 0_uz, std::get<2>(shape) - col - 1_uz) =
-                            adrt::_common::array_access(data, shape, batch, std::get<1>(shape) - row - 1_uz, col);
-                    }
+
+                // Perform remaining computations, radix-2 levels first
+                for(int i = 0; i < num_radix2; ++i) {
+                    buf_shape = adrt::_impl::adrt_core(buf_a, buf_shape, buf_b);
+                    std::swap(buf_a, buf_b);
                 }
-            }
-            // Fill rest with zeros
-            ADRT_OPENMP("omp for collapse(4)")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
-                    for(size_t row = 0; row < std::get<1>(shape); ++row) {
-                        for(size_t col = std::get<2>(shape); col < 2_uz * std::get<2>(shape) - 1_uz; ++col) {
-                            adrt::_common::array_access(buf_a, buf_shape, batch, quadrant, row, 0_uz, col) = 0;
-                        }
-                    }
+                for(int i = 0; i < num_radix4; ++i) {
+                    buf_shape = adrt::_impl::adrt_core_radix4(buf_a, buf_shape, buf_b);
+                    std::swap(buf_a, buf_b);
                 }
             }
 
-            // Perform computations
-            for(int i = 0; i < num_iters; ++i) {
-                buf_shape = adrt::_impl::adrt_core(buf_a, buf_shape, buf_b);
-                std::swap(buf_a, buf_b);
-            }
-
             // Copy result to out buffer (always tmp -> out)
             ADRT_OPENMP("omp for collapse(4) nowait")
             for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
@@ -199,7 +447,7 @@ namespace adrt {
                             // Inner blocks serial
                             for(size_t d = d_start; d < std::min(d_start + block_stride, std::get<2>(output_shape)); ++d) {
                                 for(size_t a = a_start; a < std::min(a_start + block_stride, std::get<3>(output_shape)); ++a) {
-                                    const adrt_scalar val = adrt::_common::array_access(tmp, buf_shape, batch, quadrant, 0_uz, a, d);
+                                    const adrt_scalar val = static_cast<adrt_scalar>(adrt::_common::array_access(tmp, buf_shape, batch, quadrant, 0_uz, a, d));
                                     adrt::_common::array_access(out, output_shape, batch, quadrant, d, a) = val;
                                 }
                             }
@@ -210,6 +458,30 @@ namespace adrt {
         }
     }
 
+    } // end namespace: adrt::_impl
+
+    // DOC ANCHOR: adrt.adrt +2
+    template <typename adrt_scalar, typename accum_scalar = adrt_scalar>
+    void adrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, accum_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix = 4) {
+        // A wider accum_scalar keeps both level buffers in tmp, which then has twice the usual size
+        const std::array<size_t, 3> image_shape = {1, std::get<1>(shape), std::get<2>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::adrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t tmp_size = (std::is_same_v<adrt_scalar, accum_scalar> ? 1_uz : 2_uz) * buf_size;
+        const size_t image_bytes = (in_size + buf_size) * sizeof(adrt_scalar) + tmp_size * sizeof(accum_scalar);
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread transforms whole images with no barriers between levels
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, tmp, out, radix, image_shape, buf_size, tmp_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::adrt_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, tmp + batch * tmp_size, out + batch * buf_size, radix, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::adrt_levels(data, shape, data_strides, tmp, out, radix, true);
+        }
+    }
+
     // DOC ANCHOR: adrt.core.adrt_step +2
     template <typename adrt_scalar>
     void adrt_step(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT out, int iter) {
@@ -256,6 +528,6 @@ namespace adrt {
         }
     }
 
-}
+}} // end namespace adrt
 
 #endif // ADRT_CDEFS_ADRT_H
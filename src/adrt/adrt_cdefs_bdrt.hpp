@@ -35,6 +35,7 @@
 
 #include <array>
 #include <utility>
+#include <type_traits>
 #include <algorithm>
 #include <cassert>
 #include "adrt_cdefs_common.hpp"
@@ -48,11 +49,27 @@ namespace adrt {
     std::array<size_t, 5> bdrt_buffer_shape(const std::array<size_t, 4> &shape);
     std::array<size_t, 4> bdrt_result_shape(const std::array<size_t, 4> &shape);
     std::array<size_t, 4> bdrt_step_result_shape(const std::array<size_t, 4> &shape);
+    bool adrt_adjoint_is_valid_shape(const std::array<size_t, 4> &shape);
+    std::array<size_t, 6> adrt_adjoint_buffer_shape(const std::array<size_t, 4> &shape);
+    std::array<size_t, 3> adrt_adjoint_result_shape(const std::array<size_t, 4> &shape);
+    std::array<size_t, 4> adrt_adjoint_quadrant_result_shape(const std::array<size_t, 4> &shape);
+
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
 
     namespace _impl {
 
+    inline size_t bdrt_pass_row_limit(const std::array<size_t, 5> &curr_shape, size_t row_limit) {
+        // Rows of this pass's output needed to produce the first row_limit rows of the final result.
+        // Each later level with sections of size s reads at most s rows past its output row, and
+        // these sizes halve down to one, so later levels together reach (section size - 1) rows further.
+        return std::min(std::get<4>(curr_shape), row_limit + (std::get<2>(curr_shape) - 1_uz));
+    }
+
     template <typename adrt_scalar>
-    std::array<size_t, 5> bdrt_core(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out) {
+    std::array<size_t, 5> bdrt_core(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out, size_t row_limit) {
+        // Only output rows below the effective row limit are written, see bdrt_pass_row_limit
         assert(data);
         assert(out);
 
@@ -63,6 +80,8 @@ namespace adrt {
             std::get<3>(in_shape) * 2_uz, // Double the number of sections
             std::get<4>(in_shape), // Keep same number of rows
         };
+        const size_t num_rows = std::get<4>(curr_shape);
+        const size_t row_end = adrt::_impl::bdrt_pass_row_limit(curr_shape, row_limit);
 
         assert(adrt::_assert::same_total_size(in_shape, curr_shape));
 
@@ -76,14 +95,14 @@ namespace adrt {
                         const size_t sec_right = sec_left + 1_uz;
 
                         ADRT_OPENMP("omp simd")
-                        for(size_t row = 0; row < sec_i; ++row) {
+                        for(size_t row = 0; row < std::min(sec_i, row_end); ++row) {
                             const adrt_scalar la_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i, section, row);
                             const adrt_scalar lb_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i + 1_uz, section, row);
                             adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_left, row) = la_val + lb_val;
                         }
 
                         ADRT_OPENMP("omp simd")
-                        for(size_t row = sec_i; row < std::get<4>(curr_shape) - 1_uz; ++row) {
+                        for(size_t row = sec_i; row < std::min(num_rows - 1_uz, row_end); ++row) {
                             // Left section
                             const adrt_scalar la_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i, section, row);
                             const adrt_scalar lb_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i + 1_uz, section, row);
@@ -92,18 +111,30 @@ namespace adrt {
                             adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_right, row - sec_i) = la_val + lbb_val;
                         }
 
+                        // Offset rows still needed past the end of the left section (only with a row limit)
+                        ADRT_OPENMP("omp simd")
+                        for(size_t row = std::max(sec_i, row_end); row < std::min(num_rows - 1_uz, row_end + sec_i); ++row) {
+                            const adrt_scalar la_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i, section, row);
+                            const adrt_scalar lbb_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i + 1_uz, section, row + 1_uz);
+                            adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_right, row - sec_i) = la_val + lbb_val;
+                        }
+
                         {
-                            const size_t row = std::get<4>(curr_shape) - 1_uz;
+                            const size_t row = num_rows - 1_uz;
                             const adrt_scalar la_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i, section, row);
-                            const adrt_scalar lb_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i + 1_uz, section, row);
-                            adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_left, row) = la_val + lb_val;
+                            if(row < row_end) {
+                                const adrt_scalar lb_val = adrt::_common::array_access(data, in_shape, batch, quadrant, 2_uz * sec_i + 1_uz, section, row);
+                                adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_left, row) = la_val + lb_val;
+                            }
                             // NOTE: We have at least as many rows as columns so num_rows - 1 >= sec_i
-                            adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_right, row - sec_i) = la_val;
+                            if(row - sec_i < row_end) {
+                                adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_right, row - sec_i) = la_val;
+                            }
                         }
 
                         // Zero the last sec_i entries in offset row
                         ADRT_OPENMP("omp simd")
-                        for(size_t zrow = std::get<4>(curr_shape) - sec_i; zrow < std::get<4>(curr_shape); ++zrow) {
+                        for(size_t zrow = num_rows - sec_i; zrow < row_end; ++zrow) {
                             adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, sec_right, zrow) = 0;
                         }
                     }
@@ -114,56 +145,231 @@ namespace adrt {
         return curr_shape;
     }
 
-    } // end namespace: adrt::_impl
+    template <size_t m1_terms, size_t m2_terms, bool has_m2, typename adrt_scalar>
+    void bdrt_radix4_segment(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out, const std::array<size_t, 5> &curr_shape, size_t batch, size_t quadrant, size_t sec_i, size_t section, size_t out_section, const std::array<size_t, 4> &offsets, size_t row_start, size_t row_end) {
+        // Computes one output row segment of a radix-4 bdrt pass with fixed terms present.
+        // Sums are grouped as (a + b) + (c + d) matching the two radix-2 levels. The
+        // second pair is a literal zero if its row was zeroed in the first level.
+        static_assert(m1_terms == 1u || m1_terms == 2u, "First pair must have one or two terms");
+        static_assert(m2_terms <= 2u, "Second pair has at most two terms");
+        static_assert(has_m2 || m2_terms == 0u, "Second pair must be present to have terms");
+        const size_t in_sec = 4_uz * sec_i;
+        ADRT_OPENMP("omp simd")
+        for(size_t row = row_start; row < row_end; ++row) {
+            adrt_scalar m1 = adrt::_common::array_access(data, in_shape, batch, quadrant, in_sec, section, row + std::get<0>(offsets));
+            if constexpr(m1_terms == 2u) {
+                m1 = m1 + adrt::_common::array_access(data, in_shape, batch, quadrant, in_sec + 1_uz, section, row + std::get<1>(offsets));
+            }
+            if constexpr(has_m2) {
+                adrt_scalar m2 = 0;
+                if constexpr(m2_terms >= 1u) {
+                    m2 = adrt::_common::array_access(data, in_shape, batch, quadrant, in_sec + 2_uz, section, row + std::get<2>(offsets));
+                }
+                if constexpr(m2_terms == 2u) {
+                    m2 = m2 + adrt::_common::array_access(data, in_shape, batch, quadrant, in_sec + 3_uz, section, row + std::get<3>(offsets));
+                }
+                adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, out_section, row) = m1 + m2;
+            }
+            else {
+                adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, out_section, row) = m1;
+            }
+        }
+    }
 
-    // DOC ANCHOR: adrt.bdrt +2
     template <typename adrt_scalar>
-    void bdrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+    std::array<size_t, 5> bdrt_core_radix4(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out, size_t row_limit) {
+        // Computes two levels of bdrt_core in a single pass over the buffers.
+        // Results are identical to two separate passes, including zeroed entries.
+        // Only output rows below the effective row limit are written, see bdrt_pass_row_limit
         assert(data);
-        assert(tmp);
         assert(out);
-        assert(adrt::bdrt_is_valid_shape(shape));
-        assert(adrt::_assert::same_total_size(adrt::bdrt_result_shape(shape), adrt::bdrt_buffer_shape(shape)));
+        assert(std::get<2>(in_shape) % 4_uz == 0u);
 
-        const int num_iters = adrt::num_iters(std::get<3>(shape));
-        const std::array<size_t, 4> output_shape = adrt::bdrt_result_shape(shape);
+        const std::array<size_t, 5> curr_shape = {
+            std::get<0>(in_shape), // Keep batch dimension
+            4, // Always 4 quadrants
+            adrt::_common::floor_div(std::get<2>(in_shape), 4_uz), // Section size shrinks by a factor of four
+            std::get<3>(in_shape) * 4_uz, // Quadruple the number of sections
+            std::get<4>(in_shape), // Keep same number of rows
+        };
+        const size_t num_rows = std::get<4>(curr_shape);
+        const size_t row_stop = adrt::_impl::bdrt_pass_row_limit(curr_shape, row_limit);
 
-        ADRT_OPENMP("omp parallel default(none) shared(data, shape, tmp, out, num_iters, output_shape)")
-        {
-            // Choose the ordering of the two buffers so that we always end with result in tmp (ready to copy out)
-            adrt_scalar *buf_a = tmp;
-            adrt_scalar *buf_b = out;
-            if(num_iters % 2 != 0) {
-                std::swap(buf_a, buf_b);
-            }
-            std::array<size_t, 5> buf_shape = adrt::bdrt_buffer_shape(shape);
-            const size_t block_stride = 16;
+        assert(adrt::_assert::same_total_size(in_shape, curr_shape));
 
-            // Copy data to tmp buffer (always load into buf_a)
-            ADRT_OPENMP("omp for collapse(4)")
-            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
-                for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
-                    // Note: no overflow here (or in other blocked loop) because very large shapes (> size_t_max - 16) are impossible
-                    // The input array must be (2 * N - 1)-by-N. With that dimension the buffer is too large to exist
-                    for(size_t row_start = 0; row_start < std::get<2>(shape); row_start += block_stride) {
-                        for(size_t col_start = 0; col_start < std::get<3>(shape); col_start += block_stride) {
-                            // Transpose inside each block (serial)
-                            for(size_t row = row_start; row < std::min(row_start + block_stride, std::get<2>(shape)); ++row) {
-                                for(size_t col = col_start; col < std::min(col_start + block_stride, std::get<3>(shape)); ++col) {
-                                    adrt::_common::array_access(buf_a, buf_shape, batch, quadrant, col, 0_uz, row) =
-                                        adrt::_common::array_access(data, shape, batch, quadrant, row, col);
+        ADRT_OPENMP("omp for collapse(4)")
+        for(size_t batch = 0; batch < std::get<0>(curr_shape); ++batch) {
+            for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                for(size_t sec_i = 0; sec_i < std::get<2>(curr_shape); ++sec_i) {
+                    for(size_t section = 0; section < std::get<3>(in_shape); ++section) {
+                        for(size_t sub_section = 0; sub_section < 4u; ++sub_section) {
+                            // Output section 4*section + 2*p + q, p selects the first level's
+                            // offset rows and q selects the second level's
+                            const size_t p = adrt::_common::floor_div2(sub_section);
+                            const size_t q = sub_section % 2_uz;
+                            const size_t out_section = 4_uz * section + sub_section;
+                            // Row offsets of the four inputs (nondecreasing) and the two pairs
+                            const std::array<size_t, 4> offsets = {
+                                q * sec_i + p * (2_uz * sec_i),
+                                q * sec_i + p * (2_uz * sec_i + 1_uz),
+                                q * (sec_i + 1_uz) + p * (2_uz * sec_i + 1_uz),
+                                q * (sec_i + 1_uz) + p * (2_uz * sec_i + 2_uz),
+                            };
+                            const size_t m1_offset = q * sec_i;
+                            const size_t m2_offset = q * (sec_i + 1_uz);
+                            // Each input is in bounds for rows below its limit
+                            const auto limit = [num_rows](size_t offset) {
+                                return num_rows - std::min(offset, num_rows);
+                            };
+                            const std::array<size_t, 6> limits = {
+                                limit(std::get<0>(offsets)),
+                                limit(std::get<1>(offsets)),
+                                limit(std::get<2>(offsets)),
+                                limit(std::get<3>(offsets)),
+                                limit(m1_offset),
+                                limit(m2_offset),
+                            };
+                            // Walk row segments between consecutive limits
+                            size_t row_start = 0;
+                            while(row_start < row_stop) {
+                                size_t row_end = row_stop;
+                                for(const size_t lim : limits) {
+                                    if(lim > row_start) {
+                                        row_end = std::min(row_end, lim);
+                                    }
                                 }
+                                const bool has_a = row_start < std::get<0>(limits);
+                                const bool has_b = row_start < std::get<1>(limits);
+                                const bool has_c = row_start < std::get<2>(limits);
+                                const bool has_d = row_start < std::get<3>(limits);
+                                const bool has_m1 = row_start < std::get<4>(limits);
+                                const bool has_m2 = row_start < std::get<5>(limits);
+                                if(!has_m1 || !has_a) {
+                                    // Entire value is zero
+                                    ADRT_OPENMP("omp simd")
+                                    for(size_t row = row_start; row < row_end; ++row) {
+                                        adrt::_common::array_access(out, curr_shape, batch, quadrant, sec_i, out_section, row) = 0;
+                                    }
+                                }
+                                else if(has_b) {
+                                    if(!has_m2) {
+                                        adrt::_impl::bdrt_radix4_segment<2, 0, false>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                    else if(!has_c) {
+                                        adrt::_impl::bdrt_radix4_segment<2, 0, true>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                    else if(!has_d) {
+                                        adrt::_impl::bdrt_radix4_segment<2, 1, true>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                    else {
+                                        adrt::_impl::bdrt_radix4_segment<2, 2, true>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                }
+                                else {
+                                    // Without b, d is also out of bounds
+                                    assert(!has_d);
+                                    if(!has_m2) {
+                                        adrt::_impl::bdrt_radix4_segment<1, 0, false>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                    else if(!has_c) {
+                                        adrt::_impl::bdrt_radix4_segment<1, 0, true>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                    else {
+                                        adrt::_impl::bdrt_radix4_segment<1, 1, true>(data, in_shape, out, curr_shape, batch, quadrant, sec_i, section, out_section, offsets, row_start, row_end);
+                                    }
+                                }
+                                row_start = row_end;
                             }
                         }
                     }
                 }
             }
+        }
+
+        return curr_shape;
+    }
 
-            // Perform computations
-            for(int i = 0; i < num_iters; ++i) {
-                buf_shape = adrt::_impl::bdrt_core(buf_a, buf_shape, buf_b);
-                std::swap(buf_a, buf_b);
+    template <typename adrt_scalar, typename accum_scalar>
+    std::array<size_t, 5> bdrt_compute(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, accum_scalar *const ADRT_RESTRICT tmp, accum_scalar *const ADRT_RESTRICT scratch, int radix, size_t row_limit) {
+        // Runs all bdrt levels, must be called from inside a parallel region (or serially)
+        // Result is left in tmp, returns its buffer shape. Clobbers scratch.
+        // Only the first row_limit rows of the result are computed, the rest are left unset.
+        const int num_iters = adrt::num_iters(std::get<3>(shape));
+        const int num_radix4 = (radix == 4) ? num_iters / 2 : 0;
+        const int num_radix2 = num_iters - 2 * num_radix4;
+        const int num_passes = num_radix2 + num_radix4;
+
+        // Choose the ordering of the two buffers so that we always end with result in tmp
+        accum_scalar *buf_a = tmp;
+        accum_scalar *buf_b = scratch;
+        if(num_passes % 2 != 0) {
+            std::swap(buf_a, buf_b);
+        }
+        std::array<size_t, 5> buf_shape = adrt::bdrt_buffer_shape(shape);
+        const size_t block_stride = 16;
+
+        // Copy data to tmp buffer (always load into buf_a)
+        ADRT_OPENMP("omp for collapse(4)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                // Note: no overflow here (or in other blocked loop) because very large shapes (> size_t_max - 16) are impossible
+                // The input array must be (2 * N - 1)-by-N. With that dimension the buffer is too large to exist
+                for(size_t row_start = 0; row_start < std::get<2>(shape); row_start += block_stride) {
+                    for(size_t col_start = 0; col_start < std::get<3>(shape); col_start += block_stride) {
+                        // Transpose inside each block (serial)
+                        for(size_t row = row_start; row < std::min(row_start + block_stride, std::get<2>(shape)); ++row) {
+                            for(size_t col = col_start; col < std::min(col_start + block_stride, std::get<3>(shape)); ++col) {
+                                adrt::_common::array_access(buf_a, buf_shape, batch, quadrant, col, 0_uz, row) =
+                                    static_cast<accum_scalar>(adrt::_common::array_stride_access(data, data_strides, batch, quadrant, row, col));
+                            }
+                        }
+                    }
+                }
             }
+        }
+
+        // Perform computations, radix-2 levels first
+        // Unlike adrt_levels these passes are not tiled across levels. Output position sec_i of a
+        // level reads positions 2*sec_i and 2*sec_i + 1 of the previous one, and each output section
+        // reads rows up to a full section size away, so no block of the buffer maps back onto itself
+        // from one level to the next. A depth-first tile would need its own scratch space for every
+        // level, and the radix-4 passes already halve the number of sweeps over the buffers.
+        for(int i = 0; i < num_radix2; ++i) {
+            buf_shape = adrt::_impl::bdrt_core(buf_a, buf_shape, buf_b, row_limit);
+            std::swap(buf_a, buf_b);
+        }
+        for(int i = 0; i < num_radix4; ++i) {
+            buf_shape = adrt::_impl::bdrt_core_radix4(buf_a, buf_shape, buf_b, row_limit);
+            std::swap(buf_a, buf_b);
+        }
+        return buf_shape;
+    }
+
+    template <typename adrt_scalar, typename accum_scalar>
+    void bdrt_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, accum_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix, [[maybe_unused]] bool cooperative) {
+        // With cooperative == false the calling thread runs every level alone
+        // If accum_scalar is wider than adrt_scalar, tmp holds both level buffers and out is only written at the end
+        assert(data);
+        assert(tmp);
+        assert(out);
+        assert(adrt::bdrt_is_valid_shape(shape));
+        assert(adrt::_assert::same_total_size(adrt::bdrt_result_shape(shape), adrt::bdrt_buffer_shape(shape)));
+        assert(adrt::is_valid_radix(radix));
+
+        const std::array<size_t, 4> output_shape = adrt::bdrt_result_shape(shape);
+
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, tmp, out, output_shape, radix)")
+        {
+            // The output buffer doubles as scratch space for the levels
+            accum_scalar *scratch = nullptr;
+            if constexpr(std::is_same_v<adrt_scalar, accum_scalar>) {
+                scratch = out;
+            }
+            else {
+                scratch = tmp + adrt::_common::shape_product(adrt::bdrt_buffer_shape(shape)).value_or(0_uz);
+            }
+            const std::array<size_t, 5> buf_shape = adrt::_impl::bdrt_compute(data, shape, data_strides, tmp, scratch, radix, std::get<2>(shape));
+            const size_t block_stride = 16;
 
             // Copy result to out buffer (always tmp -> out)
             ADRT_OPENMP("omp for collapse(4) nowait")
@@ -175,7 +381,57 @@ namespace adrt {
                             for(size_t row = row_start; row < std::min(row_start + block_stride, std::get<2>(output_shape)); ++row) {
                                 for(size_t col = col_start; col < std::min(col_start + block_stride, std::get<3>(output_shape)); ++col) {
                                     adrt::_common::array_access(out, output_shape, batch, quadrant, row, col) =
-                                        adrt::_common::array_access(tmp, buf_shape, batch, quadrant, 0_uz, col, row);
+                                        static_cast<adrt_scalar>(adrt::_common::array_access(tmp, buf_shape, batch, quadrant, 0_uz, col, row));
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void adrt_adjoint_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT scratch, adrt_scalar *const ADRT_RESTRICT out, bool per_quadrant, int radix, [[maybe_unused]] bool cooperative) {
+        // With cooperative == false the calling thread runs every level alone
+        assert(data);
+        assert(tmp);
+        assert(scratch);
+        assert(out);
+        assert(adrt::adrt_adjoint_is_valid_shape(shape));
+        assert(adrt::is_valid_radix(radix));
+
+        const std::array<size_t, 4> quadrant_shape = adrt::adrt_adjoint_quadrant_result_shape(shape);
+        const std::array<size_t, 3> sum_shape = adrt::adrt_adjoint_result_shape(shape);
+        const size_t n = std::get<3>(shape);
+
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, tmp, scratch, out, per_quadrant, radix, quadrant_shape, sum_shape, n)")
+        {
+            // Only the top square of each quadrant is kept
+            const std::array<size_t, 5> buf_shape = adrt::_impl::bdrt_compute(data, shape, data_strides, tmp, scratch, radix, n);
+            const size_t block_stride = 16;
+
+            // Copy only the top square of each quadrant, rotated as by adrt.utils.truncate.
+            // Entry (row, col) of quadrant q of the bdrt result is buffer entry (q, 0, col, row).
+            ADRT_OPENMP("omp for collapse(3) nowait")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                for(size_t row_start = 0; row_start < n; row_start += block_stride) {
+                    for(size_t col_start = 0; col_start < n; col_start += block_stride) {
+                        for(size_t row = row_start; row < std::min(row_start + block_stride, n); ++row) {
+                            for(size_t col = col_start; col < std::min(col_start + block_stride, n); ++col) {
+                                const adrt_scalar q0 = adrt::_common::array_access(tmp, buf_shape, batch, 0_uz, 0_uz, row, n - 1_uz - col);
+                                const adrt_scalar q1 = adrt::_common::array_access(tmp, buf_shape, batch, 1_uz, 0_uz, col, n - 1_uz - row);
+                                const adrt_scalar q2 = adrt::_common::array_access(tmp, buf_shape, batch, 2_uz, 0_uz, col, row);
+                                const adrt_scalar q3 = adrt::_common::array_access(tmp, buf_shape, batch, 3_uz, 0_uz, n - 1_uz - row, n - 1_uz - col);
+                                if(per_quadrant) {
+                                    adrt::_common::array_access(out, quadrant_shape, batch, 0_uz, row, col) = q0;
+                                    adrt::_common::array_access(out, quadrant_shape, batch, 1_uz, row, col) = q1;
+                                    adrt::_common::array_access(out, quadrant_shape, batch, 2_uz, row, col) = q2;
+                                    adrt::_common::array_access(out, quadrant_shape, batch, 3_uz, row, col) = q3;
+                                }
+                                else {
+                                    // Same summation order as a reduction over the quadrant axis
+                                    adrt::_common::array_access(out, sum_shape, batch, row, col) = ((q0 + q1) + q2) + q3;
                                 }
                             }
                         }
@@ -185,6 +441,53 @@ namespace adrt {
         }
     }
 
+    } // end namespace: adrt::_impl
+
+    // DOC ANCHOR: adrt.bdrt +2
+    template <typename adrt_scalar, typename accum_scalar = adrt_scalar>
+    void bdrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, accum_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix = 4) {
+        // A wider accum_scalar keeps both level buffers in tmp, which then has twice the usual size
+        const std::array<size_t, 4> image_shape = {1, std::get<1>(shape), std::get<2>(shape), std::get<3>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape) * std::get<3>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::bdrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t tmp_size = (std::is_same_v<adrt_scalar, accum_scalar> ? 1_uz : 2_uz) * buf_size;
+        const size_t image_bytes = (in_size + buf_size) * sizeof(adrt_scalar) + tmp_size * sizeof(accum_scalar);
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread transforms whole images with no barriers between levels
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, tmp, out, radix, image_shape, buf_size, tmp_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::bdrt_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, tmp + batch * tmp_size, out + batch * buf_size, radix, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::bdrt_levels(data, shape, data_strides, tmp, out, radix, true);
+        }
+    }
+
+    // DOC ANCHOR: adrt.core.adrt_adjoint +2
+    template <typename adrt_scalar>
+    void adrt_adjoint_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, bool per_quadrant, int radix = 4) {
+        // The workspace holds two bdrt buffers: the result buffer followed by scratch space
+        const std::array<size_t, 4> image_shape = {1, std::get<1>(shape), std::get<2>(shape), std::get<3>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape) * std::get<3>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::bdrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t out_size = (per_quadrant ? 4_uz : 1_uz) * std::get<3>(shape) * std::get<3>(shape);
+        const size_t image_bytes = (in_size + 2 * buf_size + out_size) * sizeof(adrt_scalar);
+        adrt_scalar *const scratch = tmp + std::get<0>(shape) * buf_size;
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread transforms whole images with no barriers between levels
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, tmp, scratch, out, per_quadrant, radix, image_shape, buf_size, out_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::adrt_adjoint_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, tmp + batch * buf_size, scratch + batch * buf_size, out + batch * out_size, per_quadrant, radix, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::adrt_adjoint_levels(data, shape, data_strides, tmp, scratch, out, per_quadrant, radix, true);
+        }
+    }
+
     // DOC ANCHOR: adrt.core.bdrt_step +2
     template <typename adrt_scalar>
     void bdrt_step(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT out, int iter) {
@@ -242,6 +545,6 @@ namespace adrt {
         }
     }
 
-}
+}} // end namespace adrt
 
 #endif // ADRT_CDEFS_BDRT_H
@@ -35,23 +35,44 @@
 #include <array>
 #include <cassert>
 #include <optional>
+#include <algorithm>
 
 #ifdef _MSC_VER
 // MSVC intrinsics
 #include <intrin.h>
 #endif
 
+#if defined(_WIN32)
+#define WIN32_LEAN_AND_MEAN
+#define NOMINMAX
+#include <windows.h>
+#include <vector>
+#elif defined(__APPLE__)
+#include <cstdint>
+#include <sys/types.h>
+#include <sys/sysctl.h>
+#elif defined(__linux__)
+#include <unistd.h>
+#include <fstream>
+#include <string>
+#endif
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 #include "adrt_cdefs_common.hpp"
 #include "adrt_cdefs_adrt.hpp"
 #include "adrt_cdefs_iadrt.hpp"
 #include "adrt_cdefs_bdrt.hpp"
 #include "adrt_cdefs_interp_adrtcart.hpp"
 #include "adrt_cdefs_fmg.hpp"
+#include "adrt_cdefs_normal.hpp"
 
 using namespace adrt::_literals;
 using std::size_t;
 
-namespace adrt { namespace _impl { namespace {
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE { namespace _impl { namespace {
 
 // This imposes a limit on max_iters(n) <= (digits-1) and ensures that in our
 // single-step functions the shifts of 1<<(iter+1) never go out of range
@@ -207,7 +228,98 @@ int num_iters(size_t shape) {
 
 #endif // End platform cases
 
-}}} // End namespace adrt::_impl
+// Implementation of cache size queries
+
+// Used when the cache size cannot be determined
+const size_t default_cache_size_l2 = 256_uz * 1024_uz;
+
+// Images per thread needed before batch_parallel hands out whole images
+const size_t min_images_per_thread = 4;
+
+#if defined(_WIN32)
+
+size_t query_cache_size_l2() {
+    DWORD buffer_size = 0;
+    GetLogicalProcessorInformation(nullptr, &buffer_size);
+    if(buffer_size == 0u) {
+        return 0;
+    }
+    std::vector<SYSTEM_LOGICAL_PROCESSOR_INFORMATION> info(buffer_size / sizeof(SYSTEM_LOGICAL_PROCESSOR_INFORMATION));
+    if(!GetLogicalProcessorInformation(info.data(), &buffer_size)) {
+        return 0;
+    }
+    for(const SYSTEM_LOGICAL_PROCESSOR_INFORMATION &entry : info) {
+        if(entry.Relationship == RelationCache && entry.Cache.Level == 2 && entry.Cache.Type != CacheInstruction) {
+            return static_cast<size_t>(entry.Cache.Size);
+        }
+    }
+    return 0;
+}
+
+#elif defined(__APPLE__)
+
+size_t query_cache_size_l2() {
+    std::int64_t size = 0;
+    size_t len = sizeof(size);
+    if(sysctlbyname("hw.l2cachesize", &size, &len, nullptr, 0) != 0 || size <= 0) {
+        return 0;
+    }
+    return static_cast<size_t>(size);
+}
+
+#elif defined(__linux__)
+
+size_t query_cache_size_l2_sysfs() {
+    // Some C libraries do not report cache sizes, read them from sysfs instead
+    for(int index = 0; index < 8; ++index) {
+        const std::string dir = "/sys/devices/system/cpu/cpu0/cache/index" + std::to_string(index) + "/";
+        int level = 0;
+        std::string type;
+        std::string size;
+        std::ifstream(dir + "level") >> level;
+        std::ifstream(dir + "type") >> type;
+        std::ifstream(dir + "size") >> size;
+        if(level != 2 || type == "Instruction" || size.empty()) {
+            continue;
+        }
+        // Sizes are reported like "2048K"
+        size_t value = 0;
+        size_t pos = 0;
+        for(; pos < size.size() && size[pos] >= '0' && size[pos] <= '9'; ++pos) {
+            value = value * 10_uz + static_cast<size_t>(size[pos] - '0');
+        }
+        if(pos < size.size() && size[pos] == 'K') {
+            value *= 1024_uz;
+        }
+        else if(pos < size.size() && size[pos] == 'M') {
+            value *= 1024_uz * 1024_uz;
+        }
+        return value;
+    }
+    return 0;
+}
+
+size_t query_cache_size_l2() {
+    #ifdef _SC_LEVEL2_CACHE_SIZE
+    {
+        const long size = sysconf(_SC_LEVEL2_CACHE_SIZE);
+        if(size > 0) {
+            return static_cast<size_t>(size);
+        }
+    }
+    #endif
+    return adrt::_impl::query_cache_size_l2_sysfs();
+}
+
+#else // Fallback only
+
+size_t query_cache_size_l2() {
+    return 0;
+}
+
+#endif // End platform cases
+
+}}}} // End namespace adrt::_impl
 
 namespace adrt {
 
@@ -218,7 +330,7 @@ namespace adrt {
         return adrt::_impl::num_iters(shape);
     }
 
-    namespace _common {
+    namespace _baseline {
         std::optional<size_t> mul_check(size_t a, size_t b) {
             size_t prod;
             const bool ok = adrt::_impl::mul_check(a, b, prod);
@@ -247,7 +359,42 @@ namespace adrt {
             return prod;
         }
 
-    } // End adrt::_common
+        size_t cache_size_l2() {
+            // Query once, the value is reused by every transform call
+            static const size_t size = []() {
+                const size_t queried = adrt::_impl::query_cache_size_l2();
+                return (queried > 0u) ? queried : adrt::_impl::default_cache_size_l2;
+            }();
+            return size;
+        }
+
+        size_t max_threads() {
+            #ifdef _OPENMP
+            return static_cast<size_t>(std::max(omp_get_max_threads(), 1));
+            #else
+            return 1;
+            #endif
+        }
+
+        void set_max_threads(size_t num_threads) {
+            // Applies to parallel regions started by the calling thread
+            assert(num_threads > 0u);
+            #ifdef _OPENMP
+            omp_set_num_threads(static_cast<int>(std::min(num_threads, static_cast<size_t>(std::numeric_limits<int>::max()))));
+            #else
+            static_cast<void>(num_threads);
+            #endif
+        }
+
+        bool batch_parallel(size_t batch, size_t image_bytes) {
+            // Give each thread whole images when every thread gets several of them
+            // (balancing the load) and one image's buffers fit in its cache.
+            // Otherwise threads cooperate on each level of the same images.
+            const size_t num_threads = adrt::_common::max_threads();
+            return (num_threads > 1u) && (batch / num_threads >= adrt::_impl::min_images_per_thread) && (image_bytes <= adrt::_common::cache_size_l2());
+        }
+
+    } // End adrt::_baseline
 
     // Implementation for adrt
     bool adrt_is_valid_shape(const std::array<size_t, 3> &shape) {
@@ -331,6 +478,59 @@ namespace adrt {
         return shape;
     }
 
+    bool adrt_adjoint_is_valid_shape(const std::array<size_t, 4> &shape) {
+        // The adjoint takes the same inputs as bdrt, reuse
+        return adrt::bdrt_is_valid_shape(shape);
+    }
+
+    std::array<size_t, 6> adrt_adjoint_buffer_shape(const std::array<size_t, 4> &shape) {
+        return {
+            2, // bdrt result and scratch space
+            std::get<0>(shape), // batch
+            4, // quadrant
+            std::get<3>(shape), // col
+            1, // sections
+            std::get<2>(shape), // row
+        };
+    }
+
+    std::array<size_t, 3> adrt_adjoint_result_shape(const std::array<size_t, 4> &shape) {
+        return {
+            std::get<0>(shape), // batch
+            std::get<3>(shape), // N
+            std::get<3>(shape), // N
+        };
+    }
+
+    std::array<size_t, 4> adrt_adjoint_quadrant_result_shape(const std::array<size_t, 4> &shape) {
+        return {
+            std::get<0>(shape), // batch
+            4, // quadrant
+            std::get<3>(shape), // N
+            std::get<3>(shape), // N
+        };
+    }
+
+    bool adrt_normal_is_valid_shape(const std::array<size_t, 3> &shape) {
+        // The normal operator takes the same inputs as adrt, reuse
+        return adrt::adrt_is_valid_shape(shape);
+    }
+
+    std::array<size_t, 6> adrt_normal_buffer_shape(const std::array<size_t, 3> &shape) {
+        return {
+            3, // adrt result and two working buffers
+            std::get<0>(shape), // batch
+            4, // quadrant
+            std::get<1>(shape), // N
+            1, // sections
+            2_uz * std::get<2>(shape) - 1_uz, // No overflow because n^2 fits in size_t, so must 2*n
+        };
+    }
+
+    std::array<size_t, 3> adrt_normal_result_shape(const std::array<size_t, 3> &shape) {
+        return shape;
+    }
+
     bool iadrt_is_valid_shape(const std::array<size_t, 4> &shape) {
         // bdrt also requires its input to have the shape of an adrt result, reuse
         return adrt::bdrt_is_valid_shape(shape);
@@ -406,4 +606,46 @@ namespace adrt {
         return shape;
     }
 
+    bool iadrt_fmg_step_is_valid_shape(const std::array<size_t, 4> &shape) {
+        // The step takes the same inputs as bdrt, reuse
+        return adrt::bdrt_is_valid_shape(shape);
+    }
+
+    std::array<size_t, 6> iadrt_fmg_step_buffer_shape(const std::array<size_t, 4> &shape) {
+        return {
+            4, // adrt result, two working buffers, and the restriction pyramid with coarse estimates
+            std::get<0>(shape), // batch
+            4, // quadrant
+            std::get<3>(shape), // col
+            1, // sections
+            std::get<2>(shape), // row
+        };
+    }
+
+    std::array<size_t, 3> iadrt_fmg_step_result_shape(const std::array<size_t, 4> &shape) {
+        return {
+            std::get<0>(shape), // batch
+            std::get<3>(shape), // N
+            std::get<3>(shape), // N
+        };
+    }
+
+    bool fmg_precondition_is_valid_shape(const std::array<size_t, 3> &shape) {
+        // The preconditioner filters images of the same shape as adrt inputs, reuse
+        return adrt::adrt_is_valid_shape(shape);
+    }
+
+    std::array<size_t, 4> fmg_precondition_buffer_shape(const std::array<size_t, 3> &shape) {
+        return {
+            2, // row pass and smoothed image
+            std::get<0>(shape), // batch
+            std::get<1>(shape), // N
+            std::get<2>(shape), // N
+        };
+    }
+
+    std::array<size_t, 3> fmg_precondition_result_shape(const std::array<size_t, 3> &shape) {
+        return shape;
+    }
+
 } // End namespace adrt
@@ -54,12 +54,49 @@
 #define ADRT_RESTRICT
 #endif
 
+// Kernels may be compiled several times for different instruction sets.
+// Each build places its templates and functions in a separate inline
+// namespace so that the copies are kept distinct when linked together.
+// Functions defined in adrt_cdefs_common.cpp are compiled only once, for
+// the baseline instruction set, and are declared outside that namespace.
+#ifndef ADRT_ISA_NAMESPACE
+#define ADRT_ISA_NAMESPACE isa_baseline
+#endif
+
 namespace adrt {
 
     using std::size_t;
 
+    // Defined in: adrt_cdefs_common.cpp
     int num_iters(size_t shape);
 
+    namespace _baseline {
+
+        std::optional<size_t> mul_check(size_t a, size_t b);
+
+        std::optional<size_t> shape_product(const size_t *shape, size_t n);
+
+        size_t cache_size_l2();
+
+        size_t max_threads();
+
+        void set_max_threads(size_t num_threads);
+
+        bool batch_parallel(size_t batch, size_t image_bytes);
+
+    } // end namespace adrt::_baseline
+
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
+    using std::size_t;
+
+    inline bool is_valid_radix(int radix) {
+        // Iterative transforms merge either one (radix-2) or two (radix-4) levels per pass
+        return radix == 2 || radix == 4;
+    }
+
     inline namespace _literals {
         constexpr size_t operator""_uz(unsigned long long val) {
             return static_cast<size_t>(val);
@@ -117,9 +154,12 @@ namespace adrt {
 
     namespace _common {
 
-        std::optional<size_t> mul_check(size_t a, size_t b);
-
-        std::optional<size_t> shape_product(const size_t *shape, size_t n);
+        using adrt::_baseline::mul_check;
+        using adrt::_baseline::shape_product;
+        using adrt::_baseline::cache_size_l2;
+        using adrt::_baseline::max_threads;
+        using adrt::_baseline::set_max_threads;
+        using adrt::_baseline::batch_parallel;
 
         template<size_t N>
         std::optional<size_t> shape_product(const std::array<size_t, N> &shape) {
@@ -211,6 +251,6 @@ namespace adrt {
         }
     } // end namespace adrt::_assert
 
-} // end namespace adrt
+}} // end namespace adrt
 
 #endif //ADRT_CDEFS_COMMON_H
@@ -0,0 +1,186 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <cstddef>
+
+// Instruction set variants are only used on x86-64. Other architectures (for
+// example in macOS universal builds) always use the baseline kernels.
+#if defined(__x86_64__) || defined(_M_X64)
+#ifdef ADRT_DISPATCH_AVX2
+#define ADRT_USE_AVX2
+#endif
+#ifdef ADRT_DISPATCH_AVX512
+#define ADRT_USE_AVX512
+#endif
+#endif
+
+#if defined(_MSC_VER) && (defined(ADRT_USE_AVX2) || defined(ADRT_USE_AVX512))
+// MSVC intrinsics
+#include <intrin.h>
+#include <immintrin.h>
+#endif
+
+#include "adrt_cdefs_common.hpp"
+#include "adrt_cdefs_dispatch.hpp"
+
+namespace adrt {
+
+    // Defined in: adrt_cdefs_kernels.cpp, each compiled with extra instruction sets enabled
+    #ifdef ADRT_USE_AVX2
+    namespace isa_avx2 {
+        const adrt::_dispatch::kernel_table &isa_kernels();
+    }
+    #endif
+
+    #ifdef ADRT_USE_AVX512
+    namespace isa_avx512 {
+        const adrt::_dispatch::kernel_table &isa_kernels();
+    }
+    #endif
+
+} // end namespace adrt
+
+namespace adrt { namespace _dispatch { namespace {
+
+struct kernel_variant {
+    const char *name;
+    const kernel_table *kernels;
+};
+
+#if defined(ADRT_USE_AVX2) || defined(ADRT_USE_AVX512)
+
+#if defined(__GNUC__) || defined(__clang__)
+
+[[maybe_unused]] bool cpu_supports_avx2() {
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+}
+
+[[maybe_unused]] bool cpu_supports_avx512() {
+    __builtin_cpu_init();
+    return (adrt::_dispatch::cpu_supports_avx2() &&
+            __builtin_cpu_supports("avx512f") &&
+            __builtin_cpu_supports("avx512cd") &&
+            __builtin_cpu_supports("avx512vl") &&
+            __builtin_cpu_supports("avx512bw") &&
+            __builtin_cpu_supports("avx512dq"));
+}
+
+#elif defined(_MSC_VER)
+
+bool cpuid_bit(int reg, int bit) {
+    return ((static_cast<unsigned int>(reg) >> bit) & 1u) != 0u;
+}
+
+[[maybe_unused]] bool cpu_supports_avx2() {
+    int info[4];
+    __cpuid(info, 0);
+    if(info[0] < 7) {
+        return false;
+    }
+    __cpuid(info, 1);
+    // Require OS support for saving the AVX registers (XMM and YMM state)
+    if(!adrt::_dispatch::cpuid_bit(info[2], 27) || !adrt::_dispatch::cpuid_bit(info[2], 28) || !adrt::_dispatch::cpuid_bit(info[2], 12)) {
+        return false;
+    }
+    if((_xgetbv(0) & 0x6u) != 0x6u) {
+        return false;
+    }
+    __cpuidex(info, 7, 0);
+    return adrt::_dispatch::cpuid_bit(info[1], 5);
+}
+
+[[maybe_unused]] bool cpu_supports_avx512() {
+    if(!adrt::_dispatch::cpu_supports_avx2()) {
+        return false;
+    }
+    // Require OS support for saving the AVX-512 registers (opmask, ZMM state)
+    if((_xgetbv(0) & 0xe6u) != 0xe6u) {
+        return false;
+    }
+    int info[4];
+    __cpuidex(info, 7, 0);
+    // Check for F, DQ, CD, BW, VL
+    return (adrt::_dispatch::cpuid_bit(info[1], 16) &&
+            adrt::_dispatch::cpuid_bit(info[1], 17) &&
+            adrt::_dispatch::cpuid_bit(info[1], 28) &&
+            adrt::_dispatch::cpuid_bit(info[1], 30) &&
+            adrt::_dispatch::cpuid_bit(info[1], 31));
+}
+
+#else // No feature detection
+
+[[maybe_unused]] bool cpu_supports_avx2() {
+    return false;
+}
+
+[[maybe_unused]] bool cpu_supports_avx512() {
+    return false;
+}
+
+#endif // End platform cases
+
+#endif // End instruction set variants
+
+kernel_variant select_variant() {
+    // Prefer the widest instruction set supported by the CPU
+    #ifdef ADRT_USE_AVX512
+    if(adrt::_dispatch::cpu_supports_avx512()) {
+        return {"avx512", &adrt::isa_avx512::isa_kernels()};
+    }
+    #endif
+    #ifdef ADRT_USE_AVX2
+    if(adrt::_dispatch::cpu_supports_avx2()) {
+        return {"avx2", &adrt::isa_avx2::isa_kernels()};
+    }
+    #endif
+    return {"baseline", &adrt::isa_kernels()};
+}
+
+const kernel_variant &active_variant() {
+    static const kernel_variant variant = adrt::_dispatch::select_variant();
+    return variant;
+}
+
+}}} // end namespace adrt::_dispatch
+
+namespace adrt { namespace _dispatch {
+
+    const kernel_table &active_kernels() {
+        return *adrt::_dispatch::active_variant().kernels;
+    }
+
+    const char *active_variant_name() {
+        return adrt::_dispatch::active_variant().name;
+    }
+
+}} // end namespace adrt::_dispatch
@@ -0,0 +1,190 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef ADRT_CDEFS_DISPATCH_H
+#define ADRT_CDEFS_DISPATCH_H
+
+#include <cstddef>
+#include <cstdint>
+#include <array>
+#include <type_traits>
+#include "adrt_cdefs_common.hpp"
+
+namespace adrt { namespace _dispatch {
+
+    using std::size_t;
+
+    // Float type used for index calculations in interp_adrtcart
+    using interp_index_type = float;
+
+    // Kernels for one scalar type, compiled for one instruction set
+    template <typename adrt_scalar>
+    struct kernel_set {
+        void (*adrt_basic)(const adrt_scalar *data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *tmp, adrt_scalar *out, int radix);
+        void (*adrt_wide_basic)(const adrt_scalar *data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, double *tmp, adrt_scalar *out, int radix);
+        void (*iadrt_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *tmp, adrt_scalar *out);
+        void (*iadrt_wide_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *tmp, adrt_scalar *out);
+        void (*bdrt_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *tmp, adrt_scalar *out, int radix);
+        void (*bdrt_wide_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, double *tmp, adrt_scalar *out, int radix);
+        void (*adrt_adjoint_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *tmp, adrt_scalar *out, bool per_quadrant, int radix);
+        void (*adrt_normal_basic)(const adrt_scalar *data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *tmp, adrt_scalar *out, adrt_scalar ridge, int radix);
+        void (*iadrt_fmg_step_basic)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *tmp, adrt_scalar *out, int radix);
+        void (*fmg_precondition_basic)(const adrt_scalar *data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *tmp, adrt_scalar *out);
+        void (*fmg_highpass)(const adrt_scalar *data, const std::array<size_t, 3> &shape, adrt_scalar *out);
+        void (*interp_adrtcart)(const adrt_scalar *data, const std::array<size_t, 4> &shape, adrt_scalar *out);
+        void (*interp_adrtcart_gather)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::int16_t *heights, const std::int32_t *quadrants, const std::int32_t *slopes, const adrt_scalar *factors, adrt_scalar *out);
+        void (*interp_adrtcart_coords)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const double *theta, size_t num_theta, const double *t, size_t num_t, bool bilinear, adrt_scalar *out);
+        void (*interp_adrtcart_gather_adjoint)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const std::int16_t *heights, const std::int32_t *quadrants, const std::int32_t *slopes, const adrt_scalar *factors, size_t *bin_starts, size_t *bin_angles, adrt_scalar *out);
+        void (*interp_adrtcart_coords_adjoint)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const double *theta, size_t num_theta, const double *t, size_t num_t, bool bilinear, size_t *bin_starts, size_t *bin_angles, adrt_scalar *out);
+        void (*interp_adrtcart_sample)(const adrt_scalar *data, const std::array<size_t, 4> &shape, const double *theta, const double *t, size_t count, bool bilinear, adrt_scalar *out);
+    };
+
+    struct kernel_table {
+        kernel_set<float> float32;
+        kernel_set<double> float64;
+    };
+
+}} // end namespace adrt::_dispatch
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
+    // Defined in: adrt_cdefs_kernels.cpp, kernels for the instruction set of this build
+    const adrt::_dispatch::kernel_table &isa_kernels();
+
+}} // end namespace adrt
+
+namespace adrt { namespace _dispatch {
+
+    // Defined in: adrt_cdefs_dispatch.cpp
+    // The variant is selected once, based on the features of the running CPU
+    const kernel_table &active_kernels();
+    const char *active_variant_name();
+
+    template <typename adrt_scalar>
+    const kernel_set<adrt_scalar> &active_kernel_set() {
+        static_assert(std::is_same_v<adrt_scalar, float> || std::is_same_v<adrt_scalar, double>, "Kernels are only available for float and double");
+        if constexpr(std::is_same_v<adrt_scalar, float>) {
+            return adrt::_dispatch::active_kernels().float32;
+        }
+        else {
+            return adrt::_dispatch::active_kernels().float64;
+        }
+    }
+
+    template <typename adrt_scalar>
+    void adrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().adrt_basic(data, shape, data_strides, tmp, out, radix);
+    }
+
+    template <typename adrt_scalar>
+    void adrt_wide_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, double *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().adrt_wide_basic(data, shape, data_strides, tmp, out, radix);
+    }
+
+    template <typename adrt_scalar>
+    void iadrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().iadrt_basic(data, shape, data_strides, tmp, out);
+    }
+
+    template <typename adrt_scalar>
+    void iadrt_wide_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().iadrt_wide_basic(data, shape, data_strides, tmp, out);
+    }
+
+    template <typename adrt_scalar>
+    void bdrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().bdrt_basic(data, shape, data_strides, tmp, out, radix);
+    }
+
+    template <typename adrt_scalar>
+    void bdrt_wide_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, double *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().bdrt_wide_basic(data, shape, data_strides, tmp, out, radix);
+    }
+
+    template <typename adrt_scalar>
+    void adrt_adjoint_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, bool per_quadrant, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().adrt_adjoint_basic(data, shape, data_strides, tmp, out, per_quadrant, radix);
+    }
+
+    template <typename adrt_scalar>
+    void adrt_normal_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, adrt_scalar ridge, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().adrt_normal_basic(data, shape, data_strides, tmp, out, ridge, radix);
+    }
+
+    template <typename adrt_scalar>
+    void iadrt_fmg_step_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().iadrt_fmg_step_basic(data, shape, data_strides, tmp, out, radix);
+    }
+
+    template <typename adrt_scalar>
+    void fmg_precondition_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().fmg_precondition_basic(data, shape, data_strides, tmp, out);
+    }
+
+    template <typename adrt_scalar>
+    void fmg_highpass(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().fmg_highpass(data, shape, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart(data, shape, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_gather(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::int16_t *const ADRT_RESTRICT heights, const std::int32_t *const ADRT_RESTRICT quadrants, const std::int32_t *const ADRT_RESTRICT slopes, const adrt_scalar *const ADRT_RESTRICT factors, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart_gather(data, shape, heights, quadrants, slopes, factors, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_coords(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const double *const ADRT_RESTRICT theta, size_t num_theta, const double *const ADRT_RESTRICT t, size_t num_t, bool bilinear, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart_coords(data, shape, theta, num_theta, t, num_t, bilinear, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_gather_adjoint(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::int16_t *const ADRT_RESTRICT heights, const std::int32_t *const ADRT_RESTRICT quadrants, const std::int32_t *const ADRT_RESTRICT slopes, const adrt_scalar *const ADRT_RESTRICT factors, size_t *const ADRT_RESTRICT bin_starts, size_t *const ADRT_RESTRICT bin_angles, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart_gather_adjoint(data, shape, heights, quadrants, slopes, factors, bin_starts, bin_angles, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_coords_adjoint(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const double *const ADRT_RESTRICT theta, size_t num_theta, const double *const ADRT_RESTRICT t, size_t num_t, bool bilinear, size_t *const ADRT_RESTRICT bin_starts, size_t *const ADRT_RESTRICT bin_angles, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart_coords_adjoint(data, shape, theta, num_theta, t, num_t, bilinear, bin_starts, bin_angles, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_sample(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const double *const ADRT_RESTRICT theta, const double *const ADRT_RESTRICT t, size_t count, bool bilinear, adrt_scalar *const ADRT_RESTRICT out) {
+        adrt::_dispatch::active_kernel_set<adrt_scalar>().interp_adrtcart_sample(data, shape, theta, t, count, bilinear, out);
+    }
+
+}} // end namespace adrt::_dispatch
+
+#endif // ADRT_CDEFS_DISPATCH_H
@@ -37,6 +37,8 @@
 #include <cassert>
 #include <type_traits>
 #include "adrt_cdefs_common.hpp"
+#include "adrt_cdefs_adrt.hpp"
+#include "adrt_cdefs_bdrt.hpp"
 
 namespace adrt {
 
@@ -47,23 +49,31 @@ namespace adrt {
     std::array<size_t, 4> fmg_restriction_result_shape(const std::array<size_t, 4> &shape);
     std::array<size_t, 3> fmg_prolongation_result_shape(const std::array<size_t, 3> &shape);
     std::array<size_t, 3> fmg_highpass_result_shape(const std::array<size_t, 3> &shape);
+    bool iadrt_fmg_step_is_valid_shape(const std::array<size_t, 4> &shape);
+    std::array<size_t, 6> iadrt_fmg_step_buffer_shape(const std::array<size_t, 4> &shape);
+    std::array<size_t, 3> iadrt_fmg_step_result_shape(const std::array<size_t, 4> &shape);
+    bool fmg_precondition_is_valid_shape(const std::array<size_t, 3> &shape);
+    std::array<size_t, 4> fmg_precondition_buffer_shape(const std::array<size_t, 3> &shape);
+    std::array<size_t, 3> fmg_precondition_result_shape(const std::array<size_t, 3> &shape);
 
-    template <typename adrt_scalar>
-    void fmg_restriction(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT out) {
-        static_assert(std::is_floating_point_v<adrt_scalar>, "FMG restriction requires floating point");
-        assert(data);
-        assert(out);
-        assert(adrt::fmg_restriction_is_valid_shape(shape));
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
+    namespace _impl {
 
+    template <typename adrt_scalar>
+    void fmg_restriction_level(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
         const std::array<size_t, 4> output_shape = adrt::fmg_restriction_result_shape(shape);
 
-        ADRT_OPENMP("omp parallel for collapse(4) default(none) shared(data, shape, out, output_shape)")
+        ADRT_OPENMP("omp for collapse(4)")
         for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
             for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
                 for(size_t row = 0; row < std::get<2>(output_shape); ++row) {
                     for(size_t col = 0; col < std::get<3>(output_shape); ++col) {
-                        const adrt_scalar val_a = adrt::_common::array_access(data, shape, batch, quadrant, 2_uz * row, 2_uz * col);
-                        const adrt_scalar val_b = adrt::_common::array_access(data, shape, batch, quadrant, 2_uz * row + 1_uz, 2_uz * col);
+                        const adrt_scalar val_a = adrt::_common::array_stride_access(data, data_strides, batch, quadrant, 2_uz * row, 2_uz * col);
+                        const adrt_scalar val_b = adrt::_common::array_stride_access(data, data_strides, batch, quadrant, 2_uz * row + 1_uz, 2_uz * col);
                         adrt::_common::array_access(out, output_shape, batch, quadrant, row, col) = (val_a + val_b) / static_cast<adrt_scalar>(4);
                     }
                 }
@@ -72,14 +82,11 @@ namespace adrt {
     }
 
     template <typename adrt_scalar>
-    void fmg_prolongation(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
-        assert(data);
-        assert(out);
-        assert(adrt::fmg_prolongation_is_valid_shape(shape));
-
+    void fmg_prolongation_level(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
         const std::array<size_t, 3> output_shape = adrt::fmg_prolongation_result_shape(shape);
 
-        ADRT_OPENMP("omp parallel for collapse(3) default(none) shared(data, shape, out, output_shape)")
+        ADRT_OPENMP("omp for collapse(3)")
         for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
             for(size_t row = 0; row < std::get<1>(shape); ++row) {
                 for(size_t col = 0; col < std::get<2>(shape); ++col) {
@@ -93,83 +100,394 @@ namespace adrt {
         }
     }
 
-    template <typename adrt_scalar>
-    void fmg_highpass(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+    template <typename adrt_scalar, typename store_fn>
+    void fmg_highpass_row(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, size_t batch, size_t row, store_fn &&store) {
+        // Filters one row of one image, passing each (col, value) pair to store
         static_assert(std::is_floating_point_v<adrt_scalar>, "FMG high-pass filter requires floating point");
-        assert(data);
-        assert(out);
-        assert(adrt::fmg_highpass_is_valid_shape(shape));
-        assert(shape == adrt::fmg_highpass_result_shape(shape));
 
         // Convolution constants for kernel [[a, b, a], [b, c, b], [a, b, a]]
         const adrt_scalar conv_a = static_cast<adrt_scalar>(-0.0625L); // -1/16
         const adrt_scalar conv_b = static_cast<adrt_scalar>(-0.125L); // -1/8
         const adrt_scalar conv_c = static_cast<adrt_scalar>(0.75L); // 3/4
 
-        ADRT_OPENMP("omp parallel for collapse(2) default(none) shared(data, shape, out, conv_a, conv_b, conv_c)")
+        const size_t prev_row = (row == 0u ? 1_uz : row - 1_uz);
+        const size_t next_row = (row == std::get<1>(shape) - 1_uz ? row - 1_uz : row + 1_uz);
+
+        // First col
+        {
+            const size_t col = 0;
+            const size_t prev_col = 1;
+            // Conv row 1
+            const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
+            const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
+            // Conv row 2
+            const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
+            const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
+            // Conv row 3
+            const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
+            const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
+            // Store result
+            store(col, (v11 + v21 + v31) + (v12 + v22 + v32) + (v11 + v21 + v31));
+        }
+
+        // Middle columns
+        ADRT_OPENMP("omp simd")
+        for(size_t col = 1; col < std::get<2>(shape) - 1_uz; ++col) {
+            const size_t prev_col = col - 1_uz;
+            const size_t next_col = col + 1_uz;
+            // Conv row 1
+            const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
+            const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
+            const adrt_scalar v13 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, next_col);
+            // Conv row 2
+            const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
+            const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
+            const adrt_scalar v23 = conv_b * adrt::_common::array_access(data, shape, batch, row, next_col);
+            // Conv row 3
+            const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
+            const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
+            const adrt_scalar v33 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, next_col);
+            // Store result
+            store(col, (v11 + v21 + v31) + (v12 + v22 + v32) + (v13 + v23 + v33));
+        }
+
+        // Last col
+        {
+            const size_t col = std::get<2>(shape) - 1_uz;
+            const size_t prev_col = col - 1_uz;
+            // Conv row 1
+            const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
+            const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
+            // Conv row 2
+            const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
+            const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
+            // Conv row 3
+            const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
+            const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
+            // Store result
+            store(col, (v11 + v21 + v31) + (v12 + v22 + v32) + (v11 + v21 + v31));
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_highpass_level(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        ADRT_OPENMP("omp for collapse(2)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t row = 0; row < std::get<1>(shape); ++row) {
+                adrt::_impl::fmg_highpass_row(data, shape, batch, row, [out, &shape, batch, row](size_t col, adrt_scalar val) {
+                    adrt::_common::array_access(out, shape, batch, row, col) = val;
+                });
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_highpass_correct(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar scale, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        // Subtracts the filtered, scaled correction in data from the estimate in out
+        ADRT_OPENMP("omp for collapse(2)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t row = 0; row < std::get<1>(shape); ++row) {
+                adrt::_impl::fmg_highpass_row(data, shape, batch, row, [out, &shape, batch, row, scale](size_t col, adrt_scalar val) {
+                    adrt::_common::array_access(out, shape, batch, row, col) -= scale * val;
+                });
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_subtract_level(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        ADRT_OPENMP("omp for collapse(3)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
+                for(size_t row = 0; row < std::get<2>(shape); ++row) {
+                    ADRT_OPENMP("omp simd")
+                    for(size_t col = 0; col < std::get<3>(shape); ++col) {
+                        adrt::_common::array_access(out, shape, batch, quadrant, row, col) -= adrt::_common::array_stride_access(data, data_strides, batch, quadrant, row, col);
+                    }
+                }
+            }
+        }
+    }
+
+    inline size_t fmg_level_size(size_t n) {
+        // Elements in one restricted ADRT output of width n
+        return 4_uz * (2_uz * n - 1_uz) * n;
+    }
+
+    inline size_t fmg_pyramid_size(size_t n) {
+        // Elements in all restrictions of an ADRT output of width n
+        size_t size = 0;
+        for(size_t width = n / 2_uz; width > 0u; width /= 2_uz) {
+            size += adrt::_impl::fmg_level_size(width);
+        }
+        return size;
+    }
+
+    template <typename adrt_scalar>
+    void iadrt_fmg_step_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT proj, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT scratch, adrt_scalar *const ADRT_RESTRICT pyramid, adrt_scalar *const ADRT_RESTRICT out, int radix, bool cooperative) {
+        // The pyramid buffer holds each restriction of the input, finest first, followed by one
+        // image buffer for coarse estimates and one for the corrections
+        assert(data);
+        assert(proj);
+        assert(tmp);
+        assert(scratch);
+        assert(pyramid);
+        assert(out);
+        assert(adrt::iadrt_fmg_step_is_valid_shape(shape));
+
+        const size_t batch_size = std::get<0>(shape);
+        const size_t n = std::get<3>(shape);
+        const int num_levels = adrt::num_iters(n);
+
+        // Restrict the input down to width one
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, pyramid, batch_size, num_levels)")
+        {
+            const adrt_scalar *prev_data = data;
+            std::array<size_t, 4> prev_shape = shape;
+            std::array<size_t, 4> prev_strides = data_strides;
+            adrt_scalar *level_data = pyramid;
+            for(int level = 0; level < num_levels; ++level) {
+                adrt::_impl::fmg_restriction_level(prev_data, prev_shape, prev_strides, level_data);
+                prev_data = level_data;
+                prev_shape = adrt::fmg_restriction_result_shape(prev_shape);
+                prev_strides = adrt::_common::compute_strides(prev_shape);
+                level_data += batch_size * adrt::_impl::fmg_level_size(std::get<3>(prev_shape));
+            }
+        }
+        adrt_scalar *const coarse = pyramid + batch_size * adrt::_impl::fmg_pyramid_size(n);
+        adrt_scalar *const correction = coarse + batch_size * n * n;
+
+        // Estimates alternate between out and coarse so that the finest level lands in out
+        const auto estimate_buffer = [out, coarse](int level) {
+            return (level % 2 == 0 ? out : coarse);
+        };
+
+        // The coarsest estimate is the single entry of the first quadrant of the last restriction
+        const adrt_scalar *level_data = (num_levels == 0 ? data : coarse - batch_size * adrt::_impl::fmg_level_size(1));
+        {
+            const std::array<size_t, 4> level_strides = (num_levels == 0 ? data_strides : adrt::_common::compute_strides(std::array<size_t, 4>{batch_size, 4, 1, 1}));
+            adrt_scalar *const estimate = estimate_buffer(num_levels);
+            for(size_t batch = 0; batch < batch_size; ++batch) {
+                estimate[batch] = adrt::_common::array_stride_access(level_data, level_strides, batch, 0_uz, 0_uz, 0_uz);
+            }
+        }
+
+        // Prolong and correct up to the full width
+        for(int level = num_levels - 1; level >= 0; --level) {
+            const size_t width = n >> static_cast<size_t>(level);
+            const std::array<size_t, 3> coarse_shape = {batch_size, width / 2_uz, width / 2_uz};
+            const std::array<size_t, 3> image_shape = {batch_size, width, width};
+            const std::array<size_t, 3> image_strides = adrt::_common::compute_strides(image_shape);
+            const std::array<size_t, 4> proj_shape = adrt::adrt_result_shape(image_shape);
+            const std::array<size_t, 4> proj_strides = adrt::_common::compute_strides(proj_shape);
+            // The restricted input at this level, or the original input at the finest level
+            level_data = (level == 0 ? data : level_data - batch_size * adrt::_impl::fmg_level_size(width));
+            const adrt_scalar *const target = level_data;
+            const std::array<size_t, 4> target_strides = (level == 0 ? data_strides : proj_strides);
+            const adrt_scalar *const prev_estimate = estimate_buffer(level + 1);
+            adrt_scalar *const estimate = estimate_buffer(level);
+            const adrt_scalar scale = static_cast<adrt_scalar>(1) / static_cast<adrt_scalar>(4_uz * (width - 1_uz));
+
+            ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(prev_estimate, coarse_shape, estimate)")
+            {
+                adrt::_impl::fmg_prolongation_level(prev_estimate, coarse_shape, estimate);
+            }
+            adrt::_impl::adrt_levels(static_cast<const adrt_scalar*>(estimate), image_shape, image_strides, tmp, proj, radix, cooperative);
+            ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(target, proj_shape, target_strides, proj)")
+            {
+                adrt::_impl::fmg_subtract_level(target, proj_shape, target_strides, proj);
+            }
+            adrt::_impl::adrt_adjoint_levels(static_cast<const adrt_scalar*>(proj), proj_shape, proj_strides, tmp, scratch, correction, false, radix, cooperative);
+            ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(correction, image_shape, scale, estimate)")
+            {
+                adrt::_impl::fmg_highpass_correct(static_cast<const adrt_scalar*>(correction), image_shape, scale, estimate);
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_precondition_init(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        ADRT_OPENMP("omp for collapse(2)")
         for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
             for(size_t row = 0; row < std::get<1>(shape); ++row) {
-                const size_t prev_row = (row == 0u ? 1_uz : row - 1_uz);
-                const size_t next_row = (row == std::get<1>(shape) - 1_uz ? row - 1_uz : row + 1_uz);
-
-                // First col
-                {
-                    const size_t col = 0;
-                    const size_t prev_col = 1;
-                    // Conv row 1
-                    const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
-                    const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
-                    // Conv row 2
-                    const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
-                    const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
-                    // Conv row 3
-                    const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
-                    const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
-                    // Store result
-                    adrt::_common::array_access(out, shape, batch, row, col) = (v11 + v21 + v31) + (v12 + v22 + v32) + (v11 + v21 + v31);
+                ADRT_OPENMP("omp simd")
+                for(size_t col = 0; col < std::get<2>(shape); ++col) {
+                    adrt::_common::array_access(out, shape, batch, row, col) = adrt::_common::array_stride_access(data, data_strides, batch, row, col);
                 }
+            }
+        }
+    }
 
-                // Middle columns
+    inline size_t fmg_precondition_reflect_prev(size_t idx, size_t spacing) {
+        // Index spacing entries before idx, mirrored about the edge between samples
+        return (idx >= spacing ? idx - spacing : spacing - 1_uz - idx);
+    }
+
+    inline size_t fmg_precondition_reflect_next(size_t idx, size_t spacing, size_t len) {
+        // Index spacing entries after idx, mirrored about the edge between samples
+        return (idx + spacing < len ? idx + spacing : 2_uz * len - 1_uz - idx - spacing);
+    }
+
+    template <typename adrt_scalar>
+    void fmg_precondition_smooth_rows(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, size_t spacing, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        // Applies the binomial kernel [1/4, 1/2, 1/4], dilated by spacing, along each row
+        const adrt_scalar quarter = static_cast<adrt_scalar>(0.25L);
+        const adrt_scalar half = static_cast<adrt_scalar>(0.5L);
+        ADRT_OPENMP("omp for collapse(2)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t row = 0; row < std::get<1>(shape); ++row) {
                 ADRT_OPENMP("omp simd")
-                for(size_t col = 1; col < std::get<2>(shape) - 1_uz; ++col) {
-                    const size_t prev_col = col - 1_uz;
-                    const size_t next_col = col + 1_uz;
-                    // Conv row 1
-                    const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
-                    const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
-                    const adrt_scalar v13 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, next_col);
-                    // Conv row 2
-                    const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
-                    const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
-                    const adrt_scalar v23 = conv_b * adrt::_common::array_access(data, shape, batch, row, next_col);
-                    // Conv row 3
-                    const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
-                    const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
-                    const adrt_scalar v33 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, next_col);
-                    // Store result
-                    adrt::_common::array_access(out, shape, batch, row, col) = (v11 + v21 + v31) + (v12 + v22 + v32) + (v13 + v23 + v33);
+                for(size_t col = 0; col < std::get<2>(shape); ++col) {
+                    const size_t prev_col = adrt::_impl::fmg_precondition_reflect_prev(col, spacing);
+                    const size_t next_col = adrt::_impl::fmg_precondition_reflect_next(col, spacing, std::get<2>(shape));
+                    const adrt_scalar outer = adrt::_common::array_stride_access(data, data_strides, batch, row, prev_col) + adrt::_common::array_stride_access(data, data_strides, batch, row, next_col);
+                    adrt::_common::array_access(out, shape, batch, row, col) = quarter * outer + half * adrt::_common::array_stride_access(data, data_strides, batch, row, col);
                 }
+            }
+        }
+    }
 
-                // Last col
-                {
-                    const size_t col = std::get<2>(shape) - 1_uz;
-                    const size_t prev_col = col - 1_uz;
-                    // Conv row 1
-                    const adrt_scalar v11 = conv_a * adrt::_common::array_access(data, shape, batch, prev_row, prev_col);
-                    const adrt_scalar v12 = conv_b * adrt::_common::array_access(data, shape, batch, prev_row, col);
-                    // Conv row 2
-                    const adrt_scalar v21 = conv_b * adrt::_common::array_access(data, shape, batch, row, prev_col);
-                    const adrt_scalar v22 = conv_c * adrt::_common::array_access(data, shape, batch, row, col);
-                    // Conv row 3
-                    const adrt_scalar v31 = conv_a * adrt::_common::array_access(data, shape, batch, next_row, prev_col);
-                    const adrt_scalar v32 = conv_b * adrt::_common::array_access(data, shape, batch, next_row, col);
-                    // Store result
-                    adrt::_common::array_access(out, shape, batch, row, col) = (v11 + v21 + v31) + (v12 + v22 + v32) + (v11 + v21 + v31);
+    template <typename adrt_scalar>
+    void fmg_precondition_smooth_cols(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, size_t spacing, adrt_scalar weight, adrt_scalar *const ADRT_RESTRICT smooth, adrt_scalar *const ADRT_RESTRICT out) {
+        // Must be called from inside a parallel region (or serially)
+        // Completes the smoothing along each column, storing it and subtracting its weighted value from out
+        const adrt_scalar quarter = static_cast<adrt_scalar>(0.25L);
+        const adrt_scalar half = static_cast<adrt_scalar>(0.5L);
+        ADRT_OPENMP("omp for collapse(2)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t row = 0; row < std::get<1>(shape); ++row) {
+                const size_t prev_row = adrt::_impl::fmg_precondition_reflect_prev(row, spacing);
+                const size_t next_row = adrt::_impl::fmg_precondition_reflect_next(row, spacing, std::get<1>(shape));
+                ADRT_OPENMP("omp simd")
+                for(size_t col = 0; col < std::get<2>(shape); ++col) {
+                    const adrt_scalar outer = adrt::_common::array_access(data, shape, batch, prev_row, col) + adrt::_common::array_access(data, shape, batch, next_row, col);
+                    const adrt_scalar val = quarter * outer + half * adrt::_common::array_access(data, shape, batch, row, col);
+                    adrt::_common::array_access(smooth, shape, batch, row, col) = val;
+                    adrt::_common::array_access(out, shape, batch, row, col) -= weight * val;
+                }
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_precondition_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT smooth, adrt_scalar *const ADRT_RESTRICT out, [[maybe_unused]] bool cooperative) {
+        // Computes out = data - sum_k 2^-k G_k data where G_k repeats the dilated smoothing with spacings 1, 2, ..., 2^(k-1)
+        static_assert(std::is_floating_point_v<adrt_scalar>, "FMG preconditioner requires floating point");
+        assert(adrt::fmg_precondition_is_valid_shape(shape));
+        const std::array<size_t, 3> smooth_strides = adrt::_common::compute_strides(shape);
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, tmp, smooth, out, smooth_strides)")
+        {
+            adrt::_impl::fmg_precondition_init(data, shape, data_strides, out);
+            adrt_scalar weight = static_cast<adrt_scalar>(0.5L);
+            for(size_t spacing = 1; spacing < std::get<2>(shape); spacing *= 2_uz) {
+                if(spacing == 1u) {
+                    adrt::_impl::fmg_precondition_smooth_rows(data, shape, data_strides, spacing, tmp);
+                }
+                else {
+                    adrt::_impl::fmg_precondition_smooth_rows(static_cast<const adrt_scalar*>(smooth), shape, smooth_strides, spacing, tmp);
                 }
+                adrt::_impl::fmg_precondition_smooth_cols(static_cast<const adrt_scalar*>(tmp), shape, spacing, weight, smooth, out);
+                weight /= 2;
+            }
+        }
+    }
+
+    } // end namespace: adrt::_impl
+
+    template <typename adrt_scalar>
+    void fmg_restriction(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        static_assert(std::is_floating_point_v<adrt_scalar>, "FMG restriction requires floating point");
+        assert(data);
+        assert(out);
+        assert(adrt::fmg_restriction_is_valid_shape(shape));
+
+        const std::array<size_t, 4> data_strides = adrt::_common::compute_strides(shape);
+
+        ADRT_OPENMP("omp parallel default(none) shared(data, shape, data_strides, out)")
+        {
+            adrt::_impl::fmg_restriction_level(data, shape, data_strides, out);
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_prolongation(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        assert(data);
+        assert(out);
+        assert(adrt::fmg_prolongation_is_valid_shape(shape));
+
+        ADRT_OPENMP("omp parallel default(none) shared(data, shape, out)")
+        {
+            adrt::_impl::fmg_prolongation_level(data, shape, out);
+        }
+    }
+
+    template <typename adrt_scalar>
+    void fmg_highpass(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, adrt_scalar *const ADRT_RESTRICT out) {
+        static_assert(std::is_floating_point_v<adrt_scalar>, "FMG high-pass filter requires floating point");
+        assert(data);
+        assert(out);
+        assert(adrt::fmg_highpass_is_valid_shape(shape));
+        assert(shape == adrt::fmg_highpass_result_shape(shape));
+
+        ADRT_OPENMP("omp parallel default(none) shared(data, shape, out)")
+        {
+            adrt::_impl::fmg_highpass_level(data, shape, out);
+        }
+    }
+
+    // DOC ANCHOR: adrt.core.iadrt_fmg_step +2
+    template <typename adrt_scalar>
+    void iadrt_fmg_step_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, int radix = 4) {
+        // The workspace holds four ADRT-sized buffers: the projections, two working buffers, and the pyramid
+        const std::array<size_t, 4> image_shape = {1, std::get<1>(shape), std::get<2>(shape), std::get<3>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape) * std::get<3>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::bdrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t out_size = std::get<3>(shape) * std::get<3>(shape);
+        const size_t image_bytes = (in_size + 4 * buf_size + out_size) * sizeof(adrt_scalar);
+        adrt_scalar *const proj = tmp;
+        adrt_scalar *const work = proj + std::get<0>(shape) * buf_size;
+        adrt_scalar *const scratch = work + std::get<0>(shape) * buf_size;
+        adrt_scalar *const pyramid = scratch + std::get<0>(shape) * buf_size;
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread runs every level of the multigrid for whole images
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, proj, work, scratch, pyramid, out, radix, image_shape, buf_size, out_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::iadrt_fmg_step_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, proj + batch * buf_size, work + batch * buf_size, scratch + batch * buf_size, pyramid + batch * buf_size, out + batch * out_size, radix, false);
             }
         }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::iadrt_fmg_step_levels(data, shape, data_strides, proj, work, scratch, pyramid, out, radix, true);
+        }
+    }
+
+    // DOC ANCHOR: adrt.core.fmg_precondition +2
+    template <typename adrt_scalar>
+    void fmg_precondition_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+        // The workspace holds two image-sized buffers: the row pass and the running smoothed image
+        const std::array<size_t, 3> image_shape = {1, std::get<1>(shape), std::get<2>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape);
+        const size_t image_bytes = 4 * in_size * sizeof(adrt_scalar);
+        adrt_scalar *const work = tmp;
+        adrt_scalar *const smooth = work + std::get<0>(shape) * in_size;
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread filters whole images
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, work, smooth, out, image_shape, in_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::fmg_precondition_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, work + batch * in_size, smooth + batch * in_size, out + batch * in_size, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::fmg_precondition_levels(data, shape, data_strides, work, smooth, out, true);
+        }
     }
 
-}
+}} // end namespace adrt
 
 #endif // ADRT_CDEFS_FMG_H
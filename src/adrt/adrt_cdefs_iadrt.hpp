@@ -35,6 +35,7 @@
 
 #include <array>
 #include <utility>
+#include <type_traits>
 #include <algorithm>
 #include <cassert>
 #include "adrt_cdefs_common.hpp"
@@ -46,9 +47,13 @@ namespace adrt {
     std::array<size_t, 5> iadrt_buffer_shape(const std::array<size_t, 4> &shape);
     std::array<size_t, 4> iadrt_result_shape(const std::array<size_t, 4> &shape);
 
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
     namespace _impl {
 
-    template <typename adrt_scalar>
+    template <typename adrt_scalar, typename accum_scalar>
     std::array<size_t, 5> iadrt_core(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 5> &in_shape, adrt_scalar *const ADRT_RESTRICT out) {
         assert(data);
         assert(out);
@@ -63,37 +68,86 @@ namespace adrt {
 
         assert(adrt::_assert::same_total_size(in_shape, curr_shape));
 
+        const size_t num_rows = std::get<4>(curr_shape);
         ADRT_OPENMP("omp for collapse(4)")
         for(size_t batch = 0; batch < std::get<0>(curr_shape); ++batch) {
             for(size_t quadrant = 0; quadrant < 4u; ++quadrant) {
                 for(size_t l = 0; l < std::get<2>(curr_shape); ++l) {
                     for(size_t col = 0; col < std::get<3>(curr_shape); ++col) {
                         const size_t prev_l = adrt::_common::floor_div2(l);
-                        // The loop below must be serial
-                        for(size_t rev_row = 0; rev_row < std::get<4>(curr_shape); ++rev_row) {
-                            const size_t row = std::get<4>(curr_shape) - rev_row - 1_uz;
-                            adrt_scalar val = 0;
+                        const bool has_next_col = (2_uz * col + 1_uz < std::get<3>(in_shape));
+                        const adrt_scalar *const ADRT_RESTRICT curr_line = &adrt::_common::array_access(data, in_shape, batch, quadrant, prev_l, 2_uz * col, 0_uz);
+                        // Only read when has_next_col is true
+                        const adrt_scalar *const ADRT_RESTRICT next_line = curr_line + (has_next_col ? num_rows : 0_uz);
+                        adrt_scalar *const ADRT_RESTRICT out_line = &adrt::_common::array_access(out, curr_shape, batch, quadrant, l, col, 0_uz);
+                        if constexpr(!std::is_same_v<adrt_scalar, accum_scalar>) {
+                            // Wide accumulation: form each difference and the running sum in accum_scalar, rounding only on store
+                            accum_scalar running_sum = 0;
                             if(l % 2_uz == 0u) {
                                 // l + 1 odd
-                                val += adrt::_common::array_access(data, in_shape, batch, quadrant, prev_l, 2_uz * col, row);
-                                if(row + 1_uz < std::get<4>(in_shape) && 2_uz * col + 1_uz < std::get<3>(in_shape)) {
-                                    val -= adrt::_common::array_access(data, in_shape, batch, quadrant, prev_l, 2_uz * col + 1_uz, row + 1_uz);
+                                const size_t num_pairs = (has_next_col ? num_rows - 1_uz : 0_uz);
+                                for(size_t row = num_rows; row > num_pairs; --row) {
+                                    running_sum += static_cast<accum_scalar>(curr_line[row - 1_uz]);
+                                    out_line[row - 1_uz] = static_cast<adrt_scalar>(running_sum);
+                                }
+                                for(size_t row = num_pairs; row > 0u; --row) {
+                                    running_sum += static_cast<accum_scalar>(curr_line[row - 1_uz]) - static_cast<accum_scalar>(next_line[row]);
+                                    out_line[row - 1_uz] = static_cast<adrt_scalar>(running_sum);
                                 }
                             }
                             else {
                                 // l + 1 even
-                                if(row + 1_uz + col < std::get<4>(in_shape)) {
-                                    if(2_uz * col + 1_uz < std::get<3>(in_shape)){
-                                        val += adrt::_common::array_access(data, in_shape, batch, quadrant, prev_l, 2_uz * col + 1_uz, row + 1_uz + col);
-                                    }
-                                    val -= adrt::_common::array_access(data, in_shape, batch, quadrant, prev_l, 2_uz * col, row + 1_uz + col);
+                                const size_t num_shifted = (col + 1_uz < num_rows ? num_rows - col - 1_uz : 0_uz);
+                                for(size_t row = num_shifted; row < num_rows; ++row) {
+                                    out_line[row] = 0;
+                                }
+                                for(size_t row = num_shifted; row > 0u; --row) {
+                                    const accum_scalar next_val = (has_next_col ? static_cast<accum_scalar>(next_line[row + col]) : accum_scalar{0});
+                                    running_sum += next_val - static_cast<accum_scalar>(curr_line[row + col]);
+                                    out_line[row - 1_uz] = static_cast<adrt_scalar>(running_sum);
+                                }
+                            }
+                            continue;
+                        }
+                        // First compute the differences of the two input lines for every row (no dependencies, vectorizes)
+                        if(l % 2_uz == 0u) {
+                            // l + 1 odd
+                            const size_t num_pairs = (has_next_col ? num_rows - 1_uz : 0_uz);
+                            ADRT_OPENMP("omp simd")
+                            for(size_t row = 0; row < num_pairs; ++row) {
+                                out_line[row] = curr_line[row] - next_line[row + 1_uz];
+                            }
+                            ADRT_OPENMP("omp simd")
+                            for(size_t row = num_pairs; row < num_rows; ++row) {
+                                out_line[row] = curr_line[row];
+                            }
+                        }
+                        else {
+                            // l + 1 even
+                            const size_t num_shifted = (col + 1_uz < num_rows ? num_rows - col - 1_uz : 0_uz);
+                            if(has_next_col) {
+                                ADRT_OPENMP("omp simd")
+                                for(size_t row = 0; row < num_shifted; ++row) {
+                                    out_line[row] = next_line[row + 1_uz + col] - curr_line[row + 1_uz + col];
+                                }
+                            }
+                            else {
+                                ADRT_OPENMP("omp simd")
+                                for(size_t row = 0; row < num_shifted; ++row) {
+                                    out_line[row] = -curr_line[row + 1_uz + col];
                                 }
                             }
-                            if(row + 1_uz < std::get<4>(curr_shape)) {
-                                // Must ensure previous values are written before reading below (requires row loop to be serial)
-                                val += adrt::_common::array_access(out, curr_shape, batch, quadrant, l, col, row + 1_uz);
+                            ADRT_OPENMP("omp simd")
+                            for(size_t row = num_shifted; row < num_rows; ++row) {
+                                out_line[row] = 0;
                             }
-                            adrt::_common::array_access(out, curr_shape, batch, quadrant, l, col, row) = val;
+                        }
+                        // Then accumulate the running sum from the last row, carrying it in a register
+                        adrt_scalar running_sum = 0;
+                        for(size_t rev_row = 0; rev_row < num_rows; ++rev_row) {
+                            const size_t row = num_rows - rev_row - 1_uz;
+                            running_sum += out_line[row];
+                            out_line[row] = running_sum;
                         }
                     }
                 }
@@ -103,11 +157,9 @@ namespace adrt {
         return curr_shape;
     }
 
-    } // end namespace: adrt::_impl
-
-    // DOC ANCHOR: adrt.iadrt +2
-    template <typename adrt_scalar>
-    void iadrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+    template <typename adrt_scalar, typename accum_scalar>
+    void iadrt_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, [[maybe_unused]] bool cooperative) {
+        // With cooperative == false the calling thread runs every level alone
         assert(data);
         assert(tmp);
         assert(out);
@@ -117,7 +169,7 @@ namespace adrt {
         const int num_iters = adrt::num_iters(std::get<3>(shape));
         const std::array<size_t, 4> output_shape = adrt::iadrt_result_shape(shape);
 
-        ADRT_OPENMP("omp parallel default(none) shared(data, shape, tmp, out, num_iters, output_shape)")
+        ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, tmp, out, num_iters, output_shape)")
         {
             // Choose the ordering of the two buffers so that we always end with result in tmp (ready to copy out)
             adrt_scalar *buf_a = tmp;
@@ -140,7 +192,7 @@ namespace adrt {
                             for(size_t c = c_start; c < std::min(c_start + block_stride, std::get<3>(shape)); ++c) {
                                 for(size_t r = r_start; r < std::min(r_start + block_stride, std::get<2>(shape)); ++r) {
                                     adrt::_common::array_access(buf_a, buf_shape, batch, quadrant, 0_uz, c, r) =
-                                        adrt::_common::array_access(data, shape, batch, quadrant, r, c);
+                                        adrt::_common::array_stride_access(data, data_strides, batch, quadrant, r, c);
                                 }
                             }
                         }
@@ -150,7 +202,7 @@ namespace adrt {
 
             // Perform computations
             for(int i = 0; i < num_iters; ++i) {
-                buf_shape = adrt::_impl::iadrt_core(buf_a, buf_shape, buf_b);
+                buf_shape = adrt::_impl::iadrt_core<adrt_scalar, accum_scalar>(buf_a, buf_shape, buf_b);
                 std::swap(buf_a, buf_b);
             }
 
@@ -174,6 +226,28 @@ namespace adrt {
         }
     }
 
-}
+    } // end namespace: adrt::_impl
+
+    // DOC ANCHOR: adrt.iadrt +2
+    template <typename adrt_scalar, typename accum_scalar = adrt_scalar>
+    void iadrt_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &shape, const std::array<size_t, 4> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out) {
+        const std::array<size_t, 4> image_shape = {1, std::get<1>(shape), std::get<2>(shape), std::get<3>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape) * std::get<3>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::iadrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t image_bytes = (in_size + 2 * buf_size) * sizeof(adrt_scalar);
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread transforms whole images with no barriers between levels
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, tmp, out, image_shape, in_size, buf_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::iadrt_levels<adrt_scalar, accum_scalar>(data + batch * std::get<0>(data_strides), image_shape, data_strides, tmp + batch * buf_size, out + batch * buf_size, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::iadrt_levels<adrt_scalar, accum_scalar>(data, shape, data_strides, tmp, out, true);
+        }
+    }
+
+}} // end namespace adrt
 
 #endif // ADRT_CDEFS_IADRT_H
@@ -34,6 +34,7 @@
 #define ADRT_CDEFS_INTERP_ADRTCART_H
 
 #include <cmath>
+#include <cstdint>
 #include <array>
 #include <utility>
 #include <type_traits>
@@ -48,6 +49,10 @@ namespace adrt {
     bool interp_adrtcart_is_valid_shape(const std::array<size_t, 4> &shape);
     std::array<size_t, 3> interp_adrtcart_result_shape(const std::array<size_t, 4> &shape);
 
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
     template <typename float_index = double>
     bool interp_adrtcart_is_valid_float_index(const std::array<size_t, 4> &in_shape) {
         // The input shape is (batch, 4, 2*n-1, n)
@@ -56,6 +61,51 @@ namespace adrt {
         return std::get<3>(in_shape) <= adrt::_common::floor_div(adrt::_const::largest_consecutive_float_size_t<float_index>, 4_uz);
     }
 
+    namespace _impl {
+
+    template <typename adrt_scalar, typename float_index>
+    struct interp_adrtcart_entry {
+        size_t quadrant;
+        float_index hi;
+        float_index si;
+        adrt_scalar factor;
+    };
+
+    template <typename adrt_scalar, typename float_index>
+    interp_adrtcart_entry<adrt_scalar, float_index> interp_adrtcart_locate(const std::array<size_t, 4> &in_shape, const std::array<size_t, 3> &output_shape, size_t offset, size_t angle) {
+        // Source row (hi) and column (si) in quadrant q for one Cartesian output entry
+        // The row may be out of bounds, the column and factor depend only on the angle
+        using larger_float = typename std::conditional_t<(std::numeric_limits<adrt_scalar>::digits > std::numeric_limits<float_index>::digits), adrt_scalar, float_index>;
+        const size_t N = std::get<3>(in_shape);
+        const float_index t_left = adrt::_const::sqrt2_2<float_index> - (adrt::_const::sqrt2_2<float_index> / static_cast<float_index>(N));
+        const float_index th_left = adrt::_const::pi_2<float_index> - (adrt::_const::pi_8<float_index> / static_cast<float_index>(N));
+        const float_index offset_fraction = static_cast<float_index>(offset) / static_cast<float_index>(std::get<1>(output_shape) - 1_uz);
+        const float_index angle_fraction = static_cast<float_index>(angle) / static_cast<float_index>(std::get<2>(output_shape) - 1_uz);
+        const float_index t = t_left * adrt::_common::lerp(-static_cast<float_index>(1), static_cast<float_index>(1), offset_fraction);
+        const float_index th = th_left * adrt::_common::lerp(static_cast<float_index>(1), -static_cast<float_index>(1), angle_fraction);
+        // Compute the quadrant and parity of the angle th
+        const int q = static_cast<int>(std::floor(std::clamp(-th / adrt::_const::pi_4<float_index>, -static_cast<float_index>(2), static_cast<float_index>(1))) + 2);
+        const int sgn = q % 2 == 0 ? 1 : -1;
+        // Compute angle and offset for indexing
+        // We know th is in [-pi/2, pi/2] so we can compute th0 with some arithmetic
+        const float_index th0 = adrt::_const::pi_4<float_index> - std::abs(std::abs(th) - adrt::_const::pi_4<float_index>);
+        const float_index tan_theta = std::clamp(std::tan(th0), static_cast<float_index>(0), static_cast<float_index>(1));
+        const float_index si = std::round(tan_theta * static_cast<float_index>(N - 1_uz));
+        assert(std::isfinite(si));
+        assert(si >= static_cast<float_index>(0));
+        assert(si < static_cast<float_index>(std::get<3>(in_shape)));
+        // Compute the scaling factor
+        const larger_float sidea = static_cast<larger_float>(si) / static_cast<larger_float>(N - 1_uz);
+        const larger_float sideb = static_cast<larger_float>(1);
+        const adrt_scalar factor = static_cast<adrt_scalar>(std::sqrt(sidea * sidea + sideb));
+        const float_index h0 = (static_cast<float_index>(0.5L) + (tan_theta / static_cast<float_index>(2))) + ((sgn >= 0 ? t : -t) / std::cos(th0));
+        const float_index hi = (std::round(h0 * static_cast<float_index>(2_uz * N)) - static_cast<float_index>(1)) / static_cast<float_index>(2);
+        assert(std::isfinite(hi));
+        return {static_cast<size_t>(q), hi, si, factor};
+    }
+
+    } // end namespace: adrt::_impl
+
     // DOC ANCHOR: adrt.utils.interp_to_cart +2
     template <typename adrt_scalar, typename float_index = double>
     void interp_adrtcart(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &in_shape, adrt_scalar *const ADRT_RESTRICT out) {
@@ -68,43 +118,17 @@ namespace adrt {
         assert(adrt::interp_adrtcart_is_valid_shape(in_shape));
         assert(adrt::interp_adrtcart_is_valid_float_index<float_index>(in_shape));
 
-        using larger_float = typename std::conditional_t<(std::numeric_limits<adrt_scalar>::digits > std::numeric_limits<float_index>::digits), adrt_scalar, float_index>;
         const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(in_shape);
 
-        const size_t N = std::get<3>(in_shape);
-        const float_index t_left = adrt::_const::sqrt2_2<float_index> - (adrt::_const::sqrt2_2<float_index> / static_cast<float_index>(N));
-        const float_index th_left = adrt::_const::pi_2<float_index> - (adrt::_const::pi_8<float_index> / static_cast<float_index>(N));
-
-        ADRT_OPENMP("omp parallel for collapse(3) default(none) shared(data, in_shape, out, output_shape, N, t_left, th_left)")
+        ADRT_OPENMP("omp parallel for collapse(3) default(none) shared(data, in_shape, out, output_shape)")
         for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
             for(size_t offset = 0; offset < std::get<1>(output_shape); ++offset) {
                 for(size_t angle = 0; angle < std::get<2>(output_shape); ++angle) {
-                    const float_index offset_fraction = static_cast<float_index>(offset) / static_cast<float_index>(std::get<1>(output_shape) - 1_uz);
-                    const float_index angle_fraction = static_cast<float_index>(angle) / static_cast<float_index>(std::get<2>(output_shape) - 1_uz);
-                    const float_index t = t_left * adrt::_common::lerp(-static_cast<float_index>(1), static_cast<float_index>(1), offset_fraction);
-                    const float_index th = th_left * adrt::_common::lerp(static_cast<float_index>(1), -static_cast<float_index>(1), angle_fraction);
-                    // Compute the quadrant and parity of the angle th
-                    const int q = static_cast<int>(std::floor(std::clamp(-th / adrt::_const::pi_4<float_index>, -static_cast<float_index>(2), static_cast<float_index>(1))) + 2);
-                    const int sgn = q % 2 == 0 ? 1 : -1;
-                    // Compute angle and offset for indexing
-                    // We know th is in [-pi/2, pi/2] so we can compute th0 with some arithmetic
-                    const float_index th0 = adrt::_const::pi_4<float_index> - std::abs(std::abs(th) - adrt::_const::pi_4<float_index>);
-                    const float_index tan_theta = std::clamp(std::tan(th0), static_cast<float_index>(0), static_cast<float_index>(1));
-                    const float_index si = std::round(tan_theta * static_cast<float_index>(N - 1_uz));
-                    assert(std::isfinite(si));
-                    assert(si >= static_cast<float_index>(0));
-                    assert(si < static_cast<float_index>(std::get<3>(in_shape)));
-                    // Compute the scaling factor
-                    const larger_float sidea = static_cast<larger_float>(si) / static_cast<larger_float>(N - 1_uz);
-                    const larger_float sideb = static_cast<larger_float>(1);
-                    const adrt_scalar factor = static_cast<adrt_scalar>(std::sqrt(sidea * sidea + sideb));
-                    const float_index h0 = (static_cast<float_index>(0.5L) + (tan_theta / static_cast<float_index>(2))) + ((sgn >= 0 ? t : -t) / std::cos(th0));
-                    const float_index hi = (std::round(h0 * static_cast<float_index>(2_uz * N)) - static_cast<float_index>(1)) / static_cast<float_index>(2);
-                    assert(std::isfinite(hi));
+                    const adrt::_impl::interp_adrtcart_entry<adrt_scalar, float_index> entry = adrt::_impl::interp_adrtcart_locate<adrt_scalar, float_index>(in_shape, output_shape, offset, angle);
                     // Perform the updates
-                    if(hi >= static_cast<float_index>(0) && hi < static_cast<float_index>(std::get<2>(in_shape))) {
+                    if(entry.hi >= static_cast<float_index>(0) && entry.hi < static_cast<float_index>(std::get<2>(in_shape))) {
                         // Intended access is in bounds
-                        adrt::_common::array_access(out, output_shape, batch, offset, angle) = factor * adrt::_common::array_access(data, in_shape, batch, static_cast<size_t>(q), static_cast<size_t>(hi), static_cast<size_t>(si));
+                        adrt::_common::array_access(out, output_shape, batch, offset, angle) = entry.factor * adrt::_common::array_access(data, in_shape, batch, entry.quadrant, static_cast<size_t>(entry.hi), static_cast<size_t>(entry.si));
                     }
                     else {
                         // Access is out of bounds, fill with zero
@@ -115,6 +139,438 @@ namespace adrt {
         }
     }
 
-}
+    template <typename float_index = double>
+    void interp_adrtcart_plan(const std::array<size_t, 4> &in_shape, std::int16_t *const ADRT_RESTRICT heights, std::int32_t *const ADRT_RESTRICT quadrants, std::int32_t *const ADRT_RESTRICT slopes, float *const ADRT_RESTRICT factors32, double *const ADRT_RESTRICT factors64) {
+        // Tabulates the gather performed by interp_adrtcart for one ADRT output (the batch size is ignored)
+        // heights has the output shape and holds source rows (-1 if out of bounds), two bytes per entry
+        // The source quadrant, column (slope), and scaling factors depend only on the angle
+        static_assert(std::is_floating_point_v<float_index>, "Floating point index type must be a floating point type");
+
+        assert(heights);
+        assert(quadrants);
+        assert(slopes);
+        assert(factors32);
+        assert(factors64);
+        assert(adrt::interp_adrtcart_is_valid_shape(in_shape));
+        assert(adrt::interp_adrtcart_is_valid_float_index<float_index>(in_shape));
+        assert(std::get<2>(in_shape) <= static_cast<size_t>(std::numeric_limits<std::int16_t>::max()));
+
+        const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(in_shape);
+        const std::array<size_t, 3> plane_shape = {1, std::get<1>(output_shape), std::get<2>(output_shape)};
+
+        ADRT_OPENMP("omp parallel for default(none) shared(in_shape, heights, quadrants, slopes, factors32, factors64, output_shape, plane_shape)")
+        for(size_t angle = 0; angle < std::get<2>(output_shape); ++angle) {
+            const adrt::_impl::interp_adrtcart_entry<float, float_index> entry32 = adrt::_impl::interp_adrtcart_locate<float, float_index>(in_shape, output_shape, 0_uz, angle);
+            const adrt::_impl::interp_adrtcart_entry<double, float_index> entry64 = adrt::_impl::interp_adrtcart_locate<double, float_index>(in_shape, output_shape, 0_uz, angle);
+            quadrants[angle] = static_cast<std::int32_t>(entry64.quadrant);
+            slopes[angle] = static_cast<std::int32_t>(entry64.si);
+            factors32[angle] = entry32.factor;
+            factors64[angle] = entry64.factor;
+            for(size_t offset = 0; offset < std::get<1>(output_shape); ++offset) {
+                const float_index hi = adrt::_impl::interp_adrtcart_locate<double, float_index>(in_shape, output_shape, offset, angle).hi;
+                const bool in_bounds = (hi >= static_cast<float_index>(0) && hi < static_cast<float_index>(std::get<2>(in_shape)));
+                adrt::_common::array_access(heights, plane_shape, 0_uz, offset, angle) = (in_bounds ? static_cast<std::int16_t>(hi) : std::int16_t{-1});
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_gather(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &in_shape, const std::int16_t *const ADRT_RESTRICT heights, const std::int32_t *const ADRT_RESTRICT quadrants, const std::int32_t *const ADRT_RESTRICT slopes, const adrt_scalar *const ADRT_RESTRICT factors, adrt_scalar *const ADRT_RESTRICT out) {
+        // Applies tables from interp_adrtcart_plan, producing the same result as interp_adrtcart
+        assert(data);
+        assert(heights);
+        assert(quadrants);
+        assert(slopes);
+        assert(factors);
+        assert(out);
+        assert(adrt::interp_adrtcart_is_valid_shape(in_shape));
+
+        const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(in_shape);
+        const std::array<size_t, 3> plane_shape = {1, std::get<1>(output_shape), std::get<2>(output_shape)};
+        const std::array<size_t, 4> image_shape = {1, 4, std::get<2>(in_shape), std::get<3>(in_shape)};
+        const size_t in_plane = 4_uz * std::get<2>(in_shape) * std::get<3>(in_shape);
+
+        ADRT_OPENMP("omp parallel for collapse(2) default(none) shared(data, in_shape, heights, quadrants, slopes, factors, out, output_shape, plane_shape, image_shape, in_plane)")
+        for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
+            for(size_t offset = 0; offset < std::get<1>(output_shape); ++offset) {
+                const adrt_scalar *const ADRT_RESTRICT in_data = data + batch * in_plane;
+                const std::int16_t *const ADRT_RESTRICT height_row = &adrt::_common::array_access(heights, plane_shape, 0_uz, offset, 0_uz);
+                adrt_scalar *const ADRT_RESTRICT out_row = &adrt::_common::array_access(out, output_shape, batch, offset, 0_uz);
+                for(size_t angle = 0; angle < std::get<2>(output_shape); ++angle) {
+                    const std::int16_t height = height_row[angle];
+                    if(height >= 0 && static_cast<size_t>(height) < std::get<2>(in_shape)) {
+                        const adrt_scalar val = adrt::_common::array_access(in_data, image_shape, 0_uz, static_cast<size_t>(quadrants[angle]), static_cast<size_t>(height), static_cast<size_t>(slopes[angle]));
+                        out_row[angle] = factors[angle] * val;
+                    }
+                    else {
+                        out_row[angle] = 0;
+                    }
+                }
+            }
+        }
+    }
+
+    namespace _impl {
+
+    inline double interp_adrtcart_canonical_angle(double theta) {
+        // Move theta into [-pi/2, pi/2], matching the Python coordinate routines
+        if(std::abs(theta) <= adrt::_const::pi_2<double>) {
+            return theta;
+        }
+        const double pi = 2.0 * adrt::_const::pi_2<double>;
+        double rem = std::fmod(theta + adrt::_const::pi_2<double>, pi);
+        if(rem < 0.0) {
+            rem += pi;
+        }
+        return rem - adrt::_const::pi_2<double>;
+    }
+
+    struct interp_adrtcart_angle {
+        size_t quadrant;
+        double sgn;
+        double tan_theta;
+        double cos_theta;
+        // Nearest slope, or the lower of the two bracketing slopes
+        double slope_lo;
+        double slope_weight;
+        bool bilinear;
+    };
+
+    struct interp_adrtcart_tap {
+        size_t row;
+        size_t slope;
+        // Zero for taps which are unused or out of bounds
+        double weight;
+    };
+
+    inline interp_adrtcart_angle interp_adrtcart_angle_geometry(double theta, size_t N, bool bilinear) {
+        // The parts of a Cartesian sample which depend only on its angle
+        const double th = adrt::_impl::interp_adrtcart_canonical_angle(theta);
+        const double max_slope = static_cast<double>(N - 1_uz);
+        const size_t q = static_cast<size_t>(std::floor(std::clamp(th / adrt::_const::pi_4<double>, -2.0, 1.0)) + 2.0);
+        const double th0 = adrt::_const::pi_4<double> - std::abs(std::abs(th) - adrt::_const::pi_4<double>);
+        const double tan_theta = std::clamp(std::tan(th0), 0.0, 1.0);
+        // th0 is in [0, pi/4] so the cosine follows from the tangent, saving a second libm call
+        const double cos_theta = 1.0 / std::sqrt(1.0 + tan_theta * tan_theta);
+        if(!bilinear) {
+            // Round half to even, as NumPy does in coord_cart_to_adrt
+            return {q, (q % 2u == 0u) ? -1.0 : 1.0, tan_theta, cos_theta, std::nearbyint(tan_theta * max_slope), 0.0, false};
+        }
+        // Bracketing slopes, each is the exact angle of one ADRT column
+        const double slope = tan_theta * max_slope;
+        const double slope_lo = std::min(std::floor(slope), max_slope - 1.0);
+        return {q, (q % 2u == 0u) ? -1.0 : 1.0, tan_theta, cos_theta, slope_lo, std::clamp(slope - slope_lo, 0.0, 1.0), true};
+    }
+
+    inline double interp_adrtcart_slope_factor(double slope, size_t N) {
+        const double ratio = slope / static_cast<double>(N - 1_uz);
+        return std::sqrt(1.0 + ratio * ratio);
+    }
+
+    inline double interp_adrtcart_nearest_height(const interp_adrtcart_angle &geom, double t, size_t N) {
+        // Closest ADRT height for a nearest mode geometry, may be out of bounds
+        const double h = (0.5 * (1.0 + geom.tan_theta) + (geom.sgn * t) / geom.cos_theta) * static_cast<double>(N);
+        return std::floor((std::nearbyint(2.0 * h) - 1.0) / 2.0);
+    }
+
+    inline std::array<interp_adrtcart_tap, 4> interp_adrtcart_offset_taps(const interp_adrtcart_angle &geom, double t, size_t N) {
+        // ADRT entries (within quadrant geom.quadrant) and weights used for one Cartesian sample
+        const double max_slope = static_cast<double>(N - 1_uz);
+        const double num_rows = static_cast<double>(2_uz * N - 1_uz);
+        std::array<interp_adrtcart_tap, 4> taps = {{{0, 0, 0.0}, {0, 0, 0.0}, {0, 0, 0.0}, {0, 0, 0.0}}};
+        if(!geom.bilinear) {
+            const double hi = adrt::_impl::interp_adrtcart_nearest_height(geom, t, N);
+            if(hi >= 0.0 && hi < num_rows) {
+                std::get<0>(taps) = {static_cast<size_t>(hi), static_cast<size_t>(geom.slope_lo), adrt::_impl::interp_adrtcart_slope_factor(geom.slope_lo, N)};
+            }
+            return taps;
+        }
+        for(size_t j = 0; j < 2u; ++j) {
+            const double si = geom.slope_lo + static_cast<double>(j);
+            const double tan_si = si / max_slope;
+            const double sec_si = adrt::_impl::interp_adrtcart_slope_factor(si, N);
+            const double weight = (j == 0u ? 1.0 - geom.slope_weight : geom.slope_weight) * sec_si;
+            // Row centers for slope si lie at h = k + (1 + tan_si) / 2
+            const double row = (0.5 * (1.0 + tan_si) + geom.sgn * t * sec_si) * static_cast<double>(N) - 0.5 * (1.0 + tan_si);
+            const double row_lo = std::floor(row);
+            const double row_weight = row - row_lo;
+            for(size_t k = 0; k < 2u; ++k) {
+                const double hi = row_lo + static_cast<double>(k);
+                if(hi >= 0.0 && hi < num_rows) {
+                    taps[2u * j + k] = {static_cast<size_t>(hi), static_cast<size_t>(si), weight * (k == 0u ? 1.0 - row_weight : row_weight)};
+                }
+            }
+        }
+        return taps;
+    }
+
+    template <typename adrt_scalar>
+    adrt_scalar interp_adrtcart_apply_taps(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &in_shape, size_t batch, size_t quadrant, const std::array<interp_adrtcart_tap, 4> &taps, bool bilinear) {
+        if(!bilinear) {
+            // Scale in the array precision, as in interp_adrtcart
+            const adrt::_impl::interp_adrtcart_tap &tap = std::get<0>(taps);
+            return (tap.weight > 0.0 ? static_cast<adrt_scalar>(tap.weight) * adrt::_common::array_access(data, in_shape, batch, quadrant, tap.row, tap.slope) : static_cast<adrt_scalar>(0));
+        }
+        double val = 0.0;
+        for(const adrt::_impl::interp_adrtcart_tap &tap : taps) {
+            if(tap.weight > 0.0) {
+                val += tap.weight * static_cast<double>(adrt::_common::array_access(data, in_shape, batch, quadrant, tap.row, tap.slope));
+            }
+        }
+        return static_cast<adrt_scalar>(val);
+    }
+
+    template <typename adrt_scalar, typename column_fn, typename geometry_fn, typename taps_fn>
+    void interp_adrtcart_scatter(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &out_shape, size_t num_t, size_t num_theta, const column_fn &columns, const geometry_fn &geometry, const taps_fn &offset_taps, size_t *const ADRT_RESTRICT bin_starts, size_t *const ADRT_RESTRICT bin_angles, adrt_scalar *const ADRT_RESTRICT out) {
+        // Transpose of a Cartesian gather. Every sample of one angle reads from at most two ADRT
+        // columns, so angles are binned by column and each column is accumulated by a single
+        // thread without atomics.
+        // columns(angle) gives the (up to two, possibly repeated) columns as quadrant * N + slope
+        // geometry(angle) gives the per-angle state (default constructible), offset_taps(state, offset) its taps
+        // bin_starts has space for 4 * N + 1 entries, bin_angles for 2 * num_theta
+        const size_t N = std::get<3>(out_shape);
+        const size_t num_bins = 4_uz * N;
+        const std::array<size_t, 3> in_shape = {std::get<0>(out_shape), num_t, num_theta};
+        // Counting sort of angles into column bins
+        std::fill_n(bin_starts, num_bins + 1_uz, 0_uz);
+        for(size_t angle = 0; angle < num_theta; ++angle) {
+            const std::array<size_t, 2> cols = columns(angle);
+            ++bin_starts[std::get<0>(cols) + 1_uz];
+            if(std::get<1>(cols) != std::get<0>(cols)) {
+                ++bin_starts[std::get<1>(cols) + 1_uz];
+            }
+        }
+        for(size_t bin = 0; bin < num_bins; ++bin) {
+            bin_starts[bin + 1_uz] += bin_starts[bin];
+        }
+        for(size_t angle = 0; angle < num_theta; ++angle) {
+            // Use the end of each bin as a cursor, then shift back
+            const std::array<size_t, 2> cols = columns(angle);
+            bin_angles[bin_starts[std::get<0>(cols)]++] = angle;
+            if(std::get<1>(cols) != std::get<0>(cols)) {
+                bin_angles[bin_starts[std::get<1>(cols)]++] = angle;
+            }
+        }
+        for(size_t bin = num_bins; bin > 0u; --bin) {
+            bin_starts[bin] = bin_starts[bin - 1_uz];
+        }
+        bin_starts[0] = 0;
+
+        // Bins are processed in blocks of neighboring columns, so writes fall in short contiguous
+        // row segments. Within a block, angles are taken in chunks and offsets are the outer loop,
+        // so reads of data stay close together.
+        constexpr size_t bin_block = 16;
+        constexpr size_t entry_chunk = 64;
+        using geometry_type = std::decay_t<decltype(geometry(0_uz))>;
+        const size_t num_bin_blocks = adrt::_common::ceil_div(num_bins, bin_block);
+
+        ADRT_OPENMP("omp parallel for schedule(dynamic) default(none) shared(data, out_shape, num_t, geometry, offset_taps, bin_starts, bin_angles, out, N, num_bins, in_shape, bin_block, entry_chunk, num_bin_blocks)")
+        for(size_t block = 0; block < num_bin_blocks; ++block) {
+            const size_t bin_begin = block * bin_block;
+            const size_t bin_end = std::min(bin_begin + bin_block, num_bins);
+            for(size_t batch = 0; batch < std::get<0>(out_shape); ++batch) {
+                for(size_t row = 0; row < std::get<2>(out_shape); ++row) {
+                    for(size_t bin = bin_begin; bin < bin_end; ++bin) {
+                        adrt::_common::array_access(out, out_shape, batch, bin / N, row, bin % N) = 0;
+                    }
+                }
+            }
+            std::array<size_t, entry_chunk> chunk_angles;
+            std::array<size_t, entry_chunk> chunk_bins;
+            std::array<geometry_type, entry_chunk> chunk_geometry;
+            size_t bin = bin_begin;
+            for(size_t chunk_begin = bin_starts[bin_begin]; chunk_begin < bin_starts[bin_end]; chunk_begin += entry_chunk) {
+                const size_t chunk_size = std::min(entry_chunk, bin_starts[bin_end] - chunk_begin);
+                for(size_t e = 0; e < chunk_size; ++e) {
+                    while(bin_starts[bin + 1_uz] <= chunk_begin + e) {
+                        ++bin;
+                    }
+                    chunk_angles[e] = bin_angles[chunk_begin + e];
+                    chunk_bins[e] = bin;
+                    chunk_geometry[e] = geometry(chunk_angles[e]);
+                }
+                for(size_t offset = 0; offset < num_t; ++offset) {
+                    for(size_t e = 0; e < chunk_size; ++e) {
+                        const size_t quadrant = chunk_bins[e] / N;
+                        const size_t slope = chunk_bins[e] % N;
+                        // Only the taps in this entry's column, an angle may also be binned in the next column
+                        for(const adrt::_impl::interp_adrtcart_tap &tap : offset_taps(chunk_geometry[e], offset)) {
+                            if(tap.slope != slope || !(tap.weight > 0.0)) {
+                                continue;
+                            }
+                            for(size_t batch = 0; batch < std::get<0>(out_shape); ++batch) {
+                                adrt_scalar &dest = adrt::_common::array_access(out, out_shape, batch, quadrant, tap.row, slope);
+                                const double val = static_cast<double>(adrt::_common::array_access(data, in_shape, batch, offset, chunk_angles[e]));
+                                dest = static_cast<adrt_scalar>(static_cast<double>(dest) + tap.weight * val);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    } // end namespace: adrt::_impl
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_coords(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &in_shape, const double *const ADRT_RESTRICT theta, size_t num_theta, const double *const ADRT_RESTRICT t, size_t num_t, bool bilinear, adrt_scalar *const ADRT_RESTRICT out) {
+        // Samples ADRT output at each (t, theta) pair of a Cartesian grid in the Radon domain
+        // Nearest mode selects the same entries as coord_cart_to_adrt
+        // Bilinear mode interpolates between the two closest slopes, and within each between the two closest heights
+        static_assert(std::is_floating_point_v<adrt_scalar>, "Cartesian interpolation requires floating point");
+
+        assert(data);
+        assert(theta);
+        assert(t);
+        assert(out);
+        assert(num_theta > 0u);
+        assert(num_t > 0u);
+        assert(adrt::interp_adrtcart_is_valid_shape(in_shape));
+
+        const std::array<size_t, 3> output_shape = {std::get<0>(in_shape), num_t, num_theta};
+        const size_t N = std::get<3>(in_shape);
+
+        ADRT_OPENMP("omp parallel for default(none) shared(data, in_shape, theta, num_theta, t, num_t, bilinear, out, output_shape, N)")
+        for(size_t angle = 0; angle < num_theta; ++angle) {
+            const adrt::_impl::interp_adrtcart_angle geom = adrt::_impl::interp_adrtcart_angle_geometry(theta[angle], N, bilinear);
+            for(size_t offset = 0; offset < num_t; ++offset) {
+                const std::array<adrt::_impl::interp_adrtcart_tap, 4> taps = adrt::_impl::interp_adrtcart_offset_taps(geom, t[offset], N);
+                for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
+                    adrt::_common::array_access(out, output_shape, batch, offset, angle) = adrt::_impl::interp_adrtcart_apply_taps(data, in_shape, batch, geom.quadrant, taps, bilinear);
+                }
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_coords_adjoint(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &out_shape, const double *const ADRT_RESTRICT theta, size_t num_theta, const double *const ADRT_RESTRICT t, size_t num_t, bool bilinear, size_t *const ADRT_RESTRICT bin_starts, size_t *const ADRT_RESTRICT bin_angles, adrt_scalar *const ADRT_RESTRICT out) {
+        // Transpose of interp_adrtcart_coords, data has shape (batch, num_t, num_theta) and out has an ADRT shape
+        static_assert(std::is_floating_point_v<adrt_scalar>, "Cartesian interpolation requires floating point");
+
+        assert(data);
+        assert(theta);
+        assert(t);
+        assert(bin_starts);
+        assert(bin_angles);
+        assert(out);
+        assert(num_theta > 0u);
+        assert(num_t > 0u);
+        assert(adrt::interp_adrtcart_is_valid_shape(out_shape));
+
+        const size_t N = std::get<3>(out_shape);
+        const auto columns = [theta, N, bilinear](size_t angle) -> std::array<size_t, 2> {
+            const adrt::_impl::interp_adrtcart_angle geom = adrt::_impl::interp_adrtcart_angle_geometry(theta[angle], N, bilinear);
+            const size_t col = geom.quadrant * N + static_cast<size_t>(geom.slope_lo);
+            return {col, bilinear ? col + 1_uz : col};
+        };
+        const auto geometry = [theta, N, bilinear](size_t angle) {
+            return adrt::_impl::interp_adrtcart_angle_geometry(theta[angle], N, bilinear);
+        };
+        const auto offset_taps = [t, N](const adrt::_impl::interp_adrtcart_angle &geom, size_t offset) {
+            return adrt::_impl::interp_adrtcart_offset_taps(geom, t[offset], N);
+        };
+        adrt::_impl::interp_adrtcart_scatter(data, out_shape, num_t, num_theta, columns, geometry, offset_taps, bin_starts, bin_angles, out);
+    }
+
+    template <typename adrt_scalar>
+    void interp_adrtcart_gather_adjoint(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &out_shape, const std::int16_t *const ADRT_RESTRICT heights, const std::int32_t *const ADRT_RESTRICT quadrants, const std::int32_t *const ADRT_RESTRICT slopes, const adrt_scalar *const ADRT_RESTRICT factors, size_t *const ADRT_RESTRICT bin_starts, size_t *const ADRT_RESTRICT bin_angles, adrt_scalar *const ADRT_RESTRICT out) {
+        // Transpose of interp_adrtcart_gather, data has the shape of an interp_adrtcart result
+        assert(data);
+        assert(heights);
+        assert(quadrants);
+        assert(slopes);
+        assert(factors);
+        assert(bin_starts);
+        assert(bin_angles);
+        assert(out);
+        assert(adrt::interp_adrtcart_is_valid_shape(out_shape));
+
+        const size_t N = std::get<3>(out_shape);
+        const std::array<size_t, 3> cart_shape = adrt::interp_adrtcart_result_shape(out_shape);
+        const std::array<size_t, 3> plane_shape = {1, std::get<1>(cart_shape), std::get<2>(cart_shape)};
+        const size_t num_rows = std::get<2>(out_shape);
+        const auto columns = [quadrants, slopes, N](size_t angle) -> std::array<size_t, 2> {
+            const size_t col = static_cast<size_t>(quadrants[angle]) * N + static_cast<size_t>(slopes[angle]);
+            return {col, col};
+        };
+        const auto geometry = [](size_t angle) {
+            return angle;
+        };
+        const auto offset_taps = [heights, slopes, factors, plane_shape, num_rows](size_t angle, size_t offset) {
+            std::array<adrt::_impl::interp_adrtcart_tap, 1> taps = {{{0, static_cast<size_t>(slopes[angle]), 0.0}}};
+            const std::int16_t height = adrt::_common::array_access(heights, plane_shape, 0_uz, offset, angle);
+            if(height >= 0 && static_cast<size_t>(height) < num_rows) {
+                std::get<0>(taps) = {static_cast<size_t>(height), static_cast<size_t>(slopes[angle]), static_cast<double>(factors[angle])};
+            }
+            return taps;
+        };
+        adrt::_impl::interp_adrtcart_scatter(data, out_shape, std::get<1>(cart_shape), std::get<2>(cart_shape), columns, geometry, offset_taps, bin_starts, bin_angles, out);
+    }
+
+    // DOC ANCHOR: adrt.utils.sample_adrt +2
+    template <typename adrt_scalar>
+    void interp_adrtcart_sample(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 4> &in_shape, const double *const ADRT_RESTRICT theta, const double *const ADRT_RESTRICT t, size_t count, bool bilinear, adrt_scalar *const ADRT_RESTRICT out) {
+        // Samples ADRT output at each of count (theta[i], t[i]) pairs, as interp_adrtcart_coords does for a grid
+        static_assert(std::is_floating_point_v<adrt_scalar>, "Cartesian interpolation requires floating point");
+
+        assert(data);
+        assert(theta);
+        assert(t);
+        assert(out);
+        assert(adrt::interp_adrtcart_is_valid_shape(in_shape));
+
+        const std::array<size_t, 2> output_shape = {std::get<0>(in_shape), count};
+        const size_t N = std::get<3>(in_shape);
+
+        // Taps for a block of points are computed before any are read. Keeping the scattered
+        // loads together lets many cache misses overlap instead of queuing behind the trigonometry.
+        constexpr size_t block_size = 128;
+        const size_t num_blocks = adrt::_common::ceil_div(count, block_size);
+
+        ADRT_OPENMP("omp parallel for default(none) shared(data, in_shape, theta, t, count, bilinear, out, output_shape, N, block_size, num_blocks)")
+        for(size_t block = 0; block < num_blocks; ++block) {
+            const size_t block_start = block * block_size;
+            const size_t block_count = std::min(block_size, count - block_start);
+            std::array<size_t, block_size> quadrants;
+            std::array<std::array<adrt::_impl::interp_adrtcart_tap, 4>, block_size> block_taps;
+            for(size_t j = 0; j < block_count; ++j) {
+                const adrt::_impl::interp_adrtcart_angle geom = adrt::_impl::interp_adrtcart_angle_geometry(theta[block_start + j], N, bilinear);
+                quadrants[j] = geom.quadrant;
+                block_taps[j] = adrt::_impl::interp_adrtcart_offset_taps(geom, t[block_start + j], N);
+            }
+            for(size_t batch = 0; batch < std::get<0>(output_shape); ++batch) {
+                for(size_t j = 0; j < block_count; ++j) {
+                    adrt::_common::array_access(out, output_shape, batch, block_start + j) = adrt::_impl::interp_adrtcart_apply_taps(data, in_shape, batch, quadrants[j], block_taps[j], bilinear);
+                }
+            }
+        }
+    }
+
+    // DOC ANCHOR: adrt.utils.coord_cart_to_adrt
+    inline void coord_cart_to_adrt(const double *const ADRT_RESTRICT theta, const double *const ADRT_RESTRICT t, size_t count, size_t N, std::uint8_t *const ADRT_RESTRICT quadrant, std::int64_t *const ADRT_RESTRICT height, std::uint64_t *const ADRT_RESTRICT slope, double *const ADRT_RESTRICT factor) {
+        // Closest ADRT entry for each (theta[i], t[i]) pair, heights may be out of bounds
+        assert(theta);
+        assert(t);
+        assert(quadrant);
+        assert(height);
+        assert(slope);
+        assert(factor);
+        assert(N > 1u);
+
+        // Heights are saturated well inside the int64 range, only far out of bounds values are affected
+        const double height_limit = std::ldexp(1.0, 62);
+
+        ADRT_OPENMP("omp parallel for default(none) shared(theta, t, count, N, quadrant, height, slope, factor, height_limit)")
+        for(size_t i = 0; i < count; ++i) {
+            const adrt::_impl::interp_adrtcart_angle geom = adrt::_impl::interp_adrtcart_angle_geometry(theta[i], N, false);
+            const double hi = std::clamp(adrt::_impl::interp_adrtcart_nearest_height(geom, t[i], N), -height_limit, height_limit);
+            quadrant[i] = static_cast<std::uint8_t>(geom.quadrant);
+            height[i] = static_cast<std::int64_t>(hi);
+            slope[i] = static_cast<std::uint64_t>(geom.slope_lo);
+            factor[i] = adrt::_impl::interp_adrtcart_slope_factor(geom.slope_lo, N);
+        }
+    }
+
+}} // end namespace adrt
 
 #endif // ADRT_CDEFS_INTERP_ADRTCART_H
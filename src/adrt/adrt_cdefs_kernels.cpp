@@ -0,0 +1,83 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+// Instantiates the kernels selected at runtime. This file is compiled once
+// for each supported instruction set, with ADRT_ISA_NAMESPACE defined to a
+// distinct name for each build.
+
+#include "adrt_cdefs_common.hpp"
+#include "adrt_cdefs_adrt.hpp"
+#include "adrt_cdefs_iadrt.hpp"
+#include "adrt_cdefs_bdrt.hpp"
+#include "adrt_cdefs_interp_adrtcart.hpp"
+#include "adrt_cdefs_fmg.hpp"
+#include "adrt_cdefs_normal.hpp"
+#include "adrt_cdefs_dispatch.hpp"
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
+    namespace _impl { namespace {
+
+    template <typename adrt_scalar>
+    adrt::_dispatch::kernel_set<adrt_scalar> isa_kernel_set() {
+        return {
+            &adrt::adrt_basic<adrt_scalar>,
+            &adrt::adrt_basic<adrt_scalar, double>,
+            &adrt::iadrt_basic<adrt_scalar>,
+            &adrt::iadrt_basic<adrt_scalar, double>,
+            &adrt::bdrt_basic<adrt_scalar>,
+            &adrt::bdrt_basic<adrt_scalar, double>,
+            &adrt::adrt_adjoint_basic<adrt_scalar>,
+            &adrt::adrt_normal_basic<adrt_scalar>,
+            &adrt::iadrt_fmg_step_basic<adrt_scalar>,
+            &adrt::fmg_precondition_basic<adrt_scalar>,
+            &adrt::fmg_highpass<adrt_scalar>,
+            &adrt::interp_adrtcart<adrt_scalar, adrt::_dispatch::interp_index_type>,
+            &adrt::interp_adrtcart_gather<adrt_scalar>,
+            &adrt::interp_adrtcart_coords<adrt_scalar>,
+            &adrt::interp_adrtcart_gather_adjoint<adrt_scalar>,
+            &adrt::interp_adrtcart_coords_adjoint<adrt_scalar>,
+            &adrt::interp_adrtcart_sample<adrt_scalar>,
+        };
+    }
+
+    }} // end namespace adrt::_impl
+
+    const adrt::_dispatch::kernel_table &isa_kernels() {
+        static const adrt::_dispatch::kernel_table table = {
+            adrt::_impl::isa_kernel_set<float>(),
+            adrt::_impl::isa_kernel_set<double>(),
+        };
+        return table;
+    }
+
+}} // end namespace adrt
@@ -0,0 +1,114 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef ADRT_CDEFS_NORMAL_H
+#define ADRT_CDEFS_NORMAL_H
+
+#include <array>
+#include <cmath>
+#include <cassert>
+#include "adrt_cdefs_common.hpp"
+#include "adrt_cdefs_adrt.hpp"
+#include "adrt_cdefs_bdrt.hpp"
+
+namespace adrt {
+
+    // Defined in: adrt_cdefs_common.cpp
+    bool adrt_normal_is_valid_shape(const std::array<size_t, 3> &shape);
+    std::array<size_t, 6> adrt_normal_buffer_shape(const std::array<size_t, 3> &shape);
+    std::array<size_t, 3> adrt_normal_result_shape(const std::array<size_t, 3> &shape);
+
+} // end namespace adrt
+
+namespace adrt { inline namespace ADRT_ISA_NAMESPACE {
+
+    namespace _impl {
+
+    template <typename adrt_scalar>
+    void adrt_normal_add_ridge(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT out, adrt_scalar ridge) {
+        // Must be called from inside a parallel region (or serially)
+        ADRT_OPENMP("omp for collapse(2)")
+        for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+            for(size_t row = 0; row < std::get<1>(shape); ++row) {
+                ADRT_OPENMP("omp simd")
+                for(size_t col = 0; col < std::get<2>(shape); ++col) {
+                    adrt::_common::array_access(out, shape, batch, row, col) += ridge * adrt::_common::array_stride_access(data, data_strides, batch, row, col);
+                }
+            }
+        }
+    }
+
+    template <typename adrt_scalar>
+    void adrt_normal_levels(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT proj, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT scratch, adrt_scalar *const ADRT_RESTRICT out, adrt_scalar ridge, int radix, bool cooperative) {
+        // The ADRT is stored in proj, then tmp and scratch serve both transforms as working space
+        assert(adrt::adrt_normal_is_valid_shape(shape));
+        const std::array<size_t, 4> proj_shape = adrt::adrt_result_shape(shape);
+        const std::array<size_t, 4> proj_strides = adrt::_common::compute_strides(proj_shape);
+        adrt::_impl::adrt_levels(data, shape, data_strides, tmp, proj, radix, cooperative);
+        adrt::_impl::adrt_adjoint_levels(static_cast<const adrt_scalar*>(proj), proj_shape, proj_strides, tmp, scratch, out, false, radix, cooperative);
+        if(std::fpclassify(ridge) != FP_ZERO) {
+            ADRT_OPENMP("omp parallel if(cooperative) default(none) shared(data, shape, data_strides, out, ridge)")
+            {
+                adrt::_impl::adrt_normal_add_ridge(data, shape, data_strides, out, ridge);
+            }
+        }
+    }
+
+    } // end namespace: adrt::_impl
+
+    // DOC ANCHOR: adrt.core.adrt_normal +2
+    template <typename adrt_scalar>
+    void adrt_normal_basic(const adrt_scalar *const ADRT_RESTRICT data, const std::array<size_t, 3> &shape, const std::array<size_t, 3> &data_strides, adrt_scalar *const ADRT_RESTRICT tmp, adrt_scalar *const ADRT_RESTRICT out, adrt_scalar ridge, int radix = 4) {
+        // The workspace holds three ADRT-sized buffers: the projections followed by two working buffers
+        const std::array<size_t, 3> image_shape = {1, std::get<1>(shape), std::get<2>(shape)};
+        const size_t in_size = std::get<1>(shape) * std::get<2>(shape);
+        const size_t buf_size = adrt::_common::shape_product(adrt::adrt_buffer_shape(image_shape)).value_or(0_uz);
+        const size_t image_bytes = (2 * in_size + 3 * buf_size) * sizeof(adrt_scalar);
+        adrt_scalar *const proj = tmp;
+        adrt_scalar *const work = proj + std::get<0>(shape) * buf_size;
+        adrt_scalar *const scratch = work + std::get<0>(shape) * buf_size;
+        if(adrt::_common::batch_parallel(std::get<0>(shape), image_bytes)) {
+            // Many small images: each thread applies both transforms to whole images, keeping them in cache
+            ADRT_OPENMP("omp parallel for default(none) shared(data, shape, data_strides, proj, work, scratch, out, ridge, radix, image_shape, in_size, buf_size)")
+            for(size_t batch = 0; batch < std::get<0>(shape); ++batch) {
+                adrt::_impl::adrt_normal_levels(data + batch * std::get<0>(data_strides), image_shape, data_strides, proj + batch * buf_size, work + batch * buf_size, scratch + batch * buf_size, out + batch * in_size, ridge, radix, false);
+            }
+        }
+        else {
+            // Few or large images: the whole team works through each level together
+            adrt::_impl::adrt_normal_levels(data, shape, data_strides, proj, work, scratch, out, ridge, radix, true);
+        }
+    }
+
+}} // end namespace adrt
+
+#endif // ADRT_CDEFS_NORMAL_H
@@ -43,11 +43,16 @@
 #include <limits>
 #include <type_traits>
 #include <cassert>
+#include <cmath>
 #include <cstddef>
+#include <cstdint>
 #include <algorithm>
 #include <iterator>
 #include <optional>
+#include <tuple>
 #include <utility>
+#include <vector>
+#include <new>
 
 #include "adrt_cdefs_common.hpp"
 #include "adrt_cdefs_adrt.hpp"
@@ -55,6 +60,8 @@
 #include "adrt_cdefs_bdrt.hpp"
 #include "adrt_cdefs_interp_adrtcart.hpp"
 #include "adrt_cdefs_fmg.hpp"
+#include "adrt_cdefs_normal.hpp"
+#include "adrt_cdefs_dispatch.hpp"
 
 #if !defined(NDEBUG) && (defined(__GNUC__) || defined(__clang__) || defined(_MSC_VER))
 #pragma message ("Building with assertions enabled")
@@ -65,6 +72,13 @@ using std::size_t;
 
 namespace adrt { namespace _py { namespace {
 
+// Radix used by the iterative transforms. Only accessed while holding the GIL.
+int kernel_radix = 4;
+
+// Number of threads used by native routines, zero keeps the OpenMP default.
+// Only accessed while holding the GIL.
+int kernel_threads = 0;
+
 PyArrayObject *extract_array(PyObject *arg) {
     assert(arg);
     if(!PyArray_Check(arg)) {
@@ -80,6 +94,22 @@ PyArrayObject *extract_array(PyObject *arg) {
     return arr;
 }
 
+PyArrayObject *extract_strided_array(PyObject *arg) {
+    // Like extract_array, but any memory layout is allowed (strides are checked by array_strides)
+    assert(arg);
+    if(!PyArray_Check(arg)) {
+        // This isn't an array
+        PyErr_SetString(PyExc_TypeError, "array must be a NumPy array or compatible subclass");
+        return nullptr;
+    }
+    PyArrayObject *const arr = reinterpret_cast<PyArrayObject*>(arg);
+    if(!PyArray_ISALIGNED(arr) || !PyArray_ISNOTSWAPPED(arr)) {
+        PyErr_SetString(PyExc_ValueError, "array must be aligned and native byte order");
+        return nullptr;
+    }
+    return arr;
+}
+
 PyObject *array_to_pyobject(PyArrayObject *arr) {
     return reinterpret_cast<PyObject*>(arr);
 }
@@ -114,22 +144,91 @@ std::optional<int> extract_int(PyObject *arg) {
     return {static_cast<int>(val)};
 }
 
+std::optional<double> extract_double(PyObject *arg) {
+    assert(arg);
+    const double val = PyFloat_AsDouble(arg);
+    if(PyErr_Occurred()) {
+        return {};
+    }
+    return {val};
+}
+
+std::optional<bool> extract_bool(PyObject *arg) {
+    assert(arg);
+    const int val = PyObject_IsTrue(arg);
+    if(val < 0) {
+        return {};
+    }
+    return {val != 0};
+}
+
+std::optional<int> extract_threads(PyObject *arg) {
+    // None requests the default thread count, represented as zero
+    assert(arg);
+    if(arg == Py_None) {
+        return {0};
+    }
+    // Out of range values are reported as ValueError, including those too large for a C long
+    int overflow = 0;
+    const long val = PyLong_AsLongAndOverflow(arg, &overflow);
+    if(val == -1L && PyErr_Occurred()) {
+        return {};
+    }
+    if(overflow < 0 || (overflow == 0 && val < 1L)) {
+        PyErr_Format(PyExc_ValueError, "threads must be at least 1, but got %S", arg);
+        return {};
+    }
+    if(overflow > 0 || val > std::numeric_limits<int>::max()) {
+        PyErr_Format(PyExc_ValueError, "threads must be at most %d, but got %S", std::numeric_limits<int>::max(), arg);
+        return {};
+    }
+    return {static_cast<int>(val)};
+}
+
+class thread_count_scope {
+    // Limits the OpenMP threads started from the calling thread, restoring the previous limit
+    // on exit. Other threads are unaffected. Construct while holding the GIL.
+public:
+    explicit thread_count_scope(int threads) : prev_threads(0) {
+        assert(threads >= 0);
+        const int resolved = (threads > 0) ? threads : adrt::_py::kernel_threads;
+        if(resolved > 0) {
+            prev_threads = adrt::_common::max_threads();
+            adrt::_common::set_max_threads(static_cast<size_t>(resolved));
+        }
+    }
+
+    ~thread_count_scope() {
+        if(prev_threads > 0u) {
+            adrt::_common::set_max_threads(prev_threads);
+        }
+    }
+
+    thread_count_scope(const thread_count_scope&) = delete;
+    thread_count_scope& operator=(const thread_count_scope&) = delete;
+
+private:
+    size_t prev_threads;
+};
+
 template <size_t min_dim, size_t max_dim>
 std::optional<std::array<size_t, max_dim>> array_shape(PyArrayObject *arr) {
+    // Dimensions beyond max_dim are leading batch dimensions, folded into the first entry
     static_assert(min_dim <= max_dim, "Min dimensions must be less than max dimensions.");
     static_assert(min_dim > 0u, "Min dimensions must be positive.");
     assert(arr);
     std::array<size_t, max_dim> shape_arr;
     const int sndim = PyArray_NDIM(arr);
     const unsigned int ndim = static_cast<unsigned int>(sndim);
-    if(sndim < 0 || ndim < min_dim || ndim > max_dim) {
-        PyErr_Format(PyExc_ValueError, "array must have between %zu and %zu dimensions, but had %d", min_dim, max_dim, sndim);
+    if(sndim < 0 || ndim < min_dim) {
+        PyErr_Format(PyExc_ValueError, "array must have at least %zu dimensions, but had %d", min_dim, sndim);
         return {};
     }
     const npy_intp *const numpy_shape = PyArray_SHAPE(arr);
     assert(numpy_shape);
+    const size_t num_leading = (ndim > max_dim) ? (ndim - max_dim) : 0_uz;
     // Prepend trivial dimensions
-    for(size_t i = 0; i < max_dim - ndim; ++i) {
+    for(size_t i = 0; i < max_dim - (ndim - num_leading); ++i) {
         shape_arr[i] = 1;
     }
     // Fill rest of array
@@ -143,30 +242,186 @@ std::optional<std::array<size_t, max_dim>> array_shape(PyArrayObject *arr) {
             PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
             return {};
         }
-        shape_arr[i + (max_dim - ndim)] = static_cast<size_t>(shape);
+        if(i < num_leading) {
+            continue;
+        }
+        shape_arr[(i - num_leading) + (max_dim - (ndim - num_leading))] = static_cast<size_t>(shape);
+    }
+    // Fold leading dimensions into the batch dimension
+    for(size_t i = 0; i < num_leading; ++i) {
+        const std::optional<size_t> batch = adrt::_common::mul_check(std::get<0>(shape_arr), static_cast<size_t>(numpy_shape[i]));
+        if(!batch) {
+            PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
+            return {};
+        }
+        std::get<0>(shape_arr) = *batch;
     }
     return {shape_arr};
 }
 
+// Layout of an input read through its strides, with the batch dimension split into
+// groups. Entries within a group are a fixed stride apart.
+template <size_t N>
+struct batch_layout {
+    // Element strides within a group
+    std::array<size_t, N> strides;
+    // Number of batch entries in each group
+    size_t group_size;
+    // Element offset of the first entry of each group, in batch order
+    std::vector<size_t> group_offsets;
+};
+
+template <size_t min_dim, size_t max_dim>
+std::optional<batch_layout<max_dim>> array_strides(PyArrayObject *arr) {
+    // Strides in elements, matching the dimensions produced by array_shape. Leading batch
+    // dimensions are merged wherever their strides allow, and each remaining combination of
+    // outer indices becomes a separate group so no copy is needed.
+    static_assert(min_dim <= max_dim, "Min dimensions must be less than max dimensions.");
+    static_assert(min_dim > 0u, "Min dimensions must be positive.");
+    assert(arr);
+    const int sndim = PyArray_NDIM(arr);
+    const unsigned int ndim = static_cast<unsigned int>(sndim);
+    assert(sndim >= 0 && ndim >= min_dim);
+    const npy_intp *const numpy_shape = PyArray_SHAPE(arr);
+    const npy_intp *const numpy_strides = PyArray_STRIDES(arr);
+    assert(numpy_shape);
+    assert(numpy_strides);
+    const npy_intp itemsize = static_cast<npy_intp>(PyArray_ITEMSIZE(arr));
+    assert(itemsize > 0);
+    std::array<size_t, max_dim> elem_strides;
+    std::array<size_t, NPY_MAXDIMS> dim_strides;
+    for(size_t i = 0; i < ndim; ++i) {
+        const npy_intp stride = numpy_strides[i];
+        if(numpy_shape[i] == 1) {
+            // Stride is irrelevant for a single entry
+            dim_strides[i] = 0;
+        }
+        else if(stride < 0 || stride % itemsize != 0) {
+            PyErr_Format(PyExc_ValueError, "array strides must be non-negative multiples of the item size, but dimension %zu has stride %zd", i, static_cast<Py_ssize_t>(stride));
+            return {};
+        }
+        else {
+            dim_strides[i] = static_cast<size_t>(stride / itemsize);
+        }
+    }
+    const size_t num_leading = (ndim > max_dim) ? (ndim - max_dim) : 0_uz;
+    // Prepended trivial dimensions are never stepped along
+    for(size_t i = 0; i < max_dim - (ndim - num_leading); ++i) {
+        elem_strides[i] = 0;
+    }
+    for(size_t i = num_leading; i < ndim; ++i) {
+        elem_strides[(i - num_leading) + (max_dim - (ndim - num_leading))] = dim_strides[i];
+    }
+    if(num_leading == 0u) {
+        try {
+            return {batch_layout<max_dim>{elem_strides, (ndim == max_dim) ? static_cast<size_t>(numpy_shape[0]) : 1_uz, {0_uz}}};
+        }
+        catch(const std::bad_alloc &) {
+            PyErr_NoMemory();
+            return {};
+        }
+    }
+    // Merge batch dimensions (0 through num_leading) from the innermost outward
+    size_t group_size = 1;
+    size_t batch_stride = 0;
+    size_t num_outer = num_leading + 1_uz;
+    for(; num_outer > 0u; --num_outer) {
+        const size_t dim = num_outer - 1_uz;
+        const size_t extent = static_cast<size_t>(numpy_shape[dim]);
+        if(extent == 1u) {
+            continue;
+        }
+        if(group_size == 1u) {
+            batch_stride = dim_strides[dim];
+        }
+        else if(dim_strides[dim] != batch_stride * group_size) {
+            break;
+        }
+        group_size *= extent;
+    }
+    std::get<0>(elem_strides) = batch_stride;
+    try {
+        // Enumerate the remaining outer dimensions in C order
+        std::vector<size_t> group_offsets = {0_uz};
+        for(size_t dim = 0; dim < num_outer; ++dim) {
+            const size_t extent = static_cast<size_t>(numpy_shape[dim]);
+            std::vector<size_t> next_offsets;
+            next_offsets.reserve(group_offsets.size() * extent);
+            for(const size_t offset : group_offsets) {
+                for(size_t idx = 0; idx < extent; ++idx) {
+                    next_offsets.push_back(offset + idx * dim_strides[dim]);
+                }
+            }
+            group_offsets = std::move(next_offsets);
+        }
+        return {batch_layout<max_dim>{elem_strides, group_size, std::move(group_offsets)}};
+    }
+    catch(const std::bad_alloc &) {
+        PyErr_NoMemory();
+        return {};
+    }
+}
+
+template <size_t N, typename Func>
+void for_each_batch_group(const batch_layout<N> &layout, const std::array<size_t, N> &shape, Func &&func) {
+    // Calls func(input offset, index of the first batch entry, group shape) for each group
+    assert(layout.group_size * layout.group_offsets.size() == std::get<0>(shape));
+    std::array<size_t, N> group_shape = shape;
+    std::get<0>(group_shape) = layout.group_size;
+    for(size_t group = 0; group < layout.group_offsets.size(); ++group) {
+        func(layout.group_offsets[group], group * layout.group_size, group_shape);
+    }
+}
+
 template <size_t n_virtual_dim>
-[[nodiscard]] PyArrayObject *new_array(int ndim, const std::array<size_t, n_virtual_dim> &virtual_shape, int typenum) {
+bool fill_array_shape(npy_intp *new_shape, int ndim, const std::array<size_t, n_virtual_dim> &virtual_shape, const npy_intp *leading_shape) {
+    // Expand virtual_shape to ndim dimensions. If ndim exceeds n_virtual_dim, the batch
+    // dimension (virtual_shape[0]) is split into the leading dimensions of leading_shape.
     static_assert(n_virtual_dim > 0u, "Need at least one shape dimension");
-    static_assert(n_virtual_dim <= static_cast<unsigned int>(std::numeric_limits<int>::max()), "n_virtual_dim too large, will cause problems with debug assertions");
+    assert(new_shape);
     assert(ndim > 0);
-    assert(static_cast<unsigned int>(ndim) <= n_virtual_dim);
-    assert(std::all_of(virtual_shape.cbegin(), virtual_shape.cend(), [](size_t v){return v > 0u;}));
-    assert(std::all_of(virtual_shape.cbegin(), std::next(virtual_shape.cbegin(), static_cast<int>(n_virtual_dim) - ndim), [](size_t v){return v == 1u;}));
+    if(ndim > NPY_MAXDIMS) {
+        PyErr_Format(PyExc_ValueError, "result would have %d dimensions, more than the maximum of %d", ndim, NPY_MAXDIMS);
+        return false;
+    }
     const unsigned int undim = static_cast<unsigned int>(ndim);
-    std::array<npy_intp, n_virtual_dim> new_shape;
-    for(size_t i = 0; i < undim; ++i) {
-        const size_t shape_val = virtual_shape[(n_virtual_dim - undim) + i];
-        if(shape_val <= static_cast<npy_uintp>(std::numeric_limits<npy_intp>::max())) {
+    if(undim <= n_virtual_dim) {
+        assert(std::all_of(virtual_shape.cbegin(), std::next(virtual_shape.cbegin(), static_cast<int>(n_virtual_dim) - ndim), [](size_t v){return v == 1u;}));
+        for(size_t i = 0; i < undim; ++i) {
+            const size_t shape_val = virtual_shape[(n_virtual_dim - undim) + i];
+            if(shape_val > static_cast<npy_uintp>(std::numeric_limits<npy_intp>::max())) {
+                PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
+                return false;
+            }
             new_shape[i] = static_cast<npy_intp>(shape_val);
         }
-        else {
+        return true;
+    }
+    assert(leading_shape);
+    const size_t num_leading = undim - n_virtual_dim + 1_uz;
+    for(size_t i = 0; i < num_leading; ++i) {
+        new_shape[i] = leading_shape[i];
+    }
+    for(size_t i = 1; i < n_virtual_dim; ++i) {
+        const size_t shape_val = virtual_shape[i];
+        if(shape_val > static_cast<npy_uintp>(std::numeric_limits<npy_intp>::max())) {
             PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
-            return nullptr;
+            return false;
         }
+        new_shape[num_leading + i - 1_uz] = static_cast<npy_intp>(shape_val);
+    }
+    return true;
+}
+
+template <size_t n_virtual_dim>
+[[nodiscard]] PyArrayObject *new_array(int ndim, const std::array<size_t, n_virtual_dim> &virtual_shape, int typenum, const npy_intp *leading_shape = nullptr) {
+    static_assert(n_virtual_dim > 0u, "Need at least one shape dimension");
+    static_assert(n_virtual_dim <= static_cast<unsigned int>(std::numeric_limits<int>::max()), "n_virtual_dim too large, will cause problems with debug assertions");
+    assert(ndim > 0);
+    assert(std::all_of(virtual_shape.cbegin(), virtual_shape.cend(), [](size_t v){return v > 0u;}));
+    std::array<npy_intp, NPY_MAXDIMS> new_shape;
+    if(!adrt::_py::fill_array_shape(new_shape.data(), ndim, virtual_shape, leading_shape)) {
+        return nullptr;
     }
     PyObject *const arr = PyArray_SimpleNew(ndim, new_shape.data(), typenum);
     if(!arr) {
@@ -181,6 +436,43 @@ template <size_t n_virtual_dim>
     return reinterpret_cast<PyArrayObject*>(arr);
 }
 
+template <size_t n_virtual_dim>
+[[nodiscard]] PyArrayObject *output_array(PyObject *out, int ndim, const std::array<size_t, n_virtual_dim> &virtual_shape, int typenum, const npy_intp *leading_shape = nullptr) {
+    static_assert(n_virtual_dim > 0u, "Need at least one shape dimension");
+    assert(out);
+    assert(ndim > 0);
+    if(out == Py_None) {
+        // No array provided, allocate a new one
+        return adrt::_py::new_array(ndim, virtual_shape, typenum, leading_shape);
+    }
+    if(!PyArray_Check(out)) {
+        PyErr_SetString(PyExc_TypeError, "out must be a NumPy array or compatible subclass");
+        return nullptr;
+    }
+    PyArrayObject *const arr = reinterpret_cast<PyArrayObject*>(out);
+    if(!PyArray_ISCARRAY(arr)) {
+        PyErr_SetString(PyExc_ValueError, "out must be C-order, contiguous, aligned, writeable, and native byte order");
+        return nullptr;
+    }
+    if(PyArray_TYPE(arr) != typenum) {
+        PyErr_SetString(PyExc_TypeError, "out must have the same dtype as the input");
+        return nullptr;
+    }
+    std::array<npy_intp, NPY_MAXDIMS> expected_shape;
+    if(!adrt::_py::fill_array_shape(expected_shape.data(), ndim, virtual_shape, leading_shape)) {
+        return nullptr;
+    }
+    const npy_intp *const numpy_shape = PyArray_SHAPE(arr);
+    const bool shape_ok = (PyArray_NDIM(arr) == ndim) && std::equal(numpy_shape, numpy_shape + ndim, expected_shape.cbegin());
+    if(!shape_ok) {
+        PyErr_SetString(PyExc_ValueError, "out does not have the correct shape for the result");
+        return nullptr;
+    }
+    // Return a new reference, matching the behavior of new_array
+    Py_IncRef(out);
+    return arr;
+}
+
 template <size_t ndim>
 std::optional<size_t> shape_product(const std::array<size_t, ndim> &shape) {
     static_assert(ndim > 0u, "Need at least one shape dimension");
@@ -191,25 +483,88 @@ std::optional<size_t> shape_product(const std::array<size_t, ndim> &shape) {
     return n_elem;
 }
 
-template <size_t N, size_t... Ints>
+template <size_t N, size_t N_required, size_t... Ints>
 std::optional<std::array<PyObject*, N>> unpack_tuple(PyObject *tuple, const char *name, std::index_sequence<Ints...>) {
     static_assert(N >= 1u, "Must accept at least one argument");
+    static_assert(N_required <= N, "Cannot require more arguments than are accepted");
     static_assert(N <= static_cast<size_t>(std::numeric_limits<Py_ssize_t>::max()), "Required tuple size is too large for Py_ssize_t");
     static_assert(std::is_same_v<std::index_sequence<Ints...>, std::make_index_sequence<N>>, "Wrong list of indices. Do not call this overload directly!");
     assert(tuple);
     assert(name);
     std::array<PyObject*, N> ret;
-    const bool ok = PyArg_UnpackTuple(tuple, name, static_cast<Py_ssize_t>(N), static_cast<Py_ssize_t>(N), &std::get<Ints>(ret)...);
+    ret.fill(nullptr);
+    const bool ok = PyArg_UnpackTuple(tuple, name, static_cast<Py_ssize_t>(N_required), static_cast<Py_ssize_t>(N), &std::get<Ints>(ret)...);
     if(!ok) {
         return {};
     }
-    assert(std::all_of(ret.cbegin(), ret.cend(), [](PyObject *obj){return obj != nullptr;}));
+    assert(std::all_of(ret.cbegin(), std::next(ret.cbegin(), N_required), [](PyObject *obj){return obj != nullptr;}));
+    // Optional arguments which were not provided default to None
+    std::replace(ret.begin(), ret.end(), static_cast<PyObject*>(nullptr), Py_None);
     return {ret};
 }
 
-template <size_t N>
+template <size_t N, size_t N_required = N>
 std::optional<std::array<PyObject*, N>> unpack_tuple(PyObject *tuple, const char *name) {
-    return adrt::_py::unpack_tuple<N>(tuple, name, std::make_index_sequence<N>{});
+    return adrt::_py::unpack_tuple<N, N_required>(tuple, name, std::make_index_sequence<N>{});
+}
+
+template <size_t min_dim, size_t max_dim>
+std::optional<std::array<size_t, max_dim>> tuple_shape(PyObject *tuple) {
+    // Dimensions beyond max_dim are leading batch dimensions, folded into the first entry
+    static_assert(min_dim <= max_dim, "Min dimensions must be less than max dimensions.");
+    static_assert(min_dim > 0u, "Min dimensions must be positive.");
+    assert(tuple);
+    if(!PyTuple_Check(tuple)) {
+        PyErr_SetString(PyExc_TypeError, "shape must be a tuple");
+        return {};
+    }
+    std::array<size_t, max_dim> shape_arr;
+    const Py_ssize_t sndim = PyTuple_Size(tuple);
+    const size_t ndim = static_cast<size_t>(sndim);
+    if(sndim < 0 || ndim < min_dim) {
+        PyErr_Format(PyExc_ValueError, "shape must have at least %zu dimensions, but had %zd", min_dim, sndim);
+        return {};
+    }
+    const size_t num_leading = (ndim > max_dim) ? (ndim - max_dim) : 0_uz;
+    // Prepend trivial dimensions
+    for(size_t i = 0; i < max_dim - (ndim - num_leading); ++i) {
+        shape_arr[i] = 1;
+    }
+    // Fill rest of array
+    size_t leading_size = 1;
+    for(size_t i = 0; i < ndim; ++i) {
+        PyObject *const item = PyTuple_GetItem(tuple, static_cast<Py_ssize_t>(i));
+        if(!item) {
+            return {};
+        }
+        const std::optional<size_t> shape = adrt::_py::extract_size_t(item);
+        if(!shape) {
+            return {};
+        }
+        if(*shape == 0u) {
+            PyErr_Format(PyExc_ValueError, "all dimensions must be nonzero, but found zero in dimension %zu", i);
+            return {};
+        }
+        if(i < num_leading) {
+            // Fold leading dimensions into the batch dimension (filled below)
+            const std::optional<size_t> batch = adrt::_common::mul_check(leading_size, *shape);
+            if(!batch) {
+                PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
+                return {};
+            }
+            leading_size = *batch;
+        }
+        else {
+            shape_arr[(i - num_leading) + (max_dim - (ndim - num_leading))] = *shape;
+        }
+    }
+    const std::optional<size_t> batch = adrt::_common::mul_check(leading_size, std::get<0>(shape_arr));
+    if(!batch) {
+        PyErr_SetString(PyExc_ValueError, "Maximum allowed dimension exceeded");
+        return {};
+    }
+    std::get<0>(shape_arr) = *batch;
+    return {shape_arr};
 }
 
 [[nodiscard]] void *py_malloc(size_t n_elem, size_t elem_size) {
@@ -266,6 +621,125 @@ void xdecref(PyArrayObject *arr) {
     adrt::_py::xdecref(adrt::_py::array_to_pyobject(arr));
 }
 
+template <typename scalar>
+[[nodiscard]] scalar *acquire_workspace(PyObject *workspace, size_t n_elem, int typenum) {
+    assert(workspace);
+    if(workspace == Py_None) {
+        // No buffer provided, allocate temporary space
+        return adrt::_py::py_malloc<scalar>(n_elem);
+    }
+    if(!PyArray_Check(workspace)) {
+        PyErr_SetString(PyExc_TypeError, "workspace must be a NumPy array or compatible subclass");
+        return nullptr;
+    }
+    PyArrayObject *const arr = reinterpret_cast<PyArrayObject*>(workspace);
+    if(!PyArray_ISCARRAY(arr)) {
+        PyErr_SetString(PyExc_ValueError, "workspace must be C-order, contiguous, aligned, writeable, and native byte order");
+        return nullptr;
+    }
+    if(PyArray_TYPE(arr) != typenum) {
+        PyErr_SetString(PyExc_TypeError, "workspace must have the same dtype as the input");
+        return nullptr;
+    }
+    const npy_intp size = PyArray_SIZE(arr);
+    if(size < 0 || static_cast<npy_uintp>(size) < n_elem) {
+        PyErr_Format(PyExc_ValueError, "workspace is too small, must have at least %zu elements", n_elem);
+        return nullptr;
+    }
+    return static_cast<scalar*>(PyArray_DATA(arr));
+}
+
+void release_workspace(PyObject *workspace, void *buf) {
+    assert(workspace);
+    if(workspace == Py_None) {
+        // Buffer was allocated by acquire_workspace
+        adrt::_py::py_free(buf);
+    }
+}
+
+template <typename scalar>
+[[nodiscard]] const scalar *extract_table(PyObject *table, size_t n_elem, int typenum) {
+    // Read-only lookup table passed alongside an input, must exactly match the expected size
+    assert(table);
+    if(!PyArray_Check(table)) {
+        PyErr_SetString(PyExc_TypeError, "table must be a NumPy array or compatible subclass");
+        return nullptr;
+    }
+    PyArrayObject *const arr = reinterpret_cast<PyArrayObject*>(table);
+    if(!PyArray_ISCARRAY_RO(arr)) {
+        PyErr_SetString(PyExc_ValueError, "table must be C-order, contiguous, aligned, and native byte order");
+        return nullptr;
+    }
+    if(PyArray_TYPE(arr) != typenum) {
+        PyErr_SetString(PyExc_TypeError, "table has the wrong dtype");
+        return nullptr;
+    }
+    const npy_intp size = PyArray_SIZE(arr);
+    if(size < 0 || static_cast<npy_uintp>(size) != n_elem) {
+        PyErr_Format(PyExc_ValueError, "table must have exactly %zu elements", n_elem);
+        return nullptr;
+    }
+    return static_cast<const scalar*>(PyArray_DATA(arr));
+}
+
+std::optional<std::tuple<const std::int16_t*, const std::int32_t*, const std::int32_t*>> extract_interp_plan(PyObject *heights_arg, PyObject *quadrants_arg, PyObject *slopes_arg, size_t n) {
+    // Index tables from interp_to_cart_plan for ADRT outputs of size n
+    const size_t num_angles = 4_uz * n;
+    const std::int16_t *const heights = adrt::_py::extract_table<std::int16_t>(heights_arg, n * num_angles, NPY_INT16);
+    const std::int32_t *const quadrants = heights ? adrt::_py::extract_table<std::int32_t>(quadrants_arg, num_angles, NPY_INT32) : nullptr;
+    const std::int32_t *const slopes = quadrants ? adrt::_py::extract_table<std::int32_t>(slopes_arg, num_angles, NPY_INT32) : nullptr;
+    if(!slopes) {
+        return {};
+    }
+    // Heights are checked by the kernels, the per-angle entries are checked here
+    for(size_t angle = 0; angle < num_angles; ++angle) {
+        if(quadrants[angle] < 0 || quadrants[angle] > 3 || slopes[angle] < 0 || static_cast<size_t>(slopes[angle]) >= n) {
+            PyErr_SetString(PyExc_ValueError, "interpolation plan has out of bounds entries");
+            return {};
+        }
+    }
+    return {{heights, quadrants, slopes}};
+}
+
+std::optional<std::pair<const npy_float64*, size_t>> extract_coordinates(PyObject *arg) {
+    // One dimensional float64 array of finite coordinates
+    PyArrayObject *const arr = adrt::_py::extract_array(arg);
+    if(!arr) {
+        return {};
+    }
+    if(PyArray_NDIM(arr) != 1) {
+        PyErr_SetString(PyExc_ValueError, "coordinates must be one dimensional");
+        return {};
+    }
+    if(PyArray_TYPE(arr) != NPY_FLOAT64) {
+        PyErr_SetString(PyExc_TypeError, "coordinates must have dtype float64");
+        return {};
+    }
+    const std::optional<std::array<size_t, 1>> shape = adrt::_py::array_shape<1, 1>(arr);
+    if(!shape) {
+        return {};
+    }
+    const npy_float64 *const data = static_cast<const npy_float64*>(PyArray_DATA(arr));
+    if(!std::all_of(data, data + std::get<0>(*shape), [](npy_float64 v){return std::isfinite(v);})) {
+        PyErr_SetString(PyExc_ValueError, "coordinates must be finite");
+        return {};
+    }
+    return {{data, std::get<0>(*shape)}};
+}
+
+std::optional<bool> extract_interp_order(PyObject *arg) {
+    // Returns true for bilinear interpolation
+    const std::optional<int> order = adrt::_py::extract_int(arg);
+    if(!order) {
+        return {};
+    }
+    if(*order != 0 && *order != 1) {
+        PyErr_SetString(PyExc_ValueError, "interpolation order must be 0 or 1");
+        return {};
+    }
+    return {*order == 1};
+}
+
 void report_unsupported_dtype(PyArrayObject *arr) {
     assert(arr);
     PyArray_Descr *const descr = PyArray_DESCR(arr);
@@ -277,9 +751,25 @@ void report_unsupported_dtype(PyArrayObject *arr) {
 
 extern "C" {
 
-static PyObject *adrt_py_adrt(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_adrt(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 1>(args, "adrt");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<1>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<2>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<3>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Accumulate float32 inputs in float64 (None, the default, is false)
+    const std::optional<bool> wide = adrt::_py::extract_bool(std::get<4>(*unpacked_args));
+    if(!wide) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
@@ -292,51 +782,91 @@ static PyObject *adrt_py_adrt(PyObject* /* self */, PyObject *arg) {
         PyErr_SetString(PyExc_ValueError, "array must be square with a power of two shape");
         return nullptr;
     }
+    const std::optional<adrt::_py::batch_layout<3>> input_layout = adrt::_py::array_strides<2, 3>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
     // Compute effective output shape
     const std::array<size_t, 4> output_shape = adrt::adrt_result_shape(*input_shape);
     const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::adrt_buffer_shape(*input_shape));
     if(!tmp_buf_elems) {
         return nullptr;
     }
+    // Each batch entry uses the same number of elements in the workspace and the output
+    const size_t entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const int radix = adrt::_py::kernel_radix;
     // Process input array
     const int ndim = PyArray_NDIM(I);
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT32);
-        npy_float32 *const tmp_buf = adrt::_py::py_malloc<npy_float32>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
-            adrt::_py::xdecref(ret);
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim + 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        if(*wide) {
+            // Both float64 level buffers are in the workspace, the output is only written at the end
+            if(*tmp_buf_elems > std::numeric_limits<size_t>::max() / 2_uz) {
+                PyErr_SetString(PyExc_ValueError, "array is too big; unable to allocate temporary space");
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+            npy_float64 *const wide_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, 2_uz * *tmp_buf_elems, NPY_FLOAT64);
+            if(!wide_buf) {
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+            // NO PYTHON API BELOW THIS POINT
+            const adrt::_py::thread_count_scope thread_scope(*threads);
+            Py_BEGIN_ALLOW_THREADS
+            adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+                adrt::_dispatch::adrt_wide_basic(in_data + in_offset, group_shape, input_layout->strides, wide_buf + 2_uz * first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+            });
+            // PYTHON API ALLOWED BELOW THIS POINT
+            Py_END_ALLOW_THREADS
+            adrt::_py::release_workspace(workspace_arg, wide_buf);
+            return adrt::_py::array_to_pyobject(ret);
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::adrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::adrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+        });
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT64);
-        npy_float64 *const tmp_buf = adrt::_py::py_malloc<npy_float64>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim + 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
             adrt::_py::xdecref(ret);
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::adrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::adrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+        });
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     default:
@@ -347,10 +877,14 @@ static PyObject *adrt_py_adrt(PyObject* /* self */, PyObject *arg) {
 
 static PyObject *adrt_py_adrt_step(PyObject* /* self */, PyObject *args) {
     // Unpack function arguments
-    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2>(args, "adrt_step");
+    const std::optional<std::array<PyObject*, 3>> unpacked_args = adrt::_py::unpack_tuple<3, 2>(args, "adrt_step");
     if(!unpacked_args) {
         return nullptr;
     }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<2>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
     // Process array argument
     PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
@@ -375,37 +909,854 @@ static PyObject *adrt_py_adrt_step(PyObject* /* self */, PyObject *args) {
         PyErr_Format(PyExc_ValueError, "step %d is out of range for array's shape, use adrt.core.num_iters", *iter);
         return nullptr;
     }
-    // Compute effective output shape
-    const std::array<size_t, 4> output_shape = adrt::adrt_step_result_shape(*input_shape);
+    // Compute effective output shape
+    const std::array<size_t, 4> output_shape = adrt::adrt_step_result_shape(*input_shape);
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::adrt_step(in_data, *input_shape, out_data, *iter);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::adrt_step(in_data, *input_shape, out_data, *iter);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_iadrt(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 1>(args, "iadrt");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<1>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<2>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<3>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Accumulate float32 inputs in float64 (None, the default, is false)
+    const std::optional<bool> wide = adrt::_py::extract_bool(std::get<4>(*unpacked_args));
+    if(!wide) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::iadrt_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<4>> input_layout = adrt::_py::array_strides<3, 4>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 4> output_shape = adrt::iadrt_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::iadrt_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    // Each batch entry uses the same number of elements in the workspace and the output
+    const size_t entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            if(*wide) {
+                adrt::_dispatch::iadrt_wide_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems);
+            }
+            else {
+                adrt::_dispatch::iadrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems);
+            }
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::iadrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_bdrt(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 1>(args, "bdrt");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<1>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<2>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<3>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Accumulate float32 inputs in float64 (None, the default, is false)
+    const std::optional<bool> wide = adrt::_py::extract_bool(std::get<4>(*unpacked_args));
+    if(!wide) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::bdrt_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<4>> input_layout = adrt::_py::array_strides<3, 4>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 4> output_shape = adrt::bdrt_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::bdrt_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    // Each batch entry uses the same number of elements in the workspace and the output
+    const size_t entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const int radix = adrt::_py::kernel_radix;
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        if(*wide) {
+            // Both float64 level buffers are in the workspace, the output is only written at the end
+            if(*tmp_buf_elems > std::numeric_limits<size_t>::max() / 2_uz) {
+                PyErr_SetString(PyExc_ValueError, "array is too big; unable to allocate temporary space");
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+            npy_float64 *const wide_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, 2_uz * *tmp_buf_elems, NPY_FLOAT64);
+            if(!wide_buf) {
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+            // NO PYTHON API BELOW THIS POINT
+            const adrt::_py::thread_count_scope thread_scope(*threads);
+            Py_BEGIN_ALLOW_THREADS
+            adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+                adrt::_dispatch::bdrt_wide_basic(in_data + in_offset, group_shape, input_layout->strides, wide_buf + 2_uz * first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+            });
+            // PYTHON API ALLOWED BELOW THIS POINT
+            Py_END_ALLOW_THREADS
+            adrt::_py::release_workspace(workspace_arg, wide_buf);
+            return adrt::_py::array_to_pyobject(ret);
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::bdrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::bdrt_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * entry_elems, out_data + first_entry * entry_elems, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_adrt_adjoint(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 2>(args, "adrt_adjoint");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<bool> per_quadrant = adrt::_py::extract_bool(std::get<1>(*unpacked_args));
+    if(!per_quadrant) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<2>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<3>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<4>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::adrt_adjoint_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<4>> input_layout = adrt::_py::array_strides<3, 4>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape, the quadrant dimension is dropped unless per_quadrant is set
+    const std::array<size_t, 3> sum_shape = adrt::adrt_adjoint_result_shape(*input_shape);
+    const std::array<size_t, 4> quadrant_shape = adrt::adrt_adjoint_quadrant_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::adrt_adjoint_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    const size_t tmp_entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const size_t out_entry_elems = (*per_quadrant ? 4_uz : 1_uz) * std::get<3>(*input_shape) * std::get<3>(*input_shape);
+    const int radix = adrt::_py::kernel_radix;
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = (*per_quadrant ?
+                                    adrt::_py::output_array(out_arg, ndim, quadrant_shape, NPY_FLOAT32, PyArray_SHAPE(I)) :
+                                    adrt::_py::output_array(out_arg, ndim - 1, sum_shape, NPY_FLOAT32, PyArray_SHAPE(I)));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::adrt_adjoint_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, *per_quadrant, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = (*per_quadrant ?
+                                    adrt::_py::output_array(out_arg, ndim, quadrant_shape, NPY_FLOAT64, PyArray_SHAPE(I)) :
+                                    adrt::_py::output_array(out_arg, ndim - 1, sum_shape, NPY_FLOAT64, PyArray_SHAPE(I)));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::adrt_adjoint_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, *per_quadrant, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_adrt_normal(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 2>(args, "adrt_normal");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<double> ridge = adrt::_py::extract_double(std::get<1>(*unpacked_args));
+    if(!ridge) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<2>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<3>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<4>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 3>> input_shape = adrt::_py::array_shape<2, 3>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::adrt_normal_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must be square with a power of two shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<3>> input_layout = adrt::_py::array_strides<2, 3>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 3> output_shape = adrt::adrt_normal_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::adrt_normal_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    const size_t tmp_entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const size_t out_entry_elems = std::get<1>(*input_shape) * std::get<2>(*input_shape);
+    const int radix = adrt::_py::kernel_radix;
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        const npy_float32 ridge_val = static_cast<npy_float32>(*ridge);
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::adrt_normal_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, ridge_val, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        const npy_float64 ridge_val = *ridge;
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::adrt_normal_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, ridge_val, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_iadrt_fmg_step(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 4>> unpacked_args = adrt::_py::unpack_tuple<4, 1>(args, "iadrt_fmg_step");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<1>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<2>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<3>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::iadrt_fmg_step_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<4>> input_layout = adrt::_py::array_strides<3, 4>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 3> output_shape = adrt::iadrt_fmg_step_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::iadrt_fmg_step_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    const size_t tmp_entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const size_t out_entry_elems = std::get<3>(*input_shape) * std::get<3>(*input_shape);
+    const int radix = adrt::_py::kernel_radix;
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim - 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::iadrt_fmg_step_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim - 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 4> &group_shape) {
+            adrt::_dispatch::iadrt_fmg_step_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems, radix);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_fmg_precondition(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 4>> unpacked_args = adrt::_py::unpack_tuple<4, 1>(args, "fmg_precondition");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const out_arg = std::get<1>(*unpacked_args);
+    PyObject *const workspace_arg = std::get<2>(*unpacked_args);
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<3>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_strided_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 3>> input_shape = adrt::_py::array_shape<2, 3>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::fmg_precondition_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must be square with a power of two shape");
+        return nullptr;
+    }
+    const std::optional<adrt::_py::batch_layout<3>> input_layout = adrt::_py::array_strides<2, 3>(I);
+    if(!input_layout) {
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 3> output_shape = adrt::fmg_precondition_result_shape(*input_shape);
+    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::fmg_precondition_buffer_shape(*input_shape));
+    if(!tmp_buf_elems) {
+        return nullptr;
+    }
+    const size_t tmp_entry_elems = *tmp_buf_elems / std::get<0>(*input_shape);
+    const size_t out_entry_elems = std::get<1>(*input_shape) * std::get<2>(*input_shape);
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float32 *const tmp_buf = adrt::_py::acquire_workspace<npy_float32>(workspace_arg, *tmp_buf_elems, NPY_FLOAT32);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::fmg_precondition_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::output_array(out_arg, ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        npy_float64 *const tmp_buf = adrt::_py::acquire_workspace<npy_float64>(workspace_arg, *tmp_buf_elems, NPY_FLOAT64);
+        if(!tmp_buf) {
+            adrt::_py::xdecref(ret);
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::_py::for_each_batch_group(*input_layout, *input_shape, [&](size_t in_offset, size_t first_entry, const std::array<size_t, 3> &group_shape) {
+            adrt::_dispatch::fmg_precondition_basic(in_data + in_offset, group_shape, input_layout->strides, tmp_buf + first_entry * tmp_entry_elems, out_data + first_entry * out_entry_elems);
+        });
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        adrt::_py::release_workspace(workspace_arg, tmp_buf);
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_bdrt_step(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 3>> unpacked_args = adrt::_py::unpack_tuple<3, 2>(args, "bdrt_step");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<2>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shape and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::bdrt_step_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    // Process int argument
+    const std::optional<int> iter = adrt::_py::extract_int(std::get<1>(*unpacked_args));
+    if(!iter) {
+        return nullptr;
+    }
+    // Check range of iter
+    if(!adrt::bdrt_step_is_valid_iter(*input_shape, *iter)) {
+        PyErr_Format(PyExc_ValueError, "step %d is out of range for array's shape, use adrt.core.num_iters", *iter);
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 4> output_shape = adrt::bdrt_step_result_shape(*input_shape);
+    // Process input array
+    const int ndim = PyArray_NDIM(I);
+    switch(PyArray_TYPE(I)) {
+    case NPY_FLOAT32:
+    {
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
+        npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::bdrt_step(in_data, *input_shape, out_data, *iter);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    case NPY_FLOAT64:
+    {
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
+            return nullptr;
+        }
+        const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
+        npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::bdrt_step(in_data, *input_shape, out_data, *iter);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+        return adrt::_py::array_to_pyobject(ret);
+    }
+    default:
+        adrt::_py::report_unsupported_dtype(I);
+        return nullptr;
+    }
+}
+
+static PyObject *adrt_py_interp_adrtcart(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 6>> unpacked_args = adrt::_py::unpack_tuple<6, 1>(args, "interp_to_cart");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<1>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
+    if(!I) {
+        return nullptr;
+    }
+    // Extract shapes and check sizes
+    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    if(!input_shape) {
+        return nullptr;
+    }
+    if(!adrt::interp_adrtcart_is_valid_shape(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+        return nullptr;
+    }
+    // Check that we will be able to process this input shape
+    // Keep this in sync with the float type used for indexing by the kernels
+    using index_type = adrt::_dispatch::interp_index_type;
+    if(!adrt::interp_adrtcart_is_valid_float_index<index_type>(*input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array is too big for interpolation index calculations");
+        return nullptr;
+    }
+    // Compute effective output shape
+    const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(*input_shape);
+    // Optional tables from interp_to_cart_plan replace the per-entry index calculations
+    const bool use_plan = (std::get<2>(*unpacked_args) != Py_None);
+    const size_t num_angles = std::get<2>(output_shape);
+    std::tuple<const std::int16_t*, const std::int32_t*, const std::int32_t*> plan = {nullptr, nullptr, nullptr};
+    if(use_plan) {
+        const std::optional<std::tuple<const std::int16_t*, const std::int32_t*, const std::int32_t*>> plan_tables = adrt::_py::extract_interp_plan(std::get<2>(*unpacked_args), std::get<3>(*unpacked_args), std::get<4>(*unpacked_args), std::get<3>(*input_shape));
+        if(!plan_tables) {
+            return nullptr;
+        }
+        plan = *plan_tables;
+    }
     // Process input array
     const int ndim = PyArray_NDIM(I);
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
+        const npy_float32 *factors = nullptr;
+        if(use_plan) {
+            factors = adrt::_py::extract_table<npy_float32>(std::get<5>(*unpacked_args), num_angles, NPY_FLOAT32);
+            if(!factors) {
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+        }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::adrt_step(in_data, *input_shape, out_data, *iter);
+        if(use_plan) {
+            adrt::_dispatch::interp_adrtcart_gather(in_data, *input_shape, std::get<0>(plan), std::get<1>(plan), std::get<2>(plan), factors, out_data);
+        }
+        else {
+            adrt::_dispatch::interp_adrtcart(in_data, *input_shape, out_data);
+        }
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
+        const npy_float64 *factors = nullptr;
+        if(use_plan) {
+            factors = adrt::_py::extract_table<npy_float64>(std::get<5>(*unpacked_args), num_angles, NPY_FLOAT64);
+            if(!factors) {
+                adrt::_py::xdecref(ret);
+                return nullptr;
+            }
+        }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::adrt_step(in_data, *input_shape, out_data, *iter);
+        if(use_plan) {
+            adrt::_dispatch::interp_adrtcart_gather(in_data, *input_shape, std::get<0>(plan), std::get<1>(plan), std::get<2>(plan), factors, out_data);
+        }
+        else {
+            adrt::_dispatch::interp_adrtcart(in_data, *input_shape, out_data);
+        }
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
@@ -416,66 +1767,134 @@ static PyObject *adrt_py_adrt_step(PyObject* /* self */, PyObject *args) {
     }
 }
 
-static PyObject *adrt_py_iadrt(PyObject* /* self */, PyObject *arg){
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_interp_adrtcart_plan(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 6>> unpacked_args = adrt::_py::unpack_tuple<6>(args, "interp_to_cart_plan");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<size_t> n = adrt::_py::extract_size_t(std::get<0>(*unpacked_args));
+    if(!n) {
+        return nullptr;
+    }
+    // Tables are computed for a single ADRT output of size n
+    const std::array<size_t, 4> input_shape = {1, 4, 2_uz * *n - 1_uz, *n};
+    if(*n == 0u || *n > std::numeric_limits<size_t>::max() / 4u || !adrt::interp_adrtcart_is_valid_shape(input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "size must be a power of two and at least 2");
+        return nullptr;
+    }
+    if(std::get<2>(input_shape) > static_cast<size_t>(std::numeric_limits<std::int16_t>::max())) {
+        PyErr_SetString(PyExc_ValueError, "size is too big for interpolation tables");
+        return nullptr;
+    }
+    using index_type = adrt::_dispatch::interp_index_type;
+    if(!adrt::interp_adrtcart_is_valid_float_index<index_type>(input_shape)) {
+        PyErr_SetString(PyExc_ValueError, "size is too big for interpolation index calculations");
+        return nullptr;
+    }
+    const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(input_shape);
+    const std::array<size_t, 2> plane_shape = {std::get<1>(output_shape), std::get<2>(output_shape)};
+    const std::array<size_t, 1> angle_shape = {std::get<2>(output_shape)};
+    // Fill caller-provided tables
+    std::array<PyArrayObject*, 5> tables = {
+        adrt::_py::output_array(std::get<1>(*unpacked_args), 2, plane_shape, NPY_INT16),
+        adrt::_py::output_array(std::get<2>(*unpacked_args), 1, angle_shape, NPY_INT32),
+        adrt::_py::output_array(std::get<3>(*unpacked_args), 1, angle_shape, NPY_INT32),
+        adrt::_py::output_array(std::get<4>(*unpacked_args), 1, angle_shape, NPY_FLOAT32),
+        adrt::_py::output_array(std::get<5>(*unpacked_args), 1, angle_shape, NPY_FLOAT64),
+    };
+    const bool tables_ok = std::all_of(tables.cbegin(), tables.cend(), [](PyArrayObject *arr){return arr != nullptr;});
+    if(tables_ok) {
+        std::int16_t *const heights = static_cast<std::int16_t*>(PyArray_DATA(std::get<0>(tables)));
+        std::int32_t *const quadrants = static_cast<std::int32_t*>(PyArray_DATA(std::get<1>(tables)));
+        std::int32_t *const slopes = static_cast<std::int32_t*>(PyArray_DATA(std::get<2>(tables)));
+        npy_float32 *const factors32 = static_cast<npy_float32*>(PyArray_DATA(std::get<3>(tables)));
+        npy_float64 *const factors64 = static_cast<npy_float64*>(PyArray_DATA(std::get<4>(tables)));
+        // NO PYTHON API BELOW THIS POINT
+        Py_BEGIN_ALLOW_THREADS
+        adrt::interp_adrtcart_plan<index_type>(input_shape, heights, quadrants, slopes, factors32, factors64);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+    }
+    for(PyArrayObject *const arr : tables) {
+        adrt::_py::xdecref(arr);
+    }
+    if(!tables_ok) {
+        return nullptr;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *adrt_py_interp_adrtcart_coords(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 4>(args, "interp_to_cart_coords");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<bool> bilinear = adrt::_py::extract_interp_order(std::get<3>(*unpacked_args));
+    if(!bilinear) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<4>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
-    // Extract shapes and check sizes
     const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
     if(!input_shape) {
         return nullptr;
     }
-    if(!adrt::iadrt_is_valid_shape(*input_shape)) {
+    if(!adrt::interp_adrtcart_is_valid_shape(*input_shape)) {
         PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
         return nullptr;
     }
-    // Compute effective output shape
-    const std::array<size_t, 4> output_shape = adrt::iadrt_result_shape(*input_shape);
-    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::iadrt_buffer_shape(*input_shape));
-    if(!tmp_buf_elems) {
+    // Process coordinate arguments
+    const std::optional<std::pair<const npy_float64*, size_t>> theta = adrt::_py::extract_coordinates(std::get<1>(*unpacked_args));
+    if(!theta) {
+        return nullptr;
+    }
+    const std::optional<std::pair<const npy_float64*, size_t>> t = adrt::_py::extract_coordinates(std::get<2>(*unpacked_args));
+    if(!t) {
         return nullptr;
     }
+    const std::array<size_t, 3> output_shape = {std::get<0>(*input_shape), t->second, theta->second};
     // Process input array
     const int ndim = PyArray_NDIM(I);
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
-        npy_float32 *const tmp_buf = adrt::_py::py_malloc<npy_float32>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
-            adrt::_py::xdecref(ret);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::iadrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_dispatch::interp_adrtcart_coords(in_data, *input_shape, theta->first, theta->second, t->first, t->second, *bilinear, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
-        npy_float64 *const tmp_buf = adrt::_py::py_malloc<npy_float64>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
-            adrt::_py::xdecref(ret);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::iadrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_dispatch::interp_adrtcart_coords(in_data, *input_shape, theta->first, theta->second, t->first, t->second, *bilinear, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     default:
@@ -484,25 +1903,45 @@ static PyObject *adrt_py_iadrt(PyObject* /* self */, PyObject *arg){
     }
 }
 
-static PyObject *adrt_py_bdrt(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_interp_adrtcart_adjoint(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 6>> unpacked_args = adrt::_py::unpack_tuple<6, 5>(args, "interp_to_cart_adjoint");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<5>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
-    // Extract shapes and check sizes
-    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    // Extract shapes and check sizes, the input has the shape of an interp_to_cart result
+    const std::optional<std::array<size_t, 3>> input_shape = adrt::_py::array_shape<2, 3>(I);
     if(!input_shape) {
         return nullptr;
     }
-    if(!adrt::bdrt_is_valid_shape(*input_shape)) {
-        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+    const size_t n = std::get<1>(*input_shape);
+    const std::array<size_t, 4> output_shape = {std::get<0>(*input_shape), 4, 2_uz * n - 1_uz, n};
+    if(n > std::numeric_limits<size_t>::max() / 4u || std::get<2>(*input_shape) != 4_uz * n || !adrt::interp_adrtcart_is_valid_shape(output_shape)) {
+        PyErr_SetString(PyExc_ValueError, "array must have a valid interp_to_cart output shape");
         return nullptr;
     }
-    // Compute effective output shape
-    const std::array<size_t, 4> output_shape = adrt::bdrt_result_shape(*input_shape);
-    const std::optional<size_t> tmp_buf_elems = adrt::_py::shape_product(adrt::bdrt_buffer_shape(*input_shape));
-    if(!tmp_buf_elems) {
+    const std::optional<std::tuple<const std::int16_t*, const std::int32_t*, const std::int32_t*>> plan = adrt::_py::extract_interp_plan(std::get<1>(*unpacked_args), std::get<2>(*unpacked_args), std::get<3>(*unpacked_args), n);
+    if(!plan) {
+        return nullptr;
+    }
+    // Angle bins used by the scatter
+    std::vector<size_t> bin_starts;
+    std::vector<size_t> bin_angles;
+    try {
+        bin_starts.resize(4_uz * n + 1_uz);
+        bin_angles.resize(4_uz * n);
+    }
+    catch(const std::bad_alloc &) {
+        PyErr_NoMemory();
         return nullptr;
     }
     // Process input array
@@ -510,40 +1949,42 @@ static PyObject *adrt_py_bdrt(PyObject* /* self */, PyObject *arg) {
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
-        npy_float32 *const tmp_buf = adrt::_py::py_malloc<npy_float32>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
-            adrt::_py::xdecref(ret);
+        const npy_float32 *const factors = adrt::_py::extract_table<npy_float32>(std::get<4>(*unpacked_args), 4_uz * n, NPY_FLOAT32);
+        if(!factors) {
+            return nullptr;
+        }
+        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
+        if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::bdrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_dispatch::interp_adrtcart_gather_adjoint(in_data, output_shape, std::get<0>(*plan), std::get<1>(*plan), std::get<2>(*plan), factors, bin_starts.data(), bin_angles.data(), out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
-        npy_float64 *const tmp_buf = adrt::_py::py_malloc<npy_float64>(*tmp_buf_elems);
-        if(!ret || !tmp_buf) {
-            adrt::_py::py_free(tmp_buf);
-            adrt::_py::xdecref(ret);
+        const npy_float64 *const factors = adrt::_py::extract_table<npy_float64>(std::get<4>(*unpacked_args), 4_uz * n, NPY_FLOAT64);
+        if(!factors) {
+            return nullptr;
+        }
+        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
+        if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::bdrt_basic(in_data, *input_shape, tmp_buf, out_data);
+        adrt::_dispatch::interp_adrtcart_gather_adjoint(in_data, output_shape, std::get<0>(*plan), std::get<1>(*plan), std::get<2>(*plan), factors, bin_starts.data(), bin_angles.data(), out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
-        adrt::_py::py_free(tmp_buf);
         return adrt::_py::array_to_pyobject(ret);
     }
     default:
@@ -552,67 +1993,93 @@ static PyObject *adrt_py_bdrt(PyObject* /* self */, PyObject *arg) {
     }
 }
 
-static PyObject *adrt_py_bdrt_step(PyObject* /* self */, PyObject *args) {
+static PyObject *adrt_py_interp_adrtcart_coords_adjoint(PyObject* /* self */, PyObject *args) {
     // Unpack function arguments
-    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2>(args, "bdrt_step");
+    const std::optional<std::array<PyObject*, 6>> unpacked_args = adrt::_py::unpack_tuple<6, 5>(args, "interp_to_cart_coords_adjoint");
     if(!unpacked_args) {
         return nullptr;
     }
+    const std::optional<size_t> n = adrt::_py::extract_size_t(std::get<1>(*unpacked_args));
+    if(!n) {
+        return nullptr;
+    }
+    const std::optional<bool> bilinear = adrt::_py::extract_interp_order(std::get<4>(*unpacked_args));
+    if(!bilinear) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<5>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
     // Process array argument
     PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
-    // Extract shape and check sizes
-    const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
+    const std::optional<std::pair<const npy_float64*, size_t>> theta = adrt::_py::extract_coordinates(std::get<2>(*unpacked_args));
+    if(!theta) {
+        return nullptr;
+    }
+    const std::optional<std::pair<const npy_float64*, size_t>> t = adrt::_py::extract_coordinates(std::get<3>(*unpacked_args));
+    if(!t) {
+        return nullptr;
+    }
+    // The input has shape (..., len(t), len(theta)) and the output is an ADRT of size n
+    const std::optional<std::array<size_t, 3>> input_shape = adrt::_py::array_shape<2, 3>(I);
     if(!input_shape) {
         return nullptr;
     }
-    if(!adrt::bdrt_step_is_valid_shape(*input_shape)) {
-        PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
+    if(std::get<1>(*input_shape) != t->second || std::get<2>(*input_shape) != theta->second) {
+        PyErr_SetString(PyExc_ValueError, "array shape does not match the coordinates");
         return nullptr;
     }
-    // Process int argument
-    const std::optional<int> iter = adrt::_py::extract_int(std::get<1>(*unpacked_args));
-    if(!iter) {
+    const std::array<size_t, 4> output_shape = {std::get<0>(*input_shape), 4, 2_uz * *n - 1_uz, *n};
+    if(*n == 0u || *n > std::numeric_limits<size_t>::max() / 4u || !adrt::interp_adrtcart_is_valid_shape(output_shape)) {
+        PyErr_SetString(PyExc_ValueError, "size must be a power of two and at least 2");
         return nullptr;
     }
-    // Check range of iter
-    if(!adrt::bdrt_step_is_valid_iter(*input_shape, *iter)) {
-        PyErr_Format(PyExc_ValueError, "step %d is out of range for array's shape, use adrt.core.num_iters", *iter);
+    // Angle bins used by the scatter
+    std::vector<size_t> bin_starts;
+    std::vector<size_t> bin_angles;
+    try {
+        bin_starts.resize(4_uz * *n + 1_uz);
+        bin_angles.resize(2_uz * theta->second);
+    }
+    catch(const std::bad_alloc &) {
+        PyErr_NoMemory();
         return nullptr;
     }
-    // Compute effective output shape
-    const std::array<size_t, 4> output_shape = adrt::bdrt_step_result_shape(*input_shape);
     // Process input array
     const int ndim = PyArray_NDIM(I);
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::bdrt_step(in_data, *input_shape, out_data, *iter);
+        adrt::_dispatch::interp_adrtcart_coords_adjoint(in_data, output_shape, theta->first, theta->second, t->first, t->second, *bilinear, bin_starts.data(), bin_angles.data(), out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim + 1, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::bdrt_step(in_data, *input_shape, out_data, *iter);
+        adrt::_dispatch::interp_adrtcart_coords_adjoint(in_data, output_shape, theta->first, theta->second, t->first, t->second, *bilinear, bin_starts.data(), bin_angles.data(), out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
@@ -623,13 +2090,25 @@ static PyObject *adrt_py_bdrt_step(PyObject* /* self */, PyObject *args) {
     }
 }
 
-static PyObject *adrt_py_interp_adrtcart(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_interp_adrtcart_sample(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 5>> unpacked_args = adrt::_py::unpack_tuple<5, 4>(args, "sample_adrt");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<bool> bilinear = adrt::_py::extract_interp_order(std::get<3>(*unpacked_args));
+    if(!bilinear) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<4>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
-    // Extract shapes and check sizes
     const std::optional<std::array<size_t, 4>> input_shape = adrt::_py::array_shape<3, 4>(I);
     if(!input_shape) {
         return nullptr;
@@ -638,44 +2117,51 @@ static PyObject *adrt_py_interp_adrtcart(PyObject* /* self */, PyObject *arg) {
         PyErr_SetString(PyExc_ValueError, "array must have a valid ADRT output shape");
         return nullptr;
     }
-    // Check that we will be able to process this input shape
-    // Keep this in sync with the largest float type used for indexing below
-    using index_type = float;
-    if(!adrt::interp_adrtcart_is_valid_float_index<index_type>(*input_shape)) {
-        PyErr_SetString(PyExc_ValueError, "array is too big for interpolation index calculations");
+    // Process coordinate arguments
+    const std::optional<std::pair<const npy_float64*, size_t>> theta = adrt::_py::extract_coordinates(std::get<1>(*unpacked_args));
+    if(!theta) {
         return nullptr;
     }
-    // Compute effective output shape
-    const std::array<size_t, 3> output_shape = adrt::interp_adrtcart_result_shape(*input_shape);
-    // Process input array
+    const std::optional<std::pair<const npy_float64*, size_t>> t = adrt::_py::extract_coordinates(std::get<2>(*unpacked_args));
+    if(!t) {
+        return nullptr;
+    }
+    if(theta->second != t->second) {
+        PyErr_SetString(PyExc_ValueError, "theta and t must have the same length");
+        return nullptr;
+    }
+    // Output has shape (..., count), keeping the batch dimensions of the input
+    const std::array<size_t, 2> output_shape = {std::get<0>(*input_shape), t->second};
     const int ndim = PyArray_NDIM(I);
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 2, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::interp_adrtcart<npy_float32, index_type>(in_data, *input_shape, out_data);
+        adrt::_dispatch::interp_adrtcart_sample(in_data, *input_shape, theta->first, t->first, t->second, *bilinear, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim - 1, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim - 2, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::interp_adrtcart<npy_float64, index_type>(in_data, *input_shape, out_data);
+        adrt::_dispatch::interp_adrtcart_sample(in_data, *input_shape, theta->first, t->first, t->second, *bilinear, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
@@ -686,9 +2172,79 @@ static PyObject *adrt_py_interp_adrtcart(PyObject* /* self */, PyObject *arg) {
     }
 }
 
-static PyObject *adrt_py_fmg_restriction(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_coord_cart_to_adrt(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 8>> unpacked_args = adrt::_py::unpack_tuple<8, 7>(args, "coord_cart_to_adrt");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<size_t> n = adrt::_py::extract_size_t(std::get<2>(*unpacked_args));
+    if(!n) {
+        return nullptr;
+    }
+    if(*n < 2u || (*n & (*n - 1u)) != 0u) {
+        PyErr_SetString(PyExc_ValueError, "size must be a power of two and at least 2");
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<7>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process coordinate arguments
+    const std::optional<std::pair<const npy_float64*, size_t>> theta = adrt::_py::extract_coordinates(std::get<0>(*unpacked_args));
+    if(!theta) {
+        return nullptr;
+    }
+    const std::optional<std::pair<const npy_float64*, size_t>> t = adrt::_py::extract_coordinates(std::get<1>(*unpacked_args));
+    if(!t) {
+        return nullptr;
+    }
+    if(theta->second != t->second) {
+        PyErr_SetString(PyExc_ValueError, "theta and t must have the same length");
+        return nullptr;
+    }
+    // Fill caller-provided outputs
+    const std::array<size_t, 1> shape = {t->second};
+    std::array<PyArrayObject*, 4> outputs = {
+        adrt::_py::output_array(std::get<3>(*unpacked_args), 1, shape, NPY_UINT8),
+        adrt::_py::output_array(std::get<4>(*unpacked_args), 1, shape, NPY_INT64),
+        adrt::_py::output_array(std::get<5>(*unpacked_args), 1, shape, NPY_UINT64),
+        adrt::_py::output_array(std::get<6>(*unpacked_args), 1, shape, NPY_FLOAT64),
+    };
+    const bool outputs_ok = std::all_of(outputs.cbegin(), outputs.cend(), [](PyArrayObject *arr){return arr != nullptr;});
+    if(outputs_ok) {
+        std::uint8_t *const quadrant = static_cast<std::uint8_t*>(PyArray_DATA(std::get<0>(outputs)));
+        std::int64_t *const height = static_cast<std::int64_t*>(PyArray_DATA(std::get<1>(outputs)));
+        std::uint64_t *const slope = static_cast<std::uint64_t*>(PyArray_DATA(std::get<2>(outputs)));
+        npy_float64 *const factor = static_cast<npy_float64*>(PyArray_DATA(std::get<3>(outputs)));
+        // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
+        Py_BEGIN_ALLOW_THREADS
+        adrt::coord_cart_to_adrt(theta->first, t->first, t->second, *n, quadrant, height, slope, factor);
+        // PYTHON API ALLOWED BELOW THIS POINT
+        Py_END_ALLOW_THREADS
+    }
+    for(PyArrayObject *const arr : outputs) {
+        adrt::_py::xdecref(arr);
+    }
+    if(!outputs_ok) {
+        return nullptr;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *adrt_py_fmg_restriction(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2, 1>(args, "press_fmg_restriction");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<1>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
@@ -708,13 +2264,14 @@ static PyObject *adrt_py_fmg_restriction(PyObject* /* self */, PyObject *arg) {
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
         adrt::fmg_restriction(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
@@ -723,13 +2280,14 @@ static PyObject *adrt_py_fmg_restriction(PyObject* /* self */, PyObject *arg) {
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
         adrt::fmg_restriction(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
@@ -742,9 +2300,18 @@ static PyObject *adrt_py_fmg_restriction(PyObject* /* self */, PyObject *arg) {
     }
 }
 
-static PyObject *adrt_py_fmg_prolongation(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_fmg_prolongation(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2, 1>(args, "press_fmg_prolongation");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<1>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
@@ -764,13 +2331,14 @@ static PyObject *adrt_py_fmg_prolongation(PyObject* /* self */, PyObject *arg) {
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
         adrt::fmg_prolongation(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
@@ -779,13 +2347,14 @@ static PyObject *adrt_py_fmg_prolongation(PyObject* /* self */, PyObject *arg) {
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
         adrt::fmg_prolongation(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
@@ -798,9 +2367,18 @@ static PyObject *adrt_py_fmg_prolongation(PyObject* /* self */, PyObject *arg) {
     }
 }
 
-static PyObject *adrt_py_fmg_highpass(PyObject* /* self */, PyObject *arg) {
-    // Process function arguments
-    PyArrayObject *const I = adrt::_py::extract_array(arg);
+static PyObject *adrt_py_fmg_highpass(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2, 1>(args, "press_fmg_highpass");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    const std::optional<int> threads = adrt::_py::extract_threads(std::get<1>(*unpacked_args));
+    if(!threads) {
+        return nullptr;
+    }
+    // Process array argument
+    PyArrayObject *const I = adrt::_py::extract_array(std::get<0>(*unpacked_args));
     if(!I) {
         return nullptr;
     }
@@ -820,30 +2398,32 @@ static PyObject *adrt_py_fmg_highpass(PyObject* /* self */, PyObject *arg) {
     switch(PyArray_TYPE(I)) {
     case NPY_FLOAT32:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT32, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float32 *const in_data = static_cast<npy_float32*>(PyArray_DATA(I));
         npy_float32 *const out_data = static_cast<npy_float32*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::fmg_highpass(in_data, *input_shape, out_data);
+        adrt::_dispatch::fmg_highpass(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
     }
     case NPY_FLOAT64:
     {
-        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64);
+        PyArrayObject *const ret = adrt::_py::new_array(ndim, output_shape, NPY_FLOAT64, PyArray_SHAPE(I));
         if(!ret) {
             return nullptr;
         }
         const npy_float64 *const in_data = static_cast<npy_float64*>(PyArray_DATA(I));
         npy_float64 *const out_data = static_cast<npy_float64*>(PyArray_DATA(ret));
         // NO PYTHON API BELOW THIS POINT
+        const adrt::_py::thread_count_scope thread_scope(*threads);
         Py_BEGIN_ALLOW_THREADS
-        adrt::fmg_highpass(in_data, *input_shape, out_data);
+        adrt::_dispatch::fmg_highpass(in_data, *input_shape, out_data);
         // PYTHON API ALLOWED BELOW THIS POINT
         Py_END_ALLOW_THREADS
         return adrt::_py::array_to_pyobject(ret);
@@ -862,17 +2442,168 @@ static PyObject *adrt_py_num_iters(PyObject* /* self */, PyObject *arg){
     return PyLong_FromLong(adrt::num_iters(*val));
 }
 
+static PyObject *adrt_py_workspace_size(PyObject* /* self */, PyObject *args) {
+    // Unpack function arguments
+    const std::optional<std::array<PyObject*, 2>> unpacked_args = adrt::_py::unpack_tuple<2>(args, "workspace_size");
+    if(!unpacked_args) {
+        return nullptr;
+    }
+    PyObject *const op = std::get<0>(*unpacked_args);
+    PyObject *const shape_arg = std::get<1>(*unpacked_args);
+    if(!PyUnicode_Check(op)) {
+        PyErr_SetString(PyExc_TypeError, "operation name must be a str");
+        return nullptr;
+    }
+    std::optional<size_t> n_elem;
+    if(PyUnicode_CompareWithASCIIString(op, "adrt") == 0) {
+        const std::optional<std::array<size_t, 3>> shape = adrt::_py::tuple_shape<2, 3>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::adrt_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be square with a power of two shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::adrt_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "bdrt") == 0) {
+        const std::optional<std::array<size_t, 4>> shape = adrt::_py::tuple_shape<3, 4>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::bdrt_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be a valid ADRT output shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::bdrt_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "adrt_normal") == 0) {
+        const std::optional<std::array<size_t, 3>> shape = adrt::_py::tuple_shape<2, 3>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::adrt_normal_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be square with a power of two shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::adrt_normal_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "adrt_adjoint") == 0) {
+        const std::optional<std::array<size_t, 4>> shape = adrt::_py::tuple_shape<3, 4>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::adrt_adjoint_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be a valid ADRT output shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::adrt_adjoint_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "iadrt_fmg_step") == 0) {
+        const std::optional<std::array<size_t, 4>> shape = adrt::_py::tuple_shape<3, 4>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::iadrt_fmg_step_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be a valid ADRT output shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::iadrt_fmg_step_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "fmg_precondition") == 0) {
+        const std::optional<std::array<size_t, 3>> shape = adrt::_py::tuple_shape<2, 3>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::fmg_precondition_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be square with a power of two shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::fmg_precondition_buffer_shape(*shape));
+    }
+    else if(PyUnicode_CompareWithASCIIString(op, "iadrt") == 0) {
+        const std::optional<std::array<size_t, 4>> shape = adrt::_py::tuple_shape<3, 4>(shape_arg);
+        if(!shape) {
+            return nullptr;
+        }
+        if(!adrt::iadrt_is_valid_shape(*shape)) {
+            PyErr_SetString(PyExc_ValueError, "shape must be a valid ADRT output shape");
+            return nullptr;
+        }
+        n_elem = adrt::_py::shape_product(adrt::iadrt_buffer_shape(*shape));
+    }
+    else {
+        PyErr_Format(PyExc_ValueError, "unknown operation %R, must be one of 'adrt', 'bdrt', 'iadrt', 'adrt_adjoint', 'adrt_normal', 'iadrt_fmg_step', or 'fmg_precondition'", op);
+        return nullptr;
+    }
+    if(!n_elem) {
+        return nullptr;
+    }
+    return PyLong_FromSize_t(*n_elem);
+}
+
+static PyObject *adrt_py_set_radix(PyObject* /* self */, PyObject *arg) {
+    const std::optional<int> radix = adrt::_py::extract_int(arg);
+    if(!radix) {
+        return nullptr;
+    }
+    if(!adrt::is_valid_radix(*radix)) {
+        PyErr_Format(PyExc_ValueError, "radix must be 2 or 4, but got %d", *radix);
+        return nullptr;
+    }
+    adrt::_py::kernel_radix = *radix;
+    Py_RETURN_NONE;
+}
+
+static PyObject *adrt_py_get_radix(PyObject* /* self */, PyObject* /* args */) {
+    return PyLong_FromLong(adrt::_py::kernel_radix);
+}
+
+static PyObject *adrt_py_set_num_threads(PyObject* /* self */, PyObject *arg) {
+    const std::optional<int> threads = adrt::_py::extract_threads(arg);
+    if(!threads) {
+        return nullptr;
+    }
+    adrt::_py::kernel_threads = *threads;
+    Py_RETURN_NONE;
+}
+
+static PyObject *adrt_py_get_num_threads(PyObject* /* self */, PyObject* /* args */) {
+    if(!adrt::_const::openmp_enabled) {
+        return PyLong_FromLong(1);
+    }
+    if(adrt::_py::kernel_threads > 0) {
+        return PyLong_FromLong(adrt::_py::kernel_threads);
+    }
+    return PyLong_FromSize_t(adrt::_common::max_threads());
+}
+
 static PyMethodDef adrt_cdefs_methods[] = {
-    {"adrt", adrt_py_adrt, METH_O, "Compute the ADRT"},
+    {"adrt", adrt_py_adrt, METH_VARARGS, "Compute the ADRT"},
     {"adrt_step", adrt_py_adrt_step, METH_VARARGS, "Compute one step of the ADRT"},
-    {"iadrt", adrt_py_iadrt, METH_O, "Compute the inverse ADRT"},
-    {"bdrt", adrt_py_bdrt, METH_O, "Compute the backprojection of the ADRT"},
+    {"iadrt", adrt_py_iadrt, METH_VARARGS, "Compute the inverse ADRT"},
+    {"bdrt", adrt_py_bdrt, METH_VARARGS, "Compute the backprojection of the ADRT"},
+    {"adrt_adjoint", adrt_py_adrt_adjoint, METH_VARARGS, "Compute the transpose of the ADRT"},
+    {"adrt_normal", adrt_py_adrt_normal, METH_VARARGS, "Compute the normal operator of the ADRT"},
+    {"iadrt_fmg_step", adrt_py_iadrt_fmg_step, METH_VARARGS, "Compute one full multigrid inverse estimate"},
+    {"fmg_precondition", adrt_py_fmg_precondition, METH_VARARGS, "Apply the multilevel FMG preconditioner"},
     {"bdrt_step", adrt_py_bdrt_step, METH_VARARGS, "Compute one step of the bdrt"},
     {"num_iters", adrt_py_num_iters, METH_O, "Compute the number of iterations needed for the ADRT"},
-    {"interp_to_cart", adrt_py_interp_adrtcart, METH_O, "Interpolate ADRT output to Cartesian coordinate system"},
-    {"press_fmg_restriction", adrt_py_fmg_restriction, METH_O, "Multigrid restriction operator"},
-    {"press_fmg_prolongation", adrt_py_fmg_prolongation, METH_O, "Multigrid prolongation operator"},
-    {"press_fmg_highpass", adrt_py_fmg_highpass, METH_O, "Multigrid high-pass filter"},
+    {"set_radix", adrt_py_set_radix, METH_O, "Select the radix of the iterative transforms"},
+    {"get_radix", adrt_py_get_radix, METH_NOARGS, "Get the radix of the iterative transforms"},
+    {"set_num_threads", adrt_py_set_num_threads, METH_O, "Set the number of threads used by native routines"},
+    {"get_num_threads", adrt_py_get_num_threads, METH_NOARGS, "Get the number of threads used by native routines"},
+    {"workspace_size", adrt_py_workspace_size, METH_VARARGS, "Compute the size of temporary buffers used by a transform"},
+    {"interp_to_cart", adrt_py_interp_adrtcart, METH_VARARGS, "Interpolate ADRT output to Cartesian coordinate system"},
+    {"interp_to_cart_plan", adrt_py_interp_adrtcart_plan, METH_VARARGS, "Tabulate the gather used by interp_to_cart"},
+    {"interp_to_cart_coords", adrt_py_interp_adrtcart_coords, METH_VARARGS, "Interpolate ADRT output to a given Cartesian grid"},
+    {"interp_to_cart_adjoint", adrt_py_interp_adrtcart_adjoint, METH_VARARGS, "Transpose of interp_to_cart with a plan"},
+    {"interp_to_cart_coords_adjoint", adrt_py_interp_adrtcart_coords_adjoint, METH_VARARGS, "Transpose of interp_to_cart_coords"},
+    {"sample_adrt", adrt_py_interp_adrtcart_sample, METH_VARARGS, "Sample ADRT output at Cartesian coordinates"},
+    {"coord_cart_to_adrt", adrt_py_coord_cart_to_adrt, METH_VARARGS, "Closest ADRT entries for Cartesian coordinates"},
+    {"press_fmg_restriction", adrt_py_fmg_restriction, METH_VARARGS, "Multigrid restriction operator"},
+    {"press_fmg_prolongation", adrt_py_fmg_prolongation, METH_VARARGS, "Multigrid prolongation operator"},
+    {"press_fmg_highpass", adrt_py_fmg_highpass, METH_VARARGS, "Multigrid high-pass filter"},
     {nullptr, nullptr, 0, nullptr}
 };
 
@@ -908,6 +2639,10 @@ PyInit__adrt_cdefs()
         adrt::_py::xdecref(module);
         return nullptr;
     }
+    if(PyModule_AddStringConstant(module, "KERNEL_VARIANT", adrt::_dispatch::active_variant_name()) < 0) {
+        adrt::_py::xdecref(module);
+        return nullptr;
+    }
     return module;
 }
 
@@ -57,21 +57,33 @@ single-step routines make that possible.
 """
 
 
+import time
 import typing
 import numpy as np
 import numpy.typing as npt
-from .utils import truncate as _truncate
 from ._wrappers import (
     _format_object_type,
     num_iters,
     adrt_step,
+    adrt_adjoint,
+    adrt_normal,
+    iadrt_fmg_step,
+    fmg_precondition,
     bdrt_step,
     threading_enabled,
-    _press_fmg_restriction,
-    _press_fmg_prolongation,
-    _press_fmg_highpass,
+    set_num_threads,
+    get_num_threads,
+    num_threads,
+    kernel_variant,
+    layout_copy_count,
+    workspace_size,
+    set_radix,
+    get_radix,
+    TransformPlan,
+    plan_adrt,
+    plan_bdrt,
+    plan_iadrt,
     adrt as _adrt,
-    bdrt as _bdrt,
 )
 
 
@@ -82,9 +94,24 @@ __all__: typing.Final[typing.Sequence[str]] = [
     "adrt_iter",
     "bdrt_step",
     "bdrt_iter",
+    "adrt_adjoint",
+    "adrt_normal",
     "threading_enabled",
+    "set_num_threads",
+    "get_num_threads",
+    "num_threads",
+    "kernel_variant",
+    "layout_copy_count",
+    "workspace_size",
+    "set_radix",
+    "get_radix",
+    "TransformPlan",
+    "plan_adrt",
+    "plan_bdrt",
+    "plan_iadrt",
     "iadrt_fmg_step",
     "iadrt_fmg_iter",
+    "fmg_precondition",
 ]
 
 
@@ -96,7 +123,7 @@ def adrt_init(a: npt.NDArray[_A], /) -> npt.NDArray[_A]:
     r"""Initialize an array for use with :func:`adrt_step`.
 
     This function processes square arrays with side lengths a power of
-    two. These arrays may also optionally have a batch dimension. This
+    two. These arrays may also have leading batch dimensions. This
     function is intended to be used with :func:`adrt.core.adrt_step`.
 
     After processing, the resulting array has the shape of an ADRT
@@ -111,7 +138,7 @@ def adrt_init(a: npt.NDArray[_A], /) -> npt.NDArray[_A]:
     a : numpy.ndarray
         The array which will be made suitable for further processing
         with the ADRT. This array must have a square shape with sides
-        a power of two, optionally with a leading batch dimension.
+        a power of two, optionally with leading batch dimensions.
 
     Returns
     -------
@@ -126,10 +153,8 @@ def adrt_init(a: npt.NDArray[_A], /) -> npt.NDArray[_A]:
             f"array must be numpy.ndarray, but got {_format_object_type(a)}"
         )
     # Check input shape
-    if a.ndim > 3 or a.ndim < 2:
-        raise ValueError(
-            f"array must have between 2 and 3 dimensions, but had {a.ndim}"
-        )
+    if a.ndim < 2:
+        raise ValueError(f"array must have at least 2 dimensions, but had {a.ndim}")
     if (
         a.shape[-1] != a.shape[-2]
         or ((a.shape[-1] - 1) & a.shape[-1]) != 0
@@ -233,120 +258,156 @@ def bdrt_iter(
         yield a.copy() if copy else a.view()
 
 
-def iadrt_fmg_step(a: npt.NDArray[_F], /) -> npt.NDArray[_F]:
-    r"""Compute an estimated inverse by the full multigrid method.
-
-    This is an implementation of the "FMG" inverse described by Press
-    [1]_. A call to this function on an output of the :func:`ADRT
-    <adrt.adrt>` produces an estimated inverse which can be
-    iteratively refined by adding corrections for remaining errors.
-
-    For easy access to iteratively-improved inverses produced by this
-    method, consider :func:`iadrt_fmg_iter` which internally
-    performs the required recurrence.
-
-    For another inverse which may perform more reliably for certain
-    inputs consider the ``iadrt_cg`` recipe proposed in the
-    :doc:`examples.cginverse` example.
-
-    Parameters
-    ----------
-    a : numpy.ndarray of float
-        The array for which an estimated inverse is computed. This
-        array must have the shape of an ADRT output.
-
-    Returns
-    -------
-    numpy.ndarray of float
-        An estimated inverse computed by the full multigrid method for
-        the input `a`.
-
-    References
-    ----------
-    .. [1] W. Press, "Discrete Radon transform has an exact, fast
-      inverse and generalizes to operations other than sums along
-      lines," Proceedings of the National Academy of Sciences, 2006.
-      `doi:10.1073/pnas.0609228103
-      <https://doi.org/10.1073/pnas.0609228103>`_
-
-    Examples
-    --------
-    For an input array ``after_adrt``
-
-    >>> rng = np.random.default_rng(seed=0)
-    >>> orig = rng.normal(size=(16, 16))
-    >>> after_adrt = adrt.adrt(orig)
-
-    we can compute an estimated inverse
-
-    >>> est_inv = adrt.core.iadrt_fmg_step(after_adrt)
+@typing.overload
+def iadrt_fmg_iter(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = ...,
+    rtol: float = ...,
+    atol: float = ...,
+    time_limit: typing.Optional[float] = ...,
+    copy: bool = ...,
+    residuals: typing.Literal[False] = ...,
+) -> typing.Iterator[npt.NDArray[_F]]:
+    ...
 
-    and iteratively refine it by repeating the below
 
-    >>> err = after_adrt - adrt.adrt(est_inv)
-    >>> est_inv += adrt.core.iadrt_fmg_step(err)
-    """
-    arr_stack = []
-    for _ in range(num_iters(a.shape[-1])):
-        arr_stack.append(a)
-        a = _press_fmg_restriction(a)
-    ret = a[..., 0, :, :]
-    n = 1
-    while arr_stack:
-        n *= 2
-        ret = _press_fmg_prolongation(ret)
-        # In-place operation ok here since prolongation returned a new array
-        ret -= _press_fmg_highpass(
-            np.mean(_truncate(_bdrt(_adrt(ret) - arr_stack.pop())) / (n - 1), axis=-3)
-        )
-    return ret
+@typing.overload
+def iadrt_fmg_iter(
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = ...,
+    rtol: float = ...,
+    atol: float = ...,
+    time_limit: typing.Optional[float] = ...,
+    copy: bool = ...,
+    residuals: typing.Literal[True],
+) -> typing.Iterator[tuple[npt.NDArray[_F], npt.NDArray[_F]]]:
+    ...
 
 
 def iadrt_fmg_iter(
-    a: npt.NDArray[_F], /, *, copy: bool = True
-) -> typing.Iterator[npt.NDArray[_F]]:
+    a: npt.NDArray[_F],
+    /,
+    *,
+    x0: typing.Optional[npt.NDArray[_F]] = None,
+    rtol: float = 0.0,
+    atol: float = 0.0,
+    time_limit: typing.Optional[float] = None,
+    copy: bool = True,
+    residuals: bool = False,
+) -> typing.Iterator[
+    typing.Union[npt.NDArray[_F], tuple[npt.NDArray[_F], npt.NDArray[_F]]]
+]:
     r"""Iteratively improve estimated inverses by the full multigrid method.
 
     Internally computes a recurrence with :func:`iadrt_fmg_step` to
     iteratively refine an estimated inverse for the :func:`ADRT
     <adrt.adrt>` output `a`.
 
-    This iterator has *infinite* length and will continue computing
-    refinements until stopped. For a simple implementation with a
-    basic stopping condition consider :func:`adrt.iadrt_fmg`.
+    Unless a stopping condition is requested with `rtol`, `atol`, or
+    `time_limit`, this iterator has *infinite* length and will continue
+    computing refinements until stopped. For a simple implementation
+    with a basic stopping condition consider :func:`adrt.iadrt_fmg`.
 
     For another inverse which may perform more reliably for certain
-    inputs consider the ``iadrt_cg`` recipe proposed in the
-    :doc:`examples.cginverse` example.
+    inputs consider :func:`adrt.iadrt_cg`.
 
     Parameters
     ----------
     a : numpy.ndarray of float
         The array for which inverse estimates will be computed.
-        This array must have the shape of an ADRT output.
+        This array must have the shape of an ADRT output, and may
+        include any number of leading batch dimensions.
+    x0 : numpy.ndarray of float, optional
+        Starting estimate which the first refinement improves, for
+        example an inverse computed for a similar input. It must have
+        the shape of the estimates. If :pycode:`None` (default), the
+        iteration starts from zero.
+    rtol : float, optional
+        Relative tolerance. If this or `atol` is positive, the iterator
+        ends once the residual norm of every image is at most
+        :pycode:`max(rtol * norm(a), atol)`, computed separately for
+        each image.
+    atol : float, optional
+        Absolute tolerance, see `rtol`.
+    time_limit : float, optional
+        If provided, the iterator ends once this many seconds have
+        elapsed since the first estimate was requested. The estimate
+        being computed when the limit passes is still produced.
     copy : bool, optional
         If :pycode:`True` (default), the arrays produced by this
         generator are independent copies. Otherwise, read-only views
         are produced and these *must not* be modified without making a
         :meth:`copy <numpy.ndarray.copy>` first.
+    residuals : bool, optional
+        If :pycode:`True`, each estimate is produced together with its
+        residual :pycode:`a - adrt.adrt(estimate)`. The recurrence
+        computes this residual for its next refinement anyway, so it is
+        available at no extra cost. Defaults to :pycode:`False`.
 
     Yields
     ------
     numpy.ndarray of float
         Estimated inverses for `a` refined by repeated applications
-        of :func:`iadrt_fmg_step`.
+        of :func:`iadrt_fmg_step`. If `residuals` is set, each
+        estimate is instead paired with its residual in a tuple.
 
     Warning
     -------
-    This is an infinite iterator; a simple for loop over its values
-    will run forever. To limit the computation either implement some
-    desired stopping condition, or consider :func:`itertools.islice`
-    to cap the number of elements produced.
+    Without a stopping condition this is an infinite iterator; a
+    simple for loop over its values will run forever. To limit the
+    computation either implement some desired stopping condition, or
+    consider :func:`itertools.islice` to cap the number of elements
+    produced.
     """
-    inv = iadrt_fmg_step(a)
-    inv.setflags(write=False)
-    yield inv.copy() if copy else inv.view()
+    if rtol < 0 or atol < 0:
+        raise ValueError(f"tolerances must be non-negative, got {rtol} and {atol}")
+    start = time.perf_counter()
+    batch_shape: tuple[int, ...] = a.shape[:-3]
+    if x0 is None:
+        inv = iadrt_fmg_step(a)
+    else:
+        if x0.shape != (*batch_shape, a.shape[-1], a.shape[-1]):
+            raise ValueError(
+                f"x0 must have the shape of the estimates for an array of shape "
+                f"{a.shape}, got {x0.shape}"
+            )
+        inv = np.array(x0, dtype=a.dtype)
+        inv += iadrt_fmg_step(a - _adrt(inv))
+    # Buffers reused by every refinement
+    correction = np.empty_like(inv)
+    adrt_workspace = np.empty(workspace_size("adrt", inv.shape), dtype=inv.dtype)
+    step_workspace = np.empty(
+        workspace_size("iadrt_fmg_step", a.shape), dtype=inv.dtype
+    )
+    residual_buffer = None if residuals else np.empty(a.shape, dtype=inv.dtype)
+    tol = None
+    if rtol > 0 or atol > 0:
+        tol = np.maximum(
+            rtol * np.linalg.norm(np.reshape(a, (*batch_shape, -1)), axis=-1), atol
+        )
     while True:
-        inv = inv + iadrt_fmg_step(a - _adrt(inv))
         inv.setflags(write=False)
-        yield inv.copy() if copy else inv.view()
+        if residuals:
+            # A new array each time, since it is produced alongside its estimate
+            res = _adrt(inv, workspace=adrt_workspace)
+            np.subtract(a, res, out=res)
+            res.setflags(write=False)
+            yield ((inv.copy(), res.copy()) if copy else (inv.view(), res.view()))
+        else:
+            yield inv.copy() if copy else inv.view()
+            # Only computed once the next refinement is requested
+            res = _adrt(inv, out=residual_buffer, workspace=adrt_workspace)
+            np.subtract(a, res, out=res)
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            return
+        if tol is not None and np.all(
+            np.linalg.norm(res.reshape((*batch_shape, -1)), axis=-1) <= tol
+        ):
+            return
+        iadrt_fmg_step(res, out=correction, workspace=step_workspace)
+        # A new array, since views of earlier estimates may still be in use
+        inv = inv + correction
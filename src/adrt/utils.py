@@ -43,11 +43,17 @@ irregular ADRT angles into a regular spacing.
 """
 
 
+import functools
 import operator
 import typing
 import numpy as np
 import numpy.typing as npt
-from ._wrappers import interp_to_cart
+from ._wrappers import (
+    _coord_cart_to_adrt,
+    interp_to_cart,
+    interp_to_cart_adjoint,
+    sample_adrt,
+)
 
 
 __all__: typing.Final[typing.Sequence[str]] = [
@@ -55,8 +61,12 @@ __all__: typing.Final[typing.Sequence[str]] = [
     "unstitch_adrt",
     "truncate",
     "coord_adrt",
+    "ADRTOffset",
+    "ADRTLazyCoord",
     "coord_cart_to_adrt",
     "interp_to_cart",
+    "interp_to_cart_adjoint",
+    "sample_adrt",
 ]
 
 
@@ -243,12 +253,178 @@ def truncate(a: npt.NDArray[_A], /) -> npt.NDArray[_A]:
     )
 
 
+class _ADRTCoordTerms(typing.NamedTuple):
+    # Per-axis factors of the ADRT offsets, all read-only
+    sign: npt.NDArray[np.float64]
+    height: npt.NDArray[np.float64]
+    shift: npt.NDArray[np.float64]
+    denom: npt.NDArray[np.float64]
+    scale: npt.NDArray[np.float64]
+    angle: npt.NDArray[np.float64]
+
+
+@functools.lru_cache(maxsize=8)
+def _coord_adrt_terms(n: int, /) -> _ADRTCoordTerms:
+    # Callers check that n is a valid size
+    hi, step = np.linspace(
+        1, (1 - n) / n, num=2 * n - 1, endpoint=False, retstep=True, dtype=np.float64
+    )
+    hi += step / 2
+    # Compute base angles
+    ns = np.linspace(0, 1, num=n, endpoint=True, dtype=np.float64)
+    theta = np.arctan(ns)  # [0, pi/4]
+    theta_offset = theta - (np.pi / 2)
+    terms = _ADRTCoordTerms(
+        sign=np.array([1.0, -1.0, 1.0, -1.0]).reshape((4, 1, 1)),
+        height=hi.reshape((1, 2 * n - 1, 1)),
+        shift=(((2 * n - 1) / (2 * n)) * ns).reshape((1, 1, n)),
+        denom=(1 + ns).reshape((1, 1, n)),
+        scale=(np.cos(theta) + np.sin(theta)).reshape((1, 1, n)),
+        angle=np.expand_dims(
+            np.stack([theta_offset, -theta, theta, -theta_offset], axis=0), axis=1
+        ),
+    )
+    for term in terms:
+        term.flags.writeable = False
+    return terms
+
+
+def _offset_from_terms(
+    sign: npt.NDArray[np.float64],
+    height: npt.NDArray[np.float64],
+    shift: npt.NDArray[np.float64],
+    denom: npt.NDArray[np.float64],
+    scale: npt.NDArray[np.float64],
+    /,
+) -> npt.NDArray[np.float64]:
+    return sign * ((((height + shift) / denom) - 0.5) * scale)
+
+
+class ADRTOffset:
+    r"""Offset coordinates of an ADRT output, computed on demand.
+
+    Returned as the `offset` of :pycode:`coord_adrt(n, lazy=True)`. It
+    behaves as a read-only array of shape :pycode:`(4, 2*n-1, n)` but
+    stores only per-axis terms, so its memory use is linear in `n`.
+    Values are computed when indexed, with the same results as the
+    dense array from :func:`coord_adrt`.
+
+    Instances should not be created directly.
+    """
+
+    __slots__ = ("_n", "_terms")
+
+    def __init__(self, n: int, terms: _ADRTCoordTerms, /) -> None:
+        self._n = n
+        self._terms = terms
+
+    @property
+    def n(self) -> int:
+        r"""The size of the ADRT domain."""
+        return self._n
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        r"""The shape of the corresponding dense array."""
+        return (4, 2 * self._n - 1, self._n)
+
+    @property
+    def ndim(self) -> int:
+        r"""The number of dimensions, always three."""
+        return 3
+
+    @property
+    def dtype(self) -> np.dtype[np.float64]:
+        r"""The data type of the offsets, always :class:`numpy.float64`."""
+        return np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return 4
+
+    def __getitem__(self, key: typing.Any, /) -> npt.NDArray[np.float64]:
+        r"""Compute the offsets selected by `key`.
+
+        Any key accepted by a NumPy array of the same shape may be
+        used. Only the selected entries are computed.
+        """
+        t = self._terms
+        shape = self.shape
+        return _offset_from_terms(
+            *(
+                np.broadcast_to(term, shape)[key]
+                for term in (t.sign, t.height, t.shift, t.denom, t.scale)
+            )
+        )
+
+    def to_dense(self) -> npt.NDArray[np.float64]:
+        r"""Compute all offsets as a new array.
+
+        Returns
+        -------
+        numpy.ndarray of numpy.float64
+            The offsets, with shape :pycode:`(4, 2*n-1, n)`.
+        """
+        t = self._terms
+        return _offset_from_terms(t.sign, t.height, t.shift, t.denom, t.scale)
+
+    def __array__(
+        self,
+        dtype: typing.Optional[npt.DTypeLike] = None,
+        copy: typing.Optional[bool] = None,
+    ) -> npt.NDArray[typing.Any]:
+        if copy is False:
+            raise ValueError("ADRTOffset values are computed, a copy is always made")
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype, copy=bool(copy))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={self._n})"
+
+
 class ADRTCoord(typing.NamedTuple):
     offset: npt.NDArray[np.float64]
     angle: npt.NDArray[np.float64]
 
 
-def coord_adrt(n: typing.SupportsIndex, /) -> ADRTCoord:
+class ADRTLazyCoord(typing.NamedTuple):
+    r"""Coordinates from :pycode:`coord_adrt(n, lazy=True)`.
+
+    Attributes
+    ----------
+    offset : ADRTOffset
+        Offsets of each ADRT entry, computed when indexed.
+    angle : numpy.ndarray of numpy.float64
+        Read-only array of shape :pycode:`(4, 1, n)` with the angle of
+        each ADRT column in radians.
+    """
+
+    offset: ADRTOffset
+    angle: npt.NDArray[np.float64]
+
+
+@functools.lru_cache(maxsize=8)
+def _coord_adrt_lazy(n: int, /) -> ADRTLazyCoord:
+    terms = _coord_adrt_terms(n)
+    return ADRTLazyCoord(ADRTOffset(n, terms), terms.angle)
+
+
+@typing.overload
+def coord_adrt(
+    n: typing.SupportsIndex, /, *, lazy: typing.Literal[False] = ...
+) -> ADRTCoord:
+    ...
+
+
+@typing.overload
+def coord_adrt(
+    n: typing.SupportsIndex, /, *, lazy: typing.Literal[True]
+) -> ADRTLazyCoord:
+    ...
+
+
+def coord_adrt(
+    n: typing.SupportsIndex, /, *, lazy: bool = False
+) -> typing.Union[ADRTCoord, ADRTLazyCoord]:
     r"""Compute coordinates for each entry in an ADRT output.
 
     The ADRT sums values in an input image along lines of pixels.
@@ -274,6 +450,11 @@ def coord_adrt(n: typing.SupportsIndex, /) -> ADRTCoord:
     output. Consider :func:`numpy.broadcast_to` to expand this array
     to full size, if desired.
 
+    With `lazy` set, the offsets are instead returned as an
+    :class:`ADRTOffset` which computes values only for the entries it
+    is indexed with. This avoids allocating the full array for large
+    `n`.
+
     Parameters
     ----------
     n : int
@@ -281,10 +462,13 @@ def coord_adrt(n: typing.SupportsIndex, /) -> ADRTCoord:
         image :pycode:`(n, n)`, or equivalently the final dimension of
         the ADRT output :pycode:`(4, 2*n-1, n)`. Must be a power of
         two.
+    lazy : bool, optional
+        If true, return the offsets as an :class:`ADRTOffset` rather
+        than as a dense array.
 
     Returns
     -------
-    offset : numpy.ndarray of numpy.float64
+    offset : numpy.ndarray of numpy.float64 or ADRTOffset
         3D array of dimensions :pycode:`(4, 2*n-1, n)` containing
         Radon domain offset coordinates of the ADRT domain for each of
         four quadrants.
@@ -301,29 +485,24 @@ def coord_adrt(n: typing.SupportsIndex, /) -> ADRTCoord:
     for more details on how the Radon domain relates to the ADRT
     domain, and :ref:`adrt-description` for more information on the
     ADRT.
+
+    The per-axis terms used to compute coordinates are cached for the
+    most recently used sizes. Lazy results, including their `angle`
+    array, are shared between calls and are read-only. Dense results are
+    new arrays on each call.
     """
     n = operator.index(n)
     if n < 2:
         raise ValueError(f"invalid Radon domain size {n}, must be at least 2")
     if (n - 1) & n != 0:
         raise ValueError(f"invalid Radon domain size {n}, must a power of two")
-    hi, step = np.linspace(
-        1, (1 - n) / n, num=2 * n - 1, endpoint=False, retstep=True, dtype=np.float64
+    if lazy:
+        return _coord_adrt_lazy(n)
+    terms = _coord_adrt_terms(n)
+    offset = _offset_from_terms(
+        terms.sign, terms.height, terms.shift, terms.denom, terms.scale
     )
-    hi += step / 2
-    # Compute base angles
-    ns = np.linspace(0, 1, num=n, endpoint=True, dtype=np.float64)
-    theta = np.arctan(ns)  # [0, pi/4]
-    theta_offset = theta - (np.pi / 2)
-    h0 = ((np.add.outer(hi, ((2 * n - 1) / (2 * n)) * ns) / (1 + ns)) - 0.5) * (
-        np.cos(theta) + np.sin(theta)
-    )
-    # Build output quadrants
-    s_full = np.tile(np.stack([h0, -h0], axis=0), (2, 1, 1))
-    theta_full = np.expand_dims(
-        np.stack([theta_offset, -theta, theta, -theta_offset], axis=0), axis=1
-    )
-    return ADRTCoord(s_full, theta_full)
+    return ADRTCoord(offset, terms.angle.copy())
 
 
 class ADRTIndex(typing.NamedTuple):
@@ -401,6 +580,10 @@ def coord_cart_to_adrt(
     so lies exactly on the boundary between quadrants, the height and
     slope indices for the lower indexed quadrant are provided.
 
+    The mapping runs in native code, in double precision and in
+    parallel. Coordinates must be finite. To read the values of the
+    identified entries directly, use :func:`sample_adrt`.
+
     See the :doc:`coordinate transform section <examples.coordinate>` for more
     details on how the Radon domain relates to the ADRT domain.
     """
@@ -413,24 +596,4 @@ def coord_cart_to_adrt(
         raise ValueError(
             f"mismatched shapes for theta and t {theta.shape} vs. {t.shape}"
         )
-    # Move theta values into canonical range [-pi/2, pi/2]
-    theta = np.where(
-        np.abs(theta) <= np.pi / 2,
-        theta,
-        np.remainder(theta + np.pi / 2, np.pi) - np.pi / 2,
-    )
-    # Compute quadrants 0, 1, 2, 3
-    q = np.floor(np.clip(theta / (np.pi / 4), -2, 1)).astype(np.int8) + 2
-    # Compute distances from nearest multiple of pi / 2
-    # Using the fact theta is in our canonical range
-    th0 = np.pi / 4 - np.abs(np.abs(theta) - np.pi / 4)
-    # Compute slope (range from [0, n - 1])
-    si = np.around(np.tan(th0) * (n - 1)).astype(np.uint64)
-    # Compute scaling factor
-    factor = np.sqrt(1 + (si / (n - 1)) ** 2)
-    # Compute height
-    sgn = 2 * (q % 2) - 1
-    h = (0.5 * (1 + np.tan(th0)) + (sgn * t) / np.cos(th0)) * n
-    hi = (np.round(2 * h).astype(np.int64) - 1) // 2
-    # Pack return values
-    return ADRTIndex(q.astype(np.uint8), hi, si, factor)
+    return ADRTIndex(*_coord_cart_to_adrt(theta, t, n))
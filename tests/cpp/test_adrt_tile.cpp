@@ -0,0 +1,68 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include <array>
+#include <cstddef>
+#include "catch2/catch_amalgamated.hpp"
+#include "adrt_cdefs_common.hpp"
+#include "adrt_cdefs_adrt.hpp"
+
+using std::size_t;
+
+TEST_CASE("adrt_tile_shape spans several levels for large images", "[adrt][adrt_tile_shape]") {
+    const size_t cache_size = GENERATE(size_t{1} << 20u, size_t{2} << 20u);
+    const size_t elem_size = GENERATE(sizeof(float), sizeof(double));
+    const std::array<size_t, 3> shape = {1, 8192, 8192};
+    const std::array<size_t, 2> tile_shape = adrt::_impl::adrt_tile_shape(shape, elem_size, 1, cache_size);
+    CHECK(adrt::num_iters(std::get<0>(tile_shape)) > 1);
+}
+
+TEST_CASE("adrt_tile_shape column blocks cover the largest shift", "[adrt][adrt_tile_shape]") {
+    const size_t n = GENERATE(size_t{2}, size_t{16}, size_t{256}, size_t{8192});
+    const size_t cache_size = GENERATE(size_t{256} << 10u, size_t{1} << 20u, size_t{32} << 20u);
+    const std::array<size_t, 3> shape = {1, n, n};
+    const std::array<size_t, 2> tile_shape = adrt::_impl::adrt_tile_shape(shape, sizeof(float), 1, cache_size);
+    const size_t tile_rows = std::get<0>(tile_shape);
+    const size_t tile_cols = std::get<1>(tile_shape);
+    CHECK(tile_rows >= size_t{2});
+    CHECK(tile_rows <= n);
+    CHECK(n % tile_rows == size_t{0});
+    CHECK(tile_cols >= tile_rows / size_t{2});
+    CHECK(tile_cols <= size_t{2} * n - size_t{1});
+}
+
+TEST_CASE("adrt_tile_shape leaves a tile for each thread", "[adrt][adrt_tile_shape]") {
+    const std::array<size_t, 3> shape = {1, 256, 256};
+    const std::array<size_t, 2> tile_shape = adrt::_impl::adrt_tile_shape(shape, sizeof(float), 64, size_t{32} << 20u);
+    CHECK(size_t{4} * (256 / std::get<0>(tile_shape)) >= size_t{64});
+}
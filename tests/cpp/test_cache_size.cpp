@@ -0,0 +1,65 @@
+/*
+ * Copyright Karl Otness, Donsub Rim
+ *
+ * SPDX-License-Identifier: BSD-3-Clause
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in the
+ *    documentation and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <cstddef>
+#include "catch2/catch_amalgamated.hpp"
+#include "adrt_cdefs_common.hpp"
+
+using std::size_t;
+
+TEST_CASE("cache_size_l2 reports a positive size", "[common][cache_size_l2]") {
+    const size_t size = adrt::_common::cache_size_l2();
+    CHECK(size > size_t{0});
+}
+
+TEST_CASE("cache_size_l2 is stable across calls", "[common][cache_size_l2]") {
+    CHECK(adrt::_common::cache_size_l2() == adrt::_common::cache_size_l2());
+}
+
+TEST_CASE("max_threads is at least one", "[common][max_threads]") {
+    CHECK(adrt::_common::max_threads() >= size_t{1});
+}
+
+TEST_CASE("batch_parallel requires several threads", "[common][batch_parallel]") {
+    if(adrt::_common::max_threads() == size_t{1}) {
+        CHECK_FALSE(adrt::_common::batch_parallel(size_t{4096}, size_t{1}));
+    }
+}
+
+TEST_CASE("batch_parallel rejects images larger than the cache", "[common][batch_parallel]") {
+    const size_t large_image = adrt::_common::cache_size_l2() + size_t{1};
+    CHECK_FALSE(adrt::_common::batch_parallel(size_t{1} << 20u, large_image));
+}
+
+TEST_CASE("batch_parallel rejects a single image", "[common][batch_parallel]") {
+    CHECK_FALSE(adrt::_common::batch_parallel(size_t{1}, size_t{1}));
+}
@@ -105,10 +105,12 @@ class TestAdrtCdefs:
         with pytest.raises(ValueError):
             _ = adrt._adrt_cdefs.adrt(inarr)
 
-    def test_refuses_four_dim(self):
-        inarr = np.zeros((5, 3, 16, 16), dtype=np.float32)
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.adrt(inarr)
+    def test_accepts_four_dim(self):
+        inarr = np.arange(5 * 3 * 16 * 16, dtype=np.float32).reshape((5, 3, 16, 16))
+        out = adrt._adrt_cdefs.adrt(inarr)
+        assert out.shape == (5, 3, 4, 31, 16)
+        flat = adrt._adrt_cdefs.adrt(inarr.reshape((15, 16, 16)))
+        assert np.all(out == flat.reshape(out.shape))
 
     def test_refuses_non_power_of_two(self):
         inarr = np.zeros((31, 31), dtype=np.float32)
@@ -128,16 +130,21 @@ class TestAdrtCdefs:
                 ]
             )
 
-    def test_refuses_fortran_order(self):
-        inarr = np.zeros((32, 32), dtype=np.float32, order="F")
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.adrt(inarr)
+    def test_accepts_fortran_order(self):
+        inarr = np.asfortranarray(np.arange(32 * 32, dtype=np.float32).reshape(32, 32))
+        out = adrt._adrt_cdefs.adrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.adrt(np.ascontiguousarray(inarr)))
 
-    def test_refuses_c_non_contiguous(self):
-        inarr = np.zeros((64, 32), dtype=np.float32, order="F")[::2]
+    def test_accepts_c_non_contiguous(self):
+        inarr = np.arange(64 * 32, dtype=np.float32).reshape(64, 32, order="F")[::2]
         assert inarr.shape == (32, 32)
         assert not inarr.flags["C_CONTIGUOUS"]
-        with pytest.raises(ValueError):
+        out = adrt._adrt_cdefs.adrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.adrt(np.ascontiguousarray(inarr)))
+
+    def test_refuses_negative_strides(self):
+        inarr = np.zeros((32, 32), dtype=np.float32)[::-1]
+        with pytest.raises(ValueError, match="strides"):
             _ = adrt._adrt_cdefs.adrt(inarr)
 
     def test_refuses_byteswapped(self):
@@ -390,3 +397,152 @@ class TestAdrt:
         assert np.all(c_out[3, :8, 0] == 1)
         assert np.all(c_out[3, 8:, -1] == 0)
         assert np.all(c_out[3, :8, -1] == 1)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype):
+        inarr = np.arange(3 * 16 * 16, dtype=dtype).reshape((3, 16, 16))
+        expected = adrt.adrt(inarr)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("adrt", inarr.shape), np.nan, dtype=dtype
+        )
+        for _ in range(2):
+            c_out = adrt.adrt(inarr, out=out, workspace=workspace)
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_accepts_oversized_workspace(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("adrt", inarr.shape)
+        workspace = np.zeros((2, size), dtype=np.float32)
+        c_out = adrt.adrt(inarr, workspace=workspace)
+        assert np.all(c_out == adrt.adrt(inarr))
+
+    def test_refuses_small_workspace(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("adrt", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(inarr, workspace=np.zeros(size - 1, dtype=np.float32))
+
+    def test_refuses_out_wrong_shape(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        out = np.zeros((4, 31, 15), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(inarr, out=out)
+
+    def test_refuses_out_wrong_dtype(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.adrt(inarr), dtype=np.float64)
+        with pytest.raises(TypeError):
+            _ = adrt.adrt(inarr, out=out)
+        with pytest.raises(TypeError):
+            _ = adrt.adrt(inarr, workspace=np.zeros(4096, dtype=np.float64))
+
+    def test_refuses_out_non_contiguous(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        expected = adrt.adrt(inarr)
+        out = np.zeros((*expected.shape[:-1], 2 * expected.shape[-1]), np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(inarr, out=out[..., ::2])
+
+    def test_refuses_out_read_only(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.adrt(inarr))
+        out.flags.writeable = False
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(inarr, out=out)
+
+    def test_refuses_out_non_array(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        out = adrt.adrt(inarr).tolist()
+        with pytest.raises(TypeError):
+            _ = adrt.adrt(inarr, out=out)
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.adrt(inarr))
+        size = adrt.core.workspace_size("adrt", inarr.shape)
+        workspace = np.zeros(size + out.size, dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(inarr, workspace=inarr.reshape(-1))
+        with pytest.raises(ValueError):
+            _ = adrt.adrt(
+                inarr,
+                out=workspace[: out.size].reshape(out.shape),
+                workspace=workspace[1:],
+            )
+
+    @pytest.mark.parametrize("size", [1, 2, 16, 64])
+    def test_accumulate_float64_matches_rounded_float64(self, size):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.random((size, size), dtype=np.float32)
+        wide = adrt.adrt(inarr, accumulate=np.float64)
+        assert wide.dtype == np.float32
+        ref = adrt.adrt(inarr.astype(np.float64)).astype(np.float32)
+        assert np.array_equal(wide, ref)
+
+    def test_accumulate_float64_batch_threads(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = np.stack([rng.random((size, size), dtype=np.float32) for _ in range(5)])
+        wide = adrt.adrt(inarr, accumulate=np.float64, threads=3)
+        for i in range(inarr.shape[0]):
+            assert np.array_equal(
+                wide[i], adrt.adrt(inarr[i], accumulate=np.float64, threads=1)
+            )
+
+    def test_accumulate_float64_strided(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = rng.random((size, size), dtype=np.float32)
+        wide = adrt.adrt(np.asfortranarray(inarr), accumulate=np.float64)
+        assert np.array_equal(wide, adrt.adrt(inarr, accumulate=np.float64))
+
+    def test_accumulate_float64_out_and_workspace(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = np.stack([rng.random((size, size), dtype=np.float32) for _ in range(3)])
+        expected = adrt.adrt(inarr, accumulate=np.float64)
+        out = np.zeros_like(expected)
+        ws_size = 2 * adrt.core.workspace_size("adrt", inarr.shape)
+        workspace = np.full(ws_size, np.nan, dtype=np.float64)
+        ret = adrt.adrt(inarr, accumulate=np.float64, out=out, workspace=workspace)
+        assert ret is out
+        assert np.array_equal(out, expected)
+
+    def test_accumulate_float64_refuses_workspace(self):
+        size = 16
+        inarr = np.ones((size, size), dtype=np.float32)
+        ws_size = adrt.core.workspace_size("adrt", inarr.shape)
+        with pytest.raises(TypeError, match="float64"):
+            _ = adrt.adrt(
+                inarr,
+                accumulate=np.float64,
+                workspace=np.zeros(2 * ws_size, dtype=np.float32),
+            )
+        with pytest.raises(ValueError, match="too small"):
+            _ = adrt.adrt(
+                inarr,
+                accumulate=np.float64,
+                workspace=np.zeros(ws_size, dtype=np.float64),
+            )
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_accumulate_same_dtype_unchanged(self, dtype):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = rng.random((size, size), dtype=np.float32).astype(dtype)
+        assert np.array_equal(adrt.adrt(inarr, accumulate=dtype), adrt.adrt(inarr))
+
+    def test_refuses_accumulate_narrower(self):
+        size = 16
+        inarr = np.ones((size, size), dtype=np.float64)
+        with pytest.raises(ValueError, match="narrower"):
+            _ = adrt.adrt(inarr, accumulate=np.float32)
+
+    @pytest.mark.parametrize("accumulate", [np.int64, np.float16, "complex128"])
+    def test_refuses_accumulate_unsupported(self, accumulate):
+        size = 16
+        inarr = np.ones((size, size), dtype=np.float32)
+        with pytest.raises(TypeError, match="accumulation dtype"):
+            _ = adrt.adrt(inarr, accumulate=accumulate)
@@ -0,0 +1,214 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import pytest
+import numpy as np
+import adrt
+
+
+def _reference_adjoint(a):
+    return adrt.utils.truncate(adrt.bdrt(a))
+
+
+class TestAdrtAdjointCdefs:
+    def test_accepts_float32(self):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32)
+        _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+    def test_accepts_float64(self):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float64)
+        _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+    def test_refuses_int32(self):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.int32)
+        with pytest.raises(TypeError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+    def test_refuses_mismatched_shape(self):
+        size = 16
+        inarr_a = np.zeros((4, 2 * size - 1, size - 1), dtype=np.float32)
+        inarr_b = np.zeros((4, 2 * size - 2, size), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr_a, False)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr_b, False)
+
+    def test_refuses_non_power_of_two(self):
+        size = 17
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+    def test_refuses_non_array(self):
+        with pytest.raises(TypeError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(None, False)
+
+    def test_refuses_zero_axis_array(self):
+        size = 16
+        inarr = np.zeros((0, 4, 2 * size - 1, size), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+    def test_refuses_byteswapped(self):
+        size = 16
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float32).newbyteorder()
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_adjoint(inarr, False)
+
+
+class TestAdrtAdjoint:
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_returned_dtype(self, dtype):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=dtype)
+        assert adrt.core.adrt_adjoint(inarr).dtype == np.dtype(dtype)
+
+    @pytest.mark.parametrize("radix", [2, 4])
+    @pytest.mark.parametrize("size", [1, 2, 4, 8, 16, 32, 64])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_matches_truncated_bdrt(self, size, dtype, radix):
+        rng = np.random.default_rng(seed=size)
+        inarr = rng.normal(size=(3, 4, 2 * size - 1, size)).astype(dtype)
+        old_radix = adrt.core.get_radix()
+        try:
+            adrt.core.set_radix(radix)
+            expected = _reference_adjoint(inarr)
+            c_out = adrt.core.adrt_adjoint(inarr)
+            c_out_quad = adrt.core.adrt_adjoint(inarr, per_quadrant=True)
+        finally:
+            adrt.core.set_radix(old_radix)
+        assert c_out.shape == (3, size, size)
+        assert c_out_quad.shape == (3, 4, size, size)
+        assert np.all(c_out_quad == expected)
+        assert np.all(c_out == expected.sum(axis=-3))
+
+    @pytest.mark.parametrize("size", [1, 2, 4, 8, 16])
+    def test_transpose_identity(self, size):
+        rng = np.random.default_rng(seed=0)
+        x = rng.normal(size=(size, size))
+        y = rng.normal(size=(4, 2 * size - 1, size))
+        lhs = np.vdot(adrt.adrt(x), y)
+        rhs = np.vdot(x, adrt.core.adrt_adjoint(y))
+        assert np.isclose(lhs, rhs)
+
+    @pytest.mark.parametrize("size", [1, 2, 4, 8])
+    def test_materialize_array(self, size):
+        n = size
+        full_size = n**2
+        adrt_size = 4 * n * (2 * n - 1)
+        adrt_in = np.eye(full_size, dtype=np.float32).reshape((full_size, n, n))
+        adjoint_in = np.eye(adrt_size, dtype=np.float32).reshape(
+            (adrt_size, 4, 2 * n - 1, n)
+        )
+        adrt_arr = adrt.adrt(adrt_in).reshape((full_size, -1)).T
+        adjoint_arr = adrt.core.adrt_adjoint(adjoint_in).reshape((adrt_size, full_size))
+        assert np.all(adrt_arr == adjoint_arr)
+
+    def test_batch_dimensions(self):
+        size = 8
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(2, 3, 4, 2 * size - 1, size)).astype(np.float32)
+        c_out = adrt.core.adrt_adjoint(inarr)
+        c_out_quad = adrt.core.adrt_adjoint(inarr, per_quadrant=True)
+        assert c_out.shape == (2, 3, size, size)
+        assert c_out_quad.shape == (2, 3, 4, size, size)
+        flat = adrt.core.adrt_adjoint(inarr.reshape((6, 4, 2 * size - 1, size)))
+        assert np.all(c_out == flat.reshape(c_out.shape))
+
+    def test_large_batch_small_images(self):
+        size = 4
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(257, 4, 2 * size - 1, size))
+        c_out = adrt.core.adrt_adjoint(inarr, threads=3)
+        assert np.all(c_out == _reference_adjoint(inarr).sum(axis=-3))
+
+    def test_accepts_strided_input(self):
+        size = 16
+        rng = np.random.default_rng(seed=0)
+        base = rng.normal(size=(4, 2 * size - 1, 2 * size)).astype(np.float32)
+        inarr = base[..., ::2]
+        assert not inarr.flags["C_CONTIGUOUS"]
+        copies = adrt.core.layout_copy_count()
+        c_out = adrt.core.adrt_adjoint(inarr)
+        assert adrt.core.layout_copy_count() == copies
+        assert np.all(c_out == adrt.core.adrt_adjoint(np.ascontiguousarray(inarr)))
+
+    @pytest.mark.parametrize("per_quadrant", [False, True])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype, per_quadrant):
+        inarr = np.arange(3 * 4 * 31 * 16, dtype=dtype).reshape((3, 4, 31, 16))
+        expected = adrt.core.adrt_adjoint(inarr, per_quadrant=per_quadrant)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("adrt_adjoint", inarr.shape), np.nan, dtype=dtype
+        )
+        for _ in range(2):
+            c_out = adrt.core.adrt_adjoint(
+                inarr, per_quadrant=per_quadrant, out=out, workspace=workspace
+            )
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_refuses_small_workspace(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("adrt_adjoint", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_adjoint(
+                inarr, workspace=np.zeros(size - 1, dtype=np.float32)
+            )
+
+    def test_refuses_out_wrong_shape(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_adjoint(inarr, out=np.zeros((4, 16, 16), np.float32))
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_adjoint(
+                inarr, per_quadrant=True, out=np.zeros((16, 16), np.float32)
+            )
+
+    def test_refuses_out_wrong_dtype(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        with pytest.raises(TypeError):
+            _ = adrt.core.adrt_adjoint(inarr, out=np.zeros((16, 16), np.float64))
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_adjoint(inarr, out=inarr[0, :16])
+
+    def test_refuses_bad_threads(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_adjoint(inarr, threads=0)
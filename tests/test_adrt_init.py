@@ -88,10 +88,12 @@ def test_refuses_non_array():
         )
 
 
-def test_refuses_too_many_dims():
-    in_arr = np.ones((2, 3, 16, 16)).astype("float32")
-    with pytest.raises(ValueError):
-        adrt.core.adrt_init(in_arr)
+def test_accepts_many_dims():
+    in_arr = np.arange(2 * 3 * 16 * 16).reshape((2, 3, 16, 16)).astype("float32")
+    out = adrt.core.adrt_init(in_arr)
+    assert out.shape == (2, 3, 4, 31, 16)
+    flat = adrt.core.adrt_init(in_arr.reshape((6, 16, 16)))
+    assert np.all(out == flat.reshape(out.shape))
 
 
 def test_refuses_too_few_dims():
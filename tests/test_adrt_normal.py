@@ -0,0 +1,169 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import pytest
+import numpy as np
+import adrt
+
+
+class TestAdrtNormalCdefs:
+    def test_accepts_float32(self):
+        inarr = np.zeros((16, 16), dtype=np.float32)
+        _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+    def test_accepts_float64(self):
+        inarr = np.zeros((16, 16), dtype=np.float64)
+        _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+    def test_refuses_int32(self):
+        inarr = np.zeros((16, 16), dtype=np.int32)
+        with pytest.raises(TypeError):
+            _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+    def test_refuses_non_square(self):
+        inarr = np.zeros((16, 8), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+    def test_refuses_non_power_of_two(self):
+        inarr = np.zeros((15, 15), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+    def test_refuses_non_float_ridge(self):
+        inarr = np.zeros((16, 16), dtype=np.float32)
+        with pytest.raises(TypeError):
+            _ = adrt._adrt_cdefs.adrt_normal(inarr, "1.0")
+
+    def test_refuses_zero_axis_array(self):
+        inarr = np.zeros((0, 16, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.adrt_normal(inarr, 0.0)
+
+
+class TestAdrtNormal:
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_returned_dtype(self, dtype):
+        inarr = np.zeros((16, 16), dtype=dtype)
+        c_out = adrt.core.adrt_normal(inarr)
+        assert c_out.dtype == np.dtype(dtype)
+        assert c_out.shape == inarr.shape
+
+    @pytest.mark.parametrize("radix", [2, 4])
+    @pytest.mark.parametrize("size", [1, 2, 4, 8, 16, 32, 64])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_matches_adjoint_of_adrt(self, size, dtype, radix):
+        rng = np.random.default_rng(seed=size)
+        inarr = rng.normal(size=(3, size, size)).astype(dtype)
+        old_radix = adrt.core.get_radix()
+        try:
+            adrt.core.set_radix(radix)
+            expected = adrt.core.adrt_adjoint(adrt.adrt(inarr))
+            c_out = adrt.core.adrt_normal(inarr)
+        finally:
+            adrt.core.set_radix(old_radix)
+        assert np.all(c_out == expected)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_ridge(self, dtype):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(3, 16, 16)).astype(dtype)
+        ridge = 2.5
+        expected = adrt.core.adrt_normal(inarr) + np.asarray(ridge, dtype=dtype) * inarr
+        c_out = adrt.core.adrt_normal(inarr, ridge=ridge)
+        assert np.all(c_out == expected)
+
+    def test_symmetric(self):
+        rng = np.random.default_rng(seed=0)
+        x = rng.normal(size=(16, 16))
+        y = rng.normal(size=(16, 16))
+        lhs = np.vdot(adrt.core.adrt_normal(x, ridge=0.5), y)
+        rhs = np.vdot(x, adrt.core.adrt_normal(y, ridge=0.5))
+        assert np.isclose(lhs, rhs)
+
+    def test_batch_dimensions(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(2, 3, 8, 8)).astype(np.float32)
+        c_out = adrt.core.adrt_normal(inarr, ridge=1.0)
+        assert c_out.shape == inarr.shape
+        flat = adrt.core.adrt_normal(inarr.reshape((6, 8, 8)), ridge=1.0)
+        assert np.all(c_out == flat.reshape(c_out.shape))
+
+    def test_large_batch_small_images(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(257, 4, 4))
+        c_out = adrt.core.adrt_normal(inarr, ridge=3.0, threads=3)
+        expected = adrt.core.adrt_adjoint(adrt.adrt(inarr)) + 3.0 * inarr
+        assert np.all(c_out == expected)
+
+    def test_accepts_strided_input(self):
+        rng = np.random.default_rng(seed=0)
+        base = rng.normal(size=(16, 32)).astype(np.float32)
+        inarr = base[:, ::2]
+        copies = adrt.core.layout_copy_count()
+        c_out = adrt.core.adrt_normal(inarr, ridge=1.0)
+        assert adrt.core.layout_copy_count() == copies
+        expected = adrt.core.adrt_normal(np.ascontiguousarray(inarr), ridge=1.0)
+        assert np.all(c_out == expected)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype):
+        inarr = np.arange(3 * 16 * 16, dtype=dtype).reshape((3, 16, 16))
+        expected = adrt.core.adrt_normal(inarr, ridge=1.0)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("adrt_normal", inarr.shape), np.nan, dtype=dtype
+        )
+        for _ in range(2):
+            c_out = adrt.core.adrt_normal(
+                inarr, ridge=1.0, out=out, workspace=workspace
+            )
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_refuses_small_workspace(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("adrt_normal", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_normal(
+                inarr, workspace=np.zeros(size - 1, dtype=np.float32)
+            )
+
+    def test_refuses_out_wrong_shape(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_normal(inarr, out=np.zeros((1, 16, 16), np.float32))
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.adrt_normal(inarr, out=inarr)
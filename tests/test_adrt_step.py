@@ -46,7 +46,7 @@ class TestAdrtStepCdefs:
     def test_refuses_too_many_args(self):
         arr = np.zeros((4, 31, 16), dtype=np.float64)
         with pytest.raises(TypeError):
-            adrt._adrt_cdefs.adrt_step(arr, 0, 0)
+            adrt._adrt_cdefs.adrt_step(arr, 0, None, None)
 
     def test_refuses_non_array(self):
         arr = np.zeros((4, 31, 16), dtype=np.float64).tolist()
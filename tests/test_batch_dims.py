@@ -0,0 +1,147 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+import numpy as np
+import adrt
+
+
+def _per_entry(func, a, core_ndim):
+    # Apply func to each entry of the leading dimensions separately
+    batch_shape = a.shape[:-core_ndim]
+    results = [func(a[idx]) for idx in np.ndindex(*batch_shape)]
+    return np.stack(results).reshape(batch_shape + results[0].shape)
+
+
+@pytest.fixture
+def images():
+    return np.random.default_rng(seed=0).normal(size=(2, 3, 4, 16, 16))
+
+
+@pytest.fixture
+def adrt_outputs(images):
+    return adrt.adrt(images)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_adrt_matches_per_entry(images, dtype):
+    images = images.astype(dtype)
+    out = adrt.adrt(images)
+    assert out.shape == (2, 3, 4, 4, 31, 16)
+    assert out.dtype == images.dtype
+    assert np.all(out == _per_entry(adrt.adrt, images, 2))
+
+
+@pytest.mark.parametrize("func", [adrt.bdrt, adrt.iadrt])
+def test_inverse_matches_per_entry(adrt_outputs, func):
+    out = func(adrt_outputs)
+    assert out.shape == adrt_outputs.shape
+    assert np.all(out == _per_entry(func, adrt_outputs, 3))
+
+
+def test_interp_to_cart_matches_per_entry(adrt_outputs):
+    out = adrt.utils.interp_to_cart(adrt_outputs)
+    assert out.shape == (2, 3, 4, 16, 64)
+    assert np.all(out == _per_entry(adrt.utils.interp_to_cart, adrt_outputs, 3))
+
+
+def test_adrt_step_matches_per_entry(images):
+    init = adrt.core.adrt_init(images)
+    out = adrt.core.adrt_step(init, 1)
+    assert out.shape == init.shape
+    expected = _per_entry(lambda a: adrt.core.adrt_step(a, 1), init, 3)
+    assert np.all(out == expected)
+
+
+def test_bdrt_step_matches_per_entry(adrt_outputs):
+    out = adrt.core.bdrt_step(adrt_outputs, 0)
+    expected = _per_entry(lambda a: adrt.core.bdrt_step(a, 0), adrt_outputs, 3)
+    assert np.all(out == expected)
+
+
+def test_adrt_unmergeable_view_no_copy(images):
+    # Leading dimensions which cannot be merged into a single stride
+    view = images[:, ::2]
+    assert view.shape == (2, 2, 4, 16, 16)
+    before = adrt.core.layout_copy_count()
+    out = adrt.adrt(view)
+    assert adrt.core.layout_copy_count() == before
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(view)))
+
+
+@pytest.mark.parametrize("func", [adrt.bdrt, adrt.iadrt])
+def test_inverse_unmergeable_view_no_copy(adrt_outputs, func):
+    view = adrt_outputs[::2, :, 1:]
+    assert view.shape == (1, 3, 3, 4, 31, 16)
+    before = adrt.core.layout_copy_count()
+    out = func(view)
+    assert adrt.core.layout_copy_count() == before
+    assert np.all(out == func(np.ascontiguousarray(view)))
+
+
+def test_adrt_transposed_batch_no_copy(images):
+    view = np.moveaxis(images, 0, 2)
+    assert view.shape == (3, 4, 2, 16, 16)
+    before = adrt.core.layout_copy_count()
+    out = adrt.adrt(view)
+    assert adrt.core.layout_copy_count() == before
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(view)))
+
+
+def test_adrt_length_one_dims(images):
+    view = images[:1, :, np.newaxis, :1]
+    assert view.shape == (1, 3, 1, 1, 16, 16)
+    out = adrt.adrt(view)
+    assert out.shape == (1, 3, 1, 1, 4, 31, 16)
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(view)))
+
+
+def test_adrt_out_and_workspace(images):
+    out = np.empty((2, 3, 4, 4, 31, 16))
+    workspace = np.empty(adrt.core.workspace_size("adrt", images.shape))
+    ret = adrt.adrt(images, out=out, workspace=workspace)
+    assert ret is out
+    assert np.all(out == adrt.adrt(images))
+
+
+def test_adrt_refuses_out_flat_batch(images):
+    out = np.empty((24, 4, 31, 16))
+    with pytest.raises(ValueError, match="shape"):
+        _ = adrt.adrt(images, out=out)
+
+
+def test_plan_batch_dims(images):
+    plan = adrt.core.plan_adrt((2, 2, 4, 16, 16), np.float64)
+    view = images[:, ::2]
+    assert np.all(plan(view) == adrt.adrt(view))
@@ -88,11 +88,14 @@ class TestBdrtCdefs:
         with pytest.raises(ValueError):
             _ = adrt._adrt_cdefs.bdrt(inarr_b)
 
-    def test_refuses_five_dim(self):
+    def test_accepts_five_dim(self):
         size = 16
-        inarr = np.zeros((6, 5, 4, 2 * size - 1, size), dtype=np.float32)
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.bdrt(inarr)
+        inarr = np.arange(6 * 5 * 4 * (2 * size - 1) * size, dtype=np.float32)
+        inarr = inarr.reshape((6, 5, 4, 2 * size - 1, size))
+        out = adrt._adrt_cdefs.bdrt(inarr)
+        assert out.shape == inarr.shape
+        flat = adrt._adrt_cdefs.bdrt(inarr.reshape((30, 4, 2 * size - 1, size)))
+        assert np.all(out == flat.reshape(out.shape))
 
     def test_refuses_non_power_of_two(self):
         size = 17
@@ -108,19 +111,26 @@ class TestBdrtCdefs:
         with pytest.raises(TypeError):
             _ = adrt._adrt_cdefs.bdrt(arr_list)
 
-    def test_refuses_fortran_order(self):
+    def test_accepts_fortran_order(self):
         size = 16
-        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32, order="F")
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.bdrt(inarr)
+        inarr = np.arange(4 * (2 * size - 1) * size, dtype=np.float32)
+        inarr = inarr.reshape((4, 2 * size - 1, size), order="F")
+        out = adrt._adrt_cdefs.bdrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.bdrt(np.ascontiguousarray(inarr)))
 
-    def test_refuses_c_non_contiguous(self):
+    def test_accepts_c_non_contiguous(self):
         size = 16
-        inarr = np.zeros((4, 2 * size - 1, 2 * size), dtype=np.float32, order="F")
-        inarr = inarr[:, :, ::2]
+        inarr = np.arange(4 * (2 * size - 1) * 2 * size, dtype=np.float32)
+        inarr = inarr.reshape((4, 2 * size - 1, 2 * size), order="F")[:, :, ::2]
         assert inarr.shape == (4, 31, 16)
         assert not inarr.flags["C_CONTIGUOUS"]
-        with pytest.raises(ValueError):
+        out = adrt._adrt_cdefs.bdrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.bdrt(np.ascontiguousarray(inarr)))
+
+    def test_refuses_negative_strides(self):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32)[:, ::-1]
+        with pytest.raises(ValueError, match="strides"):
             _ = adrt._adrt_cdefs.bdrt(inarr)
 
     def test_refuses_byteswapped(self):
@@ -317,3 +327,158 @@ class TestBdrt:
         )
         assert adrt_arr.shape == bdrt_arr.shape
         assert np.allclose(adrt_arr, bdrt_arr)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype):
+        inarr = np.arange(3 * 4 * 31 * 16, dtype=dtype).reshape((3, 4, 31, 16))
+        expected = adrt.bdrt(inarr)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("bdrt", inarr.shape), np.nan, dtype=dtype
+        )
+        for _ in range(2):
+            c_out = adrt.bdrt(inarr, out=out, workspace=workspace)
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_accepts_oversized_workspace(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("bdrt", inarr.shape)
+        workspace = np.zeros((2, size), dtype=np.float32)
+        c_out = adrt.bdrt(inarr, workspace=workspace)
+        assert np.all(c_out == adrt.bdrt(inarr))
+
+    def test_refuses_small_workspace(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("bdrt", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, workspace=np.zeros(size - 1, dtype=np.float32))
+
+    def test_refuses_out_wrong_shape(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        out = np.zeros((1, 4, 31, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, out=out)
+
+    def test_refuses_out_wrong_dtype(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.bdrt(inarr), dtype=np.float64)
+        with pytest.raises(TypeError):
+            _ = adrt.bdrt(inarr, out=out)
+        with pytest.raises(TypeError):
+            _ = adrt.bdrt(inarr, workspace=np.zeros(4096, dtype=np.float64))
+
+    def test_refuses_out_non_contiguous(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        expected = adrt.bdrt(inarr)
+        out = np.zeros((*expected.shape[:-1], 2 * expected.shape[-1]), np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, out=out[..., ::2])
+
+    def test_refuses_out_read_only(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.bdrt(inarr))
+        out.flags.writeable = False
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, out=out)
+
+    def test_refuses_out_non_array(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        out = adrt.bdrt(inarr).tolist()
+        with pytest.raises(TypeError):
+            _ = adrt.bdrt(inarr, out=out)
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = np.ones((4, 31, 16), dtype=np.float32)
+        out = np.zeros_like(adrt.bdrt(inarr))
+        size = adrt.core.workspace_size("bdrt", inarr.shape)
+        workspace = np.zeros(size + out.size, dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, workspace=inarr.reshape(-1))
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(inarr, out=inarr)
+        with pytest.raises(ValueError):
+            _ = adrt.bdrt(
+                inarr,
+                out=workspace[: out.size].reshape(out.shape),
+                workspace=workspace[1:],
+            )
+
+    @pytest.mark.parametrize("size", [1, 2, 16, 64])
+    def test_accumulate_float64_matches_rounded_float64(self, size):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.random((size, size), dtype=np.float32))
+        wide = adrt.bdrt(inarr, accumulate=np.float64)
+        assert wide.dtype == np.float32
+        ref = adrt.bdrt(inarr.astype(np.float64)).astype(np.float32)
+        assert np.array_equal(wide, ref)
+
+    def test_accumulate_float64_batch_threads(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = np.stack(
+            [adrt.adrt(rng.random((size, size), dtype=np.float32)) for _ in range(5)]
+        )
+        wide = adrt.bdrt(inarr, accumulate=np.float64, threads=3)
+        for i in range(inarr.shape[0]):
+            assert np.array_equal(
+                wide[i], adrt.bdrt(inarr[i], accumulate=np.float64, threads=1)
+            )
+
+    def test_accumulate_float64_strided(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = adrt.adrt(rng.random((size, size), dtype=np.float32))
+        wide = adrt.bdrt(np.asfortranarray(inarr), accumulate=np.float64)
+        assert np.array_equal(wide, adrt.bdrt(inarr, accumulate=np.float64))
+
+    def test_accumulate_float64_out_and_workspace(self):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = np.stack(
+            [adrt.adrt(rng.random((size, size), dtype=np.float32)) for _ in range(3)]
+        )
+        expected = adrt.bdrt(inarr, accumulate=np.float64)
+        out = np.zeros_like(expected)
+        ws_size = 2 * adrt.core.workspace_size("bdrt", inarr.shape)
+        workspace = np.full(ws_size, np.nan, dtype=np.float64)
+        ret = adrt.bdrt(inarr, accumulate=np.float64, out=out, workspace=workspace)
+        assert ret is out
+        assert np.array_equal(out, expected)
+
+    def test_accumulate_float64_refuses_workspace(self):
+        size = 16
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float32)
+        ws_size = adrt.core.workspace_size("bdrt", inarr.shape)
+        with pytest.raises(TypeError, match="float64"):
+            _ = adrt.bdrt(
+                inarr,
+                accumulate=np.float64,
+                workspace=np.zeros(2 * ws_size, dtype=np.float32),
+            )
+        with pytest.raises(ValueError, match="too small"):
+            _ = adrt.bdrt(
+                inarr,
+                accumulate=np.float64,
+                workspace=np.zeros(ws_size, dtype=np.float64),
+            )
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_accumulate_same_dtype_unchanged(self, dtype):
+        rng = np.random.default_rng(seed=0)
+        size = 16
+        inarr = adrt.adrt(rng.random((size, size), dtype=np.float32)).astype(dtype)
+        assert np.array_equal(adrt.bdrt(inarr, accumulate=dtype), adrt.bdrt(inarr))
+
+    def test_refuses_accumulate_narrower(self):
+        size = 16
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float64)
+        with pytest.raises(ValueError, match="narrower"):
+            _ = adrt.bdrt(inarr, accumulate=np.float32)
+
+    @pytest.mark.parametrize("accumulate", [np.int64, np.float16, "complex128"])
+    def test_refuses_accumulate_unsupported(self, accumulate):
+        size = 16
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float32)
+        with pytest.raises(TypeError, match="accumulation dtype"):
+            _ = adrt.bdrt(inarr, accumulate=accumulate)
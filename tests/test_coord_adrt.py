@@ -134,3 +134,91 @@ def test_spot_check_offset(n):
     last_val = np.sqrt(2) * (n - 1) / (2 * n)
     assert np.isclose(offset[0, 0, -1], last_val)
     assert np.isclose(offset[0, -1, -1], -last_val)
+
+
+@pytest.mark.parametrize("n", [2, 4, 8, 64])
+def test_lazy_matches_dense(n):
+    dense = adrt.utils.coord_adrt(n)
+    lazy = adrt.utils.coord_adrt(n, lazy=True)
+    assert lazy.offset.shape == dense.offset.shape
+    assert lazy.offset.dtype == dense.offset.dtype
+    assert np.array_equal(lazy.offset.to_dense(), dense.offset)
+    assert np.array_equal(np.asarray(lazy.offset), dense.offset)
+    assert np.array_equal(lazy.angle, dense.angle)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        pytest.param((1, 2, 0), id="scalar"),
+        pytest.param((slice(None), slice(1, 5), slice(None, None, 2)), id="slices"),
+        pytest.param((Ellipsis, -1), id="ellipsis"),
+        pytest.param(2, id="quadrant"),
+        pytest.param((np.array([0, 3, 3]), np.array([1, 6, 0]), 2), id="fancy"),
+    ],
+)
+def test_lazy_getitem(key):
+    n = 8
+    dense = adrt.utils.coord_adrt(n).offset
+    lazy = adrt.utils.coord_adrt(n, lazy=True).offset
+    assert np.array_equal(lazy[key], dense[key])
+
+
+def test_lazy_getitem_mask():
+    n = 8
+    dense = adrt.utils.coord_adrt(n).offset
+    lazy = adrt.utils.coord_adrt(n, lazy=True).offset
+    mask = dense > 0.1
+    assert np.array_equal(lazy[mask], dense[mask])
+
+
+def test_lazy_is_cached_and_read_only():
+    lazy = adrt.utils.coord_adrt(16, lazy=True)
+    assert adrt.utils.coord_adrt(16, lazy=True) is lazy
+    assert lazy.offset.n == 16
+    assert not lazy.angle.flags.writeable
+    with pytest.raises(ValueError):
+        lazy.angle[0, 0, 0] = 0
+
+
+def test_dense_results_are_independent():
+    first = adrt.utils.coord_adrt(8)
+    first.offset[...] = 0
+    first.angle[...] = 0
+    second = adrt.utils.coord_adrt(8)
+    assert np.any(second.offset != 0)
+    assert np.any(second.angle != 0)
+
+
+def test_lazy_large_size():
+    n = 8192
+    lazy = adrt.utils.coord_adrt(n, lazy=True)
+    assert lazy.offset.shape == (4, 2 * n - 1, n)
+    col = lazy.offset[0, :, n // 2]
+    assert col.shape == (2 * n - 1,)
+    assert np.all(np.diff(col) < 0)
+
+
+def test_lazy_reject_invalid_size():
+    with pytest.raises(ValueError):
+        adrt.utils.coord_adrt(6, lazy=True)
+
+
+def test_lazy_array_copy():
+    offset = adrt.utils.coord_adrt(8, lazy=True).offset
+    dense = adrt.utils.coord_adrt(8).offset
+    with pytest.raises(ValueError):
+        offset.__array__(copy=False)
+    assert np.array_equal(offset.__array__(copy=True), dense)
+    single = offset.__array__(np.float32, copy=True)
+    assert single.dtype == np.dtype(np.float32)
+    assert np.array_equal(single, dense.astype(np.float32))
+    if np.lib.NumpyVersion(np.__version__) >= "2.0.0":
+        with pytest.raises(ValueError):
+            np.asarray(offset, copy=False)
+
+
+def test_lazy_coord_type():
+    ret = adrt.utils.coord_adrt(4, lazy=True)
+    assert isinstance(ret, adrt.utils.ADRTLazyCoord)
+    assert isinstance(ret.offset, adrt.utils.ADRTOffset)
@@ -0,0 +1,172 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import pytest
+import numpy as np
+import adrt
+
+
+def _smooth(a, axis, spacing):
+    # Dilated [1/4, 1/2, 1/4] kernel, mirrored about the image edges
+    n = a.shape[axis]
+    idx = np.arange(n)
+    prev = np.where(idx >= spacing, idx - spacing, spacing - 1 - idx)
+    nxt = np.where(idx + spacing < n, idx + spacing, 2 * n - 1 - idx - spacing)
+    return 0.25 * np.take(a, prev, axis) + 0.5 * a + 0.25 * np.take(a, nxt, axis)
+
+
+def _naive_fmg_precondition(a):
+    out = a.copy()
+    smooth = a
+    weight = 0.5
+    spacing = 1
+    while spacing < a.shape[-1]:
+        smooth = _smooth(_smooth(smooth, -1, spacing), -2, spacing)
+        out -= weight * smooth
+        weight /= 2
+        spacing *= 2
+    return out
+
+
+class TestFmgPreconditionCdefs:
+    def test_accepts_float32(self):
+        inarr = np.zeros((16, 16), dtype=np.float32)
+        _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+    def test_accepts_float64(self):
+        inarr = np.zeros((16, 16), dtype=np.float64)
+        _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+    def test_refuses_int32(self):
+        inarr = np.zeros((16, 16), dtype=np.int32)
+        with pytest.raises(TypeError):
+            _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+    def test_refuses_non_square(self):
+        inarr = np.zeros((16, 8), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+    def test_refuses_non_power_of_two(self):
+        inarr = np.zeros((15, 15), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+    def test_refuses_zero_axis_array(self):
+        inarr = np.zeros((0, 16, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt._adrt_cdefs.fmg_precondition(inarr)
+
+
+class TestFmgPrecondition:
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_returned_dtype(self, dtype):
+        inarr = np.zeros((16, 16), dtype=dtype)
+        c_out = adrt.core.fmg_precondition(inarr)
+        assert c_out.dtype == np.dtype(dtype)
+        assert c_out.shape == inarr.shape
+
+    @pytest.mark.parametrize("size", [1, 2, 4, 8, 16, 32, 64])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_matches_naive(self, size, dtype):
+        rng = np.random.default_rng(seed=size)
+        inarr = rng.normal(size=(3, size, size)).astype(dtype)
+        expected = _naive_fmg_precondition(inarr.astype(np.float64))
+        c_out = adrt.core.fmg_precondition(inarr)
+        tol = 1e-5 if dtype == "float32" else 1e-12
+        assert np.allclose(c_out, expected, rtol=tol, atol=tol)
+
+    @pytest.mark.parametrize("size", [1, 4, 16])
+    def test_constant_image(self, size):
+        inarr = np.full((size, size), 3.0)
+        c_out = adrt.core.fmg_precondition(inarr)
+        assert np.allclose(c_out, 3.0 / size)
+
+    def test_symmetric_positive_definite(self):
+        size = 8
+        basis = np.eye(size * size).reshape((-1, size, size))
+        mat = adrt.core.fmg_precondition(basis).reshape((size * size, -1))
+        assert np.allclose(mat, mat.T)
+        assert np.all(np.linalg.eigvalsh(mat) >= 1 / size - 1e-12)
+
+    def test_batch_dimensions(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(2, 3, 8, 8)).astype(np.float32)
+        c_out = adrt.core.fmg_precondition(inarr)
+        assert c_out.shape == inarr.shape
+        flat = adrt.core.fmg_precondition(inarr.reshape((6, 8, 8)))
+        assert np.all(c_out == flat.reshape(c_out.shape))
+
+    def test_large_batch_small_images(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = rng.normal(size=(257, 4, 4))
+        c_out = adrt.core.fmg_precondition(inarr, threads=3)
+        expected = adrt.core.fmg_precondition(inarr, threads=1)
+        assert np.all(c_out == expected)
+
+    def test_accepts_strided_input(self):
+        rng = np.random.default_rng(seed=0)
+        base = rng.normal(size=(16, 32)).astype(np.float32)
+        inarr = base[:, ::2]
+        copies = adrt.core.layout_copy_count()
+        c_out = adrt.core.fmg_precondition(inarr)
+        assert adrt.core.layout_copy_count() == copies
+        expected = adrt.core.fmg_precondition(np.ascontiguousarray(inarr))
+        assert np.all(c_out == expected)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype):
+        inarr = np.arange(3 * 16 * 16, dtype=dtype).reshape((3, 16, 16))
+        expected = adrt.core.fmg_precondition(inarr)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("fmg_precondition", inarr.shape),
+            np.nan,
+            dtype=dtype,
+        )
+        for _ in range(2):
+            c_out = adrt.core.fmg_precondition(inarr, out=out, workspace=workspace)
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_refuses_small_workspace(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        size = adrt.core.workspace_size("fmg_precondition", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.core.fmg_precondition(
+                inarr, workspace=np.zeros(size - 1, dtype=np.float32)
+            )
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = np.ones((16, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.core.fmg_precondition(inarr, out=inarr)
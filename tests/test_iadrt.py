@@ -73,11 +73,14 @@ class TestIAdrtCdefs:
         with pytest.raises(ValueError):
             _ = adrt._adrt_cdefs.iadrt(inarr_b)
 
-    def test_refuses_five_dim(self):
+    def test_accepts_five_dim(self):
         size = 16
-        inarr = np.zeros((6, 5, 4, 2 * size - 1, size), dtype=np.float32)
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.iadrt(inarr)
+        inarr = np.arange(6 * 5 * 4 * (2 * size - 1) * size, dtype=np.float32)
+        inarr = inarr.reshape((6, 5, 4, 2 * size - 1, size))
+        out = adrt._adrt_cdefs.iadrt(inarr)
+        assert out.shape == inarr.shape
+        flat = adrt._adrt_cdefs.iadrt(inarr.reshape((30, 4, 2 * size - 1, size)))
+        assert np.all(out == flat.reshape(out.shape))
 
     def test_refuses_non_power_of_two(self):
         size = 17
@@ -93,19 +96,26 @@ class TestIAdrtCdefs:
         with pytest.raises(TypeError):
             _ = adrt._adrt_cdefs.iadrt(arr_list)
 
-    def test_refuses_fortran_order(self):
+    def test_accepts_fortran_order(self):
         size = 16
-        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32, order="F")
-        with pytest.raises(ValueError):
-            _ = adrt._adrt_cdefs.iadrt(inarr)
+        inarr = np.arange(4 * (2 * size - 1) * size, dtype=np.float32)
+        inarr = inarr.reshape((4, 2 * size - 1, size), order="F")
+        out = adrt._adrt_cdefs.iadrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.iadrt(np.ascontiguousarray(inarr)))
 
-    def test_refuses_c_non_contiguous(self):
+    def test_accepts_c_non_contiguous(self):
         size = 16
-        inarr = np.zeros((4, 2 * size - 1, 2 * size), dtype=np.float32, order="F")
-        inarr = inarr[:, :, ::2]
+        inarr = np.arange(4 * (2 * size - 1) * 2 * size, dtype=np.float32)
+        inarr = inarr.reshape((4, 2 * size - 1, 2 * size), order="F")[:, :, ::2]
         assert inarr.shape == (4, 31, 16)
         assert not inarr.flags["C_CONTIGUOUS"]
-        with pytest.raises(ValueError):
+        out = adrt._adrt_cdefs.iadrt(inarr)
+        assert np.all(out == adrt._adrt_cdefs.iadrt(np.ascontiguousarray(inarr)))
+
+    def test_refuses_negative_strides(self):
+        size = 16
+        inarr = np.zeros((4, 2 * size - 1, size), dtype=np.float32)[:, ::-1]
+        with pytest.raises(ValueError, match="strides"):
             _ = adrt._adrt_cdefs.iadrt(inarr)
 
     def test_refuses_byteswapped(self):
@@ -231,3 +241,129 @@ class TestIAdrt:
         c_out = np.mean(adrt.utils.truncate(c_out), axis=1)
         assert c_out.shape == expected_out.shape
         assert np.allclose(c_out, expected_out)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_out_and_workspace(self, dtype):
+        inarr = adrt.adrt(np.arange(3 * 16 * 16, dtype=dtype).reshape((3, 16, 16)))
+        expected = adrt.iadrt(inarr)
+        out = np.full_like(expected, np.nan)
+        workspace = np.full(
+            adrt.core.workspace_size("iadrt", inarr.shape), np.nan, dtype=dtype
+        )
+        for _ in range(2):
+            c_out = adrt.iadrt(inarr, out=out, workspace=workspace)
+            assert c_out is out
+            assert np.all(c_out == expected)
+
+    def test_accepts_oversized_workspace(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        size = adrt.core.workspace_size("iadrt", inarr.shape)
+        workspace = np.zeros((2, size), dtype=np.float32)
+        c_out = adrt.iadrt(inarr, workspace=workspace)
+        assert np.all(c_out == adrt.iadrt(inarr))
+
+    def test_refuses_small_workspace(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        size = adrt.core.workspace_size("iadrt", inarr.shape)
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, workspace=np.zeros(size - 1, dtype=np.float32))
+
+    def test_refuses_out_wrong_shape(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        out = np.zeros((4, 16, 31), dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, out=out)
+
+    def test_refuses_out_wrong_dtype(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        out = np.zeros_like(adrt.iadrt(inarr), dtype=np.float64)
+        with pytest.raises(TypeError):
+            _ = adrt.iadrt(inarr, out=out)
+        with pytest.raises(TypeError):
+            _ = adrt.iadrt(inarr, workspace=np.zeros(4096, dtype=np.float64))
+
+    def test_refuses_out_non_contiguous(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        expected = adrt.iadrt(inarr)
+        out = np.zeros((*expected.shape[:-1], 2 * expected.shape[-1]), np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, out=out[..., ::2])
+
+    def test_refuses_out_read_only(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        out = np.zeros_like(adrt.iadrt(inarr))
+        out.flags.writeable = False
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, out=out)
+
+    def test_refuses_out_non_array(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        out = adrt.iadrt(inarr).tolist()
+        with pytest.raises(TypeError):
+            _ = adrt.iadrt(inarr, out=out)
+
+    def test_refuses_overlapping_buffers(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        out = np.zeros_like(adrt.iadrt(inarr))
+        size = adrt.core.workspace_size("iadrt", inarr.shape)
+        workspace = np.zeros(size + out.size, dtype=np.float32)
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, workspace=inarr.reshape(-1))
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(inarr, out=inarr)
+        with pytest.raises(ValueError):
+            _ = adrt.iadrt(
+                inarr,
+                out=workspace[: out.size].reshape(out.shape),
+                workspace=workspace[1:],
+            )
+
+    @pytest.mark.parametrize("size", [1, 2, 16, 64])
+    def test_accumulate_float64_closer_to_float64(self, size):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.standard_normal((size, size))).astype(np.float32)
+        ref = adrt.iadrt(inarr.astype(np.float64))
+        plain = adrt.iadrt(inarr)
+        wide = adrt.iadrt(inarr, accumulate=np.float64)
+        assert wide.dtype == np.float32
+        assert wide.shape == plain.shape
+        assert np.linalg.norm(wide - ref) <= np.linalg.norm(plain - ref)
+        assert np.linalg.norm(wide - ref) <= 0.1 * np.linalg.norm(ref)
+
+    def test_accumulate_float64_integer_exact(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.integers(0, 256, size=(3, 32, 32)).astype(np.float32))
+        wide = adrt.iadrt(inarr, accumulate="float64")
+        assert np.array_equal(wide, adrt.iadrt(inarr.astype(np.float64)))
+
+    def test_accumulate_float64_batch_threads(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.standard_normal((5, 16, 16))).astype(np.float32)
+        wide = adrt.iadrt(inarr, accumulate=np.float64, threads=3)
+        for i in range(inarr.shape[0]):
+            assert np.array_equal(
+                wide[i], adrt.iadrt(inarr[i], accumulate=np.float64, threads=1)
+            )
+
+    def test_accumulate_float64_strided(self):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.standard_normal((16, 16))).astype(np.float32)
+        wide = adrt.iadrt(np.asfortranarray(inarr), accumulate=np.float64)
+        assert np.array_equal(wide, adrt.iadrt(inarr, accumulate=np.float64))
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_accumulate_same_dtype_unchanged(self, dtype):
+        rng = np.random.default_rng(seed=0)
+        inarr = adrt.adrt(rng.standard_normal((16, 16))).astype(dtype)
+        assert np.array_equal(adrt.iadrt(inarr, accumulate=dtype), adrt.iadrt(inarr))
+
+    def test_refuses_accumulate_narrower(self):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float64))
+        with pytest.raises(ValueError, match="narrower"):
+            _ = adrt.iadrt(inarr, accumulate=np.float32)
+
+    @pytest.mark.parametrize("accumulate", [np.int64, np.float16, "complex128"])
+    def test_refuses_accumulate_unsupported(self, accumulate):
+        inarr = adrt.adrt(np.ones((16, 16), dtype=np.float32))
+        with pytest.raises(TypeError, match="accumulation dtype"):
+            _ = adrt.iadrt(inarr, accumulate=accumulate)
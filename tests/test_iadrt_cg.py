@@ -0,0 +1,207 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import pytest
+import numpy as np
+import adrt
+
+
+def _noisy_adrt(batch_shape, size, dtype, seed=0):
+    rng = np.random.default_rng(seed=seed)
+    orig = rng.normal(size=(*batch_shape, size, size)).astype(dtype)
+    return orig, adrt.adrt(orig)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_unique_values(dtype):
+    size = 8
+    orig = np.arange(size**2).reshape((size, size)).astype(dtype)
+    inarr = adrt.adrt(orig)
+    inv = adrt.iadrt_cg(inarr, rtol=1e-7)
+    assert inv.dtype == orig.dtype
+    assert inv.shape == orig.shape
+    assert inv.flags.writeable
+    assert np.allclose(inv, orig, atol=1e-3)
+
+
+@pytest.mark.parametrize("batch_shape", [(3,), (2, 3)])
+def test_batch_matches_single(batch_shape):
+    size = 16
+    _, inarr = _noisy_adrt(batch_shape, size, "float64")
+    inv, info = adrt.iadrt_cg(inarr, rtol=1e-8, return_info=True)
+    assert inv.shape == (*batch_shape, size, size)
+    assert info.iterations.shape == batch_shape
+    assert info.residuals.shape == batch_shape
+    assert info.converged.shape == batch_shape
+    assert np.all(info.converged)
+    for idx in np.ndindex(*batch_shape):
+        single, single_info = adrt.iadrt_cg(inarr[idx], rtol=1e-8, return_info=True)
+        assert np.allclose(inv[idx], single)
+        assert info.iterations[idx] == single_info.iterations
+        assert info.residuals[idx] == pytest.approx(single_info.residuals)
+
+
+def test_matches_adrt_normal():
+    size = 16
+    _, inarr = _noisy_adrt((2,), size, "float64")
+    inarr += np.random.default_rng(seed=1).normal(scale=1e-2, size=inarr.shape)
+    ridge = 0.5
+    inv = adrt.iadrt_cg(inarr, rtol=1e-10, ridge=ridge)
+    lhs = adrt.core.adrt_normal(inv, ridge=ridge)
+    rhs = adrt.core.adrt_adjoint(inarr)
+    assert np.allclose(lhs, rhs, atol=1e-6)
+
+
+def test_converged_images_stop_early():
+    size = 16
+    _, inarr = _noisy_adrt((2,), size, "float64")
+    inarr[0] = 0
+    inv, info = adrt.iadrt_cg(inarr, return_info=True)
+    assert isinstance(info, adrt.InverseInfo)
+    assert info.iterations[0] == 0
+    assert info.iterations[1] > 0
+    assert np.all(info.converged)
+    assert np.all(inv[0] == 0)
+
+
+@pytest.mark.parametrize("maxiter", [0, 1, 2, 3])
+def test_maxiter_limits_iterations(maxiter):
+    size = 16
+    _, inarr = _noisy_adrt((2,), size, "float64")
+    _, info = adrt.iadrt_cg(inarr, rtol=0.0, maxiter=maxiter, return_info=True)
+    assert np.all(info.iterations == maxiter)
+    assert not np.any(info.converged)
+
+
+def test_warm_start():
+    size = 16
+    _, inarr = _noisy_adrt((3,), size, "float64")
+    inv, info = adrt.iadrt_cg(inarr, rtol=1e-8, return_info=True)
+    warm, warm_info = adrt.iadrt_cg(inarr, x0=inv, rtol=1e-6, return_info=True)
+    assert np.all(warm_info.iterations == 0)
+    assert np.all(warm_info.converged)
+    assert np.allclose(warm, inv)
+    assert np.all(warm_info.iterations < info.iterations)
+
+
+def test_warm_start_not_modified():
+    size = 8
+    _, inarr = _noisy_adrt((), size, "float32")
+    x0 = np.ones((size, size), dtype="float32")
+    _ = adrt.iadrt_cg(inarr, x0=x0)
+    assert np.all(x0 == 1)
+
+
+def test_rejects_bad_x0_shape():
+    size = 8
+    inarr = np.zeros((2, 4, 2 * size - 1, size), dtype="float32")
+    with pytest.raises(ValueError, match="x0"):
+        _ = adrt.iadrt_cg(inarr, x0=np.zeros((size, size), dtype="float32"))
+
+
+def test_rejects_non_integer_maxiter():
+    size = 8
+    inarr = np.zeros((4, 2 * size - 1, size), dtype="float32")
+    with pytest.raises(TypeError):
+        _ = adrt.iadrt_cg(inarr, maxiter=2.0)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"rtol": -1.0}, {"atol": -1.0}, {"maxiter": -1}, {"ridge": -1.0}]
+)
+def test_rejects_negative_parameters(kwargs):
+    size = 8
+    inarr = np.zeros((4, 2 * size - 1, size), dtype="float32")
+    with pytest.raises(ValueError):
+        _ = adrt.iadrt_cg(inarr, **kwargs)
+
+
+def test_rejects_non_adrt_shape():
+    with pytest.raises(ValueError):
+        _ = adrt.iadrt_cg(np.zeros((4, 16, 8), dtype="float32"))
+    with pytest.raises(ValueError):
+        _ = adrt.iadrt_cg(np.zeros((15, 8), dtype="float32"))
+
+
+def test_history():
+    size = 16
+    _, inarr = _noisy_adrt((3,), size, "float64")
+    inarr[0] = 0
+    _, info = adrt.iadrt_cg(inarr, rtol=1e-6, return_info=True)
+    assert info.history.shape == (info.iterations.max(), 3)
+    assert np.all(np.isnan(info.history[:, 0]))
+    for i in range(1, 3):
+        hist = info.history[:, i]
+        assert hist[info.iterations[i] - 1] == info.residuals[i]
+        assert np.all(np.isnan(hist[info.iterations[i] :]))
+
+
+@pytest.mark.parametrize("ridge", [0.0, 0.5])
+def test_precondition_matches_unpreconditioned(ridge):
+    size = 32
+    _, inarr = _noisy_adrt((2,), size, "float64")
+    inarr += np.random.default_rng(seed=1).normal(scale=1e-2, size=inarr.shape)
+    plain = adrt.iadrt_cg(inarr, rtol=1e-10, ridge=ridge)
+    inv, info = adrt.iadrt_cg(
+        inarr, rtol=1e-10, ridge=ridge, precondition=True, return_info=True
+    )
+    assert np.all(info.converged)
+    assert np.allclose(inv, plain)
+
+
+@pytest.mark.parametrize("size", [32, 64])
+def test_precondition_reduces_iterations(size):
+    _, inarr = _noisy_adrt((3,), size, "float64")
+    inarr += np.random.default_rng(seed=1).normal(scale=1e-1, size=inarr.shape)
+    _, plain = adrt.iadrt_cg(inarr, rtol=1e-5, return_info=True)
+    _, info = adrt.iadrt_cg(inarr, rtol=1e-5, precondition=True, return_info=True)
+    assert np.all(info.converged)
+    assert np.all(2 * info.iterations < plain.iterations)
+
+
+def test_precondition_batch_matches_single():
+    size = 16
+    _, inarr = _noisy_adrt((2, 2), size, "float32")
+    inv = adrt.iadrt_cg(inarr, rtol=1e-6, precondition=True)
+    for idx in np.ndindex(2, 2):
+        single = adrt.iadrt_cg(inarr[idx], rtol=1e-6, precondition=True)
+        assert np.allclose(inv[idx], single, atol=1e-5)
+
+
+def test_precondition_warm_start():
+    size = 16
+    orig, inarr = _noisy_adrt((), size, "float64")
+    inv, info = adrt.iadrt_cg(
+        inarr, x0=orig, rtol=1e-6, precondition=True, return_info=True
+    )
+    assert info.iterations == 0
+    assert np.all(inv == orig)
@@ -80,11 +80,24 @@ def test_rejects_zero_max_iters():
         _ = adrt.iadrt_fmg(inarr, max_iters=0)
 
 
-def test_rejects_batch_dimension():
-    size = 8
-    inarr = np.zeros((3, 4, 2 * size - 1, size), dtype="float32")
+@pytest.mark.parametrize("batch_shape", [(3,), (2, 3)])
+def test_batch_matches_single(batch_shape):
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    orig = rng.normal(size=(*batch_shape, size, size))
+    inarr = adrt.adrt(orig)
+    # Give images different noise levels so they stop at different iterations
+    noise_scale = np.logspace(-6, 0, num=np.prod(batch_shape)).reshape(batch_shape)
+    inarr += noise_scale[..., None, None, None] * rng.normal(size=inarr.shape)
+    inv = adrt.iadrt_fmg(inarr)
+    assert inv.shape == orig.shape
+    for idx in np.ndindex(*batch_shape):
+        assert np.allclose(inv[idx], adrt.iadrt_fmg(inarr[idx]))
+
+
+def test_rejects_too_few_dimensions():
     with pytest.raises(ValueError):
-        _ = adrt.iadrt_fmg(inarr, max_iters=50)
+        _ = adrt.iadrt_fmg(np.zeros((15, 8), dtype="float32"))
 
 
 @pytest.mark.parametrize("val", [0, np.nan, np.inf, -np.inf])
@@ -108,3 +121,124 @@ def test_max_iters_limits_iterations(counting_iadrt_fmg_step, max_iters):
     _ = adrt.iadrt_fmg(inarr, max_iters=max_iters)
     count = counting_iadrt_fmg_step()
     assert count == max_iters
+
+
+def test_no_separate_forward_transform(monkeypatch):
+    # Residuals are reused from iadrt_fmg_iter instead of being recomputed
+    size = 16
+    orig = np.arange(size**2).reshape((size, size)).astype("float64")
+    inarr = adrt.adrt(orig)
+    monkeypatch.setattr(adrt, "adrt", None)
+    inv = adrt.iadrt_fmg(inarr, max_iters=5)
+    assert inv.shape == orig.shape
+
+
+def _noisy_batch(batch_shape, size, seed=0):
+    rng = np.random.default_rng(seed=seed)
+    inarr = adrt.adrt(rng.normal(size=(*batch_shape, size, size)))
+    noise_scale = np.logspace(-6, -1, num=int(np.prod(batch_shape)))
+    inarr += noise_scale.reshape((*batch_shape, 1, 1, 1)) * rng.normal(size=inarr.shape)
+    return inarr
+
+
+def test_info_matches_result():
+    inarr = _noisy_batch((2, 3), 16)
+    inv, info = adrt.iadrt_fmg(inarr, return_info=True)
+    assert info.iterations.shape == (2, 3)
+    assert info.residuals.shape == (2, 3)
+    assert info.converged.shape == (2, 3)
+    assert info.history.shape == (info.iterations.max() + 1, 2, 3)
+    residuals = np.linalg.norm((adrt.adrt(inv) - inarr).reshape((2, 3, -1)), axis=-1)
+    assert np.allclose(info.residuals, residuals)
+    for idx in np.ndindex(2, 3):
+        hist = info.history[(slice(None), *idx)]
+        assert hist[info.iterations[idx] - 1] == info.residuals[idx]
+        assert np.all(np.diff(hist[: info.iterations[idx]]) < 0)
+
+
+@pytest.mark.parametrize("rtol", [1e-2, 1e-4])
+def test_rtol_stops_early(rtol):
+    size = 16
+    orig = np.arange(size**2).reshape((size, size)).astype("float64")
+    inarr = adrt.adrt(orig)
+    _, full_info = adrt.iadrt_fmg(inarr, max_iters=50, return_info=True)
+    _, info = adrt.iadrt_fmg(inarr, rtol=rtol, return_info=True)
+    assert info.converged
+    assert info.residuals <= rtol * np.linalg.norm(inarr)
+    assert info.iterations < full_info.iterations
+    assert info.history.shape == (info.iterations,)
+
+
+def test_atol_stops_early():
+    inarr = _noisy_batch((3,), 16)
+    atol = 1e-2
+    _, info = adrt.iadrt_fmg(inarr, atol=atol, return_info=True)
+    assert np.all(info.converged == (info.residuals <= atol))
+    assert np.all(info.residuals[info.converged] <= atol)
+
+
+def test_time_limit_runs_one_iteration(counting_iadrt_fmg_step):
+    inarr = _noisy_batch((3,), 16)
+    inv, info = adrt.iadrt_fmg(inarr, time_limit=0.0, return_info=True)
+    assert counting_iadrt_fmg_step() == 1
+    assert np.all(info.iterations == 1)
+    assert np.array_equal(inv, adrt.core.iadrt_fmg_step(inarr))
+
+
+def test_warm_start_continues_iteration():
+    inarr = _noisy_batch((3,), 16)
+    first = adrt.iadrt_fmg(inarr, max_iters=3)
+    resumed = adrt.iadrt_fmg(inarr, max_iters=2, x0=first)
+    assert np.allclose(resumed, adrt.iadrt_fmg(inarr, max_iters=5))
+
+
+def test_warm_start_saves_iterations():
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    frame = rng.normal(size=(size, size))
+    next_frame = frame + 1e-3 * rng.normal(size=(size, size))
+    rtol = 1e-4
+    prev_inv = adrt.iadrt_fmg(adrt.adrt(frame), rtol=rtol)
+    _, cold = adrt.iadrt_fmg(adrt.adrt(next_frame), rtol=rtol, return_info=True)
+    _, warm = adrt.iadrt_fmg(
+        adrt.adrt(next_frame), rtol=rtol, x0=prev_inv, return_info=True
+    )
+    assert cold.converged and warm.converged
+    assert warm.iterations < cold.iterations
+
+
+def test_rejects_bad_x0_shape():
+    size = 8
+    inarr = np.zeros((2, 4, 2 * size - 1, size), dtype="float32")
+    with pytest.raises(ValueError, match="x0"):
+        _ = adrt.iadrt_fmg(inarr, x0=np.zeros((size, size), dtype="float32"))
+
+
+def test_exact_x0_skips_iteration(counting_iadrt_fmg_step):
+    img = np.random.default_rng(seed=0).normal(size=(2, 16, 16))
+    inv, info = adrt.iadrt_fmg(adrt.adrt(img), x0=img, return_info=True)
+    assert counting_iadrt_fmg_step() == 0
+    assert np.array_equal(inv, img)
+    assert np.all(info.iterations == 0)
+    assert np.all(info.converged)
+    assert info.history.shape == (0, 2)
+
+
+def test_x0_kept_unless_improved():
+    inarr = _noisy_batch((4,), 16)
+    x0 = adrt.iadrt_fmg(inarr)
+    x0_res = np.linalg.norm((inarr - adrt.adrt(x0)).reshape((4, -1)), axis=-1)
+    inv, info = adrt.iadrt_fmg(inarr, x0=x0, max_iters=3, return_info=True)
+    assert np.all(info.residuals <= x0_res)
+    kept = info.iterations == 0
+    assert np.any(kept)
+    assert np.array_equal(inv[kept], x0[kept])
+    assert np.array_equal(info.residuals[kept], x0_res[kept])
+
+
+@pytest.mark.parametrize("kwargs", [{"rtol": -1.0}, {"atol": -1.0}])
+def test_rejects_negative_tolerance(kwargs):
+    size = 8
+    inarr = np.zeros((4, 2 * size - 1, size), dtype="float32")
+    with pytest.raises(ValueError):
+        _ = adrt.iadrt_fmg(inarr, **kwargs)
@@ -62,11 +62,13 @@ def test_accepts_batch(dtype):
     mi.consume(itertools.islice(adrt.core.iadrt_fmg_iter(inarr), 10))
 
 
-def test_refuses_too_many_dim():
+def test_accepts_many_dim():
     size = 16
     inarr = np.ones((2, 3, 4, 2 * size - 1, size)).astype("float32")
-    with pytest.raises(ValueError):
-        mi.first(adrt.core.iadrt_fmg_iter(inarr), None)
+    out = mi.first(adrt.core.iadrt_fmg_iter(inarr))
+    assert out.shape == (2, 3, size, size)
+    flat = mi.first(adrt.core.iadrt_fmg_iter(inarr.reshape((6, 4, 2 * size - 1, size))))
+    assert np.all(out == flat.reshape(out.shape))
 
 
 def test_refuses_too_few_dim():
@@ -118,3 +120,74 @@ def test_small_few_steps_monotonic_error_decrease():
         axis=(-1, -2),
     )
     assert np.all(np.diff(residuals) <= 0)
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_residuals_match_forward(copy):
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    inarr = adrt.adrt(rng.normal(size=(3, size, size)))
+    inarr += 1e-3 * rng.normal(size=inarr.shape)
+    pairs = list(
+        itertools.islice(adrt.core.iadrt_fmg_iter(inarr, copy=copy, residuals=True), 5)
+    )
+    plain = list(itertools.islice(adrt.core.iadrt_fmg_iter(inarr), 5))
+    for (est, res), ref in zip(pairs, plain):
+        assert res.shape == inarr.shape
+        assert res.flags.writeable == copy
+        assert np.array_equal(est, ref)
+        assert np.allclose(res, inarr - adrt.adrt(est))
+
+
+def test_residuals_no_extra_forward(monkeypatch):
+    count = 0
+    orig_fn = adrt.core._adrt
+
+    def counting_adrt(*args, **kwargs):
+        nonlocal count
+        count += 1
+        return orig_fn(*args, **kwargs)
+
+    monkeypatch.setattr(adrt.core, "_adrt", counting_adrt)
+    size = 16
+    inarr = np.ones((4, 2 * size - 1, size))
+    mi.consume(itertools.islice(adrt.core.iadrt_fmg_iter(inarr, residuals=True), 5))
+    assert count == 5
+
+
+def test_x0_continues_recurrence():
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    inarr = adrt.adrt(rng.normal(size=(3, size, size)))
+    estimates = list(itertools.islice(adrt.core.iadrt_fmg_iter(inarr), 4))
+    resumed = list(
+        itertools.islice(adrt.core.iadrt_fmg_iter(inarr, x0=estimates[1]), 2)
+    )
+    assert np.allclose(resumed[0], estimates[2])
+    assert np.allclose(resumed[1], estimates[3])
+
+
+def test_rtol_ends_iterator():
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    inarr = adrt.adrt(rng.normal(size=(3, size, size)))
+    rtol = 1e-3
+    pairs = list(adrt.core.iadrt_fmg_iter(inarr, rtol=rtol, residuals=True))
+    norms = np.linalg.norm(inarr.reshape((3, -1)), axis=-1)
+    last_res = np.linalg.norm(pairs[-1][1].reshape((3, -1)), axis=-1)
+    prev_res = np.linalg.norm(pairs[-2][1].reshape((3, -1)), axis=-1)
+    assert np.all(last_res <= rtol * norms)
+    assert np.any(prev_res > rtol * norms)
+
+
+def test_time_limit_ends_iterator():
+    size = 16
+    inarr = np.ones((4, 2 * size - 1, size))
+    assert len(list(adrt.core.iadrt_fmg_iter(inarr, time_limit=0.0))) == 1
+
+
+def test_rejects_bad_x0_shape():
+    size = 16
+    inarr = np.ones((3, 4, 2 * size - 1, size))
+    with pytest.raises(ValueError, match="x0"):
+        mi.first(adrt.core.iadrt_fmg_iter(inarr, x0=np.zeros((size, size))))
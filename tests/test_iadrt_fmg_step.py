@@ -94,3 +94,53 @@ def test_unique_values_batch(dtype):
     assert adrt_result.dtype == arr.dtype
     assert adrt_result.shape == (3, 16, 16)
     assert np.allclose(adrt_result, reference, atol=1e-3)
+
+
+@pytest.mark.parametrize("size", [1, 2, 4, 32])
+def test_multiple_batch_dims(size):
+    rng = np.random.default_rng(seed=0)
+    arr = adrt.adrt(rng.normal(size=(2, 3, size, size)))
+    adrt_result = adrt.core.iadrt_fmg_step(arr)
+    assert adrt_result.shape == (2, 3, size, size)
+    for idx in np.ndindex(2, 3):
+        assert np.allclose(adrt_result[idx], press_inverse(arr[idx]))
+
+
+def test_strided_input():
+    rng = np.random.default_rng(seed=0)
+    arr = adrt.adrt(rng.normal(size=(3, 16, 16)))
+    padded = np.zeros((3, 4, 31, 32))
+    padded[..., ::2] = arr
+    before = adrt.core.layout_copy_count()
+    adrt_result = adrt.core.iadrt_fmg_step(padded[..., ::2])
+    assert adrt.core.layout_copy_count() == before
+    assert np.array_equal(adrt_result, adrt.core.iadrt_fmg_step(arr))
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_out_and_workspace(dtype):
+    rng = np.random.default_rng(seed=0)
+    arr = adrt.adrt(rng.normal(size=(3, 16, 16)).astype(dtype))
+    out = np.full((3, 16, 16), np.nan, dtype=dtype)
+    workspace = np.full(
+        adrt.core.workspace_size("iadrt_fmg_step", arr.shape), np.nan, dtype=dtype
+    )
+    ret = adrt.core.iadrt_fmg_step(arr, out=out, workspace=workspace)
+    assert ret is out
+    assert np.array_equal(out, adrt.core.iadrt_fmg_step(arr))
+
+
+def test_threads_match_serial():
+    rng = np.random.default_rng(seed=0)
+    for shape in [(64, 4, 4), (2, 64, 64)]:
+        arr = adrt.adrt(rng.normal(size=shape))
+        serial = adrt.core.iadrt_fmg_step(arr, threads=1)
+        threaded = adrt.core.iadrt_fmg_step(arr, threads=3)
+        assert np.array_equal(serial, threaded)
+
+
+def test_refuses_invalid_shape():
+    with pytest.raises(ValueError):
+        _ = adrt.core.iadrt_fmg_step(np.zeros((4, 30, 16)))
+    with pytest.raises(ValueError):
+        _ = adrt.core.iadrt_fmg_step(np.zeros((3, 31, 16)))
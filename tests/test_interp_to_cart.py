@@ -177,12 +177,157 @@ class TestInterpToCart:
         with pytest.raises(ValueError):
             adrt.utils.interp_to_cart(np.zeros((4, 2 * 8 - 2, 8), dtype=np.float32))
 
-    def test_refuses_five_dim(self):
-        with pytest.raises(ValueError):
-            adrt.utils.interp_to_cart(
-                np.zeros((2, 3, 4, 2 * 8 - 1, 8), dtype=np.float32)
-            )
+    def test_accepts_five_dim(self):
+        inarr = np.random.default_rng(seed=0).normal(size=(2, 3, 4, 2 * 8 - 1, 8))
+        out = adrt.utils.interp_to_cart(inarr)
+        assert out.shape[:2] == (2, 3)
+        flat = adrt.utils.interp_to_cart(inarr.reshape((6, 4, 2 * 8 - 1, 8)))
+        assert np.all(out == flat.reshape(out.shape))
 
     def test_refuses_non_power_of_two(self):
         with pytest.raises(ValueError):
             adrt.utils.interp_to_cart(np.zeros((4, 2 * 7 - 1, 7), dtype=np.int32))
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    @pytest.mark.parametrize("size", [2, 4, 16, 64])
+    def test_plan_matches_direct(self, dtype, size):
+        inarr = (
+            np.random.default_rng(seed=size)
+            .normal(size=(3, 4, 2 * size - 1, size))
+            .astype(dtype)
+        )
+        direct = adrt._adrt_cdefs.interp_to_cart(inarr)
+        out = adrt.utils.interp_to_cart(inarr)
+        assert out.dtype == direct.dtype
+        assert np.array_equal(out, direct)
+
+    def test_plan_is_cached(self):
+        size = 32
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float32)
+        _ = adrt.utils.interp_to_cart(inarr)
+        hits = adrt._wrappers._interp_to_cart_plan.cache_info().hits
+        _ = adrt.utils.interp_to_cart(inarr.astype(np.float64))
+        assert adrt._wrappers._interp_to_cart_plan.cache_info().hits == hits + 1
+
+    def test_plan_tables_read_only(self):
+        plan = adrt._wrappers._interp_to_cart_plan(8)
+        assert plan.heights.shape == (8, 32)
+        assert plan.heights.dtype == np.int16
+        assert all(not table.flags.writeable for table in plan)
+
+    def test_plan_refuses_size_beyond_int16(self):
+        size = 2**15
+        with pytest.raises(ValueError):
+            adrt._adrt_cdefs.interp_to_cart_plan(
+                size,
+                np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.float32),
+                np.empty(0, dtype=np.float64),
+            )
+
+    def test_refuses_bad_plan(self):
+        size = 8
+        inarr = np.ones((4, 2 * size - 1, size), dtype=np.float32)
+        plan = adrt._wrappers._interp_to_cart_plan(size)
+        slopes = np.full_like(plan.slopes, size)
+        with pytest.raises(ValueError):
+            adrt._adrt_cdefs.interp_to_cart(
+                inarr, None, plan.heights, plan.quadrants, slopes, plan.factors32
+            )
+        with pytest.raises(TypeError):
+            adrt._adrt_cdefs.interp_to_cart(
+                inarr, None, plan.heights, plan.quadrants, plan.slopes, plan.factors64
+            )
+        with pytest.raises(TypeError):
+            adrt._adrt_cdefs.interp_to_cart(
+                inarr,
+                None,
+                plan.heights.astype(np.int32),
+                plan.quadrants,
+                plan.slopes,
+                plan.factors32,
+            )
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_default_counts_match_default_grid(self, dtype):
+        size = 16
+        inarr = (
+            np.random.default_rng(seed=0)
+            .normal(size=(2, 4, 2 * size - 1, size))
+            .astype(dtype)
+        )
+        out = adrt.utils.interp_to_cart(inarr, theta=4 * size, t=size)
+        expected = adrt.utils.interp_to_cart(inarr)
+        assert out.dtype == inarr.dtype
+        assert np.array_equal(out == 0, expected == 0)
+        assert np.allclose(out, expected)
+
+    @pytest.mark.parametrize("size", [2, 8, 32])
+    def test_explicit_grid_matches_coord_cart_to_adrt(self, size):
+        rng = np.random.default_rng(seed=size)
+        inarr = rng.normal(size=(3, 4, 2 * size - 1, size))
+        theta = rng.uniform(-4, 4, size=17)
+        t = rng.uniform(-0.8, 0.8, size=11)
+        out = adrt.utils.interp_to_cart(inarr, theta=theta, t=t)
+        assert out.shape == (3, 11, 17)
+        offset, angle = np.meshgrid(t, theta, indexing="ij")
+        quadrant, height, slope, factor = adrt.utils.coord_cart_to_adrt(
+            angle, offset, size
+        )
+        valid = np.logical_and(height >= 0, height < 2 * size - 1)
+        expected = np.zeros_like(out)
+        expected[:, valid] = (
+            factor[valid] * inarr[:, quadrant[valid], height[valid], slope[valid]]
+        )
+        assert np.allclose(out, expected)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_bilinear_exact_at_adrt_coordinates(self, dtype):
+        size = 8
+        inarr = (
+            np.random.default_rng(seed=0)
+            .normal(size=(4, 2 * size - 1, size))
+            .astype(dtype)
+        )
+        offset, angle = adrt.utils.coord_adrt(size)
+        # Interior slopes, the first and last are shared with adjacent quadrants
+        for quadrant in range(4):
+            for slope in range(1, size - 1):
+                out = adrt.utils.interp_to_cart(
+                    inarr,
+                    theta=angle[quadrant, :, slope],
+                    t=offset[quadrant, :, slope],
+                    order=1,
+                )
+                assert out.dtype == inarr.dtype
+                factor = np.sqrt(1 + (slope / (size - 1)) ** 2)
+                expected = factor * inarr[quadrant, :, slope]
+                assert np.allclose(out[:, 0], expected, rtol=1e-5, atol=1e-5)
+
+    def test_bilinear_batch(self):
+        size = 8
+        inarr = np.random.default_rng(seed=0).normal(size=(3, 4, 2 * size - 1, size))
+        batched = adrt.utils.interp_to_cart(inarr, theta=50, t=20, order=1)
+        stacked = np.stack(
+            [adrt.utils.interp_to_cart(b, theta=50, t=20, order=1) for b in inarr]
+        )
+        assert batched.shape == (3, 20, 50)
+        assert np.array_equal(batched, stacked)
+
+    def test_refuses_bad_order(self):
+        inarr = np.zeros((4, 2 * 8 - 1, 8), dtype=np.float32)
+        with pytest.raises(ValueError):
+            adrt.utils.interp_to_cart(inarr, order=2)
+
+    def test_refuses_bad_grid(self):
+        inarr = np.zeros((4, 2 * 8 - 1, 8), dtype=np.float32)
+        with pytest.raises(ValueError):
+            adrt.utils.interp_to_cart(inarr, theta=0)
+        with pytest.raises(ValueError):
+            adrt.utils.interp_to_cart(inarr, t=np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            adrt.utils.interp_to_cart(inarr, t=np.array([0.0, np.nan]))
+        with pytest.raises(TypeError):
+            adrt.utils.interp_to_cart(inarr, theta=1.5)
@@ -0,0 +1,148 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+import numpy as np
+import adrt
+
+
+def _inner_product_pair(rng, size, shape, dtype, **kwargs):
+    x = rng.normal(size=(*shape[:-2], 4, 2 * size - 1, size)).astype(dtype)
+    y = rng.normal(size=shape).astype(dtype)
+    lhs = np.vdot(adrt.utils.interp_to_cart(x, **kwargs), y)
+    rhs = np.vdot(x, adrt.utils.interp_to_cart_adjoint(y, n=size, **kwargs))
+    return lhs, rhs
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("size", [2, 8, 32])
+def test_default_grid_is_transpose(dtype, size):
+    rng = np.random.default_rng(seed=size)
+    lhs, rhs = _inner_product_pair(rng, size, (2, size, 4 * size), dtype)
+    assert np.isclose(lhs, rhs, rtol=1e-4)
+
+
+@pytest.mark.parametrize("order", [0, 1])
+@pytest.mark.parametrize("size", [2, 8, 32])
+def test_explicit_grid_is_transpose(order, size):
+    rng = np.random.default_rng(seed=size)
+    theta = rng.uniform(-4, 4, size=37)
+    t = rng.uniform(-0.8, 0.8, size=13)
+    lhs, rhs = _inner_product_pair(
+        rng, size, (3, 13, 37), "float64", theta=theta, t=t, order=order
+    )
+    assert np.isclose(lhs, rhs)
+
+
+def test_matches_add_at():
+    size = 16
+    rng = np.random.default_rng(seed=0)
+    theta = rng.uniform(-np.pi / 2, np.pi / 2, size=50)
+    t = rng.uniform(-0.8, 0.8, size=20)
+    inarr = rng.normal(size=(20, 50))
+    offset, angle = np.meshgrid(t, theta, indexing="ij")
+    quadrant, height, slope, factor = adrt.utils.coord_cart_to_adrt(angle, offset, size)
+    valid = np.logical_and(height >= 0, height < 2 * size - 1)
+    expected = np.zeros((4, 2 * size - 1, size))
+    np.add.at(
+        expected,
+        (quadrant[valid], height[valid], slope[valid]),
+        factor[valid] * inarr[valid],
+    )
+    out = adrt.utils.interp_to_cart_adjoint(inarr, n=size, theta=theta, t=t)
+    assert out.shape == expected.shape
+    assert np.allclose(out, expected)
+
+
+@pytest.mark.parametrize("order", [0, 1])
+def test_batch_matches_stacked(order):
+    size = 8
+    inarr = np.random.default_rng(seed=0).normal(size=(2, 3, size, 4 * size))
+    out = adrt.utils.interp_to_cart_adjoint(inarr, order=order)
+    assert out.shape == (2, 3, 4, 2 * size - 1, size)
+    for i in range(2):
+        for j in range(3):
+            single = adrt.utils.interp_to_cart_adjoint(inarr[i, j], order=order)
+            assert np.array_equal(out[i, j], single)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_preserves_dtype(dtype):
+    size = 8
+    inarr = np.ones((size, 4 * size), dtype=dtype)
+    assert adrt.utils.interp_to_cart_adjoint(inarr).dtype == inarr.dtype
+    out = adrt.utils.interp_to_cart_adjoint(inarr, t=size, order=1)
+    assert out.dtype == inarr.dtype
+
+
+def test_infers_size_from_theta_count():
+    size = 8
+    t = np.linspace(-0.5, 0.5, 5)
+    inarr = np.ones((5, 4 * size))
+    out = adrt.utils.interp_to_cart_adjoint(inarr, t=t)
+    assert out.shape == (4, 2 * size - 1, size)
+
+
+def test_refuses_missing_size():
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(
+            np.ones((3, 5)), theta=np.zeros(5), t=np.zeros(3)
+        )
+
+
+def test_refuses_mismatched_shape():
+    size = 8
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(np.ones((size, 4 * size - 1)))
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(
+            np.ones((3, 4)), n=size, theta=np.zeros(5), t=np.zeros(3)
+        )
+
+
+def test_refuses_non_power_of_two():
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(np.ones((6, 24)))
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(np.ones((6, 24)), order=1)
+
+
+def test_refuses_bad_order():
+    with pytest.raises(ValueError):
+        adrt.utils.interp_to_cart_adjoint(np.ones((8, 32)), order=2)
+
+
+def test_refuses_int32():
+    with pytest.raises(TypeError):
+        adrt.utils.interp_to_cart_adjoint(np.ones((8, 32), dtype=np.int32))
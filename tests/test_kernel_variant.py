@@ -0,0 +1,58 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import numpy as np
+import adrt
+
+
+def test_returns_known_variant():
+    assert adrt.core.kernel_variant() in {"avx512", "avx2", "baseline"}
+
+
+def test_matches_attribute():
+    assert adrt.core.kernel_variant() == adrt._adrt_cdefs.KERNEL_VARIANT
+
+
+def test_stable_across_calls():
+    assert adrt.core.kernel_variant() == adrt.core.kernel_variant()
+
+
+def test_active_variant_matches_reference():
+    # All variants must produce the same results as the reference implementation
+    inarr = np.arange(16 * 16, dtype=np.float64).reshape((16, 16)) / 7
+    c_out = adrt.adrt(inarr)
+    naive_out = adrt.core.adrt_init(inarr)
+    for step in range(adrt.core.num_iters(16)):
+        naive_out = adrt.core.adrt_step(naive_out, step)
+    np.testing.assert_array_equal(c_out, naive_out)
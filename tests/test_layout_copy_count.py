@@ -0,0 +1,159 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import threading
+import pytest
+import numpy as np
+import adrt
+
+
+def _copies_during(func, *args, **kwargs):
+    before = adrt.core.layout_copy_count()
+    result = func(*args, **kwargs)
+    return result, adrt.core.layout_copy_count() - before
+
+
+def _strided_views(base):
+    # Views of base with the same shape as base[..., ::2, ::2]
+    return [
+        base[..., ::2, ::2],
+        np.asfortranarray(base[..., ::2, ::2]),
+        np.swapaxes(base[..., ::2, ::2], -1, -2).copy().swapaxes(-1, -2),
+    ]
+
+
+def test_returns_int():
+    assert isinstance(adrt.core.layout_copy_count(), int)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_adrt_strided_no_copy(dtype):
+    base = np.random.default_rng(seed=0).normal(size=(3, 32, 32)).astype(dtype)
+    expected = adrt.adrt(np.ascontiguousarray(base[..., ::2, ::2]))
+    for view in _strided_views(base):
+        out, copies = _copies_during(adrt.adrt, view)
+        assert copies == 0
+        assert np.all(out == expected)
+
+
+def test_adrt_channel_no_copy():
+    # A single channel of an image stored height-width-channel
+    image = np.random.default_rng(seed=0).normal(size=(16, 16, 3))
+    channel = image[..., 1]
+    out, copies = _copies_during(adrt.adrt, channel)
+    assert copies == 0
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(channel)))
+
+
+@pytest.mark.parametrize("func", [adrt.iadrt, adrt.bdrt])
+def test_inverse_strided_no_copy(func):
+    base = np.random.default_rng(seed=0).normal(size=(2, 4, 62, 32))
+    view = base[:, :, ::2, ::2][:, :, :31]
+    assert not view.flags.c_contiguous
+    out, copies = _copies_during(func, view)
+    assert copies == 0
+    assert np.all(out == func(np.ascontiguousarray(view)))
+
+
+def test_large_batch_strided_no_copy():
+    # Enough images for each thread to transform whole images
+    base = np.random.default_rng(seed=0).normal(size=(64, 16, 32))
+    view = base[..., ::2]
+    with adrt.core.num_threads(3):
+        out, copies = _copies_during(adrt.adrt, view)
+    assert copies == 0
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(view)))
+
+
+def test_broadcast_no_copy():
+    row = np.arange(16, dtype=np.float64)
+    img = np.broadcast_to(row, (16, 16))
+    out, copies = _copies_during(adrt.adrt, img)
+    assert copies == 0
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(img)))
+
+
+def test_negative_strides_copied():
+    img = np.random.default_rng(seed=0).normal(size=(16, 16))
+    out, copies = _copies_during(adrt.adrt, img[::-1])
+    assert copies == 1
+    assert np.all(out == adrt.adrt(np.ascontiguousarray(img[::-1])))
+
+
+def test_byteswapped_copied():
+    img = np.ones((16, 16), dtype=np.float32)
+    swapped = img.astype(img.dtype.newbyteorder("S"))
+    out, copies = _copies_during(adrt.adrt, swapped)
+    assert copies == 1
+    assert np.all(out == adrt.adrt(img))
+
+
+def test_contiguous_no_copy():
+    img = np.ones((16, 16), dtype=np.float32)
+    _, copies = _copies_during(adrt.adrt, img)
+    assert copies == 0
+
+
+def test_step_non_contiguous_copied():
+    init = adrt.core.adrt_init(np.ones((16, 16)))
+    view = np.asfortranarray(init)
+    _, copies = _copies_during(adrt.core.adrt_step, view, 0)
+    assert copies == 1
+
+
+def test_plan_strided_no_copy():
+    plan = adrt.core.plan_adrt((16, 16), np.float64)
+    view = np.ones((16, 32))[:, ::2]
+    out, copies = _copies_during(plan, view)
+    assert copies == 0
+    assert np.all(out == adrt.adrt(view))
+
+
+def test_counts_copies_from_threads():
+    # Byteswapped inputs are always copied
+    img = np.ones((8, 8), dtype=">f8")
+    num_threads = 4
+    calls_per_thread = 50
+
+    def worker():
+        for _ in range(calls_per_thread):
+            adrt.adrt(img)
+
+    before = adrt.core.layout_copy_count()
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert adrt.core.layout_copy_count() - before == num_threads * calls_per_thread
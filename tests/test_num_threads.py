@@ -0,0 +1,212 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import concurrent.futures
+import threading
+import pytest
+import numpy as np
+import adrt
+
+
+@pytest.fixture
+def restore_num_threads():
+    yield
+    adrt.core.set_num_threads(None)
+
+
+def expected_threads(n):
+    # Without OpenMP support all routines run on one thread
+    return n if adrt.core.threading_enabled() else 1
+
+
+def test_returns_positive_int():
+    threads = adrt.core.get_num_threads()
+    assert isinstance(threads, int)
+    assert threads >= 1
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_set_num_threads(n):
+    adrt.core.set_num_threads(n)
+    assert adrt.core.get_num_threads() == expected_threads(n)
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+def test_set_num_threads_none_restores_default():
+    default = adrt.core.get_num_threads()
+    adrt.core.set_num_threads(1)
+    adrt.core.set_num_threads(None)
+    assert adrt.core.get_num_threads() == default
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+@pytest.mark.parametrize("n", [0, -1])
+def test_set_num_threads_refuses_non_positive(n):
+    with pytest.raises(ValueError, match="at least 1"):
+        adrt.core.set_num_threads(n)
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+@pytest.mark.parametrize("n", [2**31, 2**70, -(2**70)])
+def test_set_num_threads_refuses_out_of_range(n):
+    with pytest.raises(ValueError, match="threads must be at"):
+        adrt.core.set_num_threads(n)
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+def test_set_num_threads_refuses_float():
+    with pytest.raises(TypeError):
+        adrt.core.set_num_threads(1.0)
+
+
+def test_context_manager_restores():
+    default = adrt.core.get_num_threads()
+    with adrt.core.num_threads(2):
+        assert adrt.core.get_num_threads() == expected_threads(2)
+    assert adrt.core.get_num_threads() == default
+
+
+def test_context_manager_nested():
+    with adrt.core.num_threads(3):
+        assert adrt.core.get_num_threads() == expected_threads(3)
+        with adrt.core.num_threads(1):
+            assert adrt.core.get_num_threads() == 1
+        assert adrt.core.get_num_threads() == expected_threads(3)
+
+
+def test_context_manager_restores_on_error():
+    default = adrt.core.get_num_threads()
+    with pytest.raises(RuntimeError), adrt.core.num_threads(1):
+        raise RuntimeError
+    assert adrt.core.get_num_threads() == default
+
+
+@pytest.mark.usefixtures("restore_num_threads")
+def test_context_manager_overrides_global():
+    adrt.core.set_num_threads(3)
+    with adrt.core.num_threads(1):
+        assert adrt.core.get_num_threads() == 1
+    assert adrt.core.get_num_threads() == expected_threads(3)
+
+
+@pytest.mark.parametrize("n", [0, -2])
+def test_context_manager_refuses_non_positive(n):
+    with pytest.raises(ValueError, match="at least 1"), adrt.core.num_threads(n):
+        pass
+
+
+def test_context_manager_is_thread_local():
+    default = adrt.core.get_num_threads()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold_context():
+        with adrt.core.num_threads(1):
+            entered.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold_context)
+    thread.start()
+    try:
+        entered.wait()
+        assert adrt.core.get_num_threads() == default
+    finally:
+        release.set()
+        thread.join()
+
+
+@pytest.mark.parametrize("func", [adrt.adrt, adrt.bdrt, adrt.iadrt])
+@pytest.mark.parametrize("threads", [1, 2, 3])
+def test_threads_argument_matches_default(func, threads):
+    inarr = np.arange(4 * 31 * 16, dtype=np.float64).reshape((4, 31, 16))
+    if func is adrt.adrt:
+        inarr = np.arange(2 * 16 * 16, dtype=np.float64).reshape((2, 16, 16))
+    expected = func(inarr)
+    assert np.array_equal(func(inarr, threads=threads), expected)
+
+
+@pytest.mark.parametrize("func", [adrt.adrt, adrt.bdrt, adrt.iadrt])
+@pytest.mark.parametrize("threads", [0, -1])
+def test_threads_argument_refuses_non_positive(func, threads):
+    inarr = np.zeros((4, 31, 16), dtype=np.float32)
+    if func is adrt.adrt:
+        inarr = np.zeros((16, 16), dtype=np.float32)
+    with pytest.raises(ValueError, match="at least 1"):
+        func(inarr, threads=threads)
+
+
+@pytest.mark.parametrize("threads", [2**70, -(2**70)])
+def test_threads_argument_refuses_out_of_range(threads):
+    with pytest.raises(ValueError, match="threads must be at"):
+        adrt.adrt(np.zeros((16, 16), dtype=np.float32), threads=threads)
+
+
+def test_threads_argument_refuses_float():
+    with pytest.raises(TypeError):
+        adrt.adrt(np.zeros((16, 16), dtype=np.float32), threads=1.0)
+
+
+def test_plan_threads_argument():
+    inarr = np.arange(16 * 16, dtype=np.float32).reshape((16, 16))
+    plan = adrt.core.plan_adrt(inarr.shape, inarr.dtype)
+    assert np.array_equal(plan(inarr, threads=1), adrt.adrt(inarr))
+
+
+def test_routines_in_context_match_default():
+    inarr = np.arange(16 * 16, dtype=np.float64).reshape((16, 16))
+    expected = adrt.adrt(inarr)
+    expected_cart = adrt.utils.interp_to_cart(expected)
+    expected_step = adrt.core.adrt_step(adrt.core.adrt_init(inarr), 0)
+    with adrt.core.num_threads(1):
+        assert np.array_equal(adrt.adrt(inarr), expected)
+        assert np.array_equal(adrt.utils.interp_to_cart(expected), expected_cart)
+        assert np.array_equal(
+            adrt.core.adrt_step(adrt.core.adrt_init(inarr), 0), expected_step
+        )
+
+
+def test_thread_pool_workers():
+    rng = np.random.default_rng(seed=0)
+    images = [rng.normal(size=(16, 16)) for _ in range(8)]
+    expected = [adrt.adrt(img) for img in images]
+
+    def worker(img):
+        with adrt.core.num_threads(1):
+            return adrt.adrt(img)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(worker, images))
+    for res, exp in zip(results, expected):
+        assert np.array_equal(res, exp)
@@ -76,10 +76,12 @@ def test_reject_too_few_dims():
         _ = adrt._wrappers._press_fmg_prolongation(arr)
 
 
-def test_reject_too_many_dims():
+def test_accepts_many_dims():
     arr = np.arange(180).reshape((2, 3, 5, 6)).astype("float32")
-    with pytest.raises(ValueError):
-        _ = adrt._wrappers._press_fmg_prolongation(arr)
+    out = adrt._wrappers._press_fmg_prolongation(arr)
+    assert out.shape == (2, 3, 10, 12)
+    flat = adrt._wrappers._press_fmg_prolongation(arr.reshape((6, 5, 6)))
+    assert np.all(out == flat.reshape(out.shape))
 
 
 def test_reject_non_float():
@@ -0,0 +1,116 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+import numpy as np
+import adrt
+
+
+def _gather_reference(a, theta, t):
+    n = a.shape[-1]
+    idx = adrt.utils.coord_cart_to_adrt(theta, t, n)
+    valid = (idx.height >= 0) & (idx.height < 2 * n - 1)
+    height = np.clip(idx.height, 0, 2 * n - 2)
+    values = a[..., idx.quadrant, height, idx.slope] * idx.factor
+    return np.where(valid, values, 0)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("size", [2, 8, 32])
+def test_matches_index_gather(dtype, size):
+    rng = np.random.default_rng(seed=size)
+    a = adrt.adrt(rng.normal(size=(size, size)).astype(dtype))
+    theta = rng.uniform(-4, 4, size=(13, 7))
+    t = rng.uniform(-0.8, 0.8, size=(13, 7))
+    ret = adrt.utils.sample_adrt(a, theta, t)
+    assert ret.dtype == np.dtype(dtype)
+    assert ret.shape == (13, 7)
+    assert np.allclose(ret, _gather_reference(a, theta, t), rtol=1e-5)
+
+
+@pytest.mark.parametrize("order", [0, 1])
+def test_matches_interp_to_cart_grid(order):
+    size = 16
+    rng = np.random.default_rng(seed=order)
+    a = adrt.adrt(rng.normal(size=(size, size)))
+    theta = np.linspace(-np.pi / 2, np.pi / 2, 4 * size, endpoint=False)
+    t = np.linspace(0.6, -0.6, size)
+    cart = adrt.utils.interp_to_cart(a, theta=theta, t=t, order=order)
+    ret = adrt.utils.sample_adrt(a, theta[np.newaxis, :], t[:, np.newaxis], order=order)
+    assert np.allclose(ret, cart)
+
+
+def test_batch_and_broadcast():
+    size = 8
+    rng = np.random.default_rng(seed=0)
+    a = adrt.adrt(rng.normal(size=(2, 3, size, size)))
+    theta = rng.uniform(-2, 2, size=5)
+    ret = adrt.utils.sample_adrt(a, theta, 0.1)
+    assert ret.shape == (2, 3, 5)
+    for i in range(2):
+        for j in range(3):
+            assert np.allclose(ret[i, j], adrt.utils.sample_adrt(a[i, j], theta, 0.1))
+
+
+def test_empty_points():
+    a = adrt.adrt(np.ones((2, 4, 4)))
+    ret = adrt.utils.sample_adrt(a, np.zeros((0, 3)), 0.0)
+    assert ret.shape == (2, 0, 3)
+
+
+def test_order_one_exact_at_nodes():
+    size = 8
+    a = adrt.adrt(np.arange(size**2, dtype=np.float64).reshape((size, size)))
+    coord = adrt.utils.coord_adrt(size)
+    theta = np.broadcast_to(coord.angle, coord.offset.shape)
+    idx = adrt.utils.coord_cart_to_adrt(theta, coord.offset, size)
+    ret = adrt.utils.sample_adrt(a, theta, coord.offset, order=1)
+    assert np.allclose(ret, a * idx.factor)
+
+
+def test_refuses_invalid_order():
+    a = adrt.adrt(np.ones((4, 4)))
+    with pytest.raises(ValueError):
+        _ = adrt.utils.sample_adrt(a, 0.0, 0.0, order=2)
+
+
+def test_refuses_invalid_shape():
+    with pytest.raises(ValueError):
+        _ = adrt.utils.sample_adrt(np.ones((4, 6, 4)), 0.0, 0.0)
+
+
+def test_refuses_non_finite():
+    a = adrt.adrt(np.ones((4, 4)))
+    with pytest.raises(ValueError):
+        _ = adrt.utils.sample_adrt(a, np.array([0.0, np.nan]), 0.0)
@@ -0,0 +1,96 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+import numpy as np
+import adrt
+
+
+@pytest.fixture
+def restore_radix():
+    radix = adrt.core.get_radix()
+    yield
+    adrt.core.set_radix(radix)
+
+
+def test_default_radix():
+    assert adrt.core.get_radix() == 4
+
+
+@pytest.mark.usefixtures("restore_radix")
+@pytest.mark.parametrize("radix", [2, 4])
+def test_get_radix(radix):
+    adrt.core.set_radix(radix)
+    assert adrt.core.get_radix() == radix
+
+
+@pytest.mark.usefixtures("restore_radix")
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("n", [1, 2, 4, 8, 16, 32, 64])
+def test_radix_results_identical(n, dtype):
+    rng = np.random.default_rng(seed=n)
+    img = rng.normal(size=(2, n, n)).astype(dtype)
+    sino = rng.normal(size=(2, 4, 2 * n - 1, n)).astype(dtype)
+    adrt.core.set_radix(2)
+    adrt_ref = adrt.adrt(img)
+    bdrt_ref = adrt.bdrt(sino)
+    adrt.core.set_radix(4)
+    adrt_out = adrt.adrt(img)
+    bdrt_out = adrt.bdrt(sino)
+    assert adrt_out.tobytes() == adrt_ref.tobytes()
+    assert bdrt_out.tobytes() == bdrt_ref.tobytes()
+
+
+@pytest.mark.usefixtures("restore_radix")
+@pytest.mark.parametrize("n", [4, 8, 16])
+def test_radix_matches_steps(n):
+    img = np.random.default_rng(seed=n).normal(size=(n, n))
+    adrt.core.set_radix(4)
+    *_, adrt_last = adrt.core.adrt_iter(img)
+    *_, bdrt_last = adrt.core.bdrt_iter(adrt_last)
+    assert np.allclose(adrt.adrt(img), adrt_last)
+    assert np.allclose(adrt.bdrt(adrt_last), bdrt_last)
+
+
+@pytest.mark.usefixtures("restore_radix")
+@pytest.mark.parametrize("radix", [0, 1, 3, 8, -4])
+def test_refuses_invalid_radix(radix):
+    with pytest.raises(ValueError):
+        adrt.core.set_radix(radix)
+    assert adrt.core.get_radix() == 4
+
+
+def test_refuses_non_int():
+    with pytest.raises(TypeError):
+        adrt.core.set_radix(4.0)
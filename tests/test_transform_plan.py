@@ -0,0 +1,155 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pickle
+import pytest
+import numpy as np
+import adrt
+
+
+PLANS = [
+    (adrt.core.plan_adrt, adrt.adrt, (16, 16)),
+    (adrt.core.plan_adrt, adrt.adrt, (3, 16, 16)),
+    (adrt.core.plan_bdrt, adrt.bdrt, (4, 31, 16)),
+    (adrt.core.plan_bdrt, adrt.bdrt, (3, 4, 31, 16)),
+    (adrt.core.plan_iadrt, adrt.iadrt, (4, 31, 16)),
+    (adrt.core.plan_iadrt, adrt.iadrt, (3, 4, 31, 16)),
+]
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("plan_func, func, shape", PLANS)
+def test_matches_function(plan_func, func, shape, dtype):
+    plan = plan_func(shape, dtype)
+    a = np.random.default_rng(seed=0).normal(size=shape).astype(dtype)
+    expected = func(a)
+    for _ in range(2):
+        result = plan(a)
+        assert result.dtype == expected.dtype
+        assert result.shape == expected.shape == plan.out_shape
+        assert np.all(result == expected)
+
+
+@pytest.mark.parametrize("plan_func, func, shape", PLANS)
+def test_out_argument(plan_func, func, shape):
+    plan = plan_func(shape, np.float32)
+    a = np.random.default_rng(seed=0).normal(size=shape).astype(np.float32)
+    out = np.full(plan.out_shape, np.nan, dtype=np.float32)
+    result = plan(a, out=out)
+    assert result is out
+    assert np.all(out == func(a))
+
+
+@pytest.mark.parametrize("plan_func, func, shape", PLANS)
+def test_pickle_round_trip(plan_func, func, shape):
+    plan = plan_func(shape, np.float64)
+    restored = pickle.loads(pickle.dumps(plan))
+    assert isinstance(restored, adrt.core.TransformPlan)
+    assert restored.op == plan.op
+    assert restored.shape == plan.shape
+    assert restored.dtype == plan.dtype
+    assert restored.out_shape == plan.out_shape
+    a = np.random.default_rng(seed=0).normal(size=shape)
+    assert np.all(restored(a) == func(a))
+
+
+def test_accepts_non_contiguous():
+    plan = adrt.core.plan_adrt((16, 16), np.float32)
+    a = np.arange(32 * 16, dtype=np.float32).reshape((32, 16))[::2]
+    assert not a.flags["C_CONTIGUOUS"]
+    assert np.all(plan(a) == adrt.adrt(a))
+
+
+def test_accepts_byteswapped():
+    plan = adrt.core.plan_adrt((16, 16), np.float32)
+    a = np.arange(16 * 16, dtype=np.float32).reshape((16, 16))
+    swapped = a.astype(a.dtype.newbyteorder("S"))
+    assert np.all(plan(swapped) == adrt.adrt(a))
+
+
+def test_accepts_byteswapped_dtype():
+    plan = adrt.core.plan_adrt((16, 16), np.dtype(np.float32).newbyteorder("S"))
+    assert plan.dtype == np.float32
+
+
+def test_refuses_wrong_shape():
+    plan = adrt.core.plan_adrt((16, 16), np.float32)
+    with pytest.raises(ValueError):
+        plan(np.zeros((2, 16, 16), dtype=np.float32))
+    with pytest.raises(ValueError):
+        plan(np.zeros((8, 8), dtype=np.float32))
+
+
+def test_refuses_wrong_dtype():
+    plan = adrt.core.plan_adrt((16, 16), np.float32)
+    with pytest.raises(TypeError):
+        plan(np.zeros((16, 16), dtype=np.float64))
+
+
+def test_refuses_non_array():
+    plan = adrt.core.plan_adrt((4, 4), np.float32)
+    with pytest.raises(TypeError):
+        plan(np.zeros((4, 4), dtype=np.float32).tolist())
+
+
+def test_refuses_overlapping_out():
+    plan = adrt.core.plan_bdrt((4, 31, 16), np.float32)
+    a = np.zeros((4, 31, 16), dtype=np.float32)
+    with pytest.raises(ValueError):
+        plan(a, out=a)
+
+
+@pytest.mark.parametrize("dtype", ["int32", "float16", "complex64"])
+def test_refuses_unsupported_dtype(dtype):
+    with pytest.raises(TypeError):
+        adrt.core.plan_adrt((16, 16), dtype)
+
+
+@pytest.mark.parametrize(
+    "plan_func, shape",
+    [
+        (adrt.core.plan_adrt, (16, 8)),
+        (adrt.core.plan_adrt, (15, 15)),
+        (adrt.core.plan_bdrt, (4, 30, 16)),
+        (adrt.core.plan_iadrt, (3, 31, 16)),
+    ],
+)
+def test_refuses_invalid_shape(plan_func, shape):
+    with pytest.raises(ValueError):
+        plan_func(shape, np.float32)
+
+
+def test_refuses_unknown_op():
+    with pytest.raises(ValueError):
+        adrt.core.TransformPlan("interp_to_cart", (4, 31, 16), np.float32)
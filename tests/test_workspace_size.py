@@ -0,0 +1,158 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+import numpy as np
+import adrt
+
+
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_adrt_size(n):
+    assert adrt.core.workspace_size("adrt", (n, n)) == 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size("adrt", (3, n, n)) == 3 * 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size("adrt", (2, 3, n, n)) == 6 * 4 * n * (2 * n - 1)
+
+
+@pytest.mark.parametrize("op", ["bdrt", "iadrt"])
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_adrt_output_size(op, n):
+    shape = (4, 2 * n - 1, n)
+    assert adrt.core.workspace_size(op, shape) == 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size(op, (3, *shape)) == 3 * 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size(op, (2, 3, *shape)) == 6 * 4 * n * (2 * n - 1)
+
+
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_adrt_adjoint_size(n):
+    shape = (4, 2 * n - 1, n)
+    size = 2 * 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size("adrt_adjoint", shape) == size
+    assert adrt.core.workspace_size("adrt_adjoint", (3, *shape)) == 3 * size
+
+
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_adrt_normal_size(n):
+    size = 3 * 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size("adrt_normal", (n, n)) == size
+    assert adrt.core.workspace_size("adrt_normal", (3, n, n)) == 3 * size
+
+
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_iadrt_fmg_step_size(n):
+    shape = (4, 2 * n - 1, n)
+    size = 4 * 4 * n * (2 * n - 1)
+    assert adrt.core.workspace_size("iadrt_fmg_step", shape) == size
+    assert adrt.core.workspace_size("iadrt_fmg_step", (3, *shape)) == 3 * size
+
+
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_fmg_precondition_size(n):
+    size = 2 * n * n
+    assert adrt.core.workspace_size("fmg_precondition", (n, n)) == size
+    assert adrt.core.workspace_size("fmg_precondition", (3, n, n)) == 3 * size
+
+
+def test_accepts_numpy_ints():
+    shape = np.array([16, 16])
+    assert adrt.core.workspace_size("adrt", shape) == 4 * 16 * 31
+    assert adrt.core.workspace_size("adrt", tuple(shape)) == 4 * 16 * 31
+
+
+def test_refuses_unknown_op():
+    with pytest.raises(ValueError):
+        adrt.core.workspace_size("interp_to_cart", (4, 31, 16))
+
+
+def test_refuses_non_str_op():
+    with pytest.raises(TypeError):
+        adrt.core.workspace_size(adrt.adrt, (16, 16))
+
+
+@pytest.mark.parametrize(
+    "op, shape",
+    [
+        ("adrt", (16, 8)),
+        ("adrt", (15, 15)),
+        ("adrt", (16,)),
+        ("adrt", (0, 16, 16)),
+        ("bdrt", (4, 30, 16)),
+        ("bdrt", (3, 31, 16)),
+        ("adrt_adjoint", (4, 31, 15)),
+        ("adrt_normal", (16, 8)),
+        ("iadrt_fmg_step", (4, 30, 16)),
+        ("fmg_precondition", (16, 8)),
+    ],
+)
+def test_refuses_invalid_shape(op, shape):
+    with pytest.raises(ValueError):
+        adrt.core.workspace_size(op, shape)
+
+
+@pytest.mark.parametrize("op", ["adrt", "bdrt"])
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_accumulate_wide_size(op, n):
+    shape = (n, n) if op == "adrt" else (4, 2 * n - 1, n)
+    size = adrt.core.workspace_size(op, shape)
+    assert adrt.core.workspace_size(op, shape, accumulate=np.float64) == 2 * size
+    assert adrt.core.workspace_size(op, shape, accumulate=np.float32) == size
+    assert adrt.core.workspace_size(op, shape, accumulate=None) == size
+
+
+@pytest.mark.parametrize("op", ["adrt", "bdrt", "iadrt"])
+def test_accumulate_size_is_usable(op):
+    n = 16
+    shape = (2, n, n) if op == "adrt" else (2, 4, 2 * n - 1, n)
+    a = np.random.default_rng(seed=0).normal(size=shape).astype(np.float32)
+    func = getattr(adrt, op)
+    ws_size = adrt.core.workspace_size(op, shape, accumulate="float64")
+    ws_dtype = np.float32 if op == "iadrt" else np.float64
+    ws = np.empty(ws_size, dtype=ws_dtype)
+    expected = func(a, accumulate=np.float64)
+    assert np.array_equal(func(a, accumulate=np.float64, workspace=ws), expected)
+
+
+def test_accumulate_iadrt_size():
+    shape = (4, 31, 16)
+    size = adrt.core.workspace_size("iadrt", shape)
+    assert adrt.core.workspace_size("iadrt", shape, accumulate=np.float64) == size
+
+
+def test_accumulate_refuses_other_ops():
+    with pytest.raises(ValueError):
+        adrt.core.workspace_size("adrt_normal", (16, 16), accumulate=np.float64)
+
+
+def test_accumulate_refuses_invalid_dtype():
+    with pytest.raises(TypeError):
+        adrt.core.workspace_size("adrt", (16, 16), accumulate=np.int32)
@@ -0,0 +1,100 @@
+# Copyright Karl Otness, Donsub Rim
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in
+#    the documentation and/or other materials provided with the
+#    distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import argparse
+import timeit
+import numpy as np
+import adrt
+
+
+parser = argparse.ArgumentParser(
+    description="Compare float32 transforms accumulating in float64 against float64"
+)
+parser.add_argument(
+    "sizes",
+    type=int,
+    nargs="*",
+    default=[256, 512, 1024, 2048],
+    help="Image sizes to benchmark (powers of two)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Number of timing repetitions, the fastest is reported",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed for the random test images",
+)
+
+
+def best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def max_rel_error(val, ref):
+    return float(np.max(np.abs(val.astype(np.float64) - ref)) / np.max(np.abs(ref)))
+
+
+def run_case(name, func, data, repeat):
+    ref = func(data.astype(np.float64))
+    variants = {
+        "float32": lambda: func(data),
+        "accumulate=float64": lambda: func(data, accumulate=np.float64),
+        "float64 round trip": lambda: func(data.astype(np.float64)).astype(np.float32),
+    }
+    for label, variant in variants.items():
+        err = max_rel_error(variant(), ref)
+        elapsed = best_time(variant, repeat)
+        print(
+            f"{name:>5} {data.shape[-1]:>6} {label:>20} {elapsed:>10.4f} {err:>12.3e}"
+        )
+
+
+def main():
+    args = parser.parse_args()
+    rng = np.random.default_rng(seed=args.seed)
+    print(f"{'op':>5} {'n':>6} {'variant':>20} {'time (s)':>10} {'max rel err':>12}")
+    for n in args.sizes:
+        img = rng.random((n, n)).astype(np.float32)
+        run_case("adrt", adrt.adrt, img, args.repeat)
+        proj = adrt.adrt(img)
+        run_case("bdrt", adrt.bdrt, proj, args.repeat)
+
+
+if __name__ == "__main__":
+    main()